@@ -47,51 +47,106 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
 import sys
+from typing import TYPE_CHECKING
 
 # Local imports
+from ._lazy import attach
 from ._version import __version__
-from .types import (
-    AnimationDuration,
-    ColorType,
-    EventCallback,
-    IconSource,
-    IconSourceExtended,
-    SizeType,
-    ValueCallback,
-    WidgetParent,
-)
-from .widgets.button import (
-    DateButton,
-    DatePickerDialog,
-    IconButton,
-    LoaderButton,
-)
-from .widgets.input import (
-    AutoCompleteInput,
-    FilePickerInput,
-    PasswordInput,
-    SearchInput,
-    SpinBoxInput,
-    TabReplaceTextEdit,
-)
-from .widgets.label import (
-    ClickableTagLabel,
-    FramedLabel,
-    HoverLabel,
-    IndicatorLabel,
-)
-from .widgets.misc import (
-    CircularTimer,
-    CollapsibleSection,
-    DraggableItem,
-    DraggableList,
-    NotificationBanner,
-    NotificationLevel,
-    OptionSelector,
-    ThemeIcon,
-    ToggleIcon,
-    ToggleSwitch,
-)
+
+# Type-checking-only imports (widgets are loaded lazily at runtime, so
+# importing the package does not import PySide6)
+if TYPE_CHECKING:
+    from .types import (
+        AnimationDuration,
+        ColorType,
+        ContentFactory,
+        EventCallback,
+        IconSource,
+        IconSourceExtended,
+        SizeType,
+        ValueCallback,
+        WidgetParent,
+    )
+    from .widgets.button import (
+        DateButton,
+        DatePickerDialog,
+        IconButton,
+        LoaderButton,
+    )
+    from .widgets.input import (
+        AutoCompleteInput,
+        FilePickerInput,
+        PasswordInput,
+        SearchInput,
+        SpinBoxInput,
+        TabReplaceTextEdit,
+    )
+    from .widgets.label import (
+        ClickableTagLabel,
+        FramedLabel,
+        HoverLabel,
+        IndicatorGrid,
+        IndicatorLabel,
+        TagCloud,
+    )
+    from .widgets.misc import (
+        Accordion,
+        CircularTimer,
+        CollapsibleSection,
+        DraggableItem,
+        DraggableList,
+        NotificationBanner,
+        NotificationLevel,
+        OptionSelector,
+        ThemeIcon,
+        ToggleIcon,
+        ToggleSwitch,
+    )
+
+# ///////////////////////////////////////////////////////////////
+# LAZY EXPORTS
+# ///////////////////////////////////////////////////////////////
+
+_EXPORTS: dict[str, str] = {
+    "Accordion": ".widgets.misc",
+    "AnimationDuration": ".types",
+    "AutoCompleteInput": ".widgets.input",
+    "CircularTimer": ".widgets.misc",
+    "ClickableTagLabel": ".widgets.label",
+    "CollapsibleSection": ".widgets.misc",
+    "ColorType": ".types",
+    "ContentFactory": ".types",
+    "DateButton": ".widgets.button",
+    "DatePickerDialog": ".widgets.button",
+    "DraggableItem": ".widgets.misc",
+    "DraggableList": ".widgets.misc",
+    "EventCallback": ".types",
+    "FilePickerInput": ".widgets.input",
+    "FramedLabel": ".widgets.label",
+    "HoverLabel": ".widgets.label",
+    "IconButton": ".widgets.button",
+    "IconSource": ".types",
+    "IconSourceExtended": ".types",
+    "IndicatorGrid": ".widgets.label",
+    "IndicatorLabel": ".widgets.label",
+    "LoaderButton": ".widgets.button",
+    "NotificationBanner": ".widgets.misc",
+    "NotificationLevel": ".widgets.misc",
+    "OptionSelector": ".widgets.misc",
+    "PasswordInput": ".widgets.input",
+    "SearchInput": ".widgets.input",
+    "SizeType": ".types",
+    "SpinBoxInput": ".widgets.input",
+    "TabReplaceTextEdit": ".widgets.input",
+    "TagCloud": ".widgets.label",
+    "ThemeIcon": ".widgets.misc",
+    "ToggleIcon": ".widgets.misc",
+    "ToggleSwitch": ".widgets.misc",
+    "ValueCallback": ".types",
+    "WidgetParent": ".types",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 # ///////////////////////////////////////////////////////////////
 # META INFORMATIONS
@@ -134,6 +189,7 @@ if sys.version_info < (3, 11):  # noqa: UP036
 
 __all__ = [
     # Widgets
+    "Accordion",
     "AutoCompleteInput",
     "CircularTimer",
     "ClickableTagLabel",
@@ -146,6 +202,7 @@ __all__ = [
     "FramedLabel",
     "HoverLabel",
     "IconButton",
+    "IndicatorGrid",
     "IndicatorLabel",
     "LoaderButton",
     "NotificationBanner",
@@ -155,12 +212,14 @@ __all__ = [
     "SearchInput",
     "SpinBoxInput",
     "TabReplaceTextEdit",
+    "TagCloud",
     "ThemeIcon",
     "ToggleIcon",
     "ToggleSwitch",
     # Type aliases
     "AnimationDuration",
     "ColorType",
+    "ContentFactory",
     "EventCallback",
     "IconSource",
     "IconSourceExtended",
@@ -0,0 +1,73 @@
+# ///////////////////////////////////////////////////////////////
+# LAZY - Lazy Package Exports
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Lazy package exports.
+
+Builds PEP 562 module ``__getattr__`` and ``__dir__`` functions so that a
+package can list its public names without importing the modules that
+define them. A name is imported on first access and then stored in the
+package namespace, so later accesses are plain attribute lookups.
+
+Packages keep a literal ``__all__`` and a ``TYPE_CHECKING`` import block so
+type checkers and IDEs see the same API as with eager imports.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def attach(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create lazy ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Args:
+        package: The package ``__name__``.
+        exports: Public name to relative module path. A name whose module
+            path is ``"." + name`` refers to the submodule itself; any
+            other name is an attribute of its module.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions to assign at module
+        level.
+
+    Example:
+        >>> __getattr__, __dir__ = attach(__name__, {"Foo": ".foo"})
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_path = exports.get(name)
+        if module_path is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(module_path, package)
+        value = module if module_path == f".{name}" else getattr(module, name)
+        # Cache in the package namespace: later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["attach"]
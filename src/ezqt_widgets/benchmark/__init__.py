@@ -0,0 +1,58 @@
+# ///////////////////////////////////////////////////////////////
+# BENCHMARK - Widget Benchmark Package
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Widget benchmark package.
+
+Headless micro-benchmarks for every exported widget: construction, first
+paint, repaint, theme switch and memory per instance. Reports are plain
+JSON and can be compared against a stored baseline to catch regressions.
+
+Example:
+    >>> from ezqt_widgets.benchmark import compare_reports, load_report
+    >>> from ezqt_widgets.benchmark import run_benchmarks, save_report
+    >>> report = run_benchmarks(["ToggleSwitch", "TagCloud"])
+    >>> save_report(report, "bench.json")
+    >>> for regression in compare_reports(report, load_report("baseline.json")):
+    ...     print(regression.widget, regression.metric, regression.ratio)
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Local imports
+from ._report import (
+    MEMORY_METRICS,
+    REPORT_SCHEMA,
+    TIMING_METRICS,
+    Regression,
+    compare_reports,
+    load_report,
+    save_report,
+    summarize,
+)
+from ._runner import benchmark_widget, run_benchmarks
+from ._scenarios import SCENARIOS, WidgetFactory
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "MEMORY_METRICS",
+    "REPORT_SCHEMA",
+    "SCENARIOS",
+    "TIMING_METRICS",
+    "Regression",
+    "WidgetFactory",
+    "benchmark_widget",
+    "compare_reports",
+    "load_report",
+    "run_benchmarks",
+    "save_report",
+    "summarize",
+]
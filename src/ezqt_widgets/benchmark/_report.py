@@ -0,0 +1,250 @@
+# ///////////////////////////////////////////////////////////////
+# REPORT - Benchmark Reports
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Benchmark report helpers.
+
+Percentile summaries, JSON persistence and baseline comparison for the
+reports produced by run_benchmarks().
+
+A report is a JSON-compatible dict::
+
+    {
+        "schema": 1,
+        "environment": {...},
+        "config": {"instances": 30, "repeats": 30},
+        "widgets": {
+            "ToggleSwitch": {
+                "construct": {"p50": 41.2, "p90": 55.0, ...},
+                "first_paint": {...},
+                "repaint": {...},
+                "theme_switch": {...},
+                "memory": {"python_bytes": 2210, "rss_bytes": 6144},
+            },
+        },
+    }
+
+Timings are in microseconds per operation; memory is in bytes per
+instance.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import json
+import math
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+REPORT_SCHEMA: int = 1
+
+TIMING_METRICS: tuple[str, ...] = (
+    "construct",
+    "first_paint",
+    "repaint",
+    "theme_switch",
+)
+
+MEMORY_METRICS: tuple[str, ...] = ("python_bytes", "rss_bytes")
+
+# Resident set size growth depends on allocator reuse and is reported for
+# information only; baseline comparisons use the Python heap
+_COMPARED_MEMORY_METRICS: tuple[str, ...] = ("python_bytes",)
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class Regression(NamedTuple):
+    """A metric that got slower or larger than its baseline.
+
+    Attributes:
+        widget: The widget class name.
+        metric: The metric name (a timing metric or ``memory.<field>``).
+        baseline: The baseline value.
+        current: The current value.
+    """
+
+    widget: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Get the current to baseline ratio.
+
+        Returns:
+            The ratio, or infinity for a zero baseline.
+        """
+        return self.current / self.baseline if self.baseline else math.inf
+
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def summarize(samples: Sequence[float]) -> dict[str, float]:
+    """Summarize timing samples with percentiles.
+
+    Percentiles use linear interpolation between the closest ranks.
+
+    Args:
+        samples: The samples, in any order.
+
+    Returns:
+        ``p50``, ``p90``, ``p99``, ``mean``, ``min`` and ``max`` of the
+        samples, plus their count as ``n``.
+
+    Raises:
+        ValueError: If there are no samples.
+    """
+    if not samples:
+        raise ValueError("Cannot summarize an empty sample set")
+    ordered = sorted(samples)
+
+    def percentile(q: float) -> float:
+        position = (len(ordered) - 1) * q
+        low = math.floor(position)
+        high = min(low + 1, len(ordered) - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+    return {
+        "p50": round(percentile(0.50), 2),
+        "p90": round(percentile(0.90), 2),
+        "p99": round(percentile(0.99), 2),
+        "mean": round(sum(ordered) / len(ordered), 2),
+        "min": round(ordered[0], 2),
+        "max": round(ordered[-1], 2),
+        "n": len(ordered),
+    }
+
+
+def save_report(report: dict[str, Any], path: str | Path) -> Path:
+    """Write a report as JSON.
+
+    Args:
+        report: The report.
+        path: The destination file; parent directories are created.
+
+    Returns:
+        The written path.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def load_report(path: str | Path) -> dict[str, Any]:
+    """Read a report written by save_report().
+
+    Args:
+        path: The report file.
+
+    Returns:
+        The report.
+
+    Raises:
+        ValueError: If the file is not a report of a supported schema.
+    """
+    report = json.loads(Path(path).read_text())
+    if not isinstance(report, dict) or report.get("schema") != REPORT_SCHEMA:
+        raise ValueError(f"{path} is not a benchmark report (schema {REPORT_SCHEMA})")
+    return report
+
+
+def compare_reports(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = 1.5,
+    min_delta_us: float = 50.0,
+    min_delta_bytes: int = 2048,
+) -> list[Regression]:
+    """List the metrics that regressed against a baseline.
+
+    Timings are compared on their median (``p50``) and memory on the
+    Python heap per instance. A metric regresses when it exceeds
+    ``tolerance`` times its baseline and the absolute difference also
+    exceeds the minimum delta, so that noise on very cheap operations is
+    not reported. Widgets or metrics missing from either report are
+    ignored.
+
+    Args:
+        current: The new report.
+        baseline: The reference report.
+        tolerance: Allowed current to baseline ratio (default: 1.5).
+        min_delta_us: Minimum timing increase in microseconds
+            (default: 50.0).
+        min_delta_bytes: Minimum memory increase in bytes
+            (default: 2048).
+
+    Returns:
+        The regressions, in widget and metric order.
+    """
+    regressions: list[Regression] = []
+    baseline_widgets = baseline.get("widgets", {})
+    for widget, metrics in sorted(current.get("widgets", {}).items()):
+        reference = baseline_widgets.get(widget)
+        if reference is None:
+            continue
+
+        candidates: list[tuple[str, Any, Any, float]] = [
+            (
+                name,
+                metrics.get(name, {}).get("p50"),
+                reference.get(name, {}).get("p50"),
+                min_delta_us,
+            )
+            for name in TIMING_METRICS
+        ]
+        candidates += [
+            (
+                f"memory.{name}",
+                metrics.get("memory", {}).get(name),
+                reference.get("memory", {}).get(name),
+                min_delta_bytes,
+            )
+            for name in _COMPARED_MEMORY_METRICS
+        ]
+
+        for name, value, reference_value, min_delta in candidates:
+            if value is None or reference_value is None:
+                continue
+            if (
+                value > reference_value * tolerance
+                and value - reference_value > min_delta
+            ):
+                regressions.append(
+                    Regression(widget, name, float(reference_value), float(value))
+                )
+    return regressions
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "MEMORY_METRICS",
+    "REPORT_SCHEMA",
+    "TIMING_METRICS",
+    "Regression",
+    "compare_reports",
+    "load_report",
+    "save_report",
+    "summarize",
+]
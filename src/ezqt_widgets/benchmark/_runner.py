@@ -0,0 +1,326 @@
+# ///////////////////////////////////////////////////////////////
+# RUNNER - Widget Benchmark Runner
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Widget benchmark runner.
+
+Measures, for each widget scenario:
+
+- ``construct``: building one instance;
+- ``first_paint``: the first render of a new instance, which includes
+  polishing and the first layout pass;
+- ``repaint``: rendering an already painted instance again;
+- ``theme_switch``: switching between the dark and light themes
+  (``setTheme()`` when the widget has it, plus a stylesheet swap) and
+  rendering the result;
+- ``memory``: Python heap (tracemalloc) and, where the platform exposes
+  it, resident set size growth per live instance.
+
+Rendering uses ``QWidget.grab()``, which paints the widget tree
+synchronously and does not depend on a window system, so the results are
+the same under the ``offscreen`` platform.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import gc
+import os
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+# Third-party imports
+import PySide6
+from PySide6.QtCore import QCoreApplication, QEvent, QSize, qVersion
+from PySide6.QtWidgets import QApplication, QWidget
+
+# Local imports
+from .._version import __version__
+from ._report import REPORT_SCHEMA, summarize
+from ._scenarios import SCENARIOS, WidgetFactory
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_THEMES: tuple[str, str] = ("dark", "light")
+
+_THEME_STYLESHEETS: dict[str, str] = {
+    "dark": "QWidget { background-color: #2d2d2d; color: #ffffff; }",
+    "light": "QWidget { background-color: #ffffff; color: #000000; }",
+}
+
+# Size used when a widget has no usable size hint
+_FALLBACK_SIZE: QSize = QSize(200, 100)
+
+_STATM_PATH: Path = Path("/proc/self/statm")
+
+# Keeps an application created by the runner alive
+_application: QApplication | None = None
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _ensure_application() -> QApplication:
+    """Return the running QApplication, creating an offscreen one if needed.
+
+    Returns:
+        The application instance.
+    """
+    global _application
+    app = QApplication.instance()
+    if isinstance(app, QApplication):
+        return app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _application = QApplication([])
+    return _application
+
+
+def _rss_bytes() -> int | None:
+    """Return the resident set size of the process.
+
+    Returns:
+        The resident set size in bytes, or None if the platform does not
+        expose it through ``/proc``.
+    """
+    try:
+        resident_pages = int(_STATM_PATH.read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _prepare(widget: QWidget) -> None:
+    """Give a widget its preferred size before it is rendered.
+
+    Args:
+        widget: The widget.
+    """
+    size = widget.sizeHint()
+    if not size.isValid() or size.isEmpty():
+        size = _FALLBACK_SIZE
+    widget.resize(size)
+
+
+def _apply_theme(widget: QWidget, theme: str) -> None:
+    """Switch a widget to a theme.
+
+    Args:
+        widget: The widget.
+        theme: ``"dark"`` or ``"light"``.
+    """
+    set_theme = getattr(widget, "setTheme", None)
+    if callable(set_theme):
+        set_theme(theme)
+    widget.setStyleSheet(_THEME_STYLESHEETS[theme])
+
+
+def _dispose(widgets: Iterable[QWidget]) -> None:
+    """Delete widgets together with their top-level windows.
+
+    Args:
+        widgets: The widgets to delete.
+    """
+    for widget in widgets:
+        window = widget.window()
+        window.close()
+        window.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    gc.collect()
+
+
+def _elapsed_us(start_ns: int) -> float:
+    """Return the microseconds elapsed since a perf_counter_ns() value.
+
+    Args:
+        start_ns: The start time in nanoseconds.
+
+    Returns:
+        The elapsed time in microseconds.
+    """
+    return (time.perf_counter_ns() - start_ns) / 1000
+
+
+def _measure_memory(factory: WidgetFactory, instances: int) -> dict[str, float | None]:
+    """Measure the memory held by live instances.
+
+    Args:
+        factory: The widget factory.
+        instances: The number of instances to keep alive.
+
+    Returns:
+        ``python_bytes`` and ``rss_bytes`` per instance; ``rss_bytes`` is
+        None where the resident set size is unavailable.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        python_before = tracemalloc.get_traced_memory()[0]
+        rss_before = _rss_bytes()
+        widgets = [factory() for _ in range(instances)]
+        for widget in widgets:
+            widget.ensurePolished()
+        python_after = tracemalloc.get_traced_memory()[0]
+        rss_after = _rss_bytes()
+    finally:
+        tracemalloc.stop()
+    _dispose(widgets)
+
+    rss_bytes: float | None = None
+    if rss_before is not None and rss_after is not None:
+        rss_bytes = round(max(0, rss_after - rss_before) / instances)
+    return {
+        "python_bytes": round(max(0, python_after - python_before) / instances),
+        "rss_bytes": rss_bytes,
+    }
+
+
+def benchmark_widget(
+    factory: WidgetFactory, *, instances: int = 30, repeats: int = 30
+) -> dict[str, Any]:
+    """Benchmark one widget scenario.
+
+    A QApplication must exist (run_benchmarks() creates one).
+
+    Args:
+        factory: Builds one widget instance.
+        instances: Instances built for the construction, first paint and
+            memory measurements (default: 30).
+        repeats: Renders timed for the repaint and theme switch
+            measurements (default: 30).
+
+    Returns:
+        A summary per timing metric (see summarize()) and a ``memory``
+        entry, in microseconds and bytes.
+
+    Raises:
+        ValueError: If instances or repeats is lower than 1.
+    """
+    if instances < 1 or repeats < 1:
+        raise ValueError("instances and repeats must be at least 1")
+
+    # Warm-up: first-use costs (module state, icon cache, style) are not
+    # part of any per-instance metric
+    warmup = factory()
+    _prepare(warmup)
+    warmup.grab()
+    _dispose([warmup])
+
+    construct: list[float] = []
+    widgets: list[QWidget] = []
+    for _ in range(instances):
+        start = time.perf_counter_ns()
+        widgets.append(factory())
+        construct.append(_elapsed_us(start))
+    _dispose(widgets)
+
+    first_paint: list[float] = []
+    widgets = []
+    for _ in range(instances):
+        widget = factory()
+        _prepare(widget)
+        start = time.perf_counter_ns()
+        widget.grab()
+        first_paint.append(_elapsed_us(start))
+        widgets.append(widget)
+    _dispose(widgets)
+
+    widget = factory()
+    _prepare(widget)
+    widget.grab()
+    repaint: list[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        widget.grab()
+        repaint.append(_elapsed_us(start))
+
+    theme_switch: list[float] = []
+    for index in range(repeats):
+        start = time.perf_counter_ns()
+        _apply_theme(widget, _THEMES[index % 2])
+        widget.grab()
+        theme_switch.append(_elapsed_us(start))
+    _dispose([widget])
+
+    return {
+        "construct": summarize(construct),
+        "first_paint": summarize(first_paint),
+        "repaint": summarize(repaint),
+        "theme_switch": summarize(theme_switch),
+        "memory": _measure_memory(factory, instances),
+    }
+
+
+def run_benchmarks(
+    widgets: Iterable[str] | None = None,
+    *,
+    instances: int = 30,
+    repeats: int = 30,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Benchmark widget scenarios and build a report.
+
+    Creates an offscreen QApplication when none is running.
+
+    Args:
+        widgets: Widget class names to benchmark (default: every scenario).
+        instances: Instances per construction, first paint and memory
+            measurement (default: 30).
+        repeats: Renders per repaint and theme switch measurement
+            (default: 30).
+        progress: Called with each widget name before it is benchmarked
+            (default: None).
+
+    Returns:
+        The report (see ``ezqt_widgets.benchmark._report``).
+
+    Raises:
+        ValueError: If a widget name has no scenario.
+    """
+    names = sorted(SCENARIOS) if widgets is None else list(widgets)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"No benchmark scenario for: {', '.join(unknown)}")
+
+    app = _ensure_application()
+    results: dict[str, Any] = {}
+    for name in names:
+        if progress is not None:
+            progress(name)
+        results[name] = benchmark_widget(
+            SCENARIOS[name], instances=instances, repeats=repeats
+        )
+
+    return {
+        "schema": REPORT_SCHEMA,
+        "environment": {
+            "ezqt_widgets": __version__,
+            "pyside6": PySide6.__version__,
+            "qt": qVersion(),
+            "qpa_platform": app.platformName(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        },
+        "config": {"instances": instances, "repeats": repeats},
+        "widgets": results,
+    }
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["benchmark_widget", "run_benchmarks"]
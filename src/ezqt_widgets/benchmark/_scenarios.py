@@ -0,0 +1,157 @@
+# ///////////////////////////////////////////////////////////////
+# SCENARIOS - Widget Benchmark Scenarios
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Widget benchmark scenarios.
+
+One factory per exported widget, building an instance with representative
+content (a few items, a title, an icon) rather than an empty default.
+Icons are built-in icons, never URLs, so no scenario touches the network.
+Every exported QWidget subclass must have a scenario; the tests enforce it.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import weakref
+from collections.abc import Callable
+
+# Third-party imports
+from PySide6.QtWidgets import QLabel, QWidget
+
+# Local imports
+from ..widgets.button import DateButton, DatePickerDialog, IconButton, LoaderButton
+from ..widgets.input import (
+    AutoCompleteInput,
+    FilePickerInput,
+    PasswordInput,
+    SearchInput,
+    SpinBoxInput,
+    TabReplaceTextEdit,
+)
+from ..widgets.label import (
+    ClickableTagLabel,
+    FramedLabel,
+    HoverLabel,
+    IndicatorGrid,
+    IndicatorLabel,
+    TagCloud,
+)
+from ..widgets.misc import (
+    Accordion,
+    CircularTimer,
+    CollapsibleSection,
+    DraggableItem,
+    DraggableList,
+    NotificationBanner,
+    OptionSelector,
+    ToggleIcon,
+    ToggleSwitch,
+)
+from ..widgets.shared import get_builtin_icon
+
+# ///////////////////////////////////////////////////////////////
+# TYPES
+# ///////////////////////////////////////////////////////////////
+
+WidgetFactory = Callable[[], QWidget]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Overlay widgets mapped to the host widget that must outlive them
+_HOSTS: weakref.WeakKeyDictionary[QWidget, QWidget] = weakref.WeakKeyDictionary()
+
+_WORDS: list[str] = [
+    "alpha",
+    "bravo",
+    "charlie",
+    "delta",
+    "echo",
+    "foxtrot",
+    "golf",
+    "hotel",
+]
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _accordion() -> QWidget:
+    """Build an accordion with three sections, the first one expanded."""
+    accordion = Accordion(exclusive=True)
+    for index, word in enumerate(_WORDS[:3]):
+        accordion.addSection(word.title(), QLabel(word), expanded=index == 0)
+    return accordion
+
+
+def _collapsible_section() -> QWidget:
+    """Build an expanded collapsible section with a label as content."""
+    section = CollapsibleSection(title="Section")
+    section.setContentWidget(QLabel("Content"))
+    return section
+
+
+def _notification_banner() -> QWidget:
+    """Build a notification banner on its own host widget."""
+    host = QWidget()
+    host.resize(400, 300)
+    banner = NotificationBanner(host)
+    # The banner is an overlay and needs a parent: keep the host wrapper
+    # alive for as long as the banner is referenced
+    _HOSTS[banner] = host
+    return banner
+
+
+def _tab_replace_text_edit() -> QWidget:
+    """Build a text edit holding a few lines of text."""
+    editor = TabReplaceTextEdit()
+    editor.setPlainText("\n".join(_WORDS))
+    return editor
+
+
+# Widget class name -> factory
+SCENARIOS: dict[str, WidgetFactory] = {
+    "Accordion": _accordion,
+    "AutoCompleteInput": lambda: AutoCompleteInput(suggestions=list(_WORDS)),
+    "CircularTimer": lambda: CircularTimer(duration=5000),
+    "ClickableTagLabel": lambda: ClickableTagLabel(name="python"),
+    "CollapsibleSection": _collapsible_section,
+    "DateButton": DateButton,
+    "DatePickerDialog": DatePickerDialog,
+    "DraggableItem": lambda: DraggableItem(
+        item_id="item", text="Item", icon=get_builtin_icon("close")
+    ),
+    "DraggableList": lambda: DraggableList(
+        items=_WORDS[:5], icon=get_builtin_icon("close")
+    ),
+    "FilePickerInput": FilePickerInput,
+    "FramedLabel": lambda: FramedLabel("Framed"),
+    "HoverLabel": lambda: HoverLabel(icon=get_builtin_icon("info"), text="Hover"),
+    "IconButton": lambda: IconButton(icon=get_builtin_icon("info"), text="Button"),
+    "IndicatorGrid": lambda: IndicatorGrid(count=16, columns=8),
+    "IndicatorLabel": IndicatorLabel,
+    "LoaderButton": lambda: LoaderButton(text="Load"),
+    "NotificationBanner": _notification_banner,
+    "OptionSelector": lambda: OptionSelector(items=_WORDS[:3]),
+    "PasswordInput": PasswordInput,
+    "SearchInput": SearchInput,
+    "SpinBoxInput": lambda: SpinBoxInput(value=50),
+    "TabReplaceTextEdit": _tab_replace_text_edit,
+    "TagCloud": lambda: TagCloud(tags=_WORDS, selected=_WORDS[:2]),
+    "ToggleIcon": ToggleIcon,
+    "ToggleSwitch": ToggleSwitch,
+}
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["SCENARIOS", "WidgetFactory"]
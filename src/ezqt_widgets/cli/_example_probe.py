@@ -0,0 +1,150 @@
+# ///////////////////////////////////////////////////////////////
+# EXAMPLE_PROBE - Isolated Example Bootstrap
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Bootstrap for running one example script in its own process.
+
+Used by ``ezqt-widgets demo run --isolated``::
+
+    python -m ezqt_widgets.cli._example_probe EXAMPLE REPORT LAUNCHED \\
+        QUIT_AFTER TIMEOUT
+
+Before running the example, QApplication is replaced by a subclass that
+watches the widgets: the first window shown gives the startup time, and
+the end of the first paint cycle gives the first-paint time,
+both in milliseconds since LAUNCHED (a ``time.time()`` value taken by the
+parent before starting the process). The application quits QUIT_AFTER
+milliseconds after the first paint, or TIMEOUT milliseconds after it was
+created if nothing is painted. The timings are written to REPORT as JSON.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import json
+import runpy
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Third-party imports
+from PySide6 import QtWidgets
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class _WindowProbe(QObject):
+    """Record when the first window is shown and the first frame painted.
+
+    Args:
+        launched: The process launch time (``time.time()``).
+        quit_after: Milliseconds to keep running after the first paint.
+    """
+
+    def __init__(self, launched: float, quit_after: int) -> None:
+        """Initialize the probe."""
+        super().__init__()
+        self.launched: float = launched
+        self.quit_after: int = quit_after
+        self.timings: dict[str, float] = {}
+        self._paint_seen: bool = False
+
+    def _elapsed_ms(self) -> float:
+        """Return the milliseconds elapsed since the process launch."""
+        return round((time.time() - self.launched) * 1000, 1)
+
+    def _record_first_paint(self) -> None:
+        """Record the first-paint time and schedule the application exit."""
+        self.timings["first_paint_ms"] = self._elapsed_ms()
+        QTimer.singleShot(self.quit_after, QtWidgets.QApplication.quit)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Record the first window shown and the first widget painted.
+
+        Args:
+            watched: The object receiving the event.
+            event: The event.
+
+        Returns:
+            False, so that the event is always delivered.
+        """
+        kind = event.type()
+        if kind not in (QEvent.Type.Show, QEvent.Type.Paint):
+            return False
+        if not isinstance(watched, QtWidgets.QWidget):
+            return False
+        if kind == QEvent.Type.Show:
+            if watched.isWindow():
+                self.timings.setdefault("startup_ms", self._elapsed_ms())
+        elif not self._paint_seen:
+            # A window covered by opaque children gets no paint event of its
+            # own, so any widget paint marks the first frame
+            self._paint_seen = True
+            # Queued: runs once the whole window has been painted
+            QTimer.singleShot(0, self._record_first_paint)
+        return False
+
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _install_probe(probe: _WindowProbe, timeout: int) -> None:
+    """Make every QApplication created from now on use the probe.
+
+    Args:
+        probe: The window probe.
+        timeout: Milliseconds after which the application quits anyway.
+    """
+
+    class _ProbedApplication(QtWidgets.QApplication):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            """Install the probe on the new application."""
+            super().__init__(*args, **kwargs)
+            self.installEventFilter(probe)
+            QTimer.singleShot(timeout, self.quit)
+
+    _ProbedApplication.__name__ = QtWidgets.QApplication.__name__
+    # Type checkers reject rebinding QtWidgets.QApplication to a subclass
+    vars(QtWidgets)["QApplication"] = _ProbedApplication
+
+
+def main(argv: list[str]) -> int:
+    """Run one example with the probe and write its timings.
+
+    Args:
+        argv: EXAMPLE, REPORT, LAUNCHED, QUIT_AFTER and TIMEOUT.
+
+    Returns:
+        The example's exit code.
+    """
+    example, report = Path(argv[0]), Path(argv[1])
+    launched, quit_after, timeout = float(argv[2]), int(argv[3]), int(argv[4])
+
+    probe = _WindowProbe(launched, quit_after)
+    _install_probe(probe, timeout)
+
+    sys.argv = [str(example)]
+    sys.path.insert(0, str(example.parent))
+    exit_code = 0
+    try:
+        runpy.run_path(str(example), run_name="__main__")
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    finally:
+        report.write_text(json.dumps(probe.timings), encoding="utf-8")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,144 @@
+# ///////////////////////////////////////////////////////////////
+# CLI_LAZY_GROUP - Lazily Loaded Click Group
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Lazily loaded Click command group.
+
+Commands are registered by import path and short help text, and their
+modules are only imported when the command is dispatched. ``--help`` is
+rendered from the registered help text, so listing the commands imports
+none of them (and therefore neither Qt nor the widget package).
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import importlib
+from typing import Any
+
+# Third-party imports
+import click
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class LazyGroup(click.Group):
+    """Click group importing its commands on first use.
+
+    Args:
+        *args: Positional arguments forwarded to ``click.Group``.
+        lazy_commands: Command name to ``(import path, short help)``, where
+            the import path has the form ``"package.module:attribute"``.
+        **kwargs: Keyword arguments forwarded to ``click.Group``.
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: dict[str, tuple[str, str]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the group."""
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, tuple[str, str]] = dict(lazy_commands or {})
+
+    # ------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------
+
+    def _load_command(self, name: str) -> click.Command:
+        """Import a registered command and cache it on the group.
+
+        Args:
+            name: The command name.
+
+        Returns:
+            The imported command.
+
+        Raises:
+            TypeError: If the import path does not point to a click command.
+        """
+        import_path, _help = self.lazy_commands[name]
+        module_name, attribute = import_path.split(":", 1)
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{import_path} is not a click command")
+        self.add_command(command, name)
+        return command
+
+    # ///////////////////////////////////////////////////////////////
+    # CLICK OVERRIDES
+    # ///////////////////////////////////////////////////////////////
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List loaded and registered command names.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            Sorted command names.
+        """
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a command, importing it if it is registered lazily.
+
+        Args:
+            ctx: The click context.
+            cmd_name: The command name.
+
+        Returns:
+            The command, or None if it is unknown.
+        """
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load_command(cmd_name)
+        return command
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """Write the command list without importing lazy commands.
+
+        Args:
+            ctx: The click context.
+            formatter: The help formatter.
+        """
+        entries: list[tuple[str, click.Command]] = []
+        for name in self.list_commands(ctx):
+            command = self.commands.get(name)
+            if command is not None:
+                if not command.hidden:
+                    entries.append((name, command))
+            else:
+                # A bare command shortens the registered help the same way
+                # the imported command will shorten its own
+                help_text = self.lazy_commands[name][1]
+                entries.append((name, click.Command(name, help=help_text)))
+        if not entries:
+            return
+
+        # Same layout as click.Group.format_commands
+        limit = formatter.width - 6 - max(len(name) for name, _ in entries)
+        rows = [(name, command.get_short_help_str(limit)) for name, command in entries]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["LazyGroup"]
@@ -6,7 +6,9 @@
 """
 CLI Commands module for EzQt-Widgets.
 
-This module contains all CLI command implementations.
+This module contains all CLI command implementations. Commands are
+exported lazily so that importing one command module does not import the
+others.
 """
 
 from __future__ import annotations
@@ -14,19 +16,47 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
+# Standard library imports
+from typing import TYPE_CHECKING
+
 # Local imports
-from ._demo import demo_group
-from ._docs import docs_command
-from ._info import info_command
-from ._version import version_command
+from ..._lazy import attach
+
+if TYPE_CHECKING:
+    from ._bench import bench_group
+    from ._demo import demo_group
+    from ._docs import docs_command
+    from ._icons import icons_group
+    from ._info import info_command
+    from ._snapshot import snapshot_command
+    from ._version import version_command
+
+# ///////////////////////////////////////////////////////////////
+# LAZY EXPORTS
+# ///////////////////////////////////////////////////////////////
+
+_EXPORTS: dict[str, str] = {
+    "bench_group": "._bench",
+    "demo_group": "._demo",
+    "docs_command": "._docs",
+    "icons_group": "._icons",
+    "info_command": "._info",
+    "snapshot_command": "._snapshot",
+    "version_command": "._version",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
 # ///////////////////////////////////////////////////////////////
 
 __all__ = [
+    "bench_group",
     "demo_group",
     "docs_command",
+    "icons_group",
     "info_command",
+    "snapshot_command",
     "version_command",
 ]
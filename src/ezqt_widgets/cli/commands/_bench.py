@@ -0,0 +1,280 @@
+# ///////////////////////////////////////////////////////////////
+# EZQT_WIDGETS - CLI Bench Command
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+CLI commands for running the widget benchmarks.
+
+This module provides the bench command group for EzQt-Widgets. It runs the
+``ezqt_widgets.benchmark`` scenarios offscreen, so performance issues can
+be reproduced on a target machine without the development test toolchain.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+from pathlib import Path
+from typing import Any
+
+# Third-party imports
+import click
+
+# Local imports
+from .._console import console
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_PROFILE_TOP: int = 20
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _format_change(current: float | None, baseline: float | None) -> str:
+    """Format the relative change of a value against its baseline.
+
+    Args:
+        current: The current value.
+        baseline: The baseline value.
+
+    Returns:
+        A signed percentage, or an empty string if it cannot be computed.
+    """
+    if current is None or not baseline:
+        return ""
+    return f"{(current / baseline - 1) * 100:+.1f}%"
+
+
+def _print_report(
+    report: dict[str, Any],
+    baseline: dict[str, Any] | None,
+    regressed: set[tuple[str, str]],
+) -> None:
+    """Print the timing and memory tables of a report.
+
+    Args:
+        report: The benchmark report.
+        baseline: The baseline report, if any.
+        regressed: The (widget, metric) pairs that regressed.
+    """
+    from rich.table import Table
+
+    from ...benchmark import TIMING_METRICS
+
+    reference_widgets = (baseline or {}).get("widgets", {})
+
+    timings = Table(
+        title="Widget benchmarks (µs per operation)",
+        show_header=True,
+        header_style="bold blue",
+    )
+    timings.add_column("Widget", style="cyan")
+    timings.add_column("Metric")
+    for column in ("p50", "p90", "p99", "max"):
+        timings.add_column(column, justify="right", style="green")
+    if baseline is not None:
+        timings.add_column("Baseline p50", justify="right", style="dim")
+        timings.add_column("Change", justify="right")
+
+    memory = Table(
+        title="Memory per instance (bytes)", show_header=True, header_style="bold blue"
+    )
+    memory.add_column("Widget", style="cyan")
+    memory.add_column("Python heap", justify="right", style="green")
+    memory.add_column("RSS", justify="right", style="green")
+    if baseline is not None:
+        memory.add_column("Baseline heap", justify="right", style="dim")
+        memory.add_column("Change", justify="right")
+
+    for widget, metrics in report["widgets"].items():
+        reference = reference_widgets.get(widget, {})
+        for index, metric in enumerate(TIMING_METRICS):
+            summary = metrics[metric]
+            row = [
+                widget if index == 0 else "",
+                metric,
+                *(f"{summary[key]:.1f}" for key in ("p50", "p90", "p99", "max")),
+            ]
+            if baseline is not None:
+                reference_p50 = reference.get(metric, {}).get("p50")
+                change = _format_change(summary["p50"], reference_p50)
+                if (widget, metric) in regressed:
+                    change = f"[bold red]{change}[/bold red]"
+                row += ["" if reference_p50 is None else f"{reference_p50:.1f}", change]
+            timings.add_row(*row, end_section=index == len(TIMING_METRICS) - 1)
+
+        heap = metrics["memory"]["python_bytes"]
+        rss = metrics["memory"]["rss_bytes"]
+        row = [widget, f"{heap:,}", "n/a" if rss is None else f"{rss:,}"]
+        if baseline is not None:
+            reference_heap = reference.get("memory", {}).get("python_bytes")
+            change = _format_change(heap, reference_heap)
+            if (widget, "memory.python_bytes") in regressed:
+                change = f"[bold red]{change}[/bold red]"
+            row += ["" if reference_heap is None else f"{reference_heap:,}", change]
+        memory.add_row(*row)
+
+    console.print(timings)
+    console.print(memory)
+
+
+# ///////////////////////////////////////////////////////////////
+# COMMANDS
+# ///////////////////////////////////////////////////////////////
+
+
+@click.group(name="bench", help="Run the widget benchmarks")
+def bench_group() -> None:
+    """Bench command group."""
+
+
+@bench_group.command(name="run", help="Benchmark widgets offscreen")
+@click.argument("widgets", nargs=-1)
+@click.option(
+    "--instances",
+    "-n",
+    type=click.IntRange(min=1),
+    default=30,
+    show_default=True,
+    help="Instances per construction, first paint and memory measurement",
+)
+@click.option(
+    "--repeats",
+    "-r",
+    type=click.IntRange(min=1),
+    default=30,
+    show_default=True,
+    help="Renders per repaint and theme switch measurement",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the JSON report to this file",
+)
+@click.option(
+    "--compare",
+    "-c",
+    "baseline_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Baseline JSON report to compare against (exit code 1 on regression)",
+)
+@click.option(
+    "--tolerance",
+    "-t",
+    type=click.FloatRange(min=1.0),
+    default=1.5,
+    show_default=True,
+    help="Allowed ratio against the baseline before a metric regresses",
+)
+@click.option(
+    "--profile",
+    "-p",
+    "profile_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Run under cProfile and dump the pstats data to this file",
+)
+def run_command(
+    widgets: tuple[str, ...],
+    instances: int,
+    repeats: int,
+    output: Path | None,
+    baseline_path: Path | None,
+    tolerance: float,
+    profile_path: Path | None,
+) -> None:
+    """Benchmark the given widgets (default: all of them)."""
+    # Must be set before the QApplication is created
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from ...benchmark import (
+        compare_reports,
+        load_report,
+        run_benchmarks,
+        save_report,
+    )
+
+    try:
+        baseline = load_report(baseline_path) if baseline_path else None
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
+
+    with console.status("Benchmarking...") as status:
+
+        def progress(name: str) -> None:
+            status.update(f"Benchmarking [cyan]{name}[/cyan]...")
+
+        def run() -> dict[str, Any]:
+            return run_benchmarks(
+                widgets or None,
+                instances=instances,
+                repeats=repeats,
+                progress=progress,
+            )
+
+        try:
+            if profile_path is None:
+                report = run()
+            else:
+                import cProfile
+
+                profiler = cProfile.Profile()
+                report = profiler.runcall(run)
+                profile_path.parent.mkdir(parents=True, exist_ok=True)
+                profiler.dump_stats(profile_path)
+        except ValueError as e:
+            raise click.ClickException(str(e)) from e
+
+    regressions = (
+        compare_reports(report, baseline, tolerance=tolerance)
+        if baseline is not None
+        else []
+    )
+    _print_report(
+        report, baseline, {(item.widget, item.metric) for item in regressions}
+    )
+
+    if output is not None:
+        try:
+            save_report(report, output)
+        except OSError as e:
+            raise click.ClickException(str(e)) from e
+        console.print(f"[bold green]Report written:[/bold green] {output}")
+
+    if profile_path is not None:
+        import pstats
+
+        console.print(
+            f"[bold green]Profile written:[/bold green] {profile_path} "
+            f"(timings above include the profiler overhead)"
+        )
+        stats = pstats.Stats(str(profile_path)).strip_dirs()
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(_PROFILE_TOP)
+
+    if regressions:
+        console.print(
+            f"[bold red]{len(regressions)} regression(s)[/bold red] "
+            f"against {baseline_path} (tolerance x{tolerance:g})"
+        )
+        raise SystemExit(1)
+    if baseline is not None:
+        console.print(f"[bold green]No regression[/bold green] against {baseline_path}")
+
+
+@bench_group.command(name="list", help="List the benchmarked widgets")
+def list_command() -> None:
+    """List the widgets that have a benchmark scenario."""
+    from ...benchmark import SCENARIOS
+
+    for name in sorted(SCENARIOS):
+        click.echo(name)
@@ -5,6 +5,10 @@
 
 """
 CLI commands for running and listing demo examples.
+
+Examples run in-process by default. ``demo run --isolated`` runs each
+example in its own offscreen subprocess instead, in parallel, and reports
+its startup and first-paint times.
 """
 
 from __future__ import annotations
@@ -13,19 +17,64 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
+import json
 import os
 import runpy
+import subprocess
 import sys
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 # Third-party imports
 import click
 
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Category examples, in the order they run
+_CATEGORY_EXAMPLES: dict[str, str] = {
+    "buttons": "_button",
+    "inputs": "_input",
+    "labels": "_label",
+    "misc": "_misc",
+}
+
+_PROBE_MODULE: str = "ezqt_widgets.cli._example_probe"
+
+# Seconds an isolated example may take beyond its own timeout before it is killed
+_KILL_GRACE: float = 10.0
+
 # ///////////////////////////////////////////////////////////////
 # CLASSES
 # ///////////////////////////////////////////////////////////////
 
 
+class ExampleTiming(NamedTuple):
+    """The outcome of an example run in its own process.
+
+    Attributes:
+        name: The example name.
+        exit_code: The process exit code, or None if it was killed.
+        startup_ms: Milliseconds from launch to the first window shown.
+        first_paint_ms: Milliseconds from launch to the first frame
+            painted.
+        duration_ms: Milliseconds from launch to process exit.
+        error: Why the run failed, or None on success.
+    """
+
+    name: str
+    exit_code: int | None
+    startup_ms: float | None
+    first_paint_ms: float | None
+    duration_ms: float
+    error: str | None
+
+
 class ExampleRunner:
     """Handles running EzQt Widgets examples.
 
@@ -117,6 +166,85 @@ class ExampleRunner:
             sys.argv = original_argv
             sys.path = original_sys_path
 
+    def _execute_isolated(
+        self, example_path: Path, quit_after: float, timeout: float
+    ) -> ExampleTiming:
+        """Execute an example in its own offscreen process.
+
+        Args:
+            example_path: Path to the example file to execute.
+            quit_after: Seconds the example keeps running after its first
+                frame.
+            timeout: Seconds after which an example that paints nothing
+                quits.
+
+        Returns:
+            The timings and outcome of the run.
+        """
+        # Makes this package importable from the child whether or not it
+        # is installed
+        package_root = str(Path(__file__).resolve().parents[3])
+        python_path = os.environ.get("PYTHONPATH")
+        env = {
+            **os.environ,
+            "QT_QPA_PLATFORM": "offscreen",
+            "PYTHONPATH": os.pathsep.join(filter(None, [package_root, python_path])),
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report = Path(tmp_dir) / "timings.json"
+            launched = time.time()
+            start = time.perf_counter()
+            try:
+                completed = subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        _PROBE_MODULE,
+                        str(example_path),
+                        str(report),
+                        repr(launched),
+                        str(round(quit_after * 1000)),
+                        str(round(timeout * 1000)),
+                    ],
+                    cwd=example_path.parent,
+                    env=env,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout + _KILL_GRACE,
+                )
+                exit_code: int | None = completed.returncode
+                stderr = completed.stderr
+            except subprocess.TimeoutExpired:
+                exit_code, stderr = None, ""
+            duration_ms = round((time.perf_counter() - start) * 1000, 1)
+            timings = (
+                json.loads(report.read_text(encoding="utf-8"))
+                if report.exists()
+                else {}
+            )
+
+        if self.verbose and stderr:
+            click.echo(stderr, err=True)
+
+        error: str | None = None
+        if exit_code is None:
+            error = "killed after timeout"
+        elif exit_code != 0:
+            lines = stderr.strip().splitlines()
+            error = f"exit {exit_code}" + (f": {lines[-1]}" if lines else "")
+        elif "first_paint_ms" not in timings:
+            error = "no frame painted before timeout"
+
+        return ExampleTiming(
+            name=example_path.stem,
+            exit_code=exit_code,
+            startup_ms=timings.get("startup_ms"),
+            first_paint_ms=timings.get("first_paint_ms"),
+            duration_ms=duration_ms,
+            error=error,
+        )
+
     # ///////////////////////////////////////////////////////////////
     # PUBLIC METHODS
     # ///////////////////////////////////////////////////////////////
@@ -132,14 +260,15 @@ class ExampleRunner:
             examples.extend(self.examples_dir.glob(pattern))
         return sorted(examples)
 
-    def run_example(self, example_name: str) -> bool:
-        """Run a specific example by name.
+    def find_example(self, example_name: str) -> Path | None:
+        """Find an example file by name.
 
         Args:
-            example_name: Name of the example to run (without .py extension).
+            example_name: Name of the example, with or without the leading
+                underscore and .py extension.
 
         Returns:
-            True if execution was successful, False otherwise.
+            The example path, or None if there is no such example.
         """
         normalized_name = example_name.removesuffix(".py")
         candidates = (
@@ -151,7 +280,21 @@ class ExampleRunner:
         for candidate in candidates:
             example_path = self.examples_dir / f"{candidate}.py"
             if example_path.exists():
-                return self._execute_example(example_path)
+                return example_path
+        return None
+
+    def run_example(self, example_name: str) -> bool:
+        """Run a specific example by name.
+
+        Args:
+            example_name: Name of the example to run (without .py extension).
+
+        Returns:
+            True if execution was successful, False otherwise.
+        """
+        example_path = self.find_example(example_name)
+        if example_path is not None:
+            return self._execute_example(example_path)
 
         click.echo(f"❌ Example not found: {example_name}")
         return False
@@ -174,12 +317,7 @@ class ExampleRunner:
             use_gui_launcher = False
 
         # Run each example sequentially
-        examples = [
-            "_button",
-            "_input",
-            "_label",
-            "_misc",
-        ]
+        examples = list(_CATEGORY_EXAMPLES.values())
         success_count = 0
 
         for example in examples:
@@ -195,6 +333,51 @@ class ExampleRunner:
         click.echo(f"\n✅ Successfully ran {success_count}/{len(examples)} examples")
         return success_count == len(examples)
 
+    def run_isolated(
+        self,
+        example_names: Sequence[str],
+        *,
+        workers: int | None = None,
+        quit_after: float = 1.0,
+        timeout: float = 60.0,
+        progress: Callable[[ExampleTiming], None] | None = None,
+    ) -> list[ExampleTiming]:
+        """Run examples in parallel, each in its own offscreen process.
+
+        Each process quits quit_after seconds after its first frame, so
+        the runs need no display and no user interaction.
+
+        Args:
+            example_names: Names of the examples to run.
+            workers: Examples run at once (default: the CPU count).
+            quit_after: Seconds each example keeps running after its first
+                frame (default: 1.0).
+            timeout: Seconds after which an example that paints nothing
+                quits (default: 60.0).
+            progress: Called with each result as it completes.
+
+        Returns:
+            One result per example, in the given order.
+
+        Raises:
+            FileNotFoundError: If an example does not exist.
+        """
+        paths: list[Path] = []
+        for name in example_names:
+            path = self.find_example(name)
+            if path is None:
+                raise FileNotFoundError(f"Example not found: {name}")
+            paths.append(path)
+
+        def run(path: Path) -> ExampleTiming:
+            result = self._execute_isolated(path, quit_after, timeout)
+            if progress is not None:
+                progress(result)
+            return result
+
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            return list(pool.map(run, paths))
+
     def list_examples(self) -> None:
         """List all available examples."""
         examples = self.get_available_examples()
@@ -230,19 +413,12 @@ def run_example_by_category(category: str, verbose: bool = False) -> bool:
     """
     runner = ExampleRunner(verbose)
 
-    category_mapping = {
-        "buttons": "_button",
-        "inputs": "_input",
-        "labels": "_label",
-        "misc": "_misc",
-    }
-
-    if category not in category_mapping:
+    if category not in _CATEGORY_EXAMPLES:
         click.echo(f"❌ Unknown category: {category}")
-        click.echo(f"Available categories: {', '.join(category_mapping.keys())}")
+        click.echo(f"Available categories: {', '.join(_CATEGORY_EXAMPLES.keys())}")
         return False
 
-    return runner.run_example(category_mapping[category])
+    return runner.run_example(_CATEGORY_EXAMPLES[category])
 
 
 def run_all_examples(use_gui: bool = True, verbose: bool = False) -> bool:
@@ -259,6 +435,65 @@ def run_all_examples(use_gui: bool = True, verbose: bool = False) -> bool:
     return runner.run_all_examples(use_gui)
 
 
+def _format_ms(value: float | None) -> str:
+    """Format a timing for the isolated run report.
+
+    Args:
+        value: Milliseconds, or None.
+
+    Returns:
+        The right-aligned timing.
+    """
+    return f"{'n/a' if value is None else f'{value:.0f}':>6} ms"
+
+
+def run_examples_isolated(
+    categories: Sequence[str],
+    *,
+    workers: int | None = None,
+    quit_after: float = 1.0,
+    timeout: float = 60.0,
+    verbose: bool = False,
+) -> bool:
+    """Run category examples in isolated offscreen processes.
+
+    Args:
+        categories: Category names (buttons, inputs, labels, misc).
+        workers: Examples run at once (default: the CPU count).
+        quit_after: Seconds each example keeps running after its first
+            frame (default: 1.0).
+        timeout: Seconds after which an example that paints nothing quits
+            (default: 60.0).
+        verbose: Whether to print the examples' error output (default:
+            False).
+
+    Returns:
+        True if every example ran and painted, False otherwise.
+    """
+    runner = ExampleRunner(verbose)
+
+    def report(result: ExampleTiming) -> None:
+        if result.error is None:
+            click.echo(
+                f"✅ {result.name:<10} startup {_format_ms(result.startup_ms)}"
+                f"   first paint {_format_ms(result.first_paint_ms)}"
+                f"   total {result.duration_ms / 1000:.1f} s"
+            )
+        else:
+            click.echo(f"❌ {result.name:<10} {result.error}")
+
+    results = runner.run_isolated(
+        [_CATEGORY_EXAMPLES[category] for category in categories],
+        workers=workers,
+        quit_after=quit_after,
+        timeout=timeout,
+        progress=report,
+    )
+    success_count = sum(result.error is None for result in results)
+    click.echo(f"\n✅ Successfully ran {success_count}/{len(results)} examples")
+    return success_count == len(results)
+
+
 def list_available_examples() -> None:
     """List all available examples."""
     runner = ExampleRunner()
@@ -303,6 +538,32 @@ def demo_group() -> None:
     is_flag=True,
     help="Run misc examples (CircularTimer, DraggableList, OptionSelector, ToggleIcon, ToggleSwitch)",
 )
+@click.option(
+    "--isolated",
+    is_flag=True,
+    help="Run each selected example in its own offscreen process, in parallel",
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Examples run at once with --isolated (default: the CPU count)",
+)
+@click.option(
+    "--quit-after",
+    type=click.FloatRange(min=0),
+    default=1.0,
+    show_default=True,
+    help="Seconds an isolated example keeps running after its first frame",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=60.0,
+    show_default=True,
+    help="Seconds after which an isolated example that paints nothing quits",
+)
 @click.option(
     "--verbose", "-v", is_flag=True, help="Verbose output with detailed information"
 )
@@ -312,6 +573,10 @@ def run_command(
     inputs: bool,
     labels: bool,
     misc: bool,
+    isolated: bool,
+    workers: int | None,
+    quit_after: float,
+    timeout: float,
     verbose: bool,
 ) -> None:
     """Run EzQt Widgets examples."""
@@ -325,6 +590,7 @@ def run_command(
         click.echo("  --inputs, -i     Run input examples")
         click.echo("  --labels, -l     Run label examples")
         click.echo("  --misc, -m       Run misc examples")
+        click.echo("  --isolated       Run them in parallel offscreen processes")
         click.echo("\n💡 Example: ezqt run --buttons")
         return
 
@@ -333,7 +599,26 @@ def run_command(
 
     success = True
 
-    if run_all:
+    if isolated:
+        selected = {
+            "buttons": buttons,
+            "inputs": inputs,
+            "labels": labels,
+            "misc": misc,
+        }
+        categories = [
+            category for category in _CATEGORY_EXAMPLES if run_all or selected[category]
+        ]
+        click.echo(f"🧪 Running {len(categories)} example(s) in isolated processes")
+        success = run_examples_isolated(
+            categories,
+            workers=workers,
+            quit_after=quit_after,
+            timeout=timeout,
+            verbose=verbose,
+        )
+
+    elif run_all:
         click.echo("🎯 Running all examples...")
         success = run_all_examples(use_gui=True, verbose=verbose)
 
@@ -0,0 +1,91 @@
+# ///////////////////////////////////////////////////////////////
+# EZQT_WIDGETS - CLI Icons Command
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+CLI commands for managing the prebuilt built-in icon bundle.
+
+This module provides the icons command group for EzQt-Widgets.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from pathlib import Path
+
+# Third-party imports
+import click
+
+# Local imports
+from .._console import console
+
+# ///////////////////////////////////////////////////////////////
+# COMMANDS
+# ///////////////////////////////////////////////////////////////
+
+
+@click.group(name="icons", help="Manage the prebuilt built-in icon bundle")
+def icons_group() -> None:
+    """Icons command group."""
+
+
+@icons_group.command(name="build", help="Pre-rasterize the built-in icons")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Bundle file (default: the location the library loads it from)",
+)
+@click.option(
+    "--size",
+    "-s",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    help="Icon size in logical pixels (repeatable, default: 16, 20, 24)",
+)
+@click.option(
+    "--dpr",
+    "-d",
+    "dprs",
+    type=click.FloatRange(min=0, min_open=True),
+    multiple=True,
+    help="Device pixel ratio (repeatable, default: 1, 2)",
+)
+@click.option(
+    "--color",
+    "-c",
+    "colors",
+    multiple=True,
+    help="Icon color, or 'none' for SVG colors (repeatable, default: none, white)",
+)
+def build_command(
+    output: Path | None,
+    sizes: tuple[int, ...],
+    dprs: tuple[float, ...],
+    colors: tuple[str, ...],
+) -> None:
+    """Build the icon bundle used instead of runtime SVG rendering."""
+    # Rendering needs Qt: imported here so other commands stay Qt-free
+    from ...widgets.shared import _icons
+
+    try:
+        path = _icons.build_icon_bundle(
+            output,
+            sizes or _icons.DEFAULT_BUNDLE_SIZES,
+            dprs or _icons.DEFAULT_BUNDLE_DPRS,
+            [None if color.lower() == "none" else color for color in colors]
+            or _icons.DEFAULT_BUNDLE_COLORS,
+        )
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
+
+    size_kib = path.stat().st_size / 1024
+    console.print(
+        f"[bold green]Icon bundle written:[/bold green] {path} ({size_kib:.0f} KiB)"
+    )
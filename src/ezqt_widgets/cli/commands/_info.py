@@ -30,6 +30,26 @@ import ezqt_widgets
 from .._console import console
 from ._demo import ExampleRunner
 
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _package_version(package: str) -> str:
+    """Return the installed version of a distribution.
+
+    Args:
+        package: The distribution name.
+
+    Returns:
+        The version string, or ``"unknown"`` if it is not installed.
+    """
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return "unknown"
+
+
 # ///////////////////////////////////////////////////////////////
 # COMMANDS
 # ///////////////////////////////////////////////////////////////
@@ -113,25 +133,17 @@ def info_command() -> None:
         )
         console.print(panel)
 
-        # Dependencies table
+        # Dependencies table (versions come from the installed metadata, so
+        # PySide6 is not imported just to read its version)
         try:
-            import PySide6
-            import rich
-
-            try:
-                click_version = version("click")
-            except PackageNotFoundError:
-                click_version = "unknown"
-
             deps_table = Table(
                 title="Dependencies", show_header=True, header_style="bold blue"
             )
             deps_table.add_column("Package", style="cyan")
             deps_table.add_column("Version", style="green")
 
-            deps_table.add_row("PySide6", getattr(PySide6, "__version__", "unknown"))
-            deps_table.add_row("rich", getattr(rich, "__version__", "unknown"))
-            deps_table.add_row("click", click_version)
+            for package in ("PySide6", "rich", "click"):
+                deps_table.add_row(package, _package_version(package))
 
             console.print("\n")
             console.print(deps_table)
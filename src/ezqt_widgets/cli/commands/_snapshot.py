@@ -0,0 +1,122 @@
+# ///////////////////////////////////////////////////////////////
+# EZQT_WIDGETS - CLI Snapshot Command
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+CLI command for rendering widget snapshots.
+
+This module provides the snapshot command for EzQt-Widgets. It renders the
+widget variants of a YAML spec offscreen to PNG files (see
+``ezqt_widgets.snapshot``), for visual regression checks and documentation
+screenshots.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+import time
+from pathlib import Path
+
+# Third-party imports
+import click
+
+# Local imports
+from .._console import console
+
+# ///////////////////////////////////////////////////////////////
+# COMMANDS
+# ///////////////////////////////////////////////////////////////
+
+
+@click.command(name="snapshot", help="Render widget snapshots from a YAML spec")
+@click.argument(
+    "spec_path",
+    metavar="SPEC",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("snapshots"),
+    show_default=True,
+    help="Directory the PNG files are written to",
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes (default: the CPU count; 1 renders in-process)",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=32,
+    show_default=True,
+    help="Maximum snapshots sent to a worker at once",
+)
+@click.option(
+    "--list",
+    "list_only",
+    is_flag=True,
+    help="List the snapshot names of the spec without rendering",
+)
+def snapshot_command(
+    spec_path: Path,
+    output: Path,
+    workers: int | None,
+    batch_size: int,
+    list_only: bool,
+) -> None:
+    """Render the snapshots of a spec."""
+    # Must be set before a QApplication is created
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from ...snapshot import load_spec, render_snapshots
+
+    try:
+        jobs = load_spec(spec_path)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
+
+    if list_only:
+        for job in jobs:
+            click.echo(job.name)
+        return
+
+    start = time.perf_counter()
+    with console.status(f"Rendering {len(jobs)} snapshot(s)...") as status:
+        done = 0
+
+        def progress(_result: object) -> None:
+            nonlocal done
+            done += 1
+            status.update(f"Rendering snapshots... {done}/{len(jobs)}")
+
+        try:
+            results = render_snapshots(
+                jobs,
+                output,
+                workers=workers,
+                batch_size=batch_size,
+                progress=progress,
+            )
+        except OSError as e:
+            raise click.ClickException(str(e)) from e
+    elapsed = time.perf_counter() - start
+
+    failures = [result for result in results if result.error is not None]
+    for result in failures:
+        console.print(f"❌ {result.name}: {result.error}", markup=False)
+    console.print(
+        f"[bold green]{len(results) - len(failures)} snapshot(s) written[/bold green] "
+        f"to {output} in {elapsed:.1f}s"
+    )
+    if failures:
+        console.print(f"[bold red]{len(failures)} snapshot(s) failed[/bold red]")
+        raise SystemExit(1)
@@ -6,7 +6,8 @@
 """
 CLI command for displaying version information.
 
-This module provides the version command for EzQt-Widgets.
+This module provides the version command for EzQt-Widgets. The plain
+output is written with click alone; rich is only imported for ``--full``.
 """
 
 from __future__ import annotations
@@ -16,14 +17,10 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Third-party imports
 import click
-from rich.panel import Panel
-from rich.text import Text
 
 # Local imports
 import ezqt_widgets
 
-from .._console import console
-
 # ///////////////////////////////////////////////////////////////
 # COMMANDS
 # ///////////////////////////////////////////////////////////////
@@ -40,7 +37,7 @@ def version_command(full: bool) -> None:
     """
     Display version information.
 
-    Show the current version of Ezpl.
+    Show the current version of EzQt Widgets.
     Use --full for detailed version information.
     """
     version = getattr(ezqt_widgets, "__version__", "unknown")
@@ -48,8 +45,13 @@ def version_command(full: bool) -> None:
 
     if full:
         # Full version info
+        from rich.panel import Panel
+        from rich.text import Text
+
+        from .._console import console
+
         text = Text()
-        text.append("Ezpl ", style="bold bright_blue")
+        text.append("EzQt Widgets ", style="bold bright_blue")
         text.append(f"v{version}", style="bold green")
         text.append("\n\n", style="reset")
 
@@ -70,6 +72,8 @@ def version_command(full: bool) -> None:
         console.print(panel)
     else:
         # Simple version
-        console.print(
-            f"[bold bright_blue]Ezpl[/bold bright_blue] v[bold green]{version}[/bold green]"
+        click.echo(
+            click.style("EzQt Widgets", fg="bright_blue", bold=True)
+            + " v"
+            + click.style(version, fg="green", bold=True)
         )
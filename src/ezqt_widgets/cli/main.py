@@ -7,6 +7,11 @@
 EzQt Widgets CLI - Main entry point.
 
 Command-line interface for running examples and utilities.
+
+Startup is kept short: commands are imported only when they are
+dispatched (see ``LazyGroup``), and rich is imported only when it is
+about to print. ``ezqt-widgets --help`` and ``ezqt-widgets version``
+import neither Qt nor the widgets.
 """
 
 from __future__ import annotations
@@ -16,13 +21,47 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Third-party imports
 import click
-from rich.panel import Panel
-from rich.text import Text
 
 # Local imports
 from .._version import __version__
-from ._console import console
-from .commands import demo_group, docs_command, info_command, version_command
+from ._lazy_group import LazyGroup
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Command name -> ("module:attribute", short help shown by --help).
+# The help text must match the command's own help (checked by the tests).
+COMMANDS: dict[str, tuple[str, str]] = {
+    "bench": (
+        "ezqt_widgets.cli.commands._bench:bench_group",
+        "Run the widget benchmarks",
+    ),
+    "demo": (
+        "ezqt_widgets.cli.commands._demo:demo_group",
+        "Run and list demo examples",
+    ),
+    "docs": (
+        "ezqt_widgets.cli.commands._docs:docs_command",
+        "Open the online documentation",
+    ),
+    "icons": (
+        "ezqt_widgets.cli.commands._icons:icons_group",
+        "Manage the prebuilt built-in icon bundle",
+    ),
+    "info": (
+        "ezqt_widgets.cli.commands._info:info_command",
+        "Display package information",
+    ),
+    "snapshot": (
+        "ezqt_widgets.cli.commands._snapshot:snapshot_command",
+        "Render widget snapshots from a YAML spec",
+    ),
+    "version": (
+        "ezqt_widgets.cli.commands._version:version_command",
+        "Display version information",
+    ),
+}
 
 # ///////////////////////////////////////////////////////////////
 # CLI GROUP
@@ -31,6 +70,8 @@ from .commands import demo_group, docs_command, info_command, version_command
 
 @click.group(
     name="ezqt-widgets",
+    cls=LazyGroup,
+    lazy_commands=COMMANDS,
     invoke_without_command=True,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
@@ -56,6 +97,11 @@ def cli(ctx: click.Context) -> None:
 def _display_welcome() -> None:
     """Display a welcome message."""
     try:
+        from rich.panel import Panel
+        from rich.text import Text
+
+        from ._console import console
+
         welcome_text = Text()
         welcome_text.append("EzQt Widgets CLI", style="bold bright_blue")
         welcome_text.append(" - Qt Widgets Toolkit", style="dim white")
@@ -71,17 +117,6 @@ def _display_welcome() -> None:
         click.echo("EzQt Widgets CLI - Qt Widgets Toolkit")
 
 
-# ///////////////////////////////////////////////////////////////
-# COMMAND GROUPS
-# ///////////////////////////////////////////////////////////////
-
-# Register commands and groups
-cli.add_command(demo_group)
-cli.add_command(docs_command)
-cli.add_command(info_command)
-cli.add_command(version_command)
-
-
 # ///////////////////////////////////////////////////////////////
 # MAIN ENTRY POINT
 # ///////////////////////////////////////////////////////////////
@@ -95,9 +130,13 @@ def main() -> None:
         e.show()
         raise SystemExit(e.exit_code) from e
     except KeyboardInterrupt as e:
+        from ._console import console
+
         console.print("\n[yellow]Interrupted by user[/yellow]")
         raise SystemExit(1) from e
     except (OSError, RuntimeError, ValueError) as e:
+        from ._console import console
+
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise SystemExit(1) from e
 
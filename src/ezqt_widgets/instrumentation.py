@@ -0,0 +1,568 @@
+# ///////////////////////////////////////////////////////////////
+# INSTRUMENTATION - Opt-in Widget Instrumentation
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Opt-in instrumentation of the library widgets.
+
+Records call counts and durations of ``paintEvent``, ``resizeEvent``,
+``sizeHint`` and ``minimumSizeHint`` for every library widget class that
+implements them, per class and per live instance, and of the icon loading
+functions. The data is available as a plain dict (instrumentation_snapshot())
+and through the periodic ``snapshotReady`` signal of InstrumentationReporter,
+for a metrics exporter to consume.
+
+Nothing is installed until enable_instrumentation() is first called. The
+hooks then stay in place, and while instrumentation is disabled each hook
+only checks a flag before calling the original method.
+
+Qt bindings resolve a Python override once per widget instance, on its
+first call from Qt. Widgets that were already painted, resized or laid out
+before instrumentation was first enabled keep calling the original methods
+and are not measured: enable instrumentation before building the UI.
+
+The hooks and the recorded data are meant for the GUI thread only.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import functools
+import importlib
+import inspect
+import pkgutil
+import sys
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+# Third-party imports
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QWidget
+
+# Local imports
+from . import widgets as _widgets_package
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Widget methods instrumented wherever a library class implements them
+HOOKED_METHODS: tuple[str, ...] = (
+    "paintEvent",
+    "resizeEvent",
+    "sizeHint",
+    "minimumSizeHint",
+)
+
+# Icon loading functions: (module, function)
+_ICON_FUNCTIONS: tuple[tuple[str, str], ...] = (
+    ("ezqt_widgets.widgets.shared._icons", "get_builtin_pixmap"),
+    ("ezqt_widgets.widgets.shared._icons", "get_builtin_icon"),
+    ("ezqt_widgets.widgets.button.date_button", "_get_calendar_icon"),
+    ("ezqt_widgets.widgets.button.icon_button", "_load_icon_from_source"),
+    ("ezqt_widgets.widgets.button.icon_button", "_icon_from_url_data"),
+    ("ezqt_widgets.widgets.button.loader_button", "_create_loading_icon"),
+    ("ezqt_widgets.widgets.button.loader_button", "_create_success_icon"),
+    ("ezqt_widgets.widgets.button.loader_button", "_create_error_icon"),
+    ("ezqt_widgets.widgets.input.password_input", "_load_icon_from_source"),
+    ("ezqt_widgets.widgets.misc.toggle_icon", "_load_icon_from_source"),
+)
+
+# Icon loading methods: (module, class, method)
+_ICON_METHODS: tuple[tuple[str, str, str], ...] = (
+    ("ezqt_widgets.widgets.label.hover_label", "HoverLabel", "_icon_from_url_data"),
+    (
+        "ezqt_widgets.widgets.misc.notification_banner",
+        "NotificationBanner",
+        "_build_icon",
+    ),
+    ("ezqt_widgets.widgets.misc.theme_icon", "ThemeIcon", "from_source"),
+    ("ezqt_widgets.widgets.misc.theme_icon", "ThemeIcon", "_to_qicon"),
+)
+
+# Recent durations kept per (class, method) and icon function for percentiles
+_SAMPLE_SIZE: int = 512
+
+# Live instances tracked individually; further instances only count per class
+_MAX_INSTANCES: int = 4096
+
+_WIDGETS_PREFIX: str = "ezqt_widgets.widgets."
+
+# Instrumentation state: hooks are installed on the first enable
+_enabled: bool = False
+_installed: bool = False
+_active_calls: set[tuple[int, str]] = set()
+_class_stats: dict[tuple[str, str], _CallStats] = {}
+_icon_stats: dict[str, _CallStats] = {}
+_instance_stats: dict[int, _InstanceStats] = {}
+# Installed wrappers, so that a class is never hooked twice
+_hooks: set[Callable[..., Any]] = set()
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class _CallStats:
+    """Call count and durations of one instrumented callable."""
+
+    __slots__ = ("count", "max_ns", "samples", "total_ns")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+        self.samples: deque[int] = deque(maxlen=_SAMPLE_SIZE)
+
+    def record(self, duration_ns: int) -> None:
+        """Add one call.
+
+        Args:
+            duration_ns: The call duration in nanoseconds.
+        """
+        self.count += 1
+        self.total_ns += duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+        self.samples.append(duration_ns)
+
+    def to_dict(self) -> dict[str, float]:
+        """Summarize the calls.
+
+        Returns:
+            ``count``, ``total_ms``, ``mean_ms`` and ``max_ms``, plus
+            ``p50_ms``, ``p90_ms`` and ``p99_ms`` over the most recent
+            calls.
+        """
+        ordered = sorted(self.samples)
+
+        def percentile(q: float) -> float:
+            return _ms(ordered[min(len(ordered) - 1, int(q * len(ordered)))])
+
+        return {
+            "count": self.count,
+            "total_ms": _ms(self.total_ns),
+            "mean_ms": _ms(self.total_ns / self.count),
+            "max_ms": _ms(self.max_ns),
+            "p50_ms": percentile(0.50),
+            "p90_ms": percentile(0.90),
+            "p99_ms": percentile(0.99),
+        }
+
+
+class _InstanceStats:
+    """Call counts and total durations of one widget instance."""
+
+    __slots__ = ("class_name", "methods", "object_name")
+
+    def __init__(self, class_name: str, object_name: str) -> None:
+        """Initialize empty statistics for a widget.
+
+        Args:
+            class_name: The widget class name.
+            object_name: The widget object name.
+        """
+        self.class_name: str = class_name
+        self.object_name: str = object_name
+        self.methods: dict[str, list[int]] = {}
+
+
+class InstrumentationReporter(QObject):
+    """Emit instrumentation snapshots at a fixed interval.
+
+    Args:
+        parent: The parent object (default: None).
+        interval: Emission interval in milliseconds (default: 1000).
+        reset: Whether to clear the recorded data after each emission, so
+            every snapshot covers one interval only (default: False).
+
+    Properties:
+        interval: Get or set the emission interval in milliseconds.
+        reset: Get or set whether data is cleared after each emission.
+
+    Signals:
+        snapshotReady(dict): Emitted with instrumentation_snapshot().
+
+    Example:
+        >>> from ezqt_widgets.instrumentation import (
+        ...     InstrumentationReporter,
+        ...     enable_instrumentation,
+        ... )
+        >>> enable_instrumentation()
+        >>> reporter = InstrumentationReporter(interval=5000, reset=True)
+        >>> reporter.snapshotReady.connect(exporter.push)
+        >>> reporter.start()
+    """
+
+    snapshotReady = Signal(dict)
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        *,
+        interval: int = 1000,
+        reset: bool = False,
+    ) -> None:
+        """Initialize the reporter."""
+        super().__init__(parent)
+        self._reset: bool = reset
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, int(interval)))
+        self._timer.timeout.connect(self._emit_snapshot)
+
+    # ------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------
+
+    def _emit_snapshot(self) -> None:
+        """Emit the current snapshot and optionally clear the data."""
+        snapshot = instrumentation_snapshot()
+        if self._reset:
+            reset_instrumentation()
+        self.snapshotReady.emit(snapshot)
+
+    # ///////////////////////////////////////////////////////////////
+    # PROPERTIES
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def interval(self) -> int:
+        """Get the emission interval.
+
+        Returns:
+            The interval in milliseconds.
+        """
+        return self._timer.interval()
+
+    @interval.setter
+    def interval(self, value: int) -> None:
+        """Set the emission interval.
+
+        Args:
+            value: The interval in milliseconds (at least 1).
+        """
+        self._timer.setInterval(max(1, int(value)))
+
+    @property
+    def reset(self) -> bool:
+        """Get whether data is cleared after each emission.
+
+        Returns:
+            True if every snapshot covers one interval only.
+        """
+        return self._reset
+
+    @reset.setter
+    def reset(self, value: bool) -> None:
+        """Set whether data is cleared after each emission.
+
+        Args:
+            value: True to clear the data after each emission.
+        """
+        self._reset = bool(value)
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def start(self) -> None:
+        """Start emitting snapshots."""
+        self._timer.start()
+
+    def stop(self) -> None:
+        """Stop emitting snapshots."""
+        self._timer.stop()
+
+    def isActive(self) -> bool:
+        """Return whether snapshots are being emitted.
+
+        Returns:
+            True if the reporter is running.
+        """
+        return self._timer.isActive()
+
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _ms(duration_ns: float) -> float:
+    """Convert nanoseconds to rounded milliseconds.
+
+    Args:
+        duration_ns: A duration in nanoseconds.
+
+    Returns:
+        The duration in milliseconds.
+    """
+    return round(duration_ns / 1_000_000, 4)
+
+
+def _forget_instance(key: int) -> None:
+    """Drop the per-instance data of a deleted widget.
+
+    Args:
+        key: The instance key.
+    """
+    _instance_stats.pop(key, None)
+
+
+def _record_widget_call(widget: QWidget, method: str, duration_ns: int) -> None:
+    """Record a widget method call per class and per instance.
+
+    Args:
+        widget: The widget.
+        method: The method name.
+        duration_ns: The call duration in nanoseconds.
+    """
+    class_name = type(widget).__name__
+    stats = _class_stats.get((class_name, method))
+    if stats is None:
+        stats = _class_stats[(class_name, method)] = _CallStats()
+    stats.record(duration_ns)
+
+    key = id(widget)
+    instance = _instance_stats.get(key)
+    if instance is None:
+        if len(_instance_stats) >= _MAX_INSTANCES:
+            return
+        instance = _instance_stats[key] = _InstanceStats(
+            class_name, widget.objectName()
+        )
+        weakref.finalize(widget, _forget_instance, key)
+    totals = instance.methods.setdefault(method, [0, 0])
+    totals[0] += 1
+    totals[1] += duration_ns
+
+
+def _record_icon_call(name: str, duration_ns: int) -> None:
+    """Record an icon loading call.
+
+    Args:
+        name: The qualified function name.
+        duration_ns: The call duration in nanoseconds.
+    """
+    stats = _icon_stats.get(name)
+    if stats is None:
+        stats = _icon_stats[name] = _CallStats()
+    stats.record(duration_ns)
+
+
+def _hook_widget_method(method: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a widget method so that its calls are recorded.
+
+    Nested calls for the same instance and method (an override calling
+    ``super()``) are recorded once, by the outermost call.
+
+    Args:
+        method: The method name.
+        func: The original method.
+
+    Returns:
+        The wrapper.
+    """
+
+    @functools.wraps(func)
+    def hook(self: QWidget, *args: Any, **kwargs: Any) -> Any:
+        if not _enabled:
+            return func(self, *args, **kwargs)
+        token = (id(self), method)
+        if token in _active_calls:
+            return func(self, *args, **kwargs)
+        _active_calls.add(token)
+        start = time.perf_counter_ns()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _active_calls.discard(token)
+            _record_widget_call(self, method, time.perf_counter_ns() - start)
+
+    _hooks.add(hook)
+    return hook
+
+
+def _hook_icon_function(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an icon loading function so that its calls are recorded.
+
+    Args:
+        name: The qualified name the calls are recorded under.
+        func: The original function.
+
+    Returns:
+        The wrapper.
+    """
+
+    @functools.wraps(func)
+    def hook(*args: Any, **kwargs: Any) -> Any:
+        if not _enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record_icon_call(name, time.perf_counter_ns() - start)
+
+    _hooks.add(hook)
+    return hook
+
+
+def _widget_modules() -> list[Any]:
+    """Import and return every widget module.
+
+    Returns:
+        The ``ezqt_widgets.widgets`` modules.
+    """
+    for info in pkgutil.walk_packages(
+        _widgets_package.__path__, _widgets_package.__name__ + "."
+    ):
+        importlib.import_module(info.name)
+    return [
+        module
+        for name, module in list(sys.modules.items())
+        if name.startswith(_WIDGETS_PREFIX) and module is not None
+    ]
+
+
+def _install_hooks() -> None:
+    """Install the hooks on every widget class and icon loader."""
+    modules = _widget_modules()
+
+    for module in modules:
+        for obj in list(vars(module).values()):
+            if not (
+                inspect.isclass(obj)
+                and obj.__module__ == module.__name__
+                and issubclass(obj, QWidget)
+            ):
+                continue
+            for method in HOOKED_METHODS:
+                func = obj.__dict__.get(method)
+                if callable(func) and func not in _hooks:
+                    setattr(obj, method, _hook_widget_method(method, func))
+
+    for module_name, class_name, method in _ICON_METHODS:
+        cls = getattr(sys.modules[module_name], class_name)
+        descriptor = cls.__dict__[method]
+        qualified = f"{class_name}.{method}"
+        if isinstance(descriptor, (classmethod, staticmethod)):
+            hooked = type(descriptor)(
+                _hook_icon_function(qualified, descriptor.__func__)
+            )
+        else:
+            hooked = _hook_icon_function(qualified, descriptor)
+        setattr(cls, method, hooked)
+
+    for module_name, function in _ICON_FUNCTIONS:
+        original = getattr(sys.modules[module_name], function)
+        qualified = f"{module_name.removeprefix(_WIDGETS_PREFIX)}.{function}"
+        hooked = _hook_icon_function(qualified, original)
+        # Replace every binding, including "from ... import name" copies
+        for module in modules:
+            for attribute, value in list(vars(module).items()):
+                if value is original:
+                    setattr(module, attribute, hooked)
+
+
+def enable_instrumentation() -> None:
+    """Start recording widget and icon loading calls.
+
+    The first call imports every widget module and installs the hooks.
+    """
+    global _enabled, _installed
+    if not _installed:
+        _install_hooks()
+        _installed = True
+    _enabled = True
+
+
+def disable_instrumentation() -> None:
+    """Stop recording; the recorded data is kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_instrumentation_enabled() -> bool:
+    """Return whether calls are being recorded.
+
+    Returns:
+        True if instrumentation is enabled.
+    """
+    return _enabled
+
+
+def reset_instrumentation() -> None:
+    """Clear the recorded data."""
+    _class_stats.clear()
+    _icon_stats.clear()
+    for instance in _instance_stats.values():
+        instance.methods.clear()
+
+
+def instrumentation_snapshot(*, instances: bool = True) -> dict[str, Any]:
+    """Return the recorded data.
+
+    Durations are in milliseconds; percentiles cover the most recent calls
+    of each method.
+
+    Args:
+        instances: Whether to include the per-instance data
+            (default: True).
+
+    Returns:
+        A JSON-compatible dict with ``enabled``, ``classes`` (class name ->
+        method -> stats), ``icons`` (function name -> stats) and, if
+        requested, ``instances`` (one entry per live widget with recorded
+        calls: ``id``, ``class``, ``object_name`` and method -> ``count``
+        and ``total_ms``).
+    """
+    classes: dict[str, dict[str, dict[str, float]]] = {}
+    for (class_name, method), stats in sorted(_class_stats.items()):
+        classes.setdefault(class_name, {})[method] = stats.to_dict()
+
+    snapshot: dict[str, Any] = {
+        "enabled": _enabled,
+        "classes": classes,
+        "icons": {name: stats.to_dict() for name, stats in sorted(_icon_stats.items())},
+    }
+    if instances:
+        snapshot["instances"] = [
+            {
+                "id": f"{key:#x}",
+                "class": instance.class_name,
+                "object_name": instance.object_name,
+                "methods": {
+                    method: {"count": count, "total_ms": _ms(total_ns)}
+                    for method, (count, total_ns) in sorted(instance.methods.items())
+                },
+            }
+            for key, instance in _instance_stats.items()
+            if instance.methods
+        ]
+    return snapshot
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "HOOKED_METHODS",
+    "InstrumentationReporter",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "instrumentation_snapshot",
+    "is_instrumentation_enabled",
+    "reset_instrumentation",
+]
@@ -0,0 +1,39 @@
+# ///////////////////////////////////////////////////////////////
+# SNAPSHOT - Headless Snapshot Rendering Package
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Headless snapshot rendering package.
+
+Builds widget variants from a declarative YAML spec and renders them
+offscreen to PNG, in parallel over a process pool. Used for visual
+regression checks and documentation screenshots.
+
+Example:
+    >>> from ezqt_widgets.snapshot import load_spec, render_snapshots
+    >>> jobs = load_spec("gallery.yaml")
+    >>> results = render_snapshots(jobs, "screenshots", workers=4)
+    >>> failed = [result for result in results if result.error]
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Local imports
+from ._renderer import SnapshotResult, render_snapshots
+from ._spec import SnapshotJob, expand_spec, load_spec
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "SnapshotJob",
+    "SnapshotResult",
+    "expand_spec",
+    "load_spec",
+    "render_snapshots",
+]
@@ -0,0 +1,303 @@
+# ///////////////////////////////////////////////////////////////
+# RENDERER - Batch Snapshot Renderer
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Batch snapshot renderer.
+
+Renders snapshot jobs offscreen to PNG with ``QWidget.grab()``. With more
+than one worker, jobs are split into batches and rendered by a process
+pool; each worker process runs its own offscreen QApplication. Workers are
+started with the ``spawn`` method, since forking a process that already
+runs Qt is not safe; as with any spawned pool, a script calling
+render_snapshots() must guard its entry point with
+``if __name__ == "__main__":``.
+
+A failing job (a widget that cannot be built with the given arguments, an
+unwritable file) is reported in its result and does not stop the others.
+A worker process that dies (a native crash in a widget) breaks the pool:
+the jobs it took down are retried one at a time in a single-worker pool,
+restarted after each crash, and only the job running at the time of a
+crash is reported as failed.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import math
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Third-party imports
+from PySide6.QtCore import QCoreApplication, QEvent, QSize
+from PySide6.QtWidgets import QApplication, QWidget
+
+# Local imports
+from ..widgets.shared import get_builtin_icon
+from ._spec import SnapshotJob, _widget_classes
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Size used when a widget has no usable size hint
+_FALLBACK_SIZE: QSize = QSize(200, 100)
+
+# Keeps an application created by the renderer alive
+_application: QApplication | None = None
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class SnapshotResult(NamedTuple):
+    """The outcome of one snapshot job.
+
+    Attributes:
+        name: The job name.
+        path: The written PNG file, or None if the job failed.
+        error: The error message, or None on success.
+        duration_ms: Time spent building and rendering the widget.
+    """
+
+    name: str
+    path: Path | None
+    error: str | None
+    duration_ms: float
+
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _ensure_application() -> QApplication:
+    """Return the running QApplication, creating an offscreen one if needed.
+
+    Returns:
+        The application instance.
+    """
+    global _application
+    app = QApplication.instance()
+    if isinstance(app, QApplication):
+        return app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _application = QApplication([])
+    return _application
+
+
+def _init_worker() -> None:
+    """Start the offscreen QApplication of a worker process."""
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    _ensure_application()
+
+
+def _resolve_value(value: Any) -> Any:
+    """Replace ``{builtin: name}`` values with built-in icons.
+
+    Args:
+        value: A constructor argument value from the spec.
+
+    Returns:
+        The value to pass to the constructor.
+    """
+    if isinstance(value, dict):
+        if set(value) == {"builtin"}:
+            return get_builtin_icon(str(value["builtin"]))
+        return {key: _resolve_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_value(item) for item in value]
+    return value
+
+
+def _render(job: SnapshotJob, output_dir: Path) -> Path:
+    """Build the widget of a job and save it as PNG.
+
+    Args:
+        job: The job.
+        output_dir: The output directory.
+
+    Returns:
+        The written file.
+
+    Raises:
+        OSError: If the image cannot be written.
+    """
+    widget_class = _widget_classes()[job.widget]
+    widget: QWidget = widget_class(
+        **{key: _resolve_value(value) for key, value in job.args.items()}
+    )
+    try:
+        set_theme = getattr(widget, "setTheme", None)
+        if job.theme is not None and callable(set_theme):
+            set_theme(job.theme)
+        if job.stylesheet:
+            widget.setStyleSheet(job.stylesheet)
+        if job.size is not None:
+            widget.resize(*job.size)
+        else:
+            size = widget.sizeHint()
+            widget.resize(
+                size if size.isValid() and not size.isEmpty() else _FALLBACK_SIZE
+            )
+        path = output_dir / f"{job.name}.png"
+        if not widget.grab().save(str(path), "PNG"):
+            raise OSError(f"Cannot write {path}")
+        return path
+    finally:
+        widget.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def _render_batch(
+    jobs: Sequence[SnapshotJob], output_dir: Path
+) -> list[SnapshotResult]:
+    """Render a batch of jobs in the current process.
+
+    Args:
+        jobs: The jobs.
+        output_dir: The output directory.
+
+    Returns:
+        One result per job, in order.
+    """
+    _ensure_application()
+    results: list[SnapshotResult] = []
+    for job in jobs:
+        start = time.perf_counter_ns()
+        path: Path | None = None
+        error: str | None = None
+        try:
+            path = _render(job, output_dir)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        duration_ms = round((time.perf_counter_ns() - start) / 1_000_000, 3)
+        results.append(SnapshotResult(job.name, path, error, duration_ms))
+    return results
+
+
+def _render_pool(
+    batches: Sequence[Sequence[SnapshotJob]],
+    output_dir: Path,
+    workers: int,
+    on_result: Callable[[SnapshotResult], None],
+) -> list[Sequence[SnapshotJob]]:
+    """Render batches in a process pool.
+
+    Args:
+        batches: The batches.
+        output_dir: The output directory.
+        workers: Maximum worker processes.
+        on_result: Called with each result as it completes.
+
+    Returns:
+        The batches that were lost because the pool broke, in submission
+        order.
+    """
+    broken: set[Future[list[SnapshotResult]]] = set()
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(batches)) or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as pool:
+        futures = {
+            pool.submit(_render_batch, batch, output_dir): batch for batch in batches
+        }
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except BrokenProcessPool:
+                broken.add(future)
+                continue
+            for result in results:
+                on_result(result)
+    return [batch for future, batch in futures.items() if future in broken]
+
+
+def render_snapshots(
+    jobs: Sequence[SnapshotJob],
+    output_dir: str | Path,
+    *,
+    workers: int | None = None,
+    batch_size: int = 32,
+    progress: Callable[[SnapshotResult], None] | None = None,
+) -> list[SnapshotResult]:
+    """Render snapshot jobs to PNG files.
+
+    Args:
+        jobs: The jobs (see load_spec()).
+        output_dir: Where to write ``<name>.png`` files; created if needed.
+        workers: Worker processes (default: the CPU count). With 1, jobs
+            are rendered in the current process, which needs or creates a
+            QApplication.
+        batch_size: Maximum jobs sent to a worker at once (default: 32).
+        progress: Called with each result as it completes.
+
+    Returns:
+        One result per job, in job order.
+
+    Raises:
+        ValueError: If workers or batch_size is lower than 1.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or batch_size < 1:
+        raise ValueError("workers and batch_size must be at least 1")
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    if workers == 1:
+        results = []
+        for index in range(0, len(jobs), batch_size):
+            for result in _render_batch(jobs[index : index + batch_size], output):
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+        return results
+
+    # Spread small job lists over every worker
+    size = max(1, min(batch_size, math.ceil(len(jobs) / workers)))
+    batches = [jobs[index : index + size] for index in range(0, len(jobs), size)]
+    by_name: dict[str, SnapshotResult] = {}
+
+    def on_result(result: SnapshotResult) -> None:
+        by_name[result.name] = result
+        if progress is not None:
+            progress(result)
+
+    lost = [
+        job
+        for batch in _render_pool(batches, output, workers, on_result)
+        for job in batch
+    ]
+    while lost:
+        # One worker runs the lost jobs in order: the first job lost again
+        # is the one that was running when the worker died
+        again = _render_pool([[job] for job in lost], output, 1, on_result)
+        if not again:
+            break
+        culprit, *lost = (job for batch in again for job in batch)
+        on_result(
+            SnapshotResult(
+                culprit.name, None, "BrokenProcessPool: worker process died", 0.0
+            )
+        )
+    return [by_name[job.name] for job in jobs]
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["SnapshotResult", "render_snapshots"]
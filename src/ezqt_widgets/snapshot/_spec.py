@@ -0,0 +1,263 @@
+# ///////////////////////////////////////////////////////////////
+# SPEC - Snapshot Spec Loading
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Snapshot spec loading.
+
+A spec is a YAML document describing the widgets to render::
+
+    defaults:                 # optional, merged into every snapshot
+      themes: [dark, light]
+    stylesheets:              # optional, QSS applied with each theme
+      dark: "QWidget { background-color: #2d2d2d; color: #ffffff; }"
+    snapshots:
+      - widget: ToggleSwitch  # exported widget class
+        name: toggle          # file name stem (default: the class name)
+        args: {width: 60}     # constructor keyword arguments
+        matrix:               # one variant per combination
+          checked: [true, false]
+        size: [60, 30]        # default: the size hint
+        stylesheet: "..."     # QSS applied after the theme
+
+``{builtin: name}`` as an argument value is replaced by the built-in icon
+of that name. Each snapshot expands into one job per matrix combination
+and theme, named ``<name>[-<key>-<value>...][-<theme>]``.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import functools
+import inspect
+import itertools
+import re
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Third-party imports
+import yaml
+from PySide6.QtWidgets import QWidget
+
+# Local imports
+from .. import widgets as _widgets
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_SNAPSHOT_KEYS: frozenset[str] = frozenset(
+    {"widget", "name", "args", "matrix", "themes", "size", "stylesheet"}
+)
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.=-]+")
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class SnapshotJob(NamedTuple):
+    """One widget variant to render.
+
+    Attributes:
+        name: The output file stem.
+        widget: The exported widget class name.
+        args: The constructor keyword arguments.
+        size: The widget size, or None for its size hint.
+        theme: The theme passed to ``setTheme()``, or None.
+        stylesheet: The QSS applied to the widget (theme stylesheet first,
+            then the snapshot stylesheet), or an empty string.
+    """
+
+    name: str
+    widget: str
+    args: dict[str, Any]
+    size: tuple[int, int] | None
+    theme: str | None
+    stylesheet: str
+
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+@functools.cache
+def _widget_classes() -> dict[str, type[QWidget]]:
+    """Return the exported widget classes.
+
+    Returns:
+        The exported QWidget subclasses by name.
+    """
+    classes: dict[str, type[QWidget]] = {}
+    for package_name in _widgets.__all__:
+        package = getattr(_widgets, package_name)
+        for name in package.__all__:
+            obj = getattr(package, name)
+            if inspect.isclass(obj) and issubclass(obj, QWidget):
+                classes[name] = obj
+    return classes
+
+
+def _format_value(value: Any) -> str:
+    """Format a matrix value for a file name.
+
+    Args:
+        value: The value.
+
+    Returns:
+        A file-name-safe representation.
+    """
+    if isinstance(value, bool):
+        value = "on" if value else "off"
+    return _UNSAFE_NAME_CHARS.sub("_", str(value)).strip("_") or "_"
+
+
+def _mapping(value: Any, what: str) -> dict[str, Any]:
+    """Check that a spec value is a mapping.
+
+    Args:
+        value: The value (None is an empty mapping).
+        what: Its description for error messages.
+
+    Returns:
+        The mapping.
+
+    Raises:
+        ValueError: If the value is not a mapping.
+    """
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise ValueError(f"{what} must be a mapping")
+    return value
+
+
+def expand_spec(spec: dict[str, Any]) -> list[SnapshotJob]:
+    """Expand a parsed spec into render jobs.
+
+    Args:
+        spec: The spec document.
+
+    Returns:
+        One job per snapshot, matrix combination and theme, in spec order.
+
+    Raises:
+        ValueError: If the spec is malformed, names an unknown widget or
+            produces the same name twice.
+    """
+    spec = _mapping(spec, "The spec")
+    defaults = _mapping(spec.get("defaults"), "'defaults'")
+    stylesheets = _mapping(spec.get("stylesheets"), "'stylesheets'")
+    snapshots = spec.get("snapshots")
+    if not isinstance(snapshots, list) or not snapshots:
+        raise ValueError("'snapshots' must be a non-empty list")
+
+    widgets = _widget_classes()
+    jobs: list[SnapshotJob] = []
+    seen: set[str] = set()
+    for index, entry in enumerate(snapshots):
+        where = f"snapshots[{index}]"
+        entry = _mapping(entry, where)
+        unknown = set(entry) - _SNAPSHOT_KEYS
+        if unknown:
+            raise ValueError(f"{where}: unknown key(s) {', '.join(sorted(unknown))}")
+        merged = {**defaults, **entry}
+        merged["args"] = {
+            **_mapping(defaults.get("args"), "'defaults.args'"),
+            **_mapping(entry.get("args"), f"{where}.args"),
+        }
+
+        widget = merged.get("widget")
+        if widget not in widgets:
+            raise ValueError(f"{where}: unknown widget {widget!r}")
+
+        size = merged.get("size")
+        if size is not None:
+            if not (
+                isinstance(size, list)
+                and len(size) == 2
+                and all(isinstance(v, int) and v > 0 for v in size)
+            ):
+                raise ValueError(f"{where}.size must be [width, height]")
+            size = (size[0], size[1])
+
+        matrix = _mapping(merged.get("matrix"), f"{where}.matrix")
+        for key, values in matrix.items():
+            if not isinstance(values, list) or not values:
+                raise ValueError(f"{where}.matrix.{key} must be a non-empty list")
+
+        themes = merged.get("themes") or [None]
+        if not isinstance(themes, list):
+            raise ValueError(f"{where}.themes must be a list")
+
+        stem = _format_value(merged.get("name") or widget)
+        keys = list(matrix)
+        for combination in itertools.product(*(matrix[key] for key in keys)):
+            for theme in themes:
+                parts = [stem]
+                parts += [
+                    f"{key}-{_format_value(value)}"
+                    for key, value in zip(keys, combination, strict=True)
+                ]
+                if theme is not None:
+                    parts.append(_format_value(theme))
+                name = "-".join(parts)
+                if name in seen:
+                    raise ValueError(f"{where}: duplicate snapshot name {name!r}")
+                seen.add(name)
+
+                stylesheet = "\n".join(
+                    sheet
+                    for sheet in (
+                        stylesheets.get(theme, "") if theme is not None else "",
+                        merged.get("stylesheet") or "",
+                    )
+                    if sheet
+                )
+                jobs.append(
+                    SnapshotJob(
+                        name=name,
+                        widget=widget,
+                        args={
+                            **merged["args"],
+                            **dict(zip(keys, combination, strict=True)),
+                        },
+                        size=size,
+                        theme=None if theme is None else str(theme),
+                        stylesheet=stylesheet,
+                    )
+                )
+    return jobs
+
+
+def load_spec(path: str | Path) -> list[SnapshotJob]:
+    """Load a YAML spec and expand it into render jobs.
+
+    Args:
+        path: The spec file.
+
+    Returns:
+        The render jobs (see expand_spec()).
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid YAML or not a valid spec.
+    """
+    try:
+        spec = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    except yaml.YAMLError as e:
+        raise ValueError(f"{path} is not valid YAML: {e}") from e
+    return expand_spec(spec)
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["SnapshotJob", "expand_spec", "load_spec"]
@@ -24,7 +24,7 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
-from collections.abc import Callable
+from collections.abc import Callable, Generator
 from typing import TYPE_CHECKING, Any, TypeAlias
 
 # Third-party imports
@@ -144,6 +144,15 @@ ValueCallback: TypeAlias = Callable[[Any], None]
 Used by: Signal handlers, value change callbacks, etc.
 """
 
+ContentFactory: TypeAlias = Callable[[], QWidget | Generator[None, None, QWidget]]
+"""Type alias for lazy content factories.
+
+A callable returning a widget, or a generator function that yields between
+build steps and returns the widget.
+
+Used by: CollapsibleSection
+"""
+
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
 # ///////////////////////////////////////////////////////////////
@@ -151,6 +160,7 @@ Used by: Signal handlers, value change callbacks, etc.
 __all__ = [
     "AnimationDuration",
     "ColorType",
+    "ContentFactory",
     "EventCallback",
     "IconSource",
     "IconSourceExtended",
@@ -5,12 +5,40 @@
 
 """
 Utilities package.
+
+Exports the GUI thread latency monitor. The network helpers stay internal
+to the widgets.
 """
 
 from __future__ import annotations
 
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from typing import TYPE_CHECKING
+
+# Local imports
+from .._lazy import attach
+
+# Type-checking-only imports (names are loaded lazily at runtime)
+if TYPE_CHECKING:
+    from ._event_loop_monitor import EventLoopMonitor, StackFrame, StallReport
+
+# ///////////////////////////////////////////////////////////////
+# LAZY EXPORTS
+# ///////////////////////////////////////////////////////////////
+
+_EXPORTS: dict[str, str] = {
+    "EventLoopMonitor": "._event_loop_monitor",
+    "StackFrame": "._event_loop_monitor",
+    "StallReport": "._event_loop_monitor",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
 # ///////////////////////////////////////////////////////////////
 
-__all__: list[str] = []
+__all__ = ["EventLoopMonitor", "StackFrame", "StallReport"]
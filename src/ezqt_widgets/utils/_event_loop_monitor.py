@@ -0,0 +1,430 @@
+# ///////////////////////////////////////////////////////////////
+# EVENT_LOOP_MONITOR - GUI Thread Latency Monitor
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+GUI thread latency monitor.
+
+Measures event loop responsiveness with a heartbeat timer: each beat
+records how late it fired. A watchdog thread samples the Python stack of
+the GUI thread while a beat is overdue, so a stall report shows where the
+GUI thread was blocked, not where it was released. Frames from
+``ezqt_widgets`` code are listed separately to attribute the stall to
+library widget methods.
+
+Blocking calls that run a nested event loop (``fetch_url_bytes``) keep the
+heartbeat firing. The monitor detects them from the beat's own stack and
+reports them once the nested loop returns. Only the library's blocking
+helpers are tracked: other nested loops, such as modal dialogs, wait for
+the user rather than stall the GUI thread.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import linecache
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from types import FrameType
+from typing import NamedTuple
+
+# Third-party imports
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Frames under this directory are attributed to the library
+_PACKAGE_DIR: str = str(Path(__file__).parents[1])
+
+# Recent lag samples and stall reports kept by a monitor
+_LAG_HISTORY: int = 1024
+_STALL_HISTORY: int = 100
+
+# Maximum number of frames in a stack sample
+_MAX_STACK_DEPTH: int = 64
+
+# Library functions blocking their caller on a nested event loop
+_BLOCKING_HELPERS: frozenset[str] = frozenset({"fetch_url_bytes"})
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class StackFrame(NamedTuple):
+    """One frame of a stack sample."""
+
+    function: str
+    filename: str
+    lineno: int
+    line: str
+
+    def __str__(self) -> str:
+        return f"{self.function} ({Path(self.filename).name}:{self.lineno})"
+
+
+class StallReport(NamedTuple):
+    """A GUI thread stall.
+
+    Attributes:
+        kind: ``"blocked"`` when the event loop did not run, or
+            ``"nested_event_loop"`` when a blocking library helper ran a
+            nested event loop and blocked its caller meanwhile.
+        duration_ms: How long the stall lasted.
+        stack: The GUI thread stack during the stall, innermost frame
+            first (empty if no sample could be taken).
+        attribution: The ``ezqt_widgets`` frames of the stack, innermost
+            first.
+    """
+
+    kind: str
+    duration_ms: float
+    stack: tuple[StackFrame, ...]
+    attribution: tuple[StackFrame, ...]
+
+    def __str__(self) -> str:
+        culprit = str(self.attribution[0]) if self.attribution else "unknown"
+        return f"{self.kind} stall of {self.duration_ms:.1f} ms in {culprit}"
+
+
+class EventLoopMonitor(QObject):
+    """Measure GUI thread responsiveness and report stalls.
+
+    Create and start the monitor from the GUI thread.
+
+    Args:
+        parent: The parent object (default: None).
+        interval: Heartbeat interval in milliseconds (default: 50).
+        threshold: Lag in milliseconds from which a stall is reported
+            (default: 200).
+
+    Properties:
+        interval: Get or set the heartbeat interval in milliseconds.
+        threshold: Get or set the stall threshold in milliseconds.
+
+    Signals:
+        lagMeasured(float): Emitted on every heartbeat with its lag in
+            milliseconds.
+        stallDetected(object): Emitted with a StallReport when a stall
+            ends.
+
+    Example:
+        >>> from ezqt_widgets.utils import EventLoopMonitor
+        >>> monitor = EventLoopMonitor(threshold=100)
+        >>> monitor.stallDetected.connect(lambda report: print(report))
+        >>> monitor.start()
+    """
+
+    lagMeasured = Signal(float)
+    stallDetected = Signal(object)
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        *,
+        interval: int = 50,
+        threshold: int = 200,
+    ) -> None:
+        """Initialize the monitor."""
+        super().__init__(parent)
+        self._lags: deque[float] = deque(maxlen=_LAG_HISTORY)
+        self._stalls: deque[StallReport] = deque(maxlen=_STALL_HISTORY)
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_heartbeat)
+
+        # Shared with the watchdog thread, which must not touch the QTimer:
+        # it may already be deleted while the application quits
+        self._lock = threading.Lock()
+        self._interval: int = 1
+        self._threshold: int = 1
+        self._last_beat: float = 0.0
+        self._sample: tuple[StackFrame, ...] | None = None
+        self._gui_thread_id: int = 0
+        self._stop_event: threading.Event | None = None
+        self._watchdog: threading.Thread | None = None
+
+        # Nested event loop being tracked: (outermost helper frame, start, stack)
+        self._nested: tuple[FrameType, float, tuple[StackFrame, ...]] | None = None
+
+        self.interval = interval
+        self.threshold = threshold
+
+    # ------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------
+
+    def _on_heartbeat(self) -> None:
+        """Measure the lag of this beat and report a finished stall."""
+        now = time.monotonic()
+        with self._lock:
+            elapsed_ms = (now - self._last_beat) * 1000
+            self._last_beat = now
+            sample, self._sample = self._sample, None
+            interval, threshold = self._interval, self._threshold
+
+        lag_ms = max(0.0, elapsed_ms - interval)
+        self._lags.append(lag_ms)
+        self.lagMeasured.emit(lag_ms)
+        if lag_ms >= threshold:
+            stack = sample or ()
+            self._report("blocked", lag_ms, stack)
+
+        self._check_nested_loop(now, sys._getframe().f_back)
+
+    def _check_nested_loop(self, now: float, caller: FrameType | None) -> None:
+        """Track a nested event loop run by a blocking library helper.
+
+        Args:
+            now: The beat time.
+            caller: The Python frame below this beat, if any.
+        """
+        helpers = [item for item in _walk(caller) if _is_blocking_helper(item)]
+        outermost = helpers[-1] if helpers else None
+
+        if self._nested is not None and self._nested[0] is not outermost:
+            _frame, started, nested_stack = self._nested
+            self._nested = None
+            duration_ms = (now - started) * 1000
+            if duration_ms >= self._threshold:
+                self._report("nested_event_loop", duration_ms, nested_stack)
+        if outermost is not None and self._nested is None:
+            self._nested = (outermost, now, _sample_stack(caller))
+
+    def _report(
+        self, kind: str, duration_ms: float, stack: tuple[StackFrame, ...]
+    ) -> None:
+        """Record and emit a stall.
+
+        Args:
+            kind: The stall kind.
+            duration_ms: The stall duration.
+            stack: The stack sample.
+        """
+        attribution = tuple(item for item in stack if _is_library_file(item.filename))
+        report = StallReport(kind, round(duration_ms, 3), stack, attribution)
+        self._stalls.append(report)
+        self.stallDetected.emit(report)
+
+    def _watch(self, stop_event: threading.Event) -> None:
+        """Sample the GUI thread stack while a heartbeat is overdue.
+
+        Args:
+            stop_event: Set to end the watchdog thread.
+        """
+        poll = 0.0
+        while not stop_event.wait(poll):
+            with self._lock:
+                poll = self._interval / 2000
+                overdue_ms = (time.monotonic() - self._last_beat) * 1000
+                late = overdue_ms - self._interval >= self._threshold
+                if not late or self._sample is not None:
+                    continue
+                frame = sys._current_frames().get(self._gui_thread_id)
+                self._sample = _sample_stack(frame)
+
+    # ///////////////////////////////////////////////////////////////
+    # PROPERTIES
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def interval(self) -> int:
+        """Get the heartbeat interval.
+
+        Returns:
+            The interval in milliseconds.
+        """
+        return self._interval
+
+    @interval.setter
+    def interval(self, value: int) -> None:
+        """Set the heartbeat interval.
+
+        Args:
+            value: The interval in milliseconds (at least 1).
+        """
+        interval = max(1, int(value))
+        with self._lock:
+            self._interval = interval
+        self._timer.setInterval(interval)
+
+    @property
+    def threshold(self) -> int:
+        """Get the stall threshold.
+
+        Returns:
+            The threshold in milliseconds.
+        """
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, value: int) -> None:
+        """Set the stall threshold.
+
+        Args:
+            value: The threshold in milliseconds (at least 1).
+        """
+        threshold = max(1, int(value))
+        with self._lock:
+            self._threshold = threshold
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def start(self) -> None:
+        """Start the heartbeat and the watchdog thread."""
+        if self._timer.isActive():
+            return
+        with self._lock:
+            self._last_beat = time.monotonic()
+            self._sample = None
+        self._gui_thread_id = threading.get_ident()
+        self._stop_event = threading.Event()
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            args=(self._stop_event,),
+            name="ezqt-event-loop-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+        self._timer.start()
+
+    def stop(self) -> None:
+        """Stop the heartbeat and the watchdog thread."""
+        self._timer.stop()
+        self._nested = None
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+        self._stop_event = None
+        self._watchdog = None
+
+    def isActive(self) -> bool:
+        """Return whether the monitor is running.
+
+        Returns:
+            True if the heartbeat is running.
+        """
+        return self._timer.isActive()
+
+    def lagStats(self) -> dict[str, float]:
+        """Summarize the recent heartbeat lags.
+
+        Returns:
+            ``count``, ``mean_ms``, ``p50_ms``, ``p99_ms`` and ``max_ms``
+            over the most recent beats (all zero before the first beat).
+        """
+        ordered = sorted(self._lags)
+        if not ordered:
+            return dict.fromkeys(("count", "mean_ms", "p50_ms", "p99_ms", "max_ms"), 0)
+
+        def percentile(q: float) -> float:
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+        return {
+            "count": len(ordered),
+            "mean_ms": round(sum(ordered) / len(ordered), 3),
+            "p50_ms": percentile(0.50),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(ordered[-1], 3),
+        }
+
+    def stalls(self) -> list[StallReport]:
+        """Return the recent stalls.
+
+        Returns:
+            The most recent stall reports, oldest first.
+        """
+        return list(self._stalls)
+
+    def clear(self) -> None:
+        """Forget the recorded lags and stalls."""
+        self._lags.clear()
+        self._stalls.clear()
+
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _walk(frame: FrameType | None) -> list[FrameType]:
+    """List a frame and its callers, innermost first.
+
+    Args:
+        frame: The innermost frame.
+
+    Returns:
+        Up to _MAX_STACK_DEPTH frames.
+    """
+    frames: list[FrameType] = []
+    while frame is not None and len(frames) < _MAX_STACK_DEPTH:
+        frames.append(frame)
+        frame = frame.f_back
+    return frames
+
+
+def _is_library_file(filename: str) -> bool:
+    """Return whether a source file is library code other than this module.
+
+    Args:
+        filename: The source file of a frame.
+
+    Returns:
+        True for ``ezqt_widgets`` files other than the monitor.
+    """
+    return filename.startswith(_PACKAGE_DIR) and filename != __file__
+
+
+def _is_blocking_helper(frame: FrameType) -> bool:
+    """Return whether a frame runs a blocking library helper.
+
+    Args:
+        frame: A frame of the GUI thread stack.
+
+    Returns:
+        True for the library functions listed in _BLOCKING_HELPERS.
+    """
+    code = frame.f_code
+    return code.co_qualname in _BLOCKING_HELPERS and _is_library_file(code.co_filename)
+
+
+def _sample_stack(frame: FrameType | None) -> tuple[StackFrame, ...]:
+    """Take a stack sample.
+
+    Args:
+        frame: The innermost frame, or None.
+
+    Returns:
+        The frames, innermost first.
+    """
+    sample = []
+    for item in _walk(frame):
+        code = item.f_code
+        lineno = item.f_lineno or code.co_firstlineno
+        line = linecache.getline(code.co_filename, lineno).strip()
+        sample.append(StackFrame(code.co_qualname, code.co_filename, lineno, line))
+    return tuple(sample)
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["EventLoopMonitor", "StackFrame", "StallReport"]
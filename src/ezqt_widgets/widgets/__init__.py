@@ -14,14 +14,36 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
-# Local imports — import sub-packages so Pyright resolves them as package members
-from . import (
-    button,
-    input,  # noqa: A004
-    label,
-    misc,
-    shared,
-)
+# Standard library imports
+from typing import TYPE_CHECKING
+
+# Local imports
+from .._lazy import attach
+
+# Type-checking-only imports so Pyright resolves sub-packages as members
+# (sub-packages are loaded lazily at runtime)
+if TYPE_CHECKING:
+    from . import (
+        button,
+        input,  # noqa: A004
+        label,
+        misc,
+        shared,
+    )
+
+# ///////////////////////////////////////////////////////////////
+# LAZY EXPORTS
+# ///////////////////////////////////////////////////////////////
+
+_EXPORTS: dict[str, str] = {
+    "button": ".button",
+    "input": ".input",
+    "label": ".label",
+    "misc": ".misc",
+    "shared": ".shared",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
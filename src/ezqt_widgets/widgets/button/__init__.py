@@ -15,10 +15,30 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
+# Standard library imports
+from typing import TYPE_CHECKING
+
 # Local imports
-from .date_button import DateButton, DatePickerDialog
-from .icon_button import IconButton
-from .loader_button import LoaderButton
+from ..._lazy import attach
+
+# Type-checking-only imports (names are loaded lazily at runtime)
+if TYPE_CHECKING:
+    from .date_button import DateButton, DatePickerDialog
+    from .icon_button import IconButton
+    from .loader_button import LoaderButton
+
+# ///////////////////////////////////////////////////////////////
+# LAZY EXPORTS
+# ///////////////////////////////////////////////////////////////
+
+_EXPORTS: dict[str, str] = {
+    "DateButton": ".date_button",
+    "DatePickerDialog": ".date_button",
+    "IconButton": ".icon_button",
+    "LoaderButton": ".loader_button",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
@@ -16,13 +16,11 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
-import base64
 from typing import Any
 
 # Third-party imports
-from PySide6.QtCore import QByteArray, QDate, QSize, Qt, Signal
-from PySide6.QtGui import QIcon, QMouseEvent, QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import QDate, QSize, Qt, Signal
+from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import (
     QCalendarWidget,
     QDialog,
@@ -38,7 +36,7 @@ from ...types import SizeType, WidgetParent
 
 # Local imports
 from ..misc.theme_icon import ThemeIcon
-from ..shared import SVG_CALENDAR
+from ..shared import get_builtin_icon
 
 # ///////////////////////////////////////////////////////////////
 # FUNCTIONS
@@ -76,24 +74,16 @@ def _parse_date(date_str: str, format_str: str = "dd/MM/yyyy") -> QDate:
 def _get_calendar_icon() -> ThemeIcon:
     """Get a default calendar icon built from the shared SVG.
 
+    The SVG is rasterized once per process by the shared icon cache; each
+    call only wraps the cached pixmap in a new ThemeIcon.
+
     Returns:
         Calendar ThemeIcon built from SVG_CALENDAR.
 
     Raises:
         ValueError: If SVG rendering fails or ThemeIcon cannot be created.
     """
-    svg_bytes = base64.b64decode(base64.b64encode(SVG_CALENDAR))
-    renderer = QSvgRenderer(QByteArray(svg_bytes))
-    if not renderer.isValid():
-        raise ValueError("SVG_CALENDAR could not be rendered.")
-
-    pixmap = QPixmap(QSize(16, 16))
-    pixmap.fill(Qt.GlobalColor.transparent)
-    painter = QPainter(pixmap)
-    renderer.render(painter)
-    painter.end()
-
-    themed_icon = ThemeIcon.from_source(QIcon(pixmap))
+    themed_icon = ThemeIcon.from_source(get_builtin_icon("calendar", 16))
     if themed_icon is None:
         raise ValueError(
             "ThemeIcon.from_source returned None for a non-None QIcon source."
@@ -16,13 +16,35 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
+# Standard library imports
+from typing import TYPE_CHECKING
+
 # Local imports
-from .auto_complete_input import AutoCompleteInput
-from .file_picker_input import FilePickerInput
-from .password_input import PasswordInput
-from .search_input import SearchInput
-from .spin_box_input import SpinBoxInput
-from .tab_replace_textedit import TabReplaceTextEdit
+from ..._lazy import attach
+
+# Type-checking-only imports (names are loaded lazily at runtime)
+if TYPE_CHECKING:
+    from .auto_complete_input import AutoCompleteInput
+    from .file_picker_input import FilePickerInput
+    from .password_input import PasswordInput
+    from .search_input import SearchInput
+    from .spin_box_input import SpinBoxInput
+    from .tab_replace_textedit import TabReplaceTextEdit
+
+# ///////////////////////////////////////////////////////////////
+# LAZY EXPORTS
+# ///////////////////////////////////////////////////////////////
+
+_EXPORTS: dict[str, str] = {
+    "AutoCompleteInput": ".auto_complete_input",
+    "FilePickerInput": ".file_picker_input",
+    "PasswordInput": ".password_input",
+    "SearchInput": ".search_input",
+    "SpinBoxInput": ".spin_box_input",
+    "TabReplaceTextEdit": ".tab_replace_textedit",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
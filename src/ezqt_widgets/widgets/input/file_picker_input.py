@@ -7,7 +7,9 @@
 File picker input widget module.
 
 Provides a composite input widget combining a QLineEdit and a folder icon
-button that opens a QFileDialog for file or directory selection.
+button that opens a QFileDialog for file or directory selection. Typed paths
+are validated and completed in a worker thread, so a slow or unreachable
+mount never blocks the GUI thread.
 """
 
 from __future__ import annotations
@@ -16,14 +18,17 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
-import base64
-from typing import Literal
+import os
+import stat
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Literal, NamedTuple
 
 # Third-party imports
-from PySide6.QtCore import QByteArray, QSize, Qt, Signal
-from PySide6.QtGui import QIcon, QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import QSize, QStringListModel, Qt, QTimer, Signal
 from PySide6.QtWidgets import (
+    QCompleter,
     QFileDialog,
     QHBoxLayout,
     QLineEdit,
@@ -35,13 +40,201 @@ from PySide6.QtWidgets import (
 # Local imports
 from ...types import WidgetParent
 from ..misc.theme_icon import ThemeIcon
-from ..shared import SVG_FOLDER
+from ..shared import get_builtin_icon
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Directory listings kept by a worker, most recently used last
+_LISTING_CACHE_SIZE: int = 64
+
+# Maximum number of completions offered for a typed path
+_MAX_COMPLETIONS: int = 200
+
+# Seconds an idle worker thread waits for a request before exiting
+_WORKER_IDLE_TIMEOUT: float = 30.0
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    """Return whether a directory entry is a directory, following links.
+
+    Args:
+        entry: The entry.
+
+    Returns:
+        True for directories, False otherwise or on error.
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
 
 # ///////////////////////////////////////////////////////////////
 # CLASSES
 # ///////////////////////////////////////////////////////////////
 
 
+class _PathCheck(NamedTuple):
+    """The result of checking a typed path."""
+
+    request: int
+    status: str
+    completions: list[str]
+
+
+class _PathWorker:
+    """Check typed paths in a background thread.
+
+    Only the latest request is kept: a request submitted while another is
+    being checked replaces any request still waiting. The thread starts on
+    the first request and exits after _WORKER_IDLE_TIMEOUT seconds without
+    one.
+
+    Args:
+        deliver: Called from the worker thread with each result; raising
+            RuntimeError (a deleted widget) stops the worker.
+    """
+
+    def __init__(self, deliver: Callable[[_PathCheck], None]) -> None:
+        self._deliver = deliver
+        self._condition = threading.Condition()
+        self._pending: tuple[int, str, str] | None = None
+        self._thread: threading.Thread | None = None
+        # Directory listings by path: (mtime in ns, [(name, is_dir)])
+        self._listings: OrderedDict[str, tuple[int, list[tuple[str, bool]]]] = (
+            OrderedDict()
+        )
+
+    def submit(self, request: int, text: str, mode: str) -> None:
+        """Queue a path check.
+
+        Args:
+            request: The request number, returned in the result.
+            text: The typed path.
+            mode: The picker mode ("file" or "directory").
+        """
+        with self._condition:
+            self._pending = (request, text, mode)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ezqt-path-checker", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """Check pending requests until idle."""
+        while True:
+            with self._condition:
+                if self._pending is None:
+                    self._condition.wait(_WORKER_IDLE_TIMEOUT)
+                if self._pending is None:
+                    self._thread = None
+                    return
+                request, text, mode = self._pending
+                self._pending = None
+            result = _PathCheck(
+                request, self.status(text, mode), self.completions(text, mode)
+            )
+            try:
+                self._deliver(result)
+            except RuntimeError:
+                with self._condition:
+                    self._thread = None
+                return
+
+    def listing(self, directory: str) -> list[tuple[str, bool]]:
+        """List a directory, reusing the cached listing if it is unchanged.
+
+        Args:
+            directory: The directory.
+
+        Returns:
+            The entries as (name, is_dir) pairs, or an empty list if the
+            directory cannot be read.
+        """
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._listings.get(directory)
+        if cached is not None and cached[0] == mtime:
+            self._listings.move_to_end(directory)
+            return cached[1]
+        try:
+            with os.scandir(directory) as entries:
+                listing = [(entry.name, _is_dir(entry)) for entry in entries]
+        except OSError:
+            return []
+        self._listings[directory] = (mtime, listing)
+        self._listings.move_to_end(directory)
+        while len(self._listings) > _LISTING_CACHE_SIZE:
+            self._listings.popitem(last=False)
+        return listing
+
+    def completions(self, text: str, mode: str) -> list[str]:
+        """Complete the last component of a typed path.
+
+        Args:
+            text: The typed path.
+            mode: The picker mode; only directories are offered in
+                "directory" mode.
+
+        Returns:
+            The completed paths, as typed up to the last separator, with a
+            trailing separator for directories.
+        """
+        if not text:
+            return []
+        head, prefix = os.path.split(text)
+        typed_head = text[: len(text) - len(prefix)]
+        directory = os.path.expanduser(head) if head else os.curdir
+        wanted = os.path.normcase(prefix)
+        matches = [
+            typed_head + name + (os.sep if is_dir else "")
+            for name, is_dir in self.listing(directory)
+            if os.path.normcase(name).startswith(wanted)
+            and (is_dir or mode != "directory")
+            # Hidden entries only when asked for
+            and (prefix.startswith(".") or not name.startswith("."))
+        ]
+        matches.sort(key=os.path.normcase)
+        return matches[:_MAX_COMPLETIONS]
+
+    @staticmethod
+    def status(text: str, mode: str) -> str:
+        """Check a typed path.
+
+        Args:
+            text: The typed path.
+            mode: The picker mode ("file" or "directory").
+
+        Returns:
+            "empty", "missing", "not_a_file", "not_a_directory", "unreadable"
+            or "valid".
+        """
+        if not text.strip():
+            return "empty"
+        path = os.path.expanduser(text)
+        try:
+            mode_bits = os.stat(path).st_mode
+        except (OSError, ValueError):
+            return "missing"
+        if mode == "directory" and not stat.S_ISDIR(mode_bits):
+            return "not_a_directory"
+        if mode == "file" and not stat.S_ISREG(mode_bits):
+            return "not_a_file"
+        if not os.access(path, os.R_OK):
+            return "unreadable"
+        return "valid"
+
+
 class FilePickerInput(QWidget):
     """Composite input widget combining a QLineEdit and a folder icon button.
 
@@ -49,11 +242,19 @@ class FilePickerInput(QWidget):
     The selected path is displayed in the QLineEdit. The widget supports
     theme-aware icon rendering via ThemeIcon.
 
+    Typed paths are checked and completed in a worker thread once typing
+    pauses for validation_delay milliseconds. A path is valid when it
+    exists, matches the mode (a regular file or a directory) and is
+    readable. Completions come from os.scandir() of the typed directory;
+    listings are cached and reused while the directory's modification time
+    is unchanged. Results for text that has changed since are dropped.
+
     Features:
         - File or directory selection via QFileDialog
         - Editable QLineEdit for manual path entry
+        - Background path validation and prefix completion
         - Theme-aware folder icon via ThemeIcon
-        - Signals for file selection and path text changes
+        - Signals for file selection, path text and validity changes
         - Configurable placeholder, filter, and dialog title
 
     Args:
@@ -65,6 +266,10 @@ class FilePickerInput(QWidget):
         filter: File filter string for QFileDialog, e.g. "Images (*.png *.jpg)"
             (default: "").
         dialog_title: Title for the QFileDialog window (default: "").
+        validate: Whether typed paths are validated and completed
+            (default: True).
+        validation_delay: Milliseconds without typing before a path is
+            checked (default: 150).
 
     Properties:
         path: Get or set the current file/directory path.
@@ -72,10 +277,15 @@ class FilePickerInput(QWidget):
         placeholder_text: Get or set the QLineEdit placeholder text.
         filter: Get or set the file dialog filter string.
         dialog_title: Get or set the file dialog window title.
+        is_valid: Get whether the current path is valid (read-only).
+        path_status: Get the result of the last path check (read-only).
+        validation_delay: Get or set the validation delay in milliseconds.
 
     Signals:
         fileSelected(str): Emitted when a path is chosen via the dialog.
         pathChanged(str): Emitted on every text change in the QLineEdit.
+        validityChanged(bool): Emitted when the path becomes valid or
+            invalid.
 
     Example:
         >>> from ezqt_widgets import FilePickerInput
@@ -87,6 +297,8 @@ class FilePickerInput(QWidget):
 
     fileSelected = Signal(str)
     pathChanged = Signal(str)
+    validityChanged = Signal(bool)
+    _pathChecked = Signal(object)
 
     # ///////////////////////////////////////////////////////////////
     # INIT
@@ -100,6 +312,8 @@ class FilePickerInput(QWidget):
         mode: Literal["file", "directory"] = "file",
         filter: str = "",  # noqa: A002
         dialog_title: str = "",
+        validate: bool = True,
+        validation_delay: int = 150,
     ) -> None:
         """Initialize the file picker input."""
         super().__init__(parent)
@@ -111,6 +325,22 @@ class FilePickerInput(QWidget):
         self._dialog_title: str = dialog_title
         self._folder_icon: ThemeIcon | None = None
 
+        # Validation state: each text change starts a new request and
+        # results of older requests are dropped
+        self._validate: bool = validate
+        self._request: int = 0
+        self._path_status: str = "empty"
+        # Created with the first completions, keeping construction cheap
+        self._completer: QCompleter | None = None
+        self._worker = _PathWorker(self._pathChecked.emit)
+        self._validation_timer = QTimer(self)
+        self._validation_timer.setSingleShot(True)
+        self._validation_timer.setInterval(max(0, int(validation_delay)))
+        self._validation_timer.timeout.connect(self.revalidate)
+        self._pathChecked.connect(
+            self._on_path_checked, Qt.ConnectionType.QueuedConnection
+        )
+
         # Setup UI
         self._setup_widget(placeholder)
 
@@ -134,6 +364,7 @@ class FilePickerInput(QWidget):
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed
         )
         self._line_edit.textChanged.connect(self.pathChanged.emit)
+        self._line_edit.textChanged.connect(self._on_text_changed)
 
         # Folder button
         self._btn = QToolButton()
@@ -151,6 +382,46 @@ class FilePickerInput(QWidget):
         layout.addWidget(self._line_edit)
         layout.addWidget(self._btn)
 
+    def _on_text_changed(self, _text: str) -> None:
+        """Schedule a check of the edited path."""
+        self._request += 1
+        if self._validate:
+            self._validation_timer.start()
+
+    def _on_path_checked(self, result: _PathCheck) -> None:
+        """Apply the result of a path check.
+
+        Args:
+            result: The check result.
+        """
+        if result.request != self._request:
+            return
+        was_valid = self.is_valid
+        self._path_status = result.status
+        completer = self._completer
+        if completer is None and result.completions:
+            completer = self._completer = QCompleter(QStringListModel(self), self)
+            completer.setCaseSensitivity(
+                Qt.CaseSensitivity.CaseInsensitive
+                if os.name == "nt"
+                else Qt.CaseSensitivity.CaseSensitive
+            )
+            self._line_edit.setCompleter(completer)
+        if completer is not None:
+            model = completer.model()
+            if isinstance(model, QStringListModel):
+                model.setStringList(result.completions)
+            text = self._line_edit.text()
+            if (
+                self._line_edit.hasFocus()
+                and result.completions
+                and result.completions != [text]
+            ):
+                completer.setCompletionPrefix(text)
+                completer.complete()
+        if self.is_valid != was_valid:
+            self.validityChanged.emit(self.is_valid)
+
     @staticmethod
     def _build_folder_icon() -> ThemeIcon | None:
         """Build a ThemeIcon from the shared folder SVG.
@@ -158,18 +429,10 @@ class FilePickerInput(QWidget):
         Returns:
             A ThemeIcon instance, or None if rendering fails.
         """
-        svg_bytes = base64.b64decode(base64.b64encode(SVG_FOLDER))
-        renderer = QSvgRenderer(QByteArray(svg_bytes))
-        if not renderer.isValid():
+        try:
+            icon = get_builtin_icon("folder", 16)
+        except ValueError:
             return None
-
-        pixmap = QPixmap(QSize(16, 16))
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        icon = QIcon(pixmap)
         return ThemeIcon.from_source(icon)
 
     def _open_dialog(self) -> None:
@@ -237,6 +500,8 @@ class FilePickerInput(QWidget):
         """
         if value in ("file", "directory"):
             self._mode = value
+            if self._validate:
+                self.revalidate()
 
     @property
     def placeholder_text(self) -> str:
@@ -292,6 +557,44 @@ class FilePickerInput(QWidget):
         """
         self._dialog_title = str(value)
 
+    @property
+    def is_valid(self) -> bool:
+        """Get whether the current path is valid.
+
+        Returns:
+            True if the last check found an existing, readable path that
+            matches the mode.
+        """
+        return self._path_status == "valid"
+
+    @property
+    def path_status(self) -> str:
+        """Get the result of the last path check.
+
+        Returns:
+            "empty", "missing", "not_a_file", "not_a_directory",
+            "unreadable" or "valid".
+        """
+        return self._path_status
+
+    @property
+    def validation_delay(self) -> int:
+        """Get the validation delay.
+
+        Returns:
+            The delay in milliseconds.
+        """
+        return self._validation_timer.interval()
+
+    @validation_delay.setter
+    def validation_delay(self, value: int) -> None:
+        """Set the validation delay.
+
+        Args:
+            value: The delay in milliseconds.
+        """
+        self._validation_timer.setInterval(max(0, int(value)))
+
     # ///////////////////////////////////////////////////////////////
     # PUBLIC METHODS
     # ///////////////////////////////////////////////////////////////
@@ -300,6 +603,16 @@ class FilePickerInput(QWidget):
         """Clear the current path from the QLineEdit."""
         self._line_edit.clear()
 
+    def revalidate(self) -> None:
+        """Check the current path now, without waiting for the delay.
+
+        The result arrives asynchronously; use it after the file system
+        changed under an unchanged path.
+        """
+        self._validation_timer.stop()
+        self._request += 1
+        self._worker.submit(self._request, self._line_edit.text(), self._mode)
+
     def setTheme(self, theme: str) -> None:
         """Update the folder icon color for the given theme.
 
@@ -20,9 +20,16 @@ import re
 from typing import Any
 
 # Third-party imports
-from PySide6.QtCore import QRect, QSize, Qt, Signal
-from PySide6.QtGui import QIcon, QMouseEvent, QPainter, QPaintEvent, QPixmap
-from PySide6.QtWidgets import QLineEdit, QProgressBar, QVBoxLayout, QWidget
+from PySide6.QtCore import Property, QRect, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import (
+    QColor,
+    QIcon,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPixmap,
+)
+from PySide6.QtWidgets import QLineEdit, QVBoxLayout, QWidget
 
 from ...types import IconSourceExtended
 
@@ -81,6 +88,12 @@ def _get_strength_color(score: int) -> str:
         return "#00aa00"  # Dark green
 
 
+# Strength color lookup table, one entry per possible score (0-100)
+_STRENGTH_COLORS: tuple[QColor, ...] = tuple(
+    QColor(_get_strength_color(score)) for score in range(101)
+)
+
+
 def _load_icon_from_source(source: IconSourceExtended) -> QIcon | None:
     """Load icon from various sources (ThemeIcon, QIcon, QPixmap, path, URL, etc.).
 
@@ -182,9 +195,10 @@ class PasswordInput(QWidget):
         - QLineEdit in password mode with integrated strength bar
         - Right-side icon with click functionality
         - Icon management system (ThemeIcon, QIcon, QPixmap, path, URL, SVG)
-        - Animated strength bar that fills the bottom border
+        - Painted strength bar that fills the bottom border
         - Signal strengthChanged(int) emitted on password change
-        - Color-coded strength indicator
+        - Color-coded strength indicator (precomputed colors, no stylesheet
+          is parsed per keystroke)
         - External QSS styling support with CSS variables
 
     Args:
@@ -285,12 +299,8 @@ class PasswordInput(QWidget):
         self._password_input.iconClicked.connect(self.togglePassword)
 
         # Create strength bar
-        self._strength_bar = QProgressBar()
-        self._strength_bar.setProperty("type", "PasswordStrengthBar")
+        self._strength_bar = _StrengthBar()
         self._strength_bar.setFixedHeight(self._strength_bar_height)
-        self._strength_bar.setRange(0, 100)
-        self._strength_bar.setValue(0)
-        self._strength_bar.setTextVisible(False)
         self._strength_bar.setVisible(self._show_strength)
 
         # Add widgets to layout
@@ -311,25 +321,6 @@ class PasswordInput(QWidget):
                 self._show_icon = icon
                 self._password_input.setRightIcon(icon, self._icon_size)
 
-    def _update_strength_color(self, score: int) -> None:
-        """Update strength bar color based on score.
-
-        Args:
-            score: The password strength score (0-100).
-        """
-        color = _get_strength_color(score)
-        self._strength_bar.setStyleSheet(
-            f"""
-            QProgressBar {{
-                border: none;
-                background-color: #2d2d2d;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-            }}
-            """
-        )
-
     # ///////////////////////////////////////////////////////////////
     # PROPERTIES
     # ///////////////////////////////////////////////////////////////
@@ -473,7 +464,6 @@ class PasswordInput(QWidget):
         score = _password_strength(text)
         self._current_strength = score
         self._strength_bar.setValue(score)
-        self._update_strength_color(score)
         self.strengthChanged.emit(score)
 
     def setTheme(self, theme: str) -> None:
@@ -492,6 +482,128 @@ class PasswordInput(QWidget):
         self._update_icon()
 
 
+class _StrengthBar(QWidget):
+    """Painted password strength meter.
+
+    Fills a fraction of its width proportional to the score with the
+    precomputed color for that score. Setting a new value only schedules a
+    repaint. The track color and corner radius are exposed as Qt
+    properties so they can be themed once through QSS ``qproperty-*``.
+
+    Args:
+        parent: The parent widget (default: None).
+    """
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        """Initialize the strength bar."""
+        super().__init__(parent)
+
+        # Set widget type for QSS selection
+        self.setProperty("type", "PasswordStrengthBar")
+        self._value: int = 0
+        self._track_color: QColor = QColor("#2d2d2d")
+        self._radius: int = 0
+
+    # ///////////////////////////////////////////////////////////////
+    # PROPERTIES
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_track_color(self) -> QColor:
+        """Property getter for the track color.
+
+        Returns:
+            The color of the unfilled part of the bar.
+        """
+        return self._track_color
+
+    def _set_track_color(self, color: QColor) -> None:
+        """Property setter for the track color.
+
+        Args:
+            color: The color of the unfilled part of the bar.
+        """
+        self._track_color = QColor(color)
+        self.update()
+
+    def _get_radius(self) -> int:
+        """Property getter for the corner radius.
+
+        Returns:
+            The corner radius in pixels.
+        """
+        return self._radius
+
+    def _set_radius(self, radius: int) -> None:
+        """Property setter for the corner radius.
+
+        Args:
+            radius: The corner radius in pixels.
+        """
+        self._radius = max(0, int(radius))
+        self.update()
+
+    trackColor = Property(QColor, _get_track_color, _set_track_color)
+    radius = Property(int, _get_radius, _set_radius)
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def value(self) -> int:
+        """Get the current score.
+
+        Returns:
+            The score (0-100).
+        """
+        return self._value
+
+    def setValue(self, value: int) -> None:
+        """Set the score and schedule a repaint if it changed.
+
+        Args:
+            value: The new score, clamped to 0-100.
+        """
+        value = min(100, max(0, int(value)))
+        if value != self._value:
+            self._value = value
+            self.update()
+
+    # ///////////////////////////////////////////////////////////////
+    # EVENT HANDLERS
+    # ///////////////////////////////////////////////////////////////
+
+    def paintEvent(self, _event: QPaintEvent) -> None:
+        """Paint the track and the filled part of the bar.
+
+        Args:
+            _event: The paint event (unused but required by signature).
+        """
+        painter = QPainter(self)
+        rect = QRectF(self.rect())
+        chunk = QRectF(
+            rect.x(), rect.y(), rect.width() * self._value / 100, rect.height()
+        )
+        chunk_color = _STRENGTH_COLORS[self._value]
+
+        if self._radius > 0:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._track_color)
+            painter.drawRoundedRect(rect, self._radius, self._radius)
+            if self._value > 0:
+                painter.setBrush(chunk_color)
+                painter.drawRoundedRect(chunk, self._radius, self._radius)
+        else:
+            painter.fillRect(rect, self._track_color)
+            if self._value > 0:
+                painter.fillRect(chunk, chunk_color)
+        painter.end()
+
+
 class _PasswordLineEdit(QLineEdit):
     """QLineEdit subclass with right-side icon support.
 
@@ -8,7 +8,12 @@ Tab replace text edit widget module.
 
 Provides a QPlainTextEdit subclass that sanitizes pasted text by replacing
 tab characters according to the chosen mode and removing empty lines for
-PySide6 applications.
+PySide6 applications. Large pastes are sanitized chunk by chunk in a worker
+thread and inserted in batches, so the GUI stays responsive and memory use
+stays bounded. An optional tabular mode parses pasted TSV/CSV into columns
+instead and shows only a preview. A large-document mode keeps bulk inserts
+out of the undo history, and a text file can be memory-mapped and shown one
+viewport of lines at a time.
 """
 
 from __future__ import annotations
@@ -17,21 +22,356 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
+import csv
+import functools
+import io
+import itertools
+import mmap
+import os
+import queue
+import threading
+import time
+from array import array
+from collections.abc import Callable, Iterator
+from pathlib import Path
 from typing import Any
 
 # Third-party imports
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QKeyEvent, QKeySequence
-from PySide6.QtWidgets import QApplication, QPlainTextEdit
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import (
+    QKeyEvent,
+    QKeySequence,
+    QResizeEvent,
+    QTextCursor,
+    QWheelEvent,
+)
+from PySide6.QtWidgets import (
+    QAbstractSlider,
+    QApplication,
+    QPlainTextEdit,
+    QScrollBar,
+)
 
 # Local imports
 from ...types import WidgetParent
 
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Pastes longer than this (in characters) are sanitized in a worker thread
+_ASYNC_PASTE_THRESHOLD: int = 1_000_000
+
+# Source characters sanitized at once by the worker (cut at a line end)
+_PASTE_CHUNK_SIZE: int = 1 << 15
+
+# Characters inserted per event loop iteration during a background paste
+_PASTE_BATCH_SIZE: int = 1 << 15
+
+# Sanitized chunks buffered between the worker and the GUI thread
+_PASTE_QUEUE_SIZE: int = 8
+
+# Seconds between cancellation checks while the buffer is full
+_PASTE_PUT_TIMEOUT: float = 0.1
+
+# Delimiters tried, in order of preference, to detect a pasted table
+_TABLE_DELIMITERS: tuple[str, ...] = ("\t", ",", ";")
+
+# Rows of a parsed table shown in the editor
+_TABLE_PREVIEW_ROWS: int = 20
+
+# In large-document mode, pastes longer than this (in characters) bypass
+# the undo history, which they clear
+_UNDO_BYPASS_THRESHOLD: int = 1_000_000
+
+# Lines between two indexed offsets of a memory-mapped file
+_LINE_INDEX_STRIDE: int = 256
+
+# Bytes of a memory-mapped file scanned at once while indexing it
+_LINE_INDEX_CHUNK_SIZE: int = 1 << 20
+
+# Seconds between two view updates while a memory-mapped file is indexed
+_LINE_INDEX_PROGRESS_INTERVAL: float = 0.05
+
+# Lines scrolled per wheel step in a memory-mapped file
+_WHEEL_SCROLL_LINES: int = 3
+
+# Keys scrolling a memory-mapped file, with their scroll bar action
+_FILE_SCROLL_KEYS: dict[int, QAbstractSlider.SliderAction] = {
+    Qt.Key.Key_Up: QAbstractSlider.SliderAction.SliderSingleStepSub,
+    Qt.Key.Key_Down: QAbstractSlider.SliderAction.SliderSingleStepAdd,
+    Qt.Key.Key_PageUp: QAbstractSlider.SliderAction.SliderPageStepSub,
+    Qt.Key.Key_PageDown: QAbstractSlider.SliderAction.SliderPageStepAdd,
+    Qt.Key.Key_Home: QAbstractSlider.SliderAction.SliderToMinimum,
+    Qt.Key.Key_End: QAbstractSlider.SliderAction.SliderToMaximum,
+}
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _sanitize(
+    text: str,
+    tab_replacement: str,
+    remove_empty_lines: bool,
+    preserve_whitespace: bool,
+) -> str:
+    """Replace tabs and optionally remove empty lines.
+
+    Args:
+        text: The text to sanitize.
+        tab_replacement: The string replacing tab characters.
+        remove_empty_lines: Whether to remove empty lines.
+        preserve_whitespace: Whether whitespace-only lines are kept.
+
+    Returns:
+        The sanitized text.
+    """
+    # Replace tabs
+    sanitized = text.replace("\t", tab_replacement)
+
+    if remove_empty_lines:
+        # Split into lines
+        lines = sanitized.split("\n")
+
+        # Filter empty lines
+        if preserve_whitespace:
+            # Keep lines with whitespace
+            lines = [line for line in lines if line.strip() or line]
+        else:
+            # Remove all empty lines but preserve whitespace
+            lines = [line for line in lines if line.strip()]
+
+        # Rejoin lines
+        sanitized = "\n".join(lines)
+
+    return sanitized
+
+
+def _iter_sanitized_chunks(
+    text: str,
+    sanitize: Callable[[str], str],
+    remove_empty_lines: bool,
+    chunk_size: int,
+) -> Iterator[tuple[str, int]]:
+    """Sanitize text chunk by chunk.
+
+    Chunks end at a line break, so concatenating the pieces gives the same
+    result as sanitizing the whole text at once.
+
+    Args:
+        text: The text to sanitize.
+        sanitize: The sanitizer applied to each chunk.
+        remove_empty_lines: Whether the sanitizer removes empty lines
+            (chunks without remaining lines then produce an empty piece).
+        chunk_size: The preferred chunk length in characters.
+
+    Yields:
+        Each sanitized piece, with its leading line break, and the offset
+        in text up to which it was produced.
+    """
+    total = len(text)
+    start = 0
+    emitted = False
+    while True:
+        if total - start <= chunk_size:
+            end = total
+        else:
+            end = text.rfind("\n", start, start + chunk_size)
+            if end == -1:
+                # A single line longer than a chunk is kept whole
+                end = text.find("\n", start + chunk_size)
+                if end == -1:
+                    end = total
+        piece = sanitize(text[start:end])
+        if piece or not remove_empty_lines:
+            if emitted:
+                piece = "\n" + piece
+            emitted = True
+        yield piece, end
+        if end >= total:
+            return
+        start = end + 1
+
+
+def _detect_delimiter(text: str) -> str | None:
+    """Guess the cell delimiter of a table from its first two rows.
+
+    A delimiter is accepted only if the first two non-empty lines split
+    into the same number of cells, at least two, so a single line such as
+    ``"Hello, world"`` is not a table. Later rows may be ragged.
+
+    Args:
+        text: The table text.
+
+    Returns:
+        The accepted delimiter most frequent in the first line, or None.
+    """
+    head: list[str] = []
+    start = 0
+    while len(head) < 2 and start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        line = text[start:end].rstrip("\r")
+        if line:
+            head.append(line)
+        start = end + 1
+    if len(head) < 2:
+        return None
+
+    counts = [(head[0].count(d), d) for d in _TABLE_DELIMITERS]
+    for count, delimiter in sorted(counts, key=lambda item: -item[0]):
+        if not count:
+            break
+        widths = {len(row) for row in csv.reader(head, delimiter=delimiter)}
+        if len(widths) == 1:
+            return delimiter
+    return None
+
+
+def _parse_table(text: str, delimiter: str) -> list[list[str]]:
+    """Split a table into columns.
+
+    Rows with the same number of cells, the common case, are split with
+    one ``str.split()`` over the whole table and columns are taken as
+    strided slices. Quoted cells and ragged rows go through ``csv``, and
+    short rows are padded with empty cells. Empty lines are skipped.
+
+    Args:
+        text: The table text.
+        delimiter: The cell delimiter.
+
+    Returns:
+        The columns, each a list of cells.
+    """
+    if '"' not in text:
+        # Rows end at "\n" only, as in _detect_delimiter: splitlines() would
+        # also break rows at form feeds and Unicode separators inside cells
+        stripped = (line.rstrip("\r") for line in text.split("\n"))
+        lines = [line for line in stripped if line]
+        counts = {line.count(delimiter) for line in lines}
+        if len(counts) == 1:
+            width = counts.pop() + 1
+            cells = delimiter.join(lines).split(delimiter)
+            return [cells[column::width] for column in range(width)]
+        rows = [line.split(delimiter) for line in lines]
+    else:
+        reader = csv.reader(io.StringIO(text), delimiter=delimiter)
+        rows = [row for row in reader if row]
+    return [list(column) for column in itertools.zip_longest(*rows, fillvalue="")]
+
+
 # ///////////////////////////////////////////////////////////////
 # CLASSES
 # ///////////////////////////////////////////////////////////////
 
 
+class _MappedLines:
+    """The lines of a memory-mapped text file, read on demand.
+
+    Only the offset of every _LINE_INDEX_STRIDE-th line is kept, so the
+    index of a file with millions of lines stays small. The index is built
+    by iterating index(), typically in a worker thread: count grows as
+    chunks are scanned and lines below it can be read meanwhile.
+
+    Args:
+        path: The file to map.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path: Path = Path(path)
+        self._file = open(self.path, "rb")  # noqa: SIM115
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            self._map: mmap.mmap | None = (
+                mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if size
+                else None
+            )
+        except (OSError, ValueError) as e:
+            self._file.close()
+            raise OSError(f"Cannot map {self.path}: {e}") from e
+        self._index: array[int] = array("q", [0])
+        self.count: int = 0
+        self.indexed: bool = False
+
+    def index(self) -> Iterator[int]:
+        """Index the line offsets, one chunk at a time.
+
+        Scanning a file costs about 3 ms per MiB. Stop iterating to cancel.
+
+        Yields:
+            The number of lines indexed so far, after each chunk.
+        """
+        data = self._map
+        if data is None:
+            self.indexed = True
+            return
+        size = len(data)
+        newlines = 0
+        for start in range(0, size, _LINE_INDEX_CHUNK_SIZE):
+            chunk = data[start : start + _LINE_INDEX_CHUNK_SIZE]
+            # Offsets of the lines starting after each newline of the chunk
+            parts = chunk.split(b"\n")
+            starts = itertools.accumulate(
+                (len(part) + 1 for part in parts[:-1]), initial=start
+            )
+            next(starts)
+            # Line number of the first of these starts is newlines + 1
+            first = -(newlines + 1) % _LINE_INDEX_STRIDE
+            self._index.extend(
+                offset
+                for offset in itertools.islice(starts, first, None, _LINE_INDEX_STRIDE)
+                if offset < size
+            )
+            newlines += len(parts) - 1
+            # Offsets are indexed before the lines are counted, so a reader
+            # in another thread never sees a line without its offset
+            self.count = newlines
+            yield newlines
+        self.count = newlines + (data[size - 1] != ord("\n"))
+        self.indexed = True
+
+    def read(self, first: int, count: int) -> list[str]:
+        """Read consecutive lines.
+
+        Args:
+            first: The index of the first line.
+            count: The maximum number of lines.
+
+        Returns:
+            The decoded lines, without line endings.
+        """
+        data = self._map
+        first = max(0, first)
+        if data is None or first >= self.count:
+            return []
+        offset = self._index[first // _LINE_INDEX_STRIDE]
+        for _ in range(first % _LINE_INDEX_STRIDE):
+            offset = data.find(b"\n", offset) + 1
+        lines = []
+        for _ in range(min(count, self.count - first)):
+            end = data.find(b"\n", offset)
+            if end == -1:
+                end = len(data)
+            line = data[offset:end].decode("utf-8", errors="replace")
+            lines.append(line.removesuffix("\r"))
+            offset = end + 1
+        return lines
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
 class TabReplaceTextEdit(QPlainTextEdit):
     """QPlainTextEdit subclass with tab replacement and text sanitization.
 
@@ -39,6 +379,23 @@ class TabReplaceTextEdit(QPlainTextEdit):
     chosen mode and removing empty lines. Useful for pasting tabular data
     or ensuring clean input.
 
+    Pastes longer than async_paste_threshold characters are sanitized in a
+    worker thread, one chunk at a time, and inserted in batches as chunks
+    become ready. Only a few chunks are buffered at once. The editor is
+    read-only until the paste ends, the whole paste is a single undo step,
+    and pressing Escape (or calling cancelPaste()) cancels it.
+
+    With tabular_paste, a pasted table (TSV or CSV) is split into columns
+    and emitted with tableParsed instead of being inserted; the editor only
+    shows a sanitized preview of its first rows.
+
+    The large_document mode is meant for logs and data scratchpads with
+    millions of lines. Line wrapping is turned off, max_block_count is
+    applied (oldest blocks are dropped past it), and pastes of more than a
+    million characters bypass the undo history, which they clear. loadFile()
+    memory-maps a text file and shows only the lines that fit in the
+    viewport, read from the file as it is scrolled.
+
     Args:
         parent: The parent widget (default: None).
         tab_replacement: The string to replace tab characters with
@@ -48,6 +405,16 @@ class TabReplaceTextEdit(QPlainTextEdit):
             (default: True).
         preserve_whitespace: Whether to preserve leading/trailing whitespace
             (default: False).
+        async_paste_threshold: Length in characters above which pastes are
+            sanitized in a worker thread; 0 disables it (default: 1000000).
+        tabular_paste: Whether pasted tables are parsed into columns
+            (default: False).
+        table_delimiter: The cell delimiter of pasted tables, or None to
+            detect it (default: None).
+        large_document: Whether to enable the large-document mode
+            (default: False).
+        max_block_count: The block limit applied in large-document mode;
+            0 for no limit (default: 0).
         *args: Additional arguments passed to QPlainTextEdit.
         **kwargs: Additional keyword arguments passed to QPlainTextEdit.
 
@@ -56,6 +423,22 @@ class TabReplaceTextEdit(QPlainTextEdit):
         sanitize_on_paste: Enable or disable sanitizing pasted text.
         remove_empty_lines: Get or set whether to remove empty lines.
         preserve_whitespace: Get or set whether to preserve whitespace.
+        async_paste_threshold: Get or set the background paste threshold.
+        tabular_paste: Get or set whether pasted tables are parsed.
+        table_delimiter: Get or set the table delimiter (None to detect).
+        large_document: Enable or disable the large-document mode.
+        max_block_count: Get or set the large-document block limit.
+
+    Signals:
+        pasteProgress(int, int): Emitted after each batch of a background
+            paste with the characters processed and the paste length.
+        pasteFinished(bool): Emitted when a background paste ends, with
+            True if it completed and False if it was cancelled.
+        tableParsed(int, int, object): Emitted when a pasted table is
+            parsed, with its row count, column count and columns (a list
+            of lists of cells).
+        fileLoaded(int): Emitted when a file shown with loadFile() is
+            fully indexed, with its line count.
 
     Example:
         >>> from ezqt_widgets import TabReplaceTextEdit
@@ -65,6 +448,13 @@ class TabReplaceTextEdit(QPlainTextEdit):
         >>> editor.show()
     """
 
+    pasteProgress = Signal(int, int)
+    pasteFinished = Signal(bool)
+    tableParsed = Signal(int, int, object)
+    fileLoaded = Signal(int)
+    _pasteChunkReady = Signal()
+    _fileIndexProgress = Signal(object)
+
     # ///////////////////////////////////////////////////////////////
     # INIT
     # ///////////////////////////////////////////////////////////////
@@ -76,6 +466,11 @@ class TabReplaceTextEdit(QPlainTextEdit):
         sanitize_on_paste: bool = True,
         remove_empty_lines: bool = True,
         preserve_whitespace: bool = False,
+        async_paste_threshold: int = _ASYNC_PASTE_THRESHOLD,
+        tabular_paste: bool = False,
+        table_delimiter: str | None = None,
+        large_document: bool = False,
+        max_block_count: int = 0,
         *args: Any,
         **kwargs: Any,
     ) -> None:
@@ -90,6 +485,290 @@ class TabReplaceTextEdit(QPlainTextEdit):
         self._sanitize_on_paste: bool = sanitize_on_paste
         self._remove_empty_lines: bool = remove_empty_lines
         self._preserve_whitespace: bool = preserve_whitespace
+        self._async_paste_threshold: int = max(0, int(async_paste_threshold))
+        self._tabular_paste: bool = tabular_paste
+        self._table_delimiter: str | None = table_delimiter or None
+
+        # Background paste state (GUI thread); the worker only uses the
+        # queue and the cancel event
+        self._paste_queue: queue.Queue[tuple[str, int] | None] | None = None
+        self._paste_cancel: threading.Event | None = None
+        self._paste_cursor: QTextCursor | None = None
+        self._paste_start: int = 0
+        self._paste_total: int = 0
+        self._paste_inserted: bool = False
+        self._paste_was_read_only: bool = False
+        self._pasteChunkReady.connect(
+            self._on_paste_chunk_ready, Qt.ConnectionType.QueuedConnection
+        )
+
+        # Large-document mode, with the settings it replaces
+        self._large_document: bool = False
+        self._max_block_count: int = max(0, int(max_block_count))
+        self._saved_wrap_mode: QPlainTextEdit.LineWrapMode = self.lineWrapMode()
+        self._saved_block_count: int = 0
+        self._undo_suspended: bool = False
+
+        # Memory-mapped file state
+        self._mapped: _MappedLines | None = None
+        self._file_scrollbar: QScrollBar | None = None
+        self._file_was_read_only: bool = False
+        self._file_shown_lines: int = 0
+        self._index_thread: threading.Thread | None = None
+        self._index_cancel: threading.Event | None = None
+        self._fileIndexProgress.connect(
+            self._on_file_index_progress, Qt.ConnectionType.QueuedConnection
+        )
+
+        self.large_document = large_document
+
+    # ------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------
+
+    def _run_paste_worker(
+        self,
+        text: str,
+        sanitize: Callable[[str], str],
+        remove_empty_lines: bool,
+        pieces: queue.Queue[tuple[str, int] | None],
+        cancel: threading.Event,
+    ) -> None:
+        """Sanitize a paste in chunks and hand them to the GUI thread.
+
+        Runs in the worker thread.
+
+        Args:
+            text: The pasted text.
+            sanitize: The sanitizer, bound to the settings at paste time.
+            remove_empty_lines: Whether the sanitizer removes empty lines.
+            pieces: The queue receiving the pieces, then None.
+            cancel: Set when the paste is cancelled.
+        """
+
+        def put(item: tuple[str, int] | None) -> bool:
+            while not cancel.is_set():
+                try:
+                    pieces.put(item, timeout=_PASTE_PUT_TIMEOUT)
+                except queue.Full:
+                    continue
+                try:
+                    self._pasteChunkReady.emit()
+                except RuntimeError:
+                    # The widget was deleted
+                    cancel.set()
+                    return False
+                return True
+            return False
+
+        try:
+            for item in _iter_sanitized_chunks(
+                text, sanitize, remove_empty_lines, _PASTE_CHUNK_SIZE
+            ):
+                if not put(item):
+                    return
+        finally:
+            put(None)
+
+    def _on_paste_chunk_ready(self) -> None:
+        """Insert the sanitized pieces received so far as one batch."""
+        pieces = self._paste_queue
+        cursor = self._paste_cursor
+        if pieces is None or cursor is None:
+            return
+
+        batch: list[str] = []
+        size = 0
+        processed = -1
+        done = False
+        while size < _PASTE_BATCH_SIZE:
+            try:
+                item = pieces.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                done = True
+                break
+            batch.append(item[0])
+            size += len(item[0])
+            processed = item[1]
+
+        if batch:
+            # Later batches join the first edit block: one undo step
+            if self._paste_inserted:
+                cursor.joinPreviousEditBlock()
+            else:
+                cursor.beginEditBlock()
+            cursor.insertText("".join(batch))
+            cursor.endEditBlock()
+            self._paste_inserted = True
+            self.pasteProgress.emit(processed, self._paste_total)
+        if done:
+            self._finish_paste(True)
+        elif size >= _PASTE_BATCH_SIZE:
+            # Let pending events run before the next batch
+            self._pasteChunkReady.emit()
+
+    def _paste_table(self, text: str) -> bool:
+        """Parse a pasted table, emit it and insert its preview.
+
+        Args:
+            text: The pasted text.
+
+        Returns:
+            False if the text is not a table.
+        """
+        columns = self.parseTable(text)
+        if not columns:
+            return False
+        rows = len(columns[0])
+        self.tableParsed.emit(rows, len(columns), columns)
+
+        shown = min(rows, _TABLE_PREVIEW_ROWS)
+        preview = self.sanitizeText(
+            "\n".join(
+                "\t".join(column[row] for column in columns) for row in range(shown)
+            )
+        )
+        if rows > shown:
+            preview += f"\n… {rows - shown} more rows ({rows} x {len(columns)})"
+        self.insertPlainText(preview)
+        return True
+
+    def _suspend_undo(self, size: int) -> None:
+        """Keep a bulk insert out of the undo history in large-document mode.
+
+        Args:
+            size: The length of the pasted text; pastes up to
+                _UNDO_BYPASS_THRESHOLD characters stay undoable.
+        """
+        document = self.document()
+        if (
+            self._large_document
+            and size > _UNDO_BYPASS_THRESHOLD
+            and document.isUndoRedoEnabled()
+        ):
+            # Disabling undo also clears the existing history
+            document.setUndoRedoEnabled(False)
+            self._undo_suspended = True
+
+    def _resume_undo(self) -> None:
+        """Re-enable the undo history after a bulk insert."""
+        if self._undo_suspended:
+            self._undo_suspended = False
+            self.document().setUndoRedoEnabled(True)
+
+    def _visible_line_count(self) -> int:
+        """Return how many lines fit in the viewport.
+
+        Returns:
+            The number of lines (at least 1).
+        """
+        spacing = max(1, self.fontMetrics().lineSpacing())
+        return max(1, self.viewport().height() // spacing)
+
+    def _layout_file_scrollbar(self) -> None:
+        """Place the file scroll bar and update its range."""
+        scrollbar = self._file_scrollbar
+        if scrollbar is None or self._mapped is None:
+            return
+        rect = self.contentsRect()
+        width = scrollbar.sizeHint().width()
+        scrollbar.setGeometry(
+            rect.right() - width + 1, rect.top(), width, rect.height()
+        )
+        visible = self._visible_line_count()
+        scrollbar.setPageStep(visible)
+        scrollbar.setRange(0, max(0, self._mapped.count - visible))
+        self._show_file_lines()
+
+    def _show_file_lines(self) -> None:
+        """Load the lines of the mapped file shown in the viewport."""
+        if self._mapped is None or self._file_scrollbar is None:
+            return
+        lines = self._mapped.read(
+            self._file_scrollbar.value(), self._visible_line_count() + 1
+        )
+        self._file_shown_lines = len(lines)
+        self.setPlainText("\n".join(lines))
+
+    def _run_index_worker(
+        self, mapped: _MappedLines, steps: Iterator[int], cancel: threading.Event
+    ) -> None:
+        """Index a memory-mapped file and report progress to the GUI thread.
+
+        Runs in the worker thread.
+
+        Args:
+            mapped: The file to index.
+            steps: The remaining steps of mapped.index().
+            cancel: Set when the file is closed.
+        """
+
+        def report() -> bool:
+            try:
+                self._fileIndexProgress.emit(mapped)
+            except RuntimeError:
+                # The widget was deleted
+                return False
+            return True
+
+        reported_at = 0.0
+        for _count in steps:
+            if cancel.is_set():
+                return
+            now = time.monotonic()
+            if now - reported_at >= _LINE_INDEX_PROGRESS_INTERVAL:
+                reported_at = now
+                if not report():
+                    return
+        report()
+
+    def _on_file_index_progress(self, mapped: _MappedLines) -> None:
+        """Extend the file view with the lines indexed so far.
+
+        Args:
+            mapped: The file being indexed.
+        """
+        scrollbar = self._file_scrollbar
+        if mapped is not self._mapped or scrollbar is None:
+            return  # Closed or replaced meanwhile
+        visible = self._visible_line_count()
+        scrollbar.setRange(0, max(0, mapped.count - visible))
+        if self._file_shown_lines <= visible:
+            # The viewport was not full yet
+            self._show_file_lines()
+        if mapped.indexed and self._index_thread is not None:
+            # Earlier updates may arrive after the scan ended
+            self._index_thread = None
+            self._index_cancel = None
+            self.fileLoaded.emit(mapped.count)
+
+    def _stop_indexing(self) -> None:
+        """Stop the indexing of the current file, if it is running."""
+        if self._index_cancel is not None:
+            self._index_cancel.set()
+        if self._index_thread is not None:
+            self._index_thread.join()
+        self._index_thread = None
+        self._index_cancel = None
+
+    def _finish_paste(self, completed: bool) -> None:
+        """Clear the background paste state and notify.
+
+        Args:
+            completed: Whether the paste completed.
+        """
+        cursor = self._paste_cursor
+        self._paste_queue = None
+        self._paste_cancel = None
+        self._paste_cursor = None
+        self._resume_undo()
+        self.setReadOnly(self._paste_was_read_only)
+        if cursor is not None:
+            self.setTextCursor(cursor)
+            self.ensureCursorVisible()
+        self.pasteFinished.emit(completed)
 
     # ///////////////////////////////////////////////////////////////
     # PROPERTIES
@@ -167,6 +846,118 @@ class TabReplaceTextEdit(QPlainTextEdit):
         """
         self._preserve_whitespace = bool(value)
 
+    @property
+    def async_paste_threshold(self) -> int:
+        """Get the background paste threshold.
+
+        Returns:
+            The length in characters above which pastes are sanitized in a
+            worker thread (0 when disabled).
+        """
+        return self._async_paste_threshold
+
+    @async_paste_threshold.setter
+    def async_paste_threshold(self, value: int) -> None:
+        """Set the background paste threshold.
+
+        Args:
+            value: The length in characters (0 to disable).
+        """
+        self._async_paste_threshold = max(0, int(value))
+
+    @property
+    def tabular_paste(self) -> bool:
+        """Get whether pasted tables are parsed into columns.
+
+        Returns:
+            True if tabular paste is enabled, False otherwise.
+        """
+        return self._tabular_paste
+
+    @tabular_paste.setter
+    def tabular_paste(self, value: bool) -> None:
+        """Set whether pasted tables are parsed into columns.
+
+        Args:
+            value: Whether to enable tabular paste.
+        """
+        self._tabular_paste = bool(value)
+
+    @property
+    def table_delimiter(self) -> str | None:
+        """Get the cell delimiter of pasted tables.
+
+        Returns:
+            The delimiter, or None when it is detected.
+        """
+        return self._table_delimiter
+
+    @table_delimiter.setter
+    def table_delimiter(self, value: str | None) -> None:
+        """Set the cell delimiter of pasted tables.
+
+        Args:
+            value: The delimiter, or None (or "") to detect it.
+        """
+        self._table_delimiter = str(value) if value else None
+
+    @property
+    def large_document(self) -> bool:
+        """Get whether the large-document mode is enabled.
+
+        Returns:
+            True if the large-document mode is enabled, False otherwise.
+        """
+        return self._large_document
+
+    @large_document.setter
+    def large_document(self, value: bool) -> None:
+        """Enable or disable the large-document mode.
+
+        Disabling it restores the line wrap mode and block limit in place
+        before. A block limit disables the undo history (see
+        QPlainTextEdit.setMaximumBlockCount()); it is re-enabled when the
+        mode is disabled.
+
+        Args:
+            value: Whether to enable the large-document mode.
+        """
+        value = bool(value)
+        if value == self._large_document:
+            return
+        self._large_document = value
+        if value:
+            self._saved_wrap_mode = self.lineWrapMode()
+            self._saved_block_count = self.maximumBlockCount()
+            self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+            if self._max_block_count:
+                self.setMaximumBlockCount(self._max_block_count)
+        else:
+            self.setLineWrapMode(self._saved_wrap_mode)
+            self.setMaximumBlockCount(self._saved_block_count)
+            if not self._saved_block_count:
+                self.document().setUndoRedoEnabled(True)
+
+    @property
+    def max_block_count(self) -> int:
+        """Get the block limit applied in large-document mode.
+
+        Returns:
+            The block limit (0 for no limit).
+        """
+        return self._max_block_count
+
+    @max_block_count.setter
+    def max_block_count(self, value: int) -> None:
+        """Set the block limit applied in large-document mode.
+
+        Args:
+            value: The block limit (0 for no limit).
+        """
+        self._max_block_count = max(0, int(value))
+        if self._large_document:
+            self.setMaximumBlockCount(self._max_block_count or self._saved_block_count)
+
     # ///////////////////////////////////////////////////////////////
     # PUBLIC METHODS
     # ///////////////////////////////////////////////////////////////
@@ -180,25 +971,194 @@ class TabReplaceTextEdit(QPlainTextEdit):
         Returns:
             The sanitized text.
         """
-        # Replace tabs
-        sanitized = text.replace("\t", self._tab_replacement)
+        return _sanitize(
+            text,
+            self._tab_replacement,
+            self._remove_empty_lines,
+            self._preserve_whitespace,
+        )
 
-        if self._remove_empty_lines:
-            # Split into lines
-            lines = sanitized.split("\n")
+    def parseTable(self, text: str) -> list[list[str]]:
+        """Split TSV or CSV text into columns.
 
-            # Filter empty lines
-            if self._preserve_whitespace:
-                # Keep lines with whitespace
-                lines = [line for line in lines if line.strip() or line]
-            else:
-                # Remove all empty lines but preserve whitespace
-                lines = [line for line in lines if line.strip()]
+        Without table_delimiter, the text is a table only if its first
+        two rows have the same number of cells for a detected delimiter.
+
+        Args:
+            text: The table text.
+
+        Returns:
+            The columns, each a list of cells, or an empty list if the
+            text is not a table.
+        """
+        delimiter = self._table_delimiter or _detect_delimiter(text)
+        if delimiter is None or delimiter not in text:
+            return []
+        return _parse_table(text, delimiter)
+
+    def pasteSanitized(self, text: str) -> None:
+        """Sanitize text and insert it at the cursor.
+
+        With tabular_paste, a table is parsed and emitted with tableParsed
+        and only its preview is inserted. Other text longer than
+        async_paste_threshold is sanitized in a worker thread and inserted
+        in batches; the method returns immediately and pasteFinished is
+        emitted at the end. Nothing happens while another background paste
+        is running.
+
+        In large-document mode, a paste of more than a million characters
+        bypasses the undo history, which it clears; smaller pastes can be
+        undone. Nothing happens while a file is loaded with loadFile().
+
+        Args:
+            text: The text to paste.
+        """
+        if self.isPasting() or self.isFileBacked():
+            return
+        if self._tabular_paste and self._paste_table(text):
+            return
+        if not 0 < self._async_paste_threshold < len(text):
+            self._suspend_undo(len(text))
+            self.insertPlainText(self.sanitizeText(text))
+            self._resume_undo()
+            return
+
+        # The first batch replaces the selection
+        cursor = self.textCursor()
+        self._paste_cursor = cursor
+        self._paste_start = cursor.selectionStart()
+        self._paste_total = len(text)
+        self._paste_inserted = False
+        self._paste_was_read_only = self.isReadOnly()
+        self.setReadOnly(True)
+        self._suspend_undo(len(text))
+
+        self._paste_queue = queue.Queue(maxsize=_PASTE_QUEUE_SIZE)
+        self._paste_cancel = threading.Event()
+        threading.Thread(
+            target=self._run_paste_worker,
+            args=(
+                text,
+                functools.partial(
+                    _sanitize,
+                    tab_replacement=self._tab_replacement,
+                    remove_empty_lines=self._remove_empty_lines,
+                    preserve_whitespace=self._preserve_whitespace,
+                ),
+                self._remove_empty_lines,
+                self._paste_queue,
+                self._paste_cancel,
+            ),
+            name="ezqt-paste-sanitizer",
+            daemon=True,
+        ).start()
+
+    def isPasting(self) -> bool:
+        """Return whether a background paste is running.
+
+        Returns:
+            True while a background paste is running.
+        """
+        return self._paste_queue is not None
+
+    def cancelPaste(self) -> None:
+        """Cancel the running background paste.
+
+        The text inserted so far is removed and pasteFinished(False) is
+        emitted. Does nothing if no background paste is running.
+        """
+        if self._paste_cancel is None or self._paste_cursor is None:
+            return
+        self._paste_cancel.set()
+        cursor = self._paste_cursor
+        if self._paste_inserted:
+            cursor.setPosition(self._paste_start, QTextCursor.MoveMode.KeepAnchor)
+            cursor.joinPreviousEditBlock()
+            cursor.removeSelectedText()
+            cursor.endEditBlock()
+        self._finish_paste(False)
+
+    def loadFile(self, path: str | Path) -> None:
+        """Show a text file without loading it into the document.
+
+        The file is memory-mapped, and the editor becomes a read-only view
+        of it: only the lines that fit in the viewport are read, decoded as
+        UTF-8, each time the view is scrolled. The first chunk of the file
+        is indexed before returning, so the view shows its first lines
+        right away. The rest is indexed in a worker thread (about 3 ms per
+        MiB): the scroll range grows while the index is built, and
+        fileLoaded is emitted with the line count at the end. A file
+        already loaded is closed first.
 
-            # Rejoin lines
-            sanitized = "\n".join(lines)
+        Args:
+            path: The file to show.
+
+        Raises:
+            OSError: If the file cannot be opened or mapped.
+        """
+        if self.isPasting():
+            self.cancelPaste()
+        mapped = _MappedLines(path)
+        self._stop_indexing()
+        if self._mapped is not None:
+            self._mapped.close()
+        else:
+            self._file_was_read_only = self.isReadOnly()
+        self._mapped = mapped
+        self.setReadOnly(True)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+        if self._file_scrollbar is None:
+            self._file_scrollbar = QScrollBar(Qt.Orientation.Vertical, self)
+            self._file_scrollbar.valueChanged.connect(self._show_file_lines)
+        self._file_scrollbar.setValue(0)
+        self._file_scrollbar.show()
+        self.setViewportMargins(0, 0, self._file_scrollbar.sizeHint().width(), 0)
+        # Index the first chunk here, so that the viewport is filled
+        # before returning
+        steps = mapped.index()
+        next(steps, None)
+        self._layout_file_scrollbar()
 
-        return sanitized
+        self._index_cancel = threading.Event()
+        self._index_thread = threading.Thread(
+            target=self._run_index_worker,
+            args=(mapped, steps, self._index_cancel),
+            name="ezqt-file-indexer",
+            daemon=True,
+        )
+        self._index_thread.start()
+
+    def closeFile(self) -> None:
+        """Close the file shown with loadFile() and clear the editor."""
+        if self._mapped is None:
+            return
+        self._stop_indexing()
+        self._mapped.close()
+        self._mapped = None
+        if self._file_scrollbar is not None:
+            self._file_scrollbar.hide()
+        self.setViewportMargins(0, 0, 0, 0)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setReadOnly(self._file_was_read_only)
+        self.clear()
+
+    def isFileBacked(self) -> bool:
+        """Return whether a file is shown with loadFile().
+
+        Returns:
+            True while a memory-mapped file is shown.
+        """
+        return self._mapped is not None
+
+    def scrollToLine(self, line: int) -> None:
+        """Scroll a memory-mapped file so that a line is at the top.
+
+        Args:
+            line: The zero-based line index (clamped to the file).
+        """
+        if self._file_scrollbar is not None and self._mapped is not None:
+            self._file_scrollbar.setValue(int(line))
 
     # ///////////////////////////////////////////////////////////////
     # EVENT HANDLERS
@@ -213,6 +1173,23 @@ class TabReplaceTextEdit(QPlainTextEdit):
         Args:
             event: The key event.
         """
+        # A memory-mapped file is scrolled by line
+        if self._file_scrollbar is not None and self._mapped is not None:
+            action = _FILE_SCROLL_KEYS.get(event.key())
+            if action is not None:
+                self._file_scrollbar.triggerAction(action)
+                event.accept()
+                return
+
+        # A background paste blocks editing; Escape cancels it
+        if self.isPasting():
+            if event.key() == Qt.Key.Key_Escape:
+                self.cancelPaste()
+                event.accept()
+                return
+            super().keyPressEvent(event)
+            return
+
         # Handle tab key
         if event.key() == Qt.Key.Key_Tab:
             # Insert tab replacement
@@ -223,21 +1200,44 @@ class TabReplaceTextEdit(QPlainTextEdit):
 
         # Handle paste
         if self._sanitize_on_paste and event.matches(QKeySequence.StandardKey.Paste):
-            # Get clipboard text
+            # Sanitize and insert clipboard text
             clipboard = QApplication.clipboard()
-            text = clipboard.text()
-
-            # Sanitize text
-            text = self.sanitizeText(text)
-
-            # Insert sanitized text
-            self.insertPlainText(text)
+            self.pasteSanitized(clipboard.text())
             event.accept()
             return
 
         # Default behavior
         super().keyPressEvent(event)
 
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Handle resize events.
+
+        Overridden method from QPlainTextEdit. Fits the lines of a
+        memory-mapped file to the new viewport height.
+
+        Args:
+            event: The resize event.
+        """
+        super().resizeEvent(event)
+        self._layout_file_scrollbar()
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        """Handle wheel events.
+
+        Overridden method from QPlainTextEdit. Scrolls a memory-mapped
+        file by line.
+
+        Args:
+            event: The wheel event.
+        """
+        if self._file_scrollbar is None or self._mapped is None:
+            super().wheelEvent(event)
+            return
+        steps = event.angleDelta().y() / 120
+        scrollbar = self._file_scrollbar
+        scrollbar.setValue(scrollbar.value() - round(steps * _WHEEL_SCROLL_LINES))
+        event.accept()
+
     # ///////////////////////////////////////////////////////////////
     # STYLE METHODS
     # ///////////////////////////////////////////////////////////////
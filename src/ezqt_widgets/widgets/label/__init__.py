@@ -7,7 +7,8 @@
 Label widgets module.
 
 This module provides enhanced label widgets for PySide6 applications,
-including clickable tags, framed labels, hover labels, and indicator labels.
+including clickable tags, framed labels, hover labels, indicator labels,
+indicator grids and tag clouds.
 """
 
 from __future__ import annotations
@@ -15,11 +16,35 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
+# Standard library imports
+from typing import TYPE_CHECKING
+
 # Local imports
-from .clickable_tag_label import ClickableTagLabel
-from .framed_label import FramedLabel
-from .hover_label import HoverLabel
-from .indicator_label import IndicatorLabel
+from ..._lazy import attach
+
+# Type-checking-only imports (names are loaded lazily at runtime)
+if TYPE_CHECKING:
+    from .clickable_tag_label import ClickableTagLabel
+    from .framed_label import FramedLabel
+    from .hover_label import HoverLabel
+    from .indicator_grid import IndicatorGrid
+    from .indicator_label import IndicatorLabel
+    from .tag_cloud import TagCloud
+
+# ///////////////////////////////////////////////////////////////
+# LAZY EXPORTS
+# ///////////////////////////////////////////////////////////////
+
+_EXPORTS: dict[str, str] = {
+    "ClickableTagLabel": ".clickable_tag_label",
+    "FramedLabel": ".framed_label",
+    "HoverLabel": ".hover_label",
+    "IndicatorGrid": ".indicator_grid",
+    "IndicatorLabel": ".indicator_label",
+    "TagCloud": ".tag_cloud",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
@@ -29,5 +54,7 @@ __all__ = [
     "ClickableTagLabel",
     "FramedLabel",
     "HoverLabel",
+    "IndicatorGrid",
     "IndicatorLabel",
+    "TagCloud",
 ]
@@ -26,6 +26,37 @@ from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QSizePolicy
 # Local imports
 from ...types import WidgetParent
 
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_UNSELECTED_COLOR: str = "rgb(86, 86, 86)"
+
+# ///////////////////////////////////////////////////////////////
+# UTILITY FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _tag_stylesheet(status_color: str) -> str:
+    """Build the inner label stylesheet covering both states.
+
+    The selected color is matched through the label's ``status`` dynamic
+    property, so toggling only re-polishes the label and never parses a
+    new stylesheet.
+
+    Args:
+        status_color: The color used when the tag is selected.
+
+    Returns:
+        The stylesheet for the inner label.
+    """
+    return (
+        f"QLabel {{ color: {_UNSELECTED_COLOR}; background-color: transparent;"
+        " border: none; }"
+        f' QLabel[status="selected"] {{ color: {status_color}; }}'
+    )
+
+
 # ///////////////////////////////////////////////////////////////
 # CLASSES
 # ///////////////////////////////////////////////////////////////
@@ -40,6 +71,8 @@ class ClickableTagLabel(QFrame):
         - Customizable text, font, min width/height
         - Customizable status color (traditional name or hex)
         - QSS-friendly (type/class/status properties)
+        - Toggling switches a dynamic property matched by a stylesheet
+          installed once, so no stylesheet is parsed per state change
         - Automatic minimum size calculation
         - Keyboard focus and accessibility
 
@@ -130,6 +163,8 @@ class ClickableTagLabel(QFrame):
         )
         self._label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
 
+        self._label.setStyleSheet(_tag_stylesheet(self._status_color))
+
         self._layout.addWidget(self._label, 0, Qt.AlignmentFlag.AlignTop)
 
         if self._min_width:
@@ -141,20 +176,27 @@ class ClickableTagLabel(QFrame):
         """Update the display based on current state."""
         self._label.setText(self._name)
         self.setObjectName(self._name)
+        self._update_state()
+        self.adjustSize()
 
-        if self._enabled:
-            self.setProperty("status", "selected")
-            self._label.setStyleSheet(
-                f"color: {self._status_color}; background-color: transparent; border: none;"
-            )
-        else:
-            self.setProperty("status", "unselected")
-            self._label.setStyleSheet(
-                "color: rgb(86, 86, 86); background-color: transparent; border: none;"
-            )
+    def _update_state(self) -> None:
+        """Apply the selected state through dynamic properties.
 
-        self.refreshStyle()
-        self.adjustSize()
+        The inner label is re-polished against its pre-installed stylesheet;
+        polish() alone drops the cached rules, so no unpolish pass or
+        stylesheet parse is needed. The frame itself is only re-polished
+        when an application or parent stylesheet may contain
+        ``[status=...]`` selectors.
+        """
+        status = "selected" if self._enabled else "unselected"
+        self.setProperty("status", status)
+        self._label.setProperty("status", status)
+        self._label.style().polish(self._label)
+
+        if self.style().metaObject().className() == "QStyleSheetStyle":
+            self.refreshStyle()
+        else:
+            self.update()
 
     # ///////////////////////////////////////////////////////////////
     # PROPERTIES
@@ -198,7 +240,7 @@ class ClickableTagLabel(QFrame):
         """
         if value != self._enabled:
             self._enabled = bool(value)
-            self._update_display()
+            self._update_state()
             self.stateChanged.emit(self._enabled)
 
     @property
@@ -218,11 +260,7 @@ class ClickableTagLabel(QFrame):
             value: The new status color.
         """
         self._status_color = str(value)
-        if self._enabled:
-            self._label.setStyleSheet(
-                f"color: {value}; background-color: transparent; border: none;"
-            )
-            self.refreshStyle()
+        self._label.setStyleSheet(_tag_stylesheet(self._status_color))
 
     @property
     def min_width(self) -> int | None:
@@ -0,0 +1,662 @@
+# ///////////////////////////////////////////////////////////////
+# INDICATOR_GRID - Indicator Grid Widget
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Indicator grid widget module.
+
+Provides a single painted widget displaying thousands of status LEDs,
+backed by a compact array of status ids, for PySide6 applications.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any, cast
+
+# Third-party imports
+from PySide6.QtCore import QEvent, QPoint, QRect, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QHelpEvent, QMouseEvent, QPainter, QPaintEvent, QPixmap
+from PySide6.QtWidgets import QSizePolicy, QToolTip, QWidget
+
+# Local imports
+from ...types import WidgetParent
+from .indicator_label import (
+    _DEFAULT_STATUS_MAP,
+    _build_status_styles,
+    _paint_led,
+    _StatusStyle,
+)
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Above this share of dirty cells a single full repaint is cheaper than
+# accumulating one update rectangle per cell
+_FULL_REPAINT_RATIO: float = 0.25
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class IndicatorGrid(QWidget):
+    """Single painted widget displaying many status indicators.
+
+    Each cell is an LED whose status is stored as a small integer in a
+    compact ``array('H')`` buffer, so thousands of indicators cost a few
+    bytes each instead of a QFrame with two labels and a layout. Cells use
+    the same status_map format as IndicatorLabel.
+
+    Features:
+        - Compact status storage (2 bytes per cell)
+        - Same status_map format as IndicatorLabel (text, state, color)
+        - Per-status LED pixmaps rendered once per device pixel ratio
+        - Only dirty cells are repainted after updates
+        - Bulk updates via setStatuses(ids, statuses)
+        - Hit-testing with indexAt() and cellRect()
+        - Per-cell tooltips built from optional cell labels
+        - Fixed or width-driven column count
+
+    Args:
+        parent: The parent widget (default: None).
+        count: Number of cells (default: 0).
+        status_map: Dictionary defining possible states, in the same format
+            as IndicatorLabel (default: None, IndicatorLabel defaults).
+        initial_status: Status key assigned to every cell (default: "neutral").
+        columns: Fixed number of columns, or 0 to fit the widget width
+            (default: 0).
+        cell_size: LED diameter in pixels (default: 14).
+        spacing: Gap between cells in pixels (default: 4).
+        *args: Additional arguments passed to QWidget.
+        **kwargs: Additional keyword arguments passed to QWidget.
+
+    Properties:
+        count: Get or set the number of cells.
+        columns: Get or set the fixed column count (0 for automatic).
+        cell_size: Get or set the LED diameter.
+        spacing: Get or set the gap between cells.
+
+    Signals:
+        cellClicked(int): Emitted with the cell index when a cell is clicked.
+        statusesChanged(list): Emitted with the changed cell indices after
+            setStatus() or setStatuses().
+
+    Example:
+        >>> from ezqt_widgets import IndicatorGrid
+        >>> grid = IndicatorGrid(count=5000, columns=100)
+        >>> grid.setLabels([f"device-{i}" for i in range(5000)])
+        >>> grid.setStatuses(range(0, 5000, 2), "online")
+        >>> grid.cellClicked.connect(lambda i: print(f"Cell {i}"))
+        >>> grid.show()
+    """
+
+    cellClicked = Signal(int)
+    statusesChanged = Signal(list)
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        parent: WidgetParent = None,
+        count: int = 0,
+        status_map: dict[str, dict[str, str]] | None = None,
+        initial_status: str = "neutral",
+        columns: int = 0,
+        cell_size: int = 14,
+        spacing: int = 4,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the indicator grid."""
+        super().__init__(parent, *args, **kwargs)
+
+        self.setProperty("type", "IndicatorGrid")
+
+        # Status definitions, indexed by a compact integer id
+        self._status_map: dict[str, dict[str, str]] = status_map or dict(
+            _DEFAULT_STATUS_MAP
+        )
+        styles = _build_status_styles(self._status_map)
+        self._status_keys: list[str] = list(styles)
+        self._status_styles: list[_StatusStyle] = list(styles.values())
+        self._status_ids: dict[str, int] = {
+            key: index for index, key in enumerate(self._status_keys)
+        }
+        self._initial_id: int = self._status_id(initial_status)
+
+        # Geometry
+        self._columns: int = max(0, int(columns))
+        self._cell_size: int = max(4, int(cell_size))
+        self._spacing: int = max(0, int(spacing))
+
+        # Cell storage
+        self._states: array[int] = array("H", [self._initial_id]) * max(0, int(count))
+        self._labels: list[str] = []
+
+        # Per-status LED pixmaps for the current device pixel ratio
+        self._led_pixmaps: list[QPixmap] = []
+        self._led_pixmaps_dpr: float = 0.0
+
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+
+    # ------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------
+
+    def _status_id(self, status: str) -> int:
+        """Return the compact id for a status key.
+
+        Args:
+            status: The status key.
+
+        Returns:
+            The status id.
+
+        Raises:
+            ValueError: If status is not in the status_map.
+        """
+        try:
+            return self._status_ids[status]
+        except KeyError:
+            raise ValueError(f"Unknown status: {status}") from None
+
+    def _check_index(self, index: int) -> None:
+        """Validate a cell index.
+
+        Args:
+            index: The cell index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not 0 <= index < len(self._states):
+            raise IndexError(f"Cell index out of range: {index}")
+
+    def _effective_columns(self, width: int | None = None) -> int:
+        """Return the number of columns used for layout.
+
+        Args:
+            width: The width to fit, or None for the current width.
+
+        Returns:
+            The column count, at least 1.
+        """
+        if self._columns > 0:
+            return self._columns
+        available = (self.width() if width is None else width) - self._spacing
+        return max(1, available // (self._cell_size + self._spacing))
+
+    def _grid_size(self, columns: int) -> QSize:
+        """Return the size needed to show every cell with the given columns.
+
+        Args:
+            columns: The column count.
+
+        Returns:
+            The required size.
+        """
+        pitch = self._cell_size + self._spacing
+        rows = -(-len(self._states) // columns) if self._states else 0
+        return QSize(
+            self._spacing + min(columns, max(1, len(self._states))) * pitch,
+            self._spacing + rows * pitch,
+        )
+
+    def _ensure_led_pixmaps(self, dpr: float) -> None:
+        """Render one LED pixmap per status for the given pixel ratio.
+
+        Args:
+            dpr: The device pixel ratio of the target surface.
+        """
+        if self._led_pixmaps and self._led_pixmaps_dpr == dpr:
+            return
+
+        size = self._cell_size
+        physical = max(1, round(size * dpr))
+        pixmaps: list[QPixmap] = []
+        for style in self._status_styles:
+            pixmap = QPixmap(physical, physical)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            _paint_led(painter, QRectF(0, 0, size, size), style.color)
+            painter.end()
+            pixmaps.append(pixmap)
+
+        self._led_pixmaps = pixmaps
+        self._led_pixmaps_dpr = dpr
+
+    def _invalidate_layout(self) -> None:
+        """Drop cached pixmaps and schedule a relayout and full repaint."""
+        self._led_pixmaps = []
+        self.updateGeometry()
+        self.update()
+
+    def _mark_dirty(self, changed: list[int]) -> None:
+        """Schedule a repaint of the given cells only.
+
+        Args:
+            changed: Indices of the cells whose status changed.
+        """
+        if not changed:
+            return
+        if len(changed) > len(self._states) * _FULL_REPAINT_RATIO:
+            self.update()
+            return
+        for index in changed:
+            self.update(self.cellRect(index))
+
+    # ///////////////////////////////////////////////////////////////
+    # PROPERTIES
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def count(self) -> int:
+        """Get the number of cells.
+
+        Returns:
+            The number of cells.
+        """
+        return len(self._states)
+
+    @count.setter
+    def count(self, value: int) -> None:
+        """Set the number of cells.
+
+        New cells start with the initial status; extra cells are dropped.
+
+        Args:
+            value: The new number of cells.
+        """
+        value = max(0, int(value))
+        current = len(self._states)
+        if value > current:
+            self._states.extend(array("H", [self._initial_id]) * (value - current))
+        elif value < current:
+            del self._states[value:]
+        self._invalidate_layout()
+
+    @property
+    def columns(self) -> int:
+        """Get the fixed column count.
+
+        Returns:
+            The column count, or 0 when columns fit the widget width.
+        """
+        return self._columns
+
+    @columns.setter
+    def columns(self, value: int) -> None:
+        """Set the fixed column count.
+
+        Args:
+            value: The column count, or 0 to fit the widget width.
+        """
+        self._columns = max(0, int(value))
+        self._invalidate_layout()
+
+    @property
+    def cell_size(self) -> int:
+        """Get the LED diameter.
+
+        Returns:
+            The LED diameter in pixels.
+        """
+        return self._cell_size
+
+    @cell_size.setter
+    def cell_size(self, value: int) -> None:
+        """Set the LED diameter.
+
+        Args:
+            value: The LED diameter in pixels (minimum 4).
+        """
+        self._cell_size = max(4, int(value))
+        self._invalidate_layout()
+
+    @property
+    def spacing(self) -> int:
+        """Get the gap between cells.
+
+        Returns:
+            The gap in pixels.
+        """
+        return self._spacing
+
+    @spacing.setter
+    def spacing(self, value: int) -> None:
+        """Set the gap between cells.
+
+        Args:
+            value: The gap in pixels.
+        """
+        self._spacing = max(0, int(value))
+        self._invalidate_layout()
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def status(self, index: int) -> str:
+        """Return the status key of a cell.
+
+        Args:
+            index: The cell index.
+
+        Returns:
+            The status key.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        self._check_index(index)
+        return self._status_keys[self._states[index]]
+
+    def statuses(self) -> list[str]:
+        """Return the status key of every cell.
+
+        Returns:
+            A list of status keys, one per cell.
+        """
+        keys = self._status_keys
+        return [keys[status_id] for status_id in self._states]
+
+    def setStatus(self, index: int, status: str) -> None:
+        """Set the status of a single cell.
+
+        Args:
+            index: The cell index.
+            status: The status key.
+
+        Raises:
+            IndexError: If the index is out of range.
+            ValueError: If status is not in the status_map.
+        """
+        self.setStatuses((index,), (status,))
+
+    def setStatuses(self, ids: Iterable[int], statuses: Iterable[str] | str) -> None:
+        """Set the status of many cells at once.
+
+        Only cells whose status actually changes are repainted, and
+        statusesChanged is emitted once for the whole batch.
+
+        Args:
+            ids: Cell indices (any iterable of ints, e.g. a range or a
+                NumPy array).
+            statuses: One status key per index, or a single key applied to
+                every index.
+
+        Raises:
+            IndexError: If an index is out of range.
+            ValueError: If a status is not in the status_map, or if the
+                number of statuses does not match the number of indices.
+        """
+        indices = [int(index) for index in ids]
+        if isinstance(statuses, str):
+            new_ids = [self._status_id(statuses)] * len(indices)
+        else:
+            new_ids = [self._status_id(status) for status in statuses]
+            if len(new_ids) != len(indices):
+                raise ValueError(
+                    f"Expected {len(indices)} statuses, got {len(new_ids)}"
+                )
+
+        states = self._states
+        if indices and (min(indices) < 0 or max(indices) >= len(states)):
+            bad = next(i for i in indices if not 0 <= i < len(states))
+            raise IndexError(f"Cell index out of range: {bad}")
+
+        changed: list[int] = []
+        for index, status_id in zip(indices, new_ids, strict=True):
+            if states[index] != status_id:
+                states[index] = status_id
+                changed.append(index)
+
+        if changed:
+            self._mark_dirty(changed)
+            self.statusesChanged.emit(changed)
+
+    def setAllStatuses(self, status: str) -> None:
+        """Set every cell to the same status.
+
+        Args:
+            status: The status key.
+
+        Raises:
+            ValueError: If status is not in the status_map.
+        """
+        self.setStatuses(range(len(self._states)), status)
+
+    def label(self, index: int) -> str:
+        """Return the label of a cell.
+
+        Args:
+            index: The cell index.
+
+        Returns:
+            The cell label, or an empty string if none was set.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        self._check_index(index)
+        return self._labels[index] if index < len(self._labels) else ""
+
+    def setLabels(self, labels: Sequence[str]) -> None:
+        """Set the labels shown in cell tooltips.
+
+        Args:
+            labels: One label per cell; missing labels are treated as empty.
+        """
+        self._labels = [str(label) for label in labels]
+
+    def cellRect(self, index: int) -> QRect:
+        """Return the rectangle occupied by a cell.
+
+        Args:
+            index: The cell index.
+
+        Returns:
+            The cell rectangle in widget coordinates.
+        """
+        columns = self._effective_columns()
+        pitch = self._cell_size + self._spacing
+        row, column = divmod(index, columns)
+        return QRect(
+            self._spacing + column * pitch,
+            self._spacing + row * pitch,
+            self._cell_size,
+            self._cell_size,
+        )
+
+    def indexAt(self, pos: QPoint) -> int:
+        """Return the index of the cell under a point.
+
+        Args:
+            pos: The point in widget coordinates.
+
+        Returns:
+            The cell index, or -1 if no cell is under the point.
+        """
+        pitch = self._cell_size + self._spacing
+        x = pos.x() - self._spacing
+        y = pos.y() - self._spacing
+        if x < 0 or y < 0:
+            return -1
+        column, x_offset = divmod(x, pitch)
+        row, y_offset = divmod(y, pitch)
+        columns = self._effective_columns()
+        if column >= columns or x_offset >= self._cell_size:
+            return -1
+        if y_offset >= self._cell_size:
+            return -1
+        index = row * columns + column
+        return index if index < len(self._states) else -1
+
+    def toolTipAt(self, index: int) -> str:
+        """Return the tooltip text for a cell.
+
+        Args:
+            index: The cell index.
+
+        Returns:
+            The cell label and status text, or the status text alone.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        self._check_index(index)
+        text = self._status_styles[self._states[index]].text
+        label = self.label(index)
+        return f"{label}: {text}" if label else text
+
+    # ///////////////////////////////////////////////////////////////
+    # EVENT HANDLERS
+    # ///////////////////////////////////////////////////////////////
+
+    def event(self, event: QEvent) -> bool:
+        """Show per-cell tooltips.
+
+        Args:
+            event: The event.
+
+        Returns:
+            True if the event was handled.
+        """
+        if event.type() == QEvent.Type.ToolTip and isinstance(event, QHelpEvent):
+            index = self.indexAt(event.pos())
+            if index >= 0:
+                QToolTip.showText(
+                    event.globalPos(), self.toolTipAt(index), self, self.cellRect(index)
+                )
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """Emit cellClicked for left clicks on a cell.
+
+        Args:
+            event: The mouse event.
+        """
+        if event.button() == Qt.MouseButton.LeftButton:
+            index = self.indexAt(event.position().toPoint())
+            if index >= 0:
+                self.cellClicked.emit(index)
+        super().mousePressEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint the cells intersecting the exposed region.
+
+        Args:
+            event: The paint event.
+        """
+        if not self._states:
+            return
+
+        self._ensure_led_pixmaps(self.devicePixelRatioF())
+        pixmaps = self._led_pixmaps
+        states = self._states
+
+        columns = self._effective_columns()
+        pitch = self._cell_size + self._spacing
+        painter = QPainter(self)
+        # The bounding rect of scattered updates spans every cell between
+        # them: walk the dirty rects one at a time, each clipped to itself
+        # so that a cell crossing two rects is not blended twice. QRegion
+        # iterates over its rects, which its stubs do not declare
+        for exposed in cast("Iterable[QRect]", event.region()):
+            painter.setClipRect(exposed)
+            first_row = max(0, (exposed.top() - self._spacing) // pitch)
+            last_row = (exposed.bottom() - self._spacing) // pitch
+            first_column = max(0, (exposed.left() - self._spacing) // pitch)
+            last_column = min(columns - 1, (exposed.right() - self._spacing) // pitch)
+            for row in range(first_row, last_row + 1):
+                row_start = row * columns
+                if row_start >= len(states):
+                    break
+                y = self._spacing + row * pitch
+                for column in range(first_column, last_column + 1):
+                    index = row_start + column
+                    if index >= len(states):
+                        break
+                    painter.drawPixmap(
+                        self._spacing + column * pitch, y, pixmaps[states[index]]
+                    )
+        painter.end()
+
+    # ///////////////////////////////////////////////////////////////
+    # OVERRIDE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def hasHeightForWidth(self) -> bool:
+        """Return whether the preferred height depends on the width.
+
+        Returns:
+            True when columns fit the widget width.
+        """
+        return self._columns == 0
+
+    def heightForWidth(self, width: int) -> int:
+        """Return the height needed to show every cell at a given width.
+
+        Args:
+            width: The candidate width.
+
+        Returns:
+            The preferred height.
+        """
+        return self._grid_size(self._effective_columns(width)).height()
+
+    def sizeHint(self) -> QSize:
+        """Return the recommended size for the widget.
+
+        Returns:
+            The recommended size.
+        """
+        if self._columns > 0:
+            return self._grid_size(self._columns)
+        # Roughly square layout when columns follow the width
+        columns = max(1, int(len(self._states) ** 0.5))
+        return self._grid_size(columns)
+
+    def minimumSizeHint(self) -> QSize:
+        """Return the minimum size for the widget.
+
+        Returns:
+            The minimum size hint.
+        """
+        edge = self._cell_size + 2 * self._spacing
+        return QSize(edge, edge)
+
+    # ///////////////////////////////////////////////////////////////
+    # STYLE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def refreshStyle(self) -> None:
+        """Refresh the widget style.
+
+        Useful after dynamic stylesheet changes.
+        """
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["IndicatorGrid"]
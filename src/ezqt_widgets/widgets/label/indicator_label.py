@@ -16,26 +16,145 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
-from typing import Any
+import threading
+from typing import Any, NamedTuple
 
 # Third-party imports
-from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QFont
-from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QSizePolicy
+from PySide6.QtCore import QRectF, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPaintEvent, QPen
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QSizePolicy, QWidget
 
 # Local imports
 from ...types import WidgetParent
+from ..shared import parse_css_color
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_DEFAULT_TEXT: str = "Unknown"
+_DEFAULT_STATE: str = "none"
+_DEFAULT_COLOR: str = "#A0A0A0"
+
+_LED_SIZE: QSize = QSize(13, 16)
+_LED_BORDER_COLOR: QColor = QColor(66, 66, 66)
+_LED_BORDER_WIDTH: int = 2
+_LED_MARGIN_TOP: int = 3
+
+_DEFAULT_STATUS_MAP: dict[str, dict[str, str]] = {
+    "neutral": {"text": "Waiting", "state": "none", "color": "#A0A0A0"},
+    "online": {"text": "Online", "state": "ok", "color": "#4CAF50"},
+    "partial": {
+        "text": "Services disrupted",
+        "state": "partial",
+        "color": "#FFC107",
+    },
+    "offline": {"text": "Offline", "state": "ko", "color": "#F44336"},
+}
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _build_status_styles(
+    status_map: dict[str, dict[str, str]],
+) -> dict[str, _StatusStyle]:
+    """Precompute text, state and LED color for every status.
+
+    Args:
+        status_map: The status definitions (see IndicatorLabel).
+
+    Returns:
+        A mapping from status key to its display data.
+    """
+    return {
+        key: _StatusStyle(
+            text=info.get("text", _DEFAULT_TEXT),
+            state=info.get("state", _DEFAULT_STATE),
+            color=parse_css_color(info.get("color", _DEFAULT_COLOR)),
+        )
+        for key, info in status_map.items()
+    }
+
+
+def _paint_led(painter: QPainter, rect: QRectF, color: QColor) -> None:
+    """Paint a bordered LED circle inside the given rectangle.
+
+    Args:
+        painter: An active painter.
+        rect: The outer bounds of the LED, border included.
+        color: The fill color.
+    """
+    inset = _LED_BORDER_WIDTH / 2
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(QPen(_LED_BORDER_COLOR, _LED_BORDER_WIDTH))
+    painter.setBrush(QBrush(color))
+    painter.drawEllipse(rect.adjusted(inset, inset, -inset, -inset))
+
 
 # ///////////////////////////////////////////////////////////////
 # CLASSES
 # ///////////////////////////////////////////////////////////////
 
 
+class _StatusStyle(NamedTuple):
+    """Precomputed display data for one status_map entry."""
+
+    text: str
+    state: str
+    color: QColor
+
+
+class _IndicatorLed(QWidget):
+    """Internal painted LED used by IndicatorLabel.
+
+    Draws a bordered circle in the current color. Changing the color only
+    schedules a repaint, no stylesheet is parsed.
+    """
+
+    def __init__(self, parent: WidgetParent = None) -> None:
+        """Initialize the LED widget."""
+        super().__init__(parent)
+        self._color: QColor = QColor(_DEFAULT_COLOR)
+        self.setFixedSize(_LED_SIZE)
+
+    @property
+    def color(self) -> QColor:
+        """Get the LED fill color.
+
+        Returns:
+            The current fill color.
+        """
+        return self._color
+
+    def setColor(self, color: QColor) -> None:
+        """Set the LED fill color and schedule a repaint.
+
+        Args:
+            color: The new fill color.
+        """
+        if color != self._color:
+            self._color = color
+            self.update()
+
+    def paintEvent(self, _event: QPaintEvent) -> None:
+        """Paint the LED circle.
+
+        Args:
+            _event: The paint event (unused but required by signature).
+        """
+        diameter = self.width()
+        painter = QPainter(self)
+        _paint_led(painter, QRectF(0, _LED_MARGIN_TOP, diameter, diameter), self._color)
+        painter.end()
+
+
 class IndicatorLabel(QFrame):
     """Dynamic status indicator widget with label and colored LED.
 
-    This widget encapsulates a QLabel for the status text and a QLabel for
-    the LED, both arranged horizontally. The possible states are defined in
+    This widget encapsulates a QLabel for the status text and a painted LED,
+    both arranged horizontally. The possible states are defined in
     a configurable dictionary (status_map), allowing for flexible text, color,
     and state property assignment.
 
@@ -45,6 +164,11 @@ class IndicatorLabel(QFrame):
         - Emits a statusChanged(str) signal when the status changes
         - Allows custom status sets and colors for various use cases
         - Suitable for online/offline indicators, service status, etc.
+        - Per-status styling precomputed once; the LED is painted directly,
+          so a status change never parses a stylesheet
+        - Optional coalescing: at most one repaint and one statusChanged
+          per coalesce_interval, the latest status wins
+        - Thread-safe postStatus() for feeding statuses from worker threads
 
     Args:
         parent: The parent widget (default: None).
@@ -60,9 +184,16 @@ class IndicatorLabel(QFrame):
                     ...
                 }
         initial_status: The initial status key to use (default: "neutral").
+        coalesce_interval: Coalescing window in milliseconds. When greater
+            than 0, status changes are throttled to one per window and the
+            latest status wins (default: 0, disabled).
         *args: Additional arguments passed to QFrame.
         **kwargs: Additional keyword arguments passed to QFrame.
 
+    Properties:
+        status: Get or set the current status key.
+        coalesce_interval: Get or set the coalescing window in milliseconds.
+
     Signals:
         statusChanged(str): Emitted when the status changes.
 
@@ -80,6 +211,7 @@ class IndicatorLabel(QFrame):
     """
 
     statusChanged = Signal(str)
+    _statusPosted = Signal()
 
     # ///////////////////////////////////////////////////////////////
     # INIT
@@ -90,6 +222,7 @@ class IndicatorLabel(QFrame):
         parent: WidgetParent = None,
         status_map: dict[str, dict[str, str]] | None = None,
         initial_status: str = "neutral",
+        coalesce_interval: int = 0,
         *args: Any,
         **kwargs: Any,
     ) -> None:
@@ -99,27 +232,41 @@ class IndicatorLabel(QFrame):
         self.setProperty("type", "IndicatorLabel")
 
         # Default status map
-        self._status_map: dict[str, dict[str, str]] = status_map or {
-            "neutral": {"text": "Waiting", "state": "none", "color": "#A0A0A0"},
-            "online": {"text": "Online", "state": "ok", "color": "#4CAF50"},
-            "partial": {
-                "text": "Services disrupted",
-                "state": "partial",
-                "color": "#FFC107",
-            },
-            "offline": {"text": "Offline", "state": "ko", "color": "#F44336"},
-        }
+        self._status_map: dict[str, dict[str, str]] = status_map or dict(
+            _DEFAULT_STATUS_MAP
+        )
+
+        # Precomputed per-status display data
+        self._status_styles: dict[str, _StatusStyle] = _build_status_styles(
+            self._status_map
+        )
 
         # State variables
         self._current_status: str = ""
         self._status_label: QLabel | None = None
-        self._led_label: QLabel | None = None
+        self._led: _IndicatorLed | None = None
+
+        # Coalescing state (GUI thread), enabled after the initial status
+        self._coalesce_interval: int = 0
+        self._pending_status: str | None = None
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.timeout.connect(self._flush_pending_status)
+
+        # Cross-thread ingestion state (guarded by _post_lock)
+        self._post_lock = threading.Lock()
+        self._posted_status: str | None = None
+        self._post_scheduled: bool = False
+        self._statusPosted.connect(
+            self._on_status_posted, Qt.ConnectionType.QueuedConnection
+        )
 
         # Setup widget
         self._setup_widget()
 
         # Set initial status
         self.status = initial_status
+        self._coalesce_interval = max(0, int(coalesce_interval))
 
     # ------------------------------------------------
     # PRIVATE METHODS
@@ -150,38 +297,62 @@ class IndicatorLabel(QFrame):
             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
         )
 
-        self._led_label = QLabel()
-        self._led_label.setObjectName("status_led")
-        self._led_label.setFixedSize(QSize(13, 16))
-        self._led_label.setFont(QFont("Segoe UI", 10))
-        self._led_label.setLineWidth(0)
-        self._led_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._led = _IndicatorLed()
+        self._led.setObjectName("status_led")
 
         self._layout.addWidget(self._status_label, 0, Qt.AlignmentFlag.AlignTop)
-        self._layout.addWidget(self._led_label, 0, Qt.AlignmentFlag.AlignTop)
+        self._layout.addWidget(self._led, 0, Qt.AlignmentFlag.AlignTop)
 
     def _update_display(self) -> None:
         """Update the display based on current status."""
-        if not self._status_label or not self._led_label:
+        if not self._status_label or not self._led:
+            return
+
+        style = self._status_styles.get(self._current_status)
+        if style is None:
             return
 
-        status_info = self._status_map.get(self._current_status, {})
-        text = status_info.get("text", "Unknown")
-        state = status_info.get("state", "none")
-        color = status_info.get("color", "#A0A0A0")
+        if self._status_label.text() != style.text:
+            self._status_label.setText(style.text)
+        self._led.setColor(style.color)
 
-        self._status_label.setText(text)
+        if self.property("state") != style.state:
+            self.setProperty("state", style.state)
+            # Re-polishing is only needed for [state=...] QSS selectors
+            if self.style().metaObject().className() == "QStyleSheetStyle":
+                self.style().unpolish(self)
+                self.style().polish(self)
 
-        self._led_label.setStyleSheet(f"""
-            background-color: {color};
-            border: 2px solid rgb(66, 66, 66);
-            border-radius: 6px;
-            margin-top: 3px;
-            """)
+    def _apply_status(self, status: str) -> None:
+        """Apply a validated status, repaint and notify on change.
 
-        self.setProperty("state", state)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        Args:
+            status: The status key to apply.
+        """
+        if status != self._current_status:
+            self._current_status = status
+            self._update_display()
+            self.statusChanged.emit(self._current_status)
+
+    def _flush_pending_status(self) -> None:
+        """Apply the latest status received during the coalescing window."""
+        status = self._pending_status
+        self._pending_status = None
+        if status is None:
+            return
+        self._apply_status(status)
+        # Keep throttling while samples keep arriving
+        if self._coalesce_interval > 0:
+            self._coalesce_timer.start(self._coalesce_interval)
+
+    def _on_status_posted(self) -> None:
+        """Consume the latest status posted from a worker thread."""
+        with self._post_lock:
+            status = self._posted_status
+            self._posted_status = None
+            self._post_scheduled = False
+        if status is not None:
+            self.setStatus(status)
 
     # ///////////////////////////////////////////////////////////////
     # PROPERTIES
@@ -205,6 +376,29 @@ class IndicatorLabel(QFrame):
         """
         self.setStatus(value)
 
+    @property
+    def coalesce_interval(self) -> int:
+        """Get the coalescing window.
+
+        Returns:
+            The coalescing window in milliseconds (0 when disabled).
+        """
+        return self._coalesce_interval
+
+    @coalesce_interval.setter
+    def coalesce_interval(self, value: int) -> None:
+        """Set the coalescing window.
+
+        Disabling coalescing applies any pending status immediately.
+
+        Args:
+            value: The coalescing window in milliseconds (0 to disable).
+        """
+        self._coalesce_interval = max(0, int(value))
+        if self._coalesce_interval == 0:
+            self._coalesce_timer.stop()
+            self._flush_pending_status()
+
     # ///////////////////////////////////////////////////////////////
     # PUBLIC METHODS
     # ///////////////////////////////////////////////////////////////
@@ -212,6 +406,10 @@ class IndicatorLabel(QFrame):
     def setStatus(self, status: str) -> None:
         """Set the current status and update the display.
 
+        When coalescing is enabled, the first change of a window is applied
+        immediately and later ones only record the latest status, which is
+        applied when the window ends.
+
         Args:
             status: The status key to set.
 
@@ -221,10 +419,37 @@ class IndicatorLabel(QFrame):
         if status not in self._status_map:
             raise ValueError(f"Unknown status: {status}")
 
-        if status != self._current_status:
-            self._current_status = status
-            self._update_display()
-            self.statusChanged.emit(self._current_status)
+        if self._coalesce_interval > 0 and self._coalesce_timer.isActive():
+            self._pending_status = status
+            return
+
+        self._pending_status = None
+        self._apply_status(status)
+        if self._coalesce_interval > 0:
+            self._coalesce_timer.start(self._coalesce_interval)
+
+    def postStatus(self, status: str) -> None:
+        """Set the status from any thread.
+
+        Only the latest posted status is kept. A single queued wake-up is
+        sent to the GUI thread until it has been consumed, so posting at a
+        high rate does not queue one event per sample.
+
+        Args:
+            status: The status key to set.
+
+        Raises:
+            ValueError: If status is not in the status_map.
+        """
+        if status not in self._status_map:
+            raise ValueError(f"Unknown status: {status}")
+
+        with self._post_lock:
+            self._posted_status = status
+            if self._post_scheduled:
+                return
+            self._post_scheduled = True
+        self._statusPosted.emit()
 
     # ///////////////////////////////////////////////////////////////
     # STYLE METHODS
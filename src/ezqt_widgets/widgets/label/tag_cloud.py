@@ -0,0 +1,804 @@
+# ///////////////////////////////////////////////////////////////
+# TAG_CLOUD - Tag Cloud Widget
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Tag cloud widget module.
+
+Provides a single painted widget displaying thousands of toggleable tags
+in a flow layout, backed by a compact selection bitset, for PySide6
+applications.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import Any, cast
+
+# Third-party imports
+from PySide6.QtCore import QEvent, QPoint, QPointF, QRect, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QKeyEvent,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPen,
+    QResizeEvent,
+    QStaticText,
+)
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+# Local imports
+from ...types import WidgetParent
+from ..shared import parse_css_color
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Same look as ClickableTagLabel
+_DEFAULT_STATUS_COLOR: str = "#0078d4"
+_DEFAULT_UNSELECTED_COLOR: str = "rgb(86, 86, 86)"
+_DEFAULT_BORDER_COLOR: QColor = QColor("#444444")
+_TAG_PADDING: int = 8
+_TAG_RADIUS: float = 4.0
+
+# Above this share of dirty tags a single full repaint is cheaper than
+# accumulating one update rectangle per tag
+_FULL_REPAINT_RATIO: float = 0.25
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TagCloud(QWidget):
+    """Single painted widget displaying many toggleable tags.
+
+    Tags are laid out left to right and wrap to the widget width. Each tag
+    costs a prepared QStaticText and a few integers of layout data; the
+    selected state lives in a bitset (one bit per tag). This replaces one
+    ClickableTagLabel (a QFrame with a layout, a QLabel and its own
+    stylesheet) per tag.
+
+    Features:
+        - Flow layout wrapping to the widget width (height-for-width)
+        - Glyph layout cached per tag with QStaticText
+        - Compact selection bitset (1 bit per tag)
+        - Only toggled tags are repainted
+        - Same clicked/toggleKeyword/stateChanged signals as
+          ClickableTagLabel, keyed by tag name
+        - Bulk selection via setSelectedTags() with a single
+          selectionChanged emission
+        - Keyboard navigation (arrows, Home/End) and Space/Enter toggle
+
+    Args:
+        parent: The parent widget (default: None).
+        tags: Tag names, duplicates are ignored (default: ()).
+        selected: Names of the initially selected tags (default: ()).
+        status_color: Color of selected tags (default: "#0078d4").
+        spacing: Gap between tags in pixels (default: 4).
+        tag_height: Height of each tag in pixels (default: 20).
+        *args: Additional arguments passed to QWidget.
+        **kwargs: Additional keyword arguments passed to QWidget.
+
+    Properties:
+        status_color: Get or set the color of selected tags.
+        spacing: Get or set the gap between tags.
+        tag_height: Get or set the height of each tag.
+
+    Signals:
+        clicked(str): Emitted with the tag name when a tag is clicked.
+        toggleKeyword(str): Emitted with the tag name when a tag is toggled
+            by the user.
+        stateChanged(str, bool): Emitted when a single tag changes state.
+        selectionChanged(list): Emitted once with the names of the changed
+            tags after any selection change.
+
+    Example:
+        >>> from ezqt_widgets import TagCloud
+        >>> cloud = TagCloud(tags=[f"tag-{i}" for i in range(3000)])
+        >>> cloud.stateChanged.connect(lambda name, on: print(name, on))
+        >>> cloud.setSelectedTags(["tag-1", "tag-42"])
+        >>> cloud.show()
+    """
+
+    clicked = Signal(str)
+    toggleKeyword = Signal(str)
+    stateChanged = Signal(str, bool)
+    selectionChanged = Signal(list)
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        parent: WidgetParent = None,
+        tags: Iterable[str] = (),
+        selected: Iterable[str] = (),
+        status_color: str = _DEFAULT_STATUS_COLOR,
+        spacing: int = 4,
+        tag_height: int = 20,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the tag cloud."""
+        super().__init__(parent, *args, **kwargs)
+
+        self.setProperty("type", "TagCloud")
+        self.setFont(QFont("Segoe UI", 8))
+
+        # Appearance
+        self._status_color: str = status_color
+        self._selected_qcolor: QColor = parse_css_color(status_color)
+        self._unselected_qcolor: QColor = parse_css_color(_DEFAULT_UNSELECTED_COLOR)
+        self._spacing: int = max(0, int(spacing))
+        self._tag_height: int = max(8, int(tag_height))
+
+        # Tag storage
+        self._tags: list[str] = []
+        self._tag_index: dict[str, int] = {}
+        self._static_texts: list[QStaticText] = []
+        self._widths: array[int] = array("i")
+        self._selected: bytearray = bytearray()
+
+        # Flow layout cache: x offset per tag and first tag of each row
+        self._xs: array[int] = array("i")
+        self._row_starts: array[int] = array("i")
+        self._layout_width: int = -1
+        # Last layout computed by heightForWidth() for another width
+        self._queried_flow: tuple[int, array[int], array[int]] | None = None
+
+        # Keyboard focus
+        self._current: int = -1
+
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+        self.setTags(tags)
+        self._apply_selection(selected, True)
+
+    # ------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------
+
+    def _is_set(self, index: int) -> bool:
+        """Return whether the selection bit of a tag is set.
+
+        Args:
+            index: The tag index.
+
+        Returns:
+            True if the tag is selected.
+        """
+        return bool(self._selected[index >> 3] & (1 << (index & 7)))
+
+    def _set_bit(self, index: int, value: bool) -> bool:
+        """Set the selection bit of a tag.
+
+        Args:
+            index: The tag index.
+            value: The new selected state.
+
+        Returns:
+            True if the bit changed.
+        """
+        byte, mask = index >> 3, 1 << (index & 7)
+        current = self._selected[byte]
+        new = current | mask if value else current & ~mask
+        if new == current:
+            return False
+        self._selected[byte] = new
+        return True
+
+    def _tag_id(self, name: str) -> int:
+        """Return the index of a tag.
+
+        Args:
+            name: The tag name.
+
+        Returns:
+            The tag index.
+
+        Raises:
+            KeyError: If the tag does not exist.
+        """
+        try:
+            return self._tag_index[name]
+        except KeyError:
+            raise KeyError(f"Unknown tag: {name}") from None
+
+    def _measure_tags(self) -> None:
+        """Prepare static texts and widths for every tag with the current font."""
+        font = self.font()
+        metrics = QFontMetrics(font)
+        static_texts: list[QStaticText] = []
+        widths = array("i")
+        for name in self._tags:
+            static_text = QStaticText(name)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.setPerformanceHint(
+                QStaticText.PerformanceHint.AggressiveCaching
+            )
+            static_text.prepare(font=font)
+            static_texts.append(static_text)
+            widths.append(metrics.horizontalAdvance(name) + 2 * _TAG_PADDING)
+        self._static_texts = static_texts
+        self._widths = widths
+
+    def _flow(self, width: int) -> tuple[array[int], array[int]]:
+        """Compute the flow layout for a given width.
+
+        Args:
+            width: The available width.
+
+        Returns:
+            The x offset of each tag and the index of the first tag of each
+            row.
+        """
+        spacing = self._spacing
+        xs = array("i", [0]) * len(self._widths)
+        row_starts = array("i")
+        x = spacing
+        for index, tag_width in enumerate(self._widths):
+            if index == 0 or (x + tag_width > width - spacing and x > spacing):
+                row_starts.append(index)
+                x = spacing
+            xs[index] = x
+            x += tag_width + spacing
+        return xs, row_starts
+
+    def _flow_for(self, width: int) -> tuple[array[int], array[int]]:
+        """Return the flow layout for a width, reusing cached layouts.
+
+        Args:
+            width: The available width.
+
+        Returns:
+            The x offset of each tag and the index of the first tag of each
+            row.
+        """
+        if width == self._layout_width:
+            return self._xs, self._row_starts
+        queried = self._queried_flow
+        if queried is not None and queried[0] == width:
+            return queried[1], queried[2]
+        xs, row_starts = self._flow(width)
+        self._queried_flow = (width, xs, row_starts)
+        return xs, row_starts
+
+    def _ensure_layout(self) -> None:
+        """Recompute the flow layout if the width changed."""
+        width = self.width()
+        if width != self._layout_width:
+            self._xs, self._row_starts = self._flow_for(width)
+            self._layout_width = width
+
+    def _invalidate_layout(self) -> None:
+        """Drop the cached flow layout and schedule a relayout and repaint."""
+        self._layout_width = -1
+        self._queried_flow = None
+        self.updateGeometry()
+        self.update()
+
+    def _row_of(self, index: int) -> int:
+        """Return the row containing a tag.
+
+        Args:
+            index: The tag index.
+
+        Returns:
+            The row number.
+        """
+        return bisect_right(self._row_starts, index) - 1
+
+    def _vertical_neighbor(self, index: int, step: int) -> int:
+        """Return the tag above or below a tag.
+
+        Args:
+            index: The tag index, or -1 when no tag has the focus.
+            step: -1 for the row above, 1 for the row below.
+
+        Returns:
+            The tag of the adjacent row under the horizontal center of the
+            given tag, or the tag itself on the first or last row.
+        """
+        if index < 0:
+            return 0
+        self._ensure_layout()
+        row = self._row_of(index) + step
+        rows = len(self._row_starts)
+        if not 0 <= row < rows:
+            return index
+        start = self._row_starts[row]
+        end = self._row_starts[row + 1] if row + 1 < rows else len(self._tags)
+        center = self._xs[index] + self._widths[index] // 2
+        return max(start, bisect_right(self._xs, center, start, end) - 1)
+
+    def _apply_selection(self, names: Iterable[str], value: bool) -> list[int]:
+        """Set the selected state of many tags without emitting signals.
+
+        Args:
+            names: The tag names.
+            value: The new selected state.
+
+        Returns:
+            The indices of the tags whose state changed.
+
+        Raises:
+            KeyError: If a tag does not exist.
+        """
+        indices = [self._tag_id(name) for name in names]
+        changed = [index for index in indices if self._set_bit(index, value)]
+        self._mark_dirty(changed)
+        return changed
+
+    def _mark_dirty(self, changed: list[int]) -> None:
+        """Schedule a repaint of the given tags only.
+
+        Args:
+            changed: Indices of the tags whose state changed.
+        """
+        if not changed:
+            return
+        if len(changed) > len(self._tags) * _FULL_REPAINT_RATIO:
+            self.update()
+            return
+        for index in changed:
+            self.update(self.tagRect(index))
+
+    def _toggle(self, index: int) -> None:
+        """Toggle a tag as a user action and emit the related signals.
+
+        Args:
+            index: The tag index.
+        """
+        name = self._tags[index]
+        value = not self._is_set(index)
+        self._set_bit(index, value)
+        self._mark_dirty([index])
+        self.clicked.emit(name)
+        self.stateChanged.emit(name, value)
+        self.toggleKeyword.emit(name)
+        self.selectionChanged.emit([name])
+
+    def _set_current(self, index: int) -> None:
+        """Move the keyboard focus to a tag.
+
+        Args:
+            index: The tag index.
+        """
+        previous = self._current
+        self._current = index
+        if 0 <= previous < len(self._tags):
+            self.update(self.tagRect(previous))
+        self.update(self.tagRect(index))
+
+    # ///////////////////////////////////////////////////////////////
+    # PROPERTIES
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def status_color(self) -> str:
+        """Get the color of selected tags.
+
+        Returns:
+            The current status color.
+        """
+        return self._status_color
+
+    @status_color.setter
+    def status_color(self, value: str) -> None:
+        """Set the color of selected tags.
+
+        Args:
+            value: The new status color (name, hex or rgb()).
+        """
+        self._status_color = str(value)
+        self._selected_qcolor = parse_css_color(self._status_color)
+        self.update()
+
+    @property
+    def spacing(self) -> int:
+        """Get the gap between tags.
+
+        Returns:
+            The gap in pixels.
+        """
+        return self._spacing
+
+    @spacing.setter
+    def spacing(self, value: int) -> None:
+        """Set the gap between tags.
+
+        Args:
+            value: The gap in pixels.
+        """
+        self._spacing = max(0, int(value))
+        self._invalidate_layout()
+
+    @property
+    def tag_height(self) -> int:
+        """Get the height of each tag.
+
+        Returns:
+            The tag height in pixels.
+        """
+        return self._tag_height
+
+    @tag_height.setter
+    def tag_height(self, value: int) -> None:
+        """Set the height of each tag.
+
+        Args:
+            value: The tag height in pixels (minimum 8).
+        """
+        self._tag_height = max(8, int(value))
+        self._invalidate_layout()
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def tags(self) -> list[str]:
+        """Return every tag name in display order.
+
+        Returns:
+            A list of tag names.
+        """
+        return list(self._tags)
+
+    def setTags(self, tags: Iterable[str]) -> None:
+        """Replace every tag.
+
+        The selection is cleared. Duplicate names are ignored.
+
+        Args:
+            tags: The new tag names.
+        """
+        names = list(dict.fromkeys(str(tag) for tag in tags))
+        self._tags = names
+        self._tag_index = {name: index for index, name in enumerate(names)}
+        self._selected = bytearray((len(names) + 7) // 8)
+        self._current = -1
+        self._measure_tags()
+        self._invalidate_layout()
+
+    def isSelected(self, name: str) -> bool:
+        """Return whether a tag is selected.
+
+        Args:
+            name: The tag name.
+
+        Returns:
+            True if the tag is selected.
+
+        Raises:
+            KeyError: If the tag does not exist.
+        """
+        return self._is_set(self._tag_id(name))
+
+    def setSelected(self, name: str, selected: bool = True) -> None:
+        """Set the selected state of a single tag.
+
+        Args:
+            name: The tag name.
+            selected: The new selected state (default: True).
+
+        Raises:
+            KeyError: If the tag does not exist.
+        """
+        if self._apply_selection((name,), bool(selected)):
+            self.stateChanged.emit(name, bool(selected))
+            self.selectionChanged.emit([name])
+
+    def selectedTags(self) -> list[str]:
+        """Return the names of the selected tags in display order.
+
+        Returns:
+            A list of tag names.
+        """
+        return [name for index, name in enumerate(self._tags) if self._is_set(index)]
+
+    def setSelectedTags(self, names: Iterable[str]) -> None:
+        """Select exactly the given tags.
+
+        Only tags whose state changes are repainted, and selectionChanged is
+        emitted once for the whole batch. stateChanged is not emitted.
+
+        Args:
+            names: The names of the tags to select.
+
+        Raises:
+            KeyError: If a tag does not exist.
+        """
+        wanted = {self._tag_id(name) for name in names}
+        changed = [
+            index
+            for index in range(len(self._tags))
+            if self._set_bit(index, index in wanted)
+        ]
+        self._mark_dirty(changed)
+        if changed:
+            self.selectionChanged.emit([self._tags[index] for index in changed])
+
+    def clearSelection(self) -> None:
+        """Deselect every tag."""
+        self.setSelectedTags(())
+
+    def tagRect(self, index: int) -> QRect:
+        """Return the rectangle occupied by a tag.
+
+        Args:
+            index: The tag index.
+
+        Returns:
+            The tag rectangle in widget coordinates.
+        """
+        self._ensure_layout()
+        row = self._row_of(index)
+        return QRect(
+            self._xs[index],
+            self._spacing + row * (self._tag_height + self._spacing),
+            self._widths[index],
+            self._tag_height,
+        )
+
+    def indexAt(self, pos: QPoint) -> int:
+        """Return the index of the tag under a point.
+
+        Args:
+            pos: The point in widget coordinates.
+
+        Returns:
+            The tag index, or -1 if no tag is under the point.
+        """
+        if not self._tags:
+            return -1
+        self._ensure_layout()
+        pitch = self._tag_height + self._spacing
+        y = pos.y() - self._spacing
+        if y < 0 or y % pitch >= self._tag_height:
+            return -1
+        row = y // pitch
+        if row >= len(self._row_starts):
+            return -1
+        start = self._row_starts[row]
+        end = (
+            self._row_starts[row + 1]
+            if row + 1 < len(self._row_starts)
+            else len(self._tags)
+        )
+        index = bisect_right(self._xs, pos.x(), start, end) - 1
+        if index < start:
+            return -1
+        if pos.x() >= self._xs[index] + self._widths[index]:
+            return -1
+        return index
+
+    def tagAt(self, pos: QPoint) -> str | None:
+        """Return the name of the tag under a point.
+
+        Args:
+            pos: The point in widget coordinates.
+
+        Returns:
+            The tag name, or None if no tag is under the point.
+        """
+        index = self.indexAt(pos)
+        return self._tags[index] if index >= 0 else None
+
+    # ///////////////////////////////////////////////////////////////
+    # EVENT HANDLERS
+    # ///////////////////////////////////////////////////////////////
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Re-measure tags when the font changes.
+
+        Args:
+            event: The change event.
+        """
+        if event.type() == QEvent.Type.FontChange and hasattr(self, "_tags"):
+            self._measure_tags()
+            self._invalidate_layout()
+        super().changeEvent(event)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Reflow tags when the width changes.
+
+        Args:
+            event: The resize event.
+        """
+        if event.size().width() != event.oldSize().width():
+            self._layout_width = -1
+        super().resizeEvent(event)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """Toggle the tag under the cursor on left click.
+
+        Args:
+            event: The mouse event.
+        """
+        if event.button() == Qt.MouseButton.LeftButton:
+            index = self.indexAt(event.position().toPoint())
+            if index >= 0:
+                self._set_current(index)
+                self._toggle(index)
+        super().mousePressEvent(event)
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        """Handle keyboard navigation and toggling.
+
+        Args:
+            event: The key event.
+        """
+        count = len(self._tags)
+        key = event.key()
+        if not count:
+            super().keyPressEvent(event)
+        elif key in (Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            if self._current < 0:
+                self._set_current(0)
+            self._toggle(self._current)
+        elif key == Qt.Key.Key_Right:
+            self._set_current(min(count - 1, self._current + 1))
+        elif key == Qt.Key.Key_Left:
+            self._set_current(max(0, self._current - 1))
+        elif key in (Qt.Key.Key_Up, Qt.Key.Key_Down):
+            step = -1 if key == Qt.Key.Key_Up else 1
+            self._set_current(self._vertical_neighbor(self._current, step))
+        elif key == Qt.Key.Key_Home:
+            self._set_current(0)
+        elif key == Qt.Key.Key_End:
+            self._set_current(count - 1)
+        else:
+            super().keyPressEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint the tags intersecting the exposed region.
+
+        Args:
+            event: The paint event.
+        """
+        if not self._tags:
+            return
+        self._ensure_layout()
+
+        pitch = self._tag_height + self._spacing
+        rows = len(self._row_starts)
+        xs, widths = self._xs, self._widths
+        static_texts = self._static_texts
+        height = self._tag_height
+        selected_pen = QPen(self._selected_qcolor, 1)
+        unselected_pen = QPen(self._unselected_qcolor, 1)
+        border_pen = QPen(_DEFAULT_BORDER_COLOR, 1)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
+        # The bounding rect of scattered updates spans every tag between
+        # them: walk the dirty rects one at a time, each clipped to itself
+        # so that a tag crossing two rects is not blended twice. QRegion
+        # iterates over its rects, which its stubs do not declare
+        for exposed in cast("Iterable[QRect]", event.region()):
+            first_row = max(0, (exposed.top() - self._spacing) // pitch)
+            last_row = min(rows - 1, (exposed.bottom() - self._spacing) // pitch)
+            left, right = exposed.left(), exposed.right()
+            painter.setClipRect(exposed)
+            for row in range(first_row, last_row + 1):
+                start = self._row_starts[row]
+                end = self._row_starts[row + 1] if row + 1 < rows else len(self._tags)
+                y = self._spacing + row * pitch
+                # Last tag starting at or before the left edge may overlap it
+                first = max(start, bisect_right(xs, left, start, end) - 1)
+                for index in range(first, end):
+                    x, width = xs[index], widths[index]
+                    if x > right:
+                        break
+                    if x + width < left:
+                        continue
+                    selected = self._is_set(index)
+                    painter.setPen(selected_pen if selected else border_pen)
+                    painter.drawRoundedRect(
+                        QRectF(x + 0.5, y + 0.5, width - 1, height - 1),
+                        _TAG_RADIUS,
+                        _TAG_RADIUS,
+                    )
+                    static_text = static_texts[index]
+                    text_size = static_text.size()
+                    painter.setPen(selected_pen if selected else unselected_pen)
+                    painter.drawStaticText(
+                        QPointF(
+                            x + (width - text_size.width()) / 2,
+                            y + (height - text_size.height()) / 2,
+                        ),
+                        static_text,
+                    )
+                    if index == self._current and self.hasFocus():
+                        painter.setPen(
+                            QPen(self._selected_qcolor, 1, Qt.PenStyle.DotLine)
+                        )
+                        painter.drawRoundedRect(
+                            QRectF(x + 2.5, y + 2.5, width - 5, height - 5),
+                            _TAG_RADIUS,
+                            _TAG_RADIUS,
+                        )
+        painter.end()
+
+    # ///////////////////////////////////////////////////////////////
+    # OVERRIDE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def hasHeightForWidth(self) -> bool:
+        """Return whether the preferred height depends on the width.
+
+        Returns:
+            Always True, tags wrap to the widget width.
+        """
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        """Return the height needed to show every tag at a given width.
+
+        Args:
+            width: The candidate width.
+
+        Returns:
+            The preferred height.
+        """
+        if not self._tags:
+            return self._spacing
+        # The layout asks several times per pass, and the widget is then
+        # resized to the last width asked: the flow is computed once
+        rows = len(self._flow_for(width)[1])
+        return self._spacing + rows * (self._tag_height + self._spacing)
+
+    def sizeHint(self) -> QSize:
+        """Return the recommended size for the widget.
+
+        Returns:
+            The recommended size.
+        """
+        width = 400
+        return QSize(width, self.heightForWidth(width))
+
+    def minimumSizeHint(self) -> QSize:
+        """Return the minimum size for the widget.
+
+        Returns:
+            The minimum size hint.
+        """
+        widest = max(self._widths, default=0)
+        return QSize(widest + 2 * self._spacing, self._tag_height + 2 * self._spacing)
+
+    # ///////////////////////////////////////////////////////////////
+    # STYLE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def refreshStyle(self) -> None:
+        """Refresh the widget style.
+
+        Useful after dynamic stylesheet changes.
+        """
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["TagCloud"]
@@ -8,7 +8,8 @@ Miscellaneous widgets module.
 
 This module provides various utility widgets for PySide6 applications,
 including circular timers, draggable lists, option selectors, theme icons,
-toggle icons, toggle switches, notification banners, and collapsible sections.
+toggle icons, toggle switches, notification banners, collapsible sections,
+and accordions.
 """
 
 from __future__ import annotations
@@ -16,21 +17,50 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
+# Standard library imports
+from typing import TYPE_CHECKING
+
 # Local imports
-from .circular_timer import CircularTimer
-from .collapsible_section import CollapsibleSection
-from .draggable_list import DraggableItem, DraggableList
-from .notification_banner import NotificationBanner, NotificationLevel
-from .option_selector import OptionSelector
-from .theme_icon import ThemeIcon
-from .toggle_icon import ToggleIcon
-from .toggle_switch import ToggleSwitch
+from ..._lazy import attach
+
+# Type-checking-only imports (names are loaded lazily at runtime)
+if TYPE_CHECKING:
+    from .accordion import Accordion
+    from .circular_timer import CircularTimer
+    from .collapsible_section import CollapsibleSection
+    from .draggable_list import DraggableItem, DraggableList
+    from .notification_banner import NotificationBanner, NotificationLevel
+    from .option_selector import OptionSelector
+    from .theme_icon import ThemeIcon
+    from .toggle_icon import ToggleIcon
+    from .toggle_switch import ToggleSwitch
+
+# ///////////////////////////////////////////////////////////////
+# LAZY EXPORTS
+# ///////////////////////////////////////////////////////////////
+
+_EXPORTS: dict[str, str] = {
+    "Accordion": ".accordion",
+    "CircularTimer": ".circular_timer",
+    "CollapsibleSection": ".collapsible_section",
+    "DraggableItem": ".draggable_list",
+    "DraggableList": ".draggable_list",
+    "NotificationBanner": ".notification_banner",
+    "NotificationLevel": ".notification_banner",
+    "OptionSelector": ".option_selector",
+    "ThemeIcon": ".theme_icon",
+    "ToggleIcon": ".toggle_icon",
+    "ToggleSwitch": ".toggle_switch",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
 # ///////////////////////////////////////////////////////////////
 
 __all__ = [
+    "Accordion",
     "CircularTimer",
     "CollapsibleSection",
     "DraggableItem",
@@ -0,0 +1,424 @@
+# ///////////////////////////////////////////////////////////////
+# ACCORDION - Accordion Container Widget
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Accordion container widget module.
+
+Provides a vertical container of CollapsibleSection widgets with an
+exclusive or multi-expand policy, driving every section animation from a
+single shared animation group, for PySide6 applications.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from collections.abc import Callable
+
+# Third-party imports
+from PySide6.QtCore import QParallelAnimationGroup, QPropertyAnimation, Signal
+from PySide6.QtWidgets import QSizePolicy, QVBoxLayout, QWidget
+
+# Local imports
+from ...types import ContentFactory, WidgetParent
+from .collapsible_section import CollapsibleSection
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class Accordion(QWidget):
+    """Vertical stack of collapsible sections sharing one animation group.
+
+    Section animations are not started individually: the accordion adds
+    them to one QParallelAnimationGroup, so every animating section is
+    updated in the same timer tick; the frames themselves do not relayout
+    the accordion (see CollapsibleSection). Sections that are not visible
+    (scrolled out of a scroll area viewport, or the accordion is hidden)
+    jump to their final state instead of animating.
+
+    Features:
+        - Exclusive (one open section) or multi-expand policy
+        - One shared animation group for all section animations
+        - No relayout during animation frames, whatever the number of
+          animating sections
+        - No animation work for sections outside the visible area
+        - Sections accept a content widget or a lazy content factory
+        - Theme propagation to every section
+
+    Args:
+        parent: The parent widget (default: None).
+        exclusive: Whether expanding a section collapses the others
+            (default: False).
+        spacing: Vertical gap between sections in pixels (default: 0).
+
+    Properties:
+        exclusive: Get or set the exclusive expand policy.
+        count: Get the number of sections.
+
+    Signals:
+        sectionToggled(int, bool): Emitted with the section index and its
+            new expanded state when a section expands or collapses.
+
+    Example:
+        >>> from ezqt_widgets import Accordion
+        >>> accordion = Accordion(exclusive=True)
+        >>> accordion.addSection("General", general_form)
+        >>> accordion.addSection("Advanced", build_advanced_form)
+        >>> accordion.sectionToggled.connect(lambda i, e: print(i, e))
+        >>> accordion.show()
+    """
+
+    sectionToggled = Signal(int, bool)
+
+    # ///////////////////////////////////////////////////////////////
+    # INIT
+    # ///////////////////////////////////////////////////////////////
+
+    def __init__(
+        self,
+        parent: WidgetParent = None,
+        *,
+        exclusive: bool = False,
+        spacing: int = 0,
+    ) -> None:
+        """Initialize the accordion."""
+        super().__init__(parent)
+        self.setProperty("type", "Accordion")
+
+        # Initialize private state
+        self._exclusive: bool = exclusive
+        self._sections: list[CollapsibleSection] = []
+        self._toggle_slots: dict[CollapsibleSection, Callable[[bool], None]] = {}
+
+        # Shared animation group driving every section animation
+        self._group = QParallelAnimationGroup(self)
+        self._group.finished.connect(self._on_group_finished)
+
+        # Setup UI
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(max(0, int(spacing)))
+        self._layout.addStretch()
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+
+    # ------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------
+
+    def _drive_animation(
+        self, section: CollapsibleSection, animation: QPropertyAnimation
+    ) -> None:
+        """Run a section animation through the shared group.
+
+        Invisible sections skip the animation. Otherwise the group is
+        restarted with the new animation; animations already in flight
+        continue from their current value.
+
+        Args:
+            section: The section requesting the animation.
+            animation: The prepared section animation.
+        """
+        if section.visibleRegion().isEmpty():
+            if self._group.indexOfAnimation(animation) >= 0:
+                self._group.removeAnimation(animation)
+            section._finish_animation()
+            return
+
+        group = self._group
+        group.stop()
+        for index in range(group.animationCount()):
+            running = group.animationAt(index)
+            if running is not animation and isinstance(running, QPropertyAnimation):
+                running.setStartValue(running.currentValue())
+        if group.indexOfAnimation(animation) < 0:
+            group.addAnimation(animation)
+        group.start()
+
+    def _on_group_finished(self) -> None:
+        """Give finished animations back to their sections."""
+        while self._group.animationCount():
+            self._group.takeAnimation(0)
+
+    def _on_section_expanded_changed(
+        self, section: CollapsibleSection, expanded: bool
+    ) -> None:
+        """Apply the exclusive policy and forward the state change.
+
+        Args:
+            section: The section whose state changed.
+            expanded: The new expanded state.
+        """
+        if section not in self._sections:
+            return
+        self.sectionToggled.emit(self._sections.index(section), expanded)
+        if expanded and self._exclusive:
+            for other in self._sections:
+                if other is not section and other.is_expanded:
+                    other.collapse()
+
+    def _make_section(
+        self,
+        title: str | CollapsibleSection,
+        content: QWidget | ContentFactory | None,
+        expanded: bool,
+    ) -> CollapsibleSection:
+        """Create or adopt a section and attach it to the accordion.
+
+        Args:
+            title: A section title, or an existing section to adopt.
+            content: A content widget or content factory (default: None).
+            expanded: Initial expanded state for new sections.
+
+        Returns:
+            The attached section.
+        """
+        if isinstance(title, CollapsibleSection):
+            section = title
+        else:
+            section = CollapsibleSection(title=str(title), expanded=expanded)
+        if isinstance(content, QWidget):
+            section.setContentWidget(content)
+        elif content is not None:
+            section.setContentFactory(content)
+
+        def on_expanded_changed(state: bool) -> None:
+            self._on_section_expanded_changed(section, state)
+
+        section._animation_driver = self._drive_animation
+        section.expandedChanged.connect(on_expanded_changed)
+        self._toggle_slots[section] = on_expanded_changed
+        return section
+
+    # ///////////////////////////////////////////////////////////////
+    # PROPERTIES
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def exclusive(self) -> bool:
+        """Get the exclusive expand policy.
+
+        Returns:
+            True if at most one section can be expanded.
+        """
+        return self._exclusive
+
+    @exclusive.setter
+    def exclusive(self, value: bool) -> None:
+        """Set the exclusive expand policy.
+
+        Switching to exclusive keeps the first expanded section open and
+        collapses the others.
+
+        Args:
+            value: True to allow at most one expanded section.
+        """
+        self._exclusive = bool(value)
+        if self._exclusive:
+            expanded = self.expandedSections()
+            for section in expanded[1:]:
+                section.collapse()
+
+    @property
+    def count(self) -> int:
+        """Get the number of sections.
+
+        Returns:
+            The number of sections.
+        """
+        return len(self._sections)
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def addSection(
+        self,
+        title: str | CollapsibleSection,
+        content: QWidget | ContentFactory | None = None,
+        *,
+        expanded: bool = False,
+    ) -> CollapsibleSection:
+        """Append a section.
+
+        Args:
+            title: The section title, or an existing CollapsibleSection.
+            content: A content widget, or a factory building it on first
+                expand (default: None).
+            expanded: Initial expanded state of a new section
+                (default: False).
+
+        Returns:
+            The added section.
+        """
+        return self.insertSection(
+            len(self._sections), title, content, expanded=expanded
+        )
+
+    def insertSection(
+        self,
+        index: int,
+        title: str | CollapsibleSection,
+        content: QWidget | ContentFactory | None = None,
+        *,
+        expanded: bool = False,
+    ) -> CollapsibleSection:
+        """Insert a section at a position.
+
+        Args:
+            index: The position; clamped to the valid range.
+            title: The section title, or an existing CollapsibleSection.
+            content: A content widget, or a factory building it on first
+                expand (default: None).
+            expanded: Initial expanded state of a new section
+                (default: False).
+
+        Returns:
+            The inserted section.
+        """
+        section = self._make_section(title, content, expanded)
+        index = max(0, min(int(index), len(self._sections)))
+        self._sections.insert(index, section)
+        self._layout.insertWidget(index, section)
+
+        if self._exclusive and section.is_expanded:
+            for other in self._sections:
+                if other is not section and other.is_expanded:
+                    other.collapse()
+        return section
+
+    def removeSection(self, section: CollapsibleSection | int) -> CollapsibleSection:
+        """Remove a section without deleting it.
+
+        Args:
+            section: The section or its index.
+
+        Returns:
+            The removed section, detached from the accordion.
+
+        Raises:
+            ValueError: If the section does not belong to the accordion.
+            IndexError: If the index is out of range.
+        """
+        if isinstance(section, int):
+            section = self._sections[section]
+        if section not in self._sections:
+            raise ValueError("Section does not belong to this accordion")
+
+        animation = section._animation
+        if animation is not None and self._group.indexOfAnimation(animation) >= 0:
+            self._group.removeAnimation(animation)
+            section._finish_animation()
+        section._animation_driver = None
+        section.expandedChanged.disconnect(self._toggle_slots.pop(section))
+
+        self._sections.remove(section)
+        self._layout.removeWidget(section)
+        section.setParent(None)
+        return section
+
+    def section(self, index: int) -> CollapsibleSection:
+        """Return the section at a position.
+
+        Args:
+            index: The section index.
+
+        Returns:
+            The section.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        return self._sections[index]
+
+    def sections(self) -> list[CollapsibleSection]:
+        """Return every section in display order.
+
+        Returns:
+            A list of sections.
+        """
+        return list(self._sections)
+
+    def indexOf(self, section: CollapsibleSection) -> int:
+        """Return the position of a section.
+
+        Args:
+            section: The section.
+
+        Returns:
+            The section index, or -1 if it does not belong to the accordion.
+        """
+        try:
+            return self._sections.index(section)
+        except ValueError:
+            return -1
+
+    def expandedSections(self) -> list[CollapsibleSection]:
+        """Return the expanded sections in display order.
+
+        Returns:
+            A list of expanded sections.
+        """
+        return [section for section in self._sections if section.is_expanded]
+
+    def expandSection(self, index: int) -> None:
+        """Expand the section at a position.
+
+        In exclusive mode the other sections are collapsed in the same
+        animation.
+
+        Args:
+            index: The section index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        self._sections[index].expand()
+
+    def collapseAll(self) -> None:
+        """Collapse every section."""
+        for section in self._sections:
+            section.collapse()
+
+    def expandAll(self) -> None:
+        """Expand every section.
+
+        In exclusive mode only the first section is expanded.
+        """
+        targets = self._sections[:1] if self._exclusive else self._sections
+        for section in targets:
+            section.expand()
+
+    def setTheme(self, theme: str) -> None:
+        """Update the chevron icon color of every section.
+
+        Args:
+            theme: The new theme (``"dark"`` or ``"light"``).
+        """
+        for section in self._sections:
+            section.setTheme(theme)
+
+    # ///////////////////////////////////////////////////////////////
+    # STYLE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def refreshStyle(self) -> None:
+        """Refresh the widget style.
+
+        Useful after dynamic stylesheet changes.
+        """
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["Accordion"]
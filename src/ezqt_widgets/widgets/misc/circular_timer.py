@@ -16,7 +16,6 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
-import re
 from typing import Any, Literal
 
 # Third-party imports
@@ -26,42 +25,7 @@ from PySide6.QtWidgets import QWidget
 
 # Local imports
 from ...types import ColorType, WidgetParent
-
-# ///////////////////////////////////////////////////////////////
-# FUNCTIONS
-# ///////////////////////////////////////////////////////////////
-
-
-def _parse_css_color(color_str: QColor | str) -> QColor:
-    """Parse CSS color strings to QColor.
-
-    Supports rgb, rgba, hex, and named colors.
-
-    Args:
-        color_str: CSS color string or QColor object.
-
-    Returns:
-        QColor object.
-    """
-    if isinstance(color_str, QColor):
-        return color_str
-
-    color_str = str(color_str).strip()
-
-    rgb_match = re.match(r"rgb\((\d+),\s*(\d+),\s*(\d+)\)", color_str)
-    if rgb_match:
-        r, g, b = map(int, rgb_match.groups())
-        return QColor(r, g, b)
-
-    rgba_match = re.match(r"rgba\((\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\)", color_str)
-    if rgba_match:
-        r_str, g_str, b_str, a_str = rgba_match.groups()
-        r, g, b = int(r_str), int(g_str), int(b_str)
-        a = float(a_str) * 255
-        return QColor(r, g, b, int(a))
-
-    return QColor(color_str)
-
+from ..shared import parse_css_color
 
 # ///////////////////////////////////////////////////////////////
 # CLASSES
@@ -134,8 +98,8 @@ class CircularTimer(QWidget):
         self._duration: int = duration
         self._elapsed: int = 0
         self._running: bool = False
-        self._ring_color: QColor = _parse_css_color(ring_color)
-        self._node_color: QColor = _parse_css_color(node_color)
+        self._ring_color: QColor = parse_css_color(ring_color)
+        self._node_color: QColor = parse_css_color(node_color)
         self._ring_width_mode: str = ring_width_mode
         self._pen_width: float | None = pen_width
         self._loop: bool = bool(loop)
@@ -213,7 +177,7 @@ class CircularTimer(QWidget):
         Args:
             value: The new ring color (QColor or CSS string).
         """
-        self._ring_color = _parse_css_color(value)
+        self._ring_color = parse_css_color(value)
         self.update()
 
     @property
@@ -232,7 +196,7 @@ class CircularTimer(QWidget):
         Args:
             value: The new node color (QColor or CSS string).
         """
-        self._node_color = _parse_css_color(value)
+        self._node_color = parse_css_color(value)
         self.update()
 
     @property
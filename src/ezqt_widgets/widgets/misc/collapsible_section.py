@@ -7,7 +7,11 @@
 Collapsible section widget module.
 
 Provides an accordion-style section widget with a clickable header and
-smooth expand/collapse animation using QPropertyAnimation on maximumHeight.
+smooth expand/collapse animation. The content area is resized once per
+animation (before expanding, after collapsing); the frames only move a
+clip mask over a snapshot pixmap of the content, so neither the content
+tree nor the parent layout is relaid out or repainted per frame. Content
+can be given up front or built lazily by a factory on first expand.
 """
 
 from __future__ import annotations
@@ -16,17 +20,22 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
-import contextlib
+import time
+from collections.abc import Callable, Generator
 
 # Third-party imports
 from PySide6.QtCore import (
+    Property,
     QEasingCurve,
+    QEvent,
+    QObject,
     QPropertyAnimation,
     QSize,
     Qt,
+    QTimer,
     Signal,
 )
-from PySide6.QtGui import QMouseEvent
+from PySide6.QtGui import QMouseEvent, QPainter, QPaintEvent, QPixmap, QRegion
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -36,7 +45,7 @@ from PySide6.QtWidgets import (
 )
 
 # Local imports
-from ...types import WidgetParent
+from ...types import ContentFactory, WidgetParent
 from ..shared import ANIMATION_DURATION_FAST
 from .toggle_icon import ToggleIcon
 
@@ -45,6 +54,10 @@ from .toggle_icon import ToggleIcon
 # ///////////////////////////////////////////////////////////////
 
 _ANIMATION_DURATION: int = ANIMATION_DURATION_FAST
+_QWIDGETSIZE_MAX: int = 16777215
+
+# Time budget of one idle slice when building content incrementally
+_BUILD_SLICE_SECONDS: float = 0.008
 
 # ///////////////////////////////////////////////////////////////
 # CLASSES
@@ -75,17 +88,97 @@ class _HeaderWidget(QWidget):
         super().mousePressEvent(event)
 
 
+class _SnapshotWidget(QWidget):
+    """Internal opaque widget painting a pixmap of the content.
+
+    Covers the content widget while the section animates, so the real
+    content tree is not repainted on every frame. The animated
+    reveal_height property clips the parent content area to its top rows
+    with a mask, which repaints the exposed strip without any relayout.
+    """
+
+    def __init__(self, parent: WidgetParent = None) -> None:
+        """Initialize the snapshot widget."""
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._pixmap: QPixmap = QPixmap()
+        self._reveal_height: int = 0
+
+    def revealHeight(self) -> int:
+        """Return the height of the visible part of the content area.
+
+        Returns:
+            The revealed height in pixels.
+        """
+        return self._reveal_height
+
+    def setRevealHeight(self, height: int) -> None:
+        """Clip the content area to its top rows.
+
+        Args:
+            height: The height of the visible part of the content area.
+        """
+        self._reveal_height = max(0, height)
+        area = self.parentWidget()
+        if area is None:
+            return
+        if self._reveal_height > 0:
+            area.setMask(QRegion(0, 0, area.width(), self._reveal_height))
+        else:
+            # An empty region would clear the mask; hide every pixel instead
+            area.setMask(QRegion(-1, -1, 1, 1))
+
+    # Property for animation
+    reveal_height = Property(int, revealHeight, setRevealHeight)
+
+    def clearReveal(self) -> None:
+        """Remove the clip mask from the content area."""
+        area = self.parentWidget()
+        if area is not None:
+            area.clearMask()
+
+    def setPixmap(self, pixmap: QPixmap) -> None:
+        """Set the pixmap to paint.
+
+        Args:
+            pixmap: The content snapshot.
+        """
+        self._pixmap = pixmap
+        self.update()
+
+    def paintEvent(self, _event: QPaintEvent) -> None:
+        """Paint the snapshot anchored to the top-left corner.
+
+        Args:
+            _event: The paint event (unused but required by signature).
+        """
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+
 class CollapsibleSection(QWidget):
     """Accordion-style section widget with animated expand/collapse.
 
     The header is always visible. Clicking anywhere on the header (or
     calling toggle()) animates the content area between 0 height and its
-    natural size hint height.
+    natural size hint height. The area takes its final size in a single
+    relayout (at the start of an expand, at the end of a collapse) and
+    the animation reveals or hides the content behind a clip mask.
 
     Features:
         - Clickable header with title label and ToggleIcon chevron
-        - Smooth height animation via QPropertyAnimation on maximumHeight
+        - Smooth reveal animation driven by QPropertyAnimation, with one
+          relayout per expand or collapse instead of one per frame
+        - Content height measured once and cached until the content
+          requests a new layout
+        - Content shown as a snapshot while animating (no per-frame
+          relayout or repaint of the content tree)
         - Supports an arbitrary QWidget as content via setContentWidget()
+        - Lazy content via setContentFactory(), built on first expand,
+          optionally in idle slices (generator factories)
+        - Optional release of lazily built content on collapse
         - expand()/collapse()/toggle() public API
         - Theme propagation to the ToggleIcon chevron
 
@@ -93,13 +186,19 @@ class CollapsibleSection(QWidget):
         parent: The parent widget (default: None).
         title: Header title text (default: "").
         expanded: Initial expanded state (default: True).
+        release_on_collapse: Whether content built by a factory is destroyed
+            after collapsing and rebuilt on the next expand (default: False).
 
     Properties:
         title: Get or set the header title text.
         is_expanded: Get the current expanded state.
+        release_on_collapse: Get or set whether factory-built content is
+            released on collapse.
 
     Signals:
         expandedChanged(bool): Emitted when the expanded state changes.
+        contentCreated(QWidget): Emitted when a content factory has built
+            the content widget.
 
     Example:
         >>> from ezqt_widgets import CollapsibleSection
@@ -110,6 +209,7 @@ class CollapsibleSection(QWidget):
     """
 
     expandedChanged = Signal(bool)
+    contentCreated = Signal(QWidget)
 
     # ///////////////////////////////////////////////////////////////
     # INIT
@@ -121,6 +221,7 @@ class CollapsibleSection(QWidget):
         *,
         title: str = "",
         expanded: bool = True,
+        release_on_collapse: bool = False,
     ) -> None:
         """Initialize the collapsible section."""
         super().__init__(parent)
@@ -131,6 +232,22 @@ class CollapsibleSection(QWidget):
         self._content_widget: QWidget | None = None
         self._animation: QPropertyAnimation | None = None
 
+        # Cached content height as (width, height), None when stale
+        self._content_height: tuple[int, int] | None = None
+
+        # Optional owner starting animations (e.g. an Accordion batching them)
+        self._animation_driver: (
+            Callable[[CollapsibleSection, QPropertyAnimation], None] | None
+        ) = None
+
+        # Lazy content state
+        self._content_factory: ContentFactory | None = None
+        self._release_on_collapse: bool = release_on_collapse
+        self._build_steps: Generator[None, None, QWidget] | None = None
+        self._build_timer = QTimer(self)
+        self._build_timer.setInterval(0)
+        self._build_timer.timeout.connect(self._run_build_slice)
+
         # Setup UI
         self._setup_widget(title)
         self._setup_animation()
@@ -185,6 +302,11 @@ class CollapsibleSection(QWidget):
         self._content_layout.setContentsMargins(0, 0, 0, 0)
         self._content_layout.setSpacing(0)
 
+        # Snapshot shown in place of the content while animating
+        self._snapshot = _SnapshotWidget(self._content_area)
+        self._snapshot.hide()
+        self._content_area.installEventFilter(self)
+
         # ---- Main layout ----
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -193,30 +315,77 @@ class CollapsibleSection(QWidget):
         main_layout.addWidget(self._content_area)
 
     def _setup_animation(self) -> None:
-        """Setup the QPropertyAnimation on maximumHeight of the content area."""
-        self._animation = QPropertyAnimation(self._content_area, b"maximumHeight")
+        """Setup the QPropertyAnimation on the snapshot reveal height."""
+        self._animation = QPropertyAnimation(self._snapshot, b"reveal_height")
         self._animation.setDuration(_ANIMATION_DURATION)
         self._animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self._animation.finished.connect(self._on_animation_finished)
 
     def _apply_initial_state(self) -> None:
         """Apply the initial expanded/collapsed state without animation."""
         if self._expanded:
             # Allow natural height
-            self._content_area.setMaximumHeight(16777215)  # Qt QWIDGETSIZE_MAX
+            self._content_area.setMaximumHeight(_QWIDGETSIZE_MAX)
         else:
             self._content_area.setMaximumHeight(0)
 
     def _get_content_height(self) -> int:
-        """Calculate the target expanded height of the content area.
+        """Return the target expanded height of the content area.
+
+        The size hint of the content subtree is only computed when the
+        cached value is stale (content changed or width changed).
 
         Returns:
-            The content area's size hint height, minimum 0.
+            The content size hint height, minimum 0.
         """
-        if self._content_widget is not None:
-            hint = self._content_widget.sizeHint().height()
+        width = self._content_area.width()
+        cached = self._content_height
+        if cached is not None and cached[0] == width:
+            return cached[1]
+
+        content = self._content_widget
+        if content is not None:
+            if content.hasHeightForWidth() and width > 0:
+                hint = content.heightForWidth(width)
+            else:
+                hint = content.sizeHint().height()
         else:
             hint = self._content_area.sizeHint().height()
-        return max(0, hint)
+        height = max(0, hint)
+        self._content_height = (width, height)
+        return height
+
+    def _begin_snapshot(self, height: int) -> None:
+        """Freeze the content and cover it with a snapshot for animating.
+
+        The content layout is disabled and the content widget is pinned to
+        its full size, so shrinking or growing the area only clips it.
+
+        Args:
+            height: The full content height.
+        """
+        content = self._content_widget
+        width = self._content_area.width()
+        if content is None or width <= 0 or height <= 0:
+            return
+        if not self._snapshot.isHidden():
+            return  # Already animating from a snapshot
+
+        self._content_layout.setEnabled(False)
+        content.setGeometry(0, 0, width, height)
+        self._snapshot.setGeometry(0, 0, width, height)
+        self._snapshot.setPixmap(content.grab())
+        self._snapshot.show()
+        self._snapshot.raise_()
+
+    def _end_snapshot(self) -> None:
+        """Remove the snapshot and mask, hand the content back to its layout."""
+        self._snapshot.clearReveal()
+        if self._snapshot.isHidden():
+            return
+        self._snapshot.hide()
+        self._snapshot.setPixmap(QPixmap())
+        self._content_layout.setEnabled(True)
 
     def _run_animation(self, expanding: bool) -> None:
         """Run the expand or collapse animation.
@@ -228,34 +397,147 @@ class CollapsibleSection(QWidget):
         if animation is None:
             return
 
-        current = self._content_area.maximumHeight()
-        # Cap the current value to avoid QWIDGETSIZE_MAX as start
-        if current > 16777214:
-            current = self._get_content_height()
-
-        if expanding:
-            end = self._get_content_height()
-            if end == 0:
-                end = 100  # Fallback height for empty content
+        height = self._get_content_height()
+        if animation.state() == QPropertyAnimation.State.Running:
+            current = self._snapshot.revealHeight()  # Reverse from mid-flight
+        elif self._content_area.maximumHeight() == 0:
+            current = 0
         else:
-            end = 0
+            current = height
 
-        animation.setStartValue(current)
-        animation.setEndValue(end)
-        animation.start()
-
-        # After expanding, release the maximum height cap
+        animation.stop()
         if expanding:
-            animation.finished.connect(self._on_expand_finished)
+            # Single relayout: the area takes its final height up front
+            self._content_area.setMaximumHeight(_QWIDGETSIZE_MAX)
+        self._begin_snapshot(height)
+        self._snapshot.setRevealHeight(current)
+        animation.setStartValue(current)
+        animation.setEndValue(height if expanding else 0)
+        if self._animation_driver is not None:
+            self._animation_driver(self, animation)
+        else:
+            animation.start()
 
-    def _on_expand_finished(self) -> None:
-        """Release the maximumHeight cap after expand animation completes."""
+    def _finish_animation(self) -> None:
+        """Jump to the end of the current animation without running it."""
         animation = self._animation
         if animation is None:
             return
-        with contextlib.suppress(RuntimeError):
-            animation.finished.disconnect(self._on_expand_finished)
-        self._content_area.setMaximumHeight(16777215)
+        animation.stop()
+        self._on_animation_finished()
+
+    def _on_animation_finished(self) -> None:
+        """Restore the live content once an animation has completed.
+
+        After expanding, the area already has its final size. After
+        collapsing, the area is shrunk to 0 in the only relayout of the
+        animation, and factory-built content may be released.
+        """
+        self._end_snapshot()
+        if self._expanded:
+            self._content_area.setMaximumHeight(_QWIDGETSIZE_MAX)
+        else:
+            self._content_area.setMaximumHeight(0)
+            if self._release_on_collapse:
+                self.releaseContent()
+
+    def _install_content(self, widget: QWidget) -> None:
+        """Place a widget in the content area, replacing the previous one.
+
+        Args:
+            widget: The widget to display as content.
+        """
+        self._remove_content()
+        self._content_widget = widget
+        self._content_layout.addWidget(widget)
+        widget.installEventFilter(self)
+        self._content_height = None
+
+    def _remove_content(self) -> QWidget | None:
+        """Detach the current content widget from the section.
+
+        Returns:
+            The detached widget, or None if there was no content.
+        """
+        widget = self._content_widget
+        if widget is None:
+            return None
+        if self._animation is not None:
+            self._animation.stop()
+        self._end_snapshot()
+        widget.removeEventFilter(self)
+        self._content_layout.removeWidget(widget)
+        widget.setParent(None)
+        self._content_widget = None
+        self._content_height = None
+        return widget
+
+    def _cancel_build(self) -> None:
+        """Stop an incremental build in progress, if any."""
+        self._build_timer.stop()
+        if self._build_steps is not None:
+            self._build_steps.close()
+            self._build_steps = None
+
+    def _start_build(self) -> None:
+        """Build the content from the factory.
+
+        Plain factories are called synchronously. Generator factories are
+        advanced from the event loop in short slices until they return the
+        content widget.
+        """
+        if self._content_factory is None or self._build_steps is not None:
+            return
+        result = self._content_factory()
+        if isinstance(result, Generator):
+            self._build_steps = result
+            self._build_timer.start()
+        else:
+            self._finish_build(result)
+
+    def _run_build_slice(self) -> None:
+        """Advance an incremental build for at most one time slice.
+
+        A factory raising mid-build aborts the build: the timer is stopped
+        before the exception propagates, so it is reported only once and
+        the next expand starts a fresh build.
+        """
+        steps = self._build_steps
+        if steps is None:
+            self._build_timer.stop()
+            return
+        deadline = time.perf_counter() + _BUILD_SLICE_SECONDS
+        try:
+            while time.perf_counter() < deadline:
+                next(steps)
+        except StopIteration as stop:
+            self._build_timer.stop()
+            self._build_steps = None
+            self._finish_build(stop.value)
+        except Exception:
+            self._build_timer.stop()
+            self._build_steps = None
+            raise
+
+    def _finish_build(self, widget: QWidget) -> None:
+        """Install factory-built content and reveal it if expanded.
+
+        Args:
+            widget: The widget returned by the factory.
+
+        Raises:
+            TypeError: If the factory did not produce a QWidget.
+        """
+        if not isinstance(widget, QWidget):
+            raise TypeError(
+                f"Content factory must produce a QWidget, got {type(widget).__name__}"
+            )
+        self._install_content(widget)
+        self.contentCreated.emit(widget)
+        # Reveal content requested by expand(); an already open area keeps
+        # its natural height
+        if self._expanded and self._content_area.maximumHeight() == 0:
+            self._run_animation(expanding=True)
 
     # ///////////////////////////////////////////////////////////////
     # PROPERTIES
@@ -288,6 +570,24 @@ class CollapsibleSection(QWidget):
         """
         return self._expanded
 
+    @property
+    def release_on_collapse(self) -> bool:
+        """Get whether factory-built content is released on collapse.
+
+        Returns:
+            True if the content is destroyed after collapsing.
+        """
+        return self._release_on_collapse
+
+    @release_on_collapse.setter
+    def release_on_collapse(self, value: bool) -> None:
+        """Set whether factory-built content is released on collapse.
+
+        Args:
+            value: True to destroy the content after collapsing.
+        """
+        self._release_on_collapse = bool(value)
+
     # ///////////////////////////////////////////////////////////////
     # PUBLIC METHODS
     # ///////////////////////////////////////////////////////////////
@@ -298,27 +598,78 @@ class CollapsibleSection(QWidget):
         Replaces any previously set content widget. The section keeps
         its current expanded/collapsed state.
 
+        Any content factory previously set is discarded.
+
         Args:
             widget: The widget to display as content.
         """
-        # Remove previous content
-        if self._content_widget is not None:
-            self._content_layout.removeWidget(self._content_widget)
-            self._content_widget.setParent(None)
-
-        self._content_widget = widget
-        self._content_layout.addWidget(widget)
+        self._cancel_build()
+        self._content_factory = None
+        self._install_content(widget)
 
         # Re-apply state to reflect new content height
         self._apply_initial_state()
 
+    def setContentFactory(self, factory: ContentFactory) -> None:
+        """Set a callable that builds the content on first expand.
+
+        The factory is called without arguments and must return the content
+        widget. It may also be a generator function: each ``yield`` ends a
+        build step, steps run from the event loop in short idle slices, and
+        the generator's ``return`` value is the content widget. If the
+        section is already expanded, the build starts immediately.
+
+        Replaces any previously set content widget.
+
+        Args:
+            factory: The content factory.
+        """
+        self._cancel_build()
+        self._remove_content()
+
+        self._content_factory = factory
+        self._apply_initial_state()
+        if self._expanded:
+            self._start_build()
+
+    def contentWidget(self) -> QWidget | None:
+        """Return the current content widget.
+
+        Returns:
+            The content widget, or None if none is set or it has not been
+            built yet.
+        """
+        return self._content_widget
+
+    def releaseContent(self) -> bool:
+        """Destroy factory-built content while the section is collapsed.
+
+        The factory runs again on the next expand. Useful under memory
+        pressure; has no effect on content set with setContentWidget().
+
+        Returns:
+            True if content was released.
+        """
+        if self._expanded or self._content_factory is None:
+            return False
+        self._cancel_build()
+        widget = self._remove_content()
+        if widget is None:
+            return False
+        widget.deleteLater()
+        return True
+
     def expand(self) -> None:
         """Expand the content area with animation."""
         if self._expanded:
             return
         self._expanded = True
         self._toggle_icon.setStateOpened()
-        self._run_animation(expanding=True)
+        if self._content_widget is None and self._content_factory is not None:
+            # The animation runs once the factory has built the content
+            self._start_build()
+        else:
+            self._run_animation(expanding=True)
         self.expandedChanged.emit(True)
 
     def collapse(self) -> None:
@@ -348,6 +699,27 @@ class CollapsibleSection(QWidget):
         """
         self._toggle_icon.setTheme(theme)
 
+    # ///////////////////////////////////////////////////////////////
+    # EVENT HANDLERS
+    # ///////////////////////////////////////////////////////////////
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Invalidate the cached content height on layout requests.
+
+        Args:
+            watched: The content area or content widget.
+            event: The filtered event.
+
+        Returns:
+            False, the event is never consumed.
+        """
+        if event.type() == QEvent.Type.LayoutRequest and (
+            watched is not self._content_area or self._snapshot.isHidden()
+        ):
+            # Requests on the area caused by showing the snapshot are ignored
+            self._content_height = None
+        return super().eventFilter(watched, event)
+
     # ///////////////////////////////////////////////////////////////
     # STYLE METHODS
     # ///////////////////////////////////////////////////////////////
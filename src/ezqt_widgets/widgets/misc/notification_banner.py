@@ -8,7 +8,8 @@ Notification banner widget module.
 
 Provides an animated slide-down notification banner that overlays the top
 of a parent widget, supporting INFO, WARNING, ERROR, and SUCCESS levels
-with theme-aware icons and auto-dismiss behavior.
+with theme-aware icons, auto-dismiss behavior and a coalescing priority
+queue for high-rate notification sources.
 """
 
 from __future__ import annotations
@@ -17,13 +18,15 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
-import base64
 import contextlib
+import heapq
+import itertools
+import threading
+import time
 from enum import Enum
 
 # Third-party imports
 from PySide6.QtCore import (
-    QByteArray,
     QEasingCurve,
     QEvent,
     QPropertyAnimation,
@@ -33,8 +36,7 @@ from PySide6.QtCore import (
     QTimer,
     Signal,
 )
-from PySide6.QtGui import QIcon, QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -44,8 +46,7 @@ from PySide6.QtWidgets import (
 )
 
 # Local imports
-from ..shared import SVG_ERROR, SVG_INFO, SVG_SUCCESS, SVG_WARNING
-from .theme_icon import ThemeIcon
+from ..shared import get_builtin_pixmap
 
 # ///////////////////////////////////////////////////////////////
 # CONSTANTS
@@ -60,11 +61,12 @@ _LEVEL_COLORS: dict[str, str] = {
     "SUCCESS": "#22c55e",
 }
 
-_LEVEL_SVG: dict[str, bytes] = {
-    "INFO": SVG_INFO,
-    "WARNING": SVG_WARNING,
-    "ERROR": SVG_ERROR,
-    "SUCCESS": SVG_SUCCESS,
+# Queue priority per level: higher values are displayed first
+_LEVEL_PRIORITY: dict[str, int] = {
+    "ERROR": 3,
+    "WARNING": 2,
+    "SUCCESS": 1,
+    "INFO": 0,
 }
 
 # ///////////////////////////////////////////////////////////////
@@ -88,6 +90,51 @@ class NotificationLevel(Enum):
     SUCCESS = "SUCCESS"
 
 
+class _PendingNotification:
+    """A queued notification, merged with its duplicates.
+
+    Instances order by priority first (higher level first), then by
+    arrival, so they can be stored directly in a heap.
+    """
+
+    __slots__ = ("count", "duration", "level", "message", "priority", "seq")
+
+    def __init__(
+        self,
+        message: str,
+        level: NotificationLevel,
+        duration: int,
+        count: int,
+        seq: int,
+    ) -> None:
+        """Initialize the pending notification.
+
+        Args:
+            message: The text to display.
+            level: The severity level.
+            duration: Display duration in milliseconds (0 for permanent).
+            count: Number of merged occurrences.
+            seq: Arrival order, breaking ties between equal levels.
+        """
+        self.message = message
+        self.level = level
+        self.duration = duration
+        self.count = count
+        self.seq = seq
+        self.priority = _LEVEL_PRIORITY.get(level.value, 0)
+
+    def __lt__(self, other: _PendingNotification) -> bool:
+        """Compare by priority (higher first), then by arrival.
+
+        Args:
+            other: The entry to compare with.
+
+        Returns:
+            True if this entry must be displayed before the other one.
+        """
+        return (-self.priority, self.seq) < (-other.priority, other.seq)
+
+
 class NotificationBanner(QWidget):
     """Animated slide-down notification banner overlaying a parent widget.
 
@@ -96,17 +143,39 @@ class NotificationBanner(QWidget):
     visible for manual dismissal. The banner repositions itself when the
     parent is resized via event filtering.
 
+    High-rate sources should use enqueueNotification() or, from worker
+    threads, postNotification(). Queued notifications are kept in a bounded
+    priority queue ordered by level (ERROR, WARNING, SUCCESS, INFO), merged
+    with their duplicates, and replace each other no faster than the
+    minimum display interval.
+
     Features:
         - Slide-down animation via QPropertyAnimation on geometry
         - Four severity levels: INFO, WARNING, ERROR, SUCCESS
         - Auto-dismiss via QTimer when duration > 0
         - Manual close button (×)
-        - Level icon via inline SVG rendered to ThemeIcon
+        - Level icon from the shared built-in icon cache
         - Parent resize tracking via event filter
+        - Bounded priority queue with duplicate merging and a count badge
+        - Minimum display interval between queued notifications
+        - Thread-safe postNotification() for feeding from worker threads
 
     Args:
         parent: The parent widget inside which the banner is displayed.
             Must be a valid QWidget (not None).
+        max_queue_size: Maximum number of distinct pending notifications
+            (default: 100).
+        min_display_interval: Minimum time in milliseconds a notification
+            stays visible before a queued one replaces it (default: 500).
+
+    Properties:
+        max_queue_size: Get or set the maximum number of pending
+            notifications.
+        min_display_interval: Get or set the minimum display interval in
+            milliseconds.
+        pending_count: Get the number of pending notifications.
+        dropped_count: Get the number of notifications dropped because the
+            queue was full.
 
     Signals:
         dismissed(): Emitted when the banner is hidden (any cause).
@@ -116,31 +185,76 @@ class NotificationBanner(QWidget):
         >>> banner = NotificationBanner(parent=main_widget)
         >>> banner.dismissed.connect(lambda: print("Banner closed"))
         >>> banner.showNotification("File saved!", NotificationLevel.SUCCESS)
+        >>> # From a worker thread
+        >>> banner.postNotification("Backend timeout", NotificationLevel.ERROR)
     """
 
     dismissed = Signal()
+    _notificationsPosted = Signal()
 
     # ///////////////////////////////////////////////////////////////
     # INIT
     # ///////////////////////////////////////////////////////////////
 
-    def __init__(self, parent: QWidget) -> None:
+    def __init__(
+        self,
+        parent: QWidget,
+        *,
+        max_queue_size: int = 100,
+        min_display_interval: int = 500,
+    ) -> None:
         """Initialize the notification banner.
 
         Args:
             parent: The parent widget that hosts the banner overlay.
+            max_queue_size: Maximum number of distinct pending notifications
+                (default: 100).
+            min_display_interval: Minimum display time in milliseconds of a
+                notification before a queued one replaces it (default: 500).
         """
         super().__init__(parent)
         self.setProperty("type", "NotificationBanner")
 
         # Initialize private state
         self._duration: int = 3000
-        self._dismiss_timer: QTimer | None = None
         self._animation: QPropertyAnimation | None = None
+        self._sliding_out: bool = False
+        self._applied_level: NotificationLevel | None = None
+
+        # Currently displayed notification
+        self._current_key: tuple[str, str] | None = None
+        self._current_priority: int = 0
+        self._current_count: int = 0
+        self._shown_at: float = 0.0
+
+        # Pending notifications: heap ordered by level, indexed for merging
+        self._max_queue_size: int = max(1, int(max_queue_size))
+        self._min_display_interval: int = max(0, int(min_display_interval))
+        self._queue: list[_PendingNotification] = []
+        self._pending: dict[tuple[str, str], _PendingNotification] = {}
+        self._seq = itertools.count()
+        self._dropped_count: int = 0
+
+        # Cross-thread ingestion state (guarded by _post_lock)
+        self._post_lock = threading.Lock()
+        self._posted: dict[tuple[str, str], _PendingNotification] = {}
+        self._post_scheduled: bool = False
+        self._post_dropped: int = 0
+        self._notificationsPosted.connect(
+            self._on_notifications_posted, Qt.ConnectionType.QueuedConnection
+        )
 
         # Build UI before hiding
         self._setup_widget()
 
+        # Timers: auto-dismiss and queue advance
+        self._dismiss_timer = QTimer(self)
+        self._dismiss_timer.setSingleShot(True)
+        self._dismiss_timer.timeout.connect(self._dismiss)
+        self._advance_timer = QTimer(self)
+        self._advance_timer.setSingleShot(True)
+        self._advance_timer.timeout.connect(self._advance_queue)
+
         # Start hidden
         self.setGeometry(0, 0, parent.width(), 0)
         self.hide()
@@ -172,6 +286,15 @@ class NotificationBanner(QWidget):
         )
         self._message_label.setWordWrap(False)
 
+        # Duplicate count badge
+        self._count_label = QLabel()
+        self._count_label.setProperty("type", "NotificationCount")
+        self._count_label.setStyleSheet(
+            "color: white; font-weight: 600; background: rgba(0,0,0,0.2); "
+            "border-radius: 8px; padding: 0px 6px;"
+        )
+        self._count_label.hide()
+
         # Close button
         self._close_btn = QToolButton()
         self._close_btn.setText("×")
@@ -189,6 +312,7 @@ class NotificationBanner(QWidget):
         layout.setSpacing(8)
         layout.addWidget(self._icon_label)
         layout.addWidget(self._message_label)
+        layout.addWidget(self._count_label)
         layout.addStretch()
         layout.addWidget(self._close_btn)
 
@@ -198,31 +322,20 @@ class NotificationBanner(QWidget):
         self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
 
     @staticmethod
-    def _build_icon(level: NotificationLevel) -> ThemeIcon | None:
-        """Build a ThemeIcon from the inline SVG for the given level.
+    def _build_icon(level: NotificationLevel) -> QPixmap | None:
+        """Return the white level icon from the shared icon cache.
 
         Args:
             level: The notification level.
 
         Returns:
-            A ThemeIcon with white coloring, or None on failure.
+            The cached 16x16 pixmap, or None on failure.
         """
-        svg_bytes = _LEVEL_SVG.get(level.value, SVG_INFO)
-        encoded = base64.b64encode(svg_bytes)
-        decoded = base64.b64decode(encoded)
-        renderer = QSvgRenderer(QByteArray(decoded))
-        if not renderer.isValid():
+        try:
+            return get_builtin_pixmap(level.value, 16, "white")
+        except (KeyError, ValueError):
             return None
 
-        pixmap = QPixmap(QSize(16, 16))
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        icon = QIcon(pixmap)
-        return ThemeIcon.from_source(icon)
-
     def _apply_level_style(self, level: NotificationLevel) -> None:
         """Apply background color and icon for the given level.
 
@@ -234,33 +347,46 @@ class NotificationBanner(QWidget):
             f"NotificationBanner {{ background-color: {color}; border-radius: 0px; }}"
         )
 
-        icon = self._build_icon(level)
-        if icon is not None:
-            self._icon_label.setPixmap(icon.pixmap(QSize(16, 16)))
+        pixmap = self._build_icon(level)
+        if pixmap is not None:
+            self._icon_label.setPixmap(pixmap)
         else:
             self._icon_label.clear()
 
     def _slide_in(self) -> None:
-        """Animate the banner sliding down to full height."""
-        if self._animation is None:
+        """Animate the banner sliding down to full height.
+
+        A slide-out in progress is cancelled and reversed from the current
+        geometry.
+        """
+        animation = self._animation
+        if animation is None:
             return
         parent = self.parentWidget()
         if parent is None:
             return
 
         start_rect = QRect(0, 0, parent.width(), 0)
+        if self._sliding_out:
+            self._sliding_out = False
+            animation.stop()
+            with contextlib.suppress(RuntimeError):
+                animation.finished.disconnect(self._finish_dismiss)
+            start_rect = self.geometry()
         end_rect = QRect(0, 0, parent.width(), _BANNER_HEIGHT)
 
         self.setGeometry(start_rect)
         self.show()
         self.raise_()
 
-        self._animation.setStartValue(start_rect)
-        self._animation.setEndValue(end_rect)
-        self._animation.start()
+        animation.setStartValue(start_rect)
+        animation.setEndValue(end_rect)
+        animation.start()
 
     def _slide_out(self) -> None:
         """Animate the banner sliding up and then emit dismissed."""
+        if self._sliding_out:
+            return
         animation = self._animation
         if animation is None:
             self._finish_dismiss()
@@ -273,36 +399,228 @@ class NotificationBanner(QWidget):
         current = self.geometry()
         end_rect = QRect(0, 0, parent.width(), 0)
 
+        self._sliding_out = True
+        animation.stop()
         animation.setStartValue(current)
         animation.setEndValue(end_rect)
         animation.finished.connect(self._finish_dismiss)
         animation.start()
 
     def _finish_dismiss(self) -> None:
-        """Hide the widget and emit the dismissed signal."""
+        """Hide the widget, emit dismissed and show the next queued entry."""
+        was_sliding_out = self._sliding_out
+        self._sliding_out = False
+        self._current_key = None
         # Disconnect to avoid cumulative connections on next show
         animation = self._animation
-        if animation is None:
-            self.hide()
-            self.dismissed.emit()
-            return
-        with contextlib.suppress(RuntimeError):
-            animation.finished.disconnect(self._finish_dismiss)
+        if animation is not None and was_sliding_out:
+            with contextlib.suppress(RuntimeError):
+                animation.finished.disconnect(self._finish_dismiss)
         self.hide()
         self.dismissed.emit()
+        self._advance_queue()
 
     def _stop_timer(self) -> None:
         """Stop the auto-dismiss timer if active."""
-        if self._dismiss_timer is not None:
-            self._dismiss_timer.stop()
-            self._dismiss_timer.deleteLater()
-            self._dismiss_timer = None
+        self._dismiss_timer.stop()
 
     def _dismiss(self) -> None:
         """Dismiss the banner with slide-out animation."""
         self._stop_timer()
         self._slide_out()
 
+    def _update_badge(self) -> None:
+        """Show the duplicate count badge when a message was merged."""
+        if self._current_count > 1:
+            self._count_label.setText(f"x{self._current_count}")
+            self._count_label.show()
+        else:
+            self._count_label.hide()
+
+    def _display(
+        self,
+        message: str,
+        level: NotificationLevel,
+        duration: int,
+        count: int,
+    ) -> None:
+        """Display a notification, sliding in only if the banner is hidden.
+
+        Args:
+            message: The text to display.
+            level: The severity level.
+            duration: Display duration in milliseconds (0 for permanent).
+            count: Number of merged occurrences of the message.
+        """
+        self._stop_timer()
+        self._duration = duration
+        self._current_key = (level.value, message)
+        self._current_priority = _LEVEL_PRIORITY.get(level.value, 0)
+        self._current_count = count
+        self._shown_at = time.monotonic()
+
+        self._message_label.setText(message)
+        self._update_badge()
+        if level is not self._applied_level:
+            self._apply_level_style(level)
+            self._applied_level = level
+        if self._sliding_out or not self.isVisible():
+            self._slide_in()
+
+        if duration > 0:
+            self._dismiss_timer.start(duration)
+        if self._queue:
+            self._advance_timer.start(self._min_display_interval)
+
+    def _enqueue(
+        self,
+        message: str,
+        level: NotificationLevel,
+        duration: int,
+        count: int,
+    ) -> None:
+        """Merge a notification into the current display or the queue.
+
+        Args:
+            message: The text to display.
+            level: The severity level.
+            duration: Display duration in milliseconds (0 for permanent).
+            count: Number of occurrences to add.
+        """
+        key = (level.value, message)
+        if key == self._current_key and not self._sliding_out:
+            # Same message still on screen: bump the badge and keep it up
+            self._current_count += count
+            self._update_badge()
+            if self._duration > 0:
+                self._dismiss_timer.start(self._duration)
+            return
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.count += count
+            pending.duration = duration
+            return
+
+        entry = _PendingNotification(message, level, duration, count, next(self._seq))
+        if len(self._queue) >= self._max_queue_size:
+            worst = max(self._queue)
+            if not entry < worst:
+                self._dropped_count += count
+                return
+            self._drop_pending(worst)
+        heapq.heappush(self._queue, entry)
+        self._pending[key] = entry
+        self._advance_queue()
+
+    def _drop_pending(self, entry: _PendingNotification) -> None:
+        """Remove a pending entry and count it as dropped.
+
+        Args:
+            entry: The pending entry to remove.
+        """
+        self._queue.remove(entry)
+        heapq.heapify(self._queue)
+        del self._pending[(entry.level.value, entry.message)]
+        self._dropped_count += entry.count
+
+    def _advance_queue(self) -> None:
+        """Display the next queued notification when allowed.
+
+        A notification on screen is replaced only by an entry of the same
+        or a higher level, and only after the minimum display interval.
+        Lower levels wait until it is dismissed.
+        """
+        if not self._queue or self._sliding_out:
+            return
+        if self._current_key is not None:
+            if self._queue[0].priority < self._current_priority:
+                return
+            elapsed = int((time.monotonic() - self._shown_at) * 1000)
+            remaining = self._min_display_interval - elapsed
+            if remaining > 0:
+                if not self._advance_timer.isActive():
+                    self._advance_timer.start(remaining)
+                return
+
+        entry = heapq.heappop(self._queue)
+        del self._pending[(entry.level.value, entry.message)]
+        self._display(entry.message, entry.level, entry.duration, entry.count)
+
+    def _on_notifications_posted(self) -> None:
+        """Consume the notifications posted from worker threads."""
+        with self._post_lock:
+            posted = self._posted
+            self._posted = {}
+            self._post_scheduled = False
+        # Highest levels first, so they are the ones displayed right away
+        for entry in sorted(posted.values()):
+            self._enqueue(entry.message, entry.level, entry.duration, entry.count)
+
+    # ///////////////////////////////////////////////////////////////
+    # PROPERTIES
+    # ///////////////////////////////////////////////////////////////
+
+    @property
+    def max_queue_size(self) -> int:
+        """Get the maximum number of pending notifications.
+
+        Returns:
+            The maximum number of distinct pending notifications.
+        """
+        return self._max_queue_size
+
+    @max_queue_size.setter
+    def max_queue_size(self, value: int) -> None:
+        """Set the maximum number of pending notifications.
+
+        Shrinking the queue drops the lowest-priority, most recent entries.
+
+        Args:
+            value: The new maximum (at least 1).
+        """
+        self._max_queue_size = max(1, int(value))
+        while len(self._queue) > self._max_queue_size:
+            self._drop_pending(max(self._queue))
+
+    @property
+    def min_display_interval(self) -> int:
+        """Get the minimum display interval.
+
+        Returns:
+            The minimum display time in milliseconds.
+        """
+        return self._min_display_interval
+
+    @min_display_interval.setter
+    def min_display_interval(self, value: int) -> None:
+        """Set the minimum display interval.
+
+        Args:
+            value: The minimum display time in milliseconds (0 to disable).
+        """
+        self._min_display_interval = max(0, int(value))
+
+    @property
+    def pending_count(self) -> int:
+        """Get the number of pending notifications.
+
+        Returns:
+            The number of distinct notifications waiting in the queue.
+        """
+        return len(self._queue)
+
+    @property
+    def dropped_count(self) -> int:
+        """Get the number of dropped notifications.
+
+        Returns:
+            The number of notifications discarded because the queue was
+            full, duplicates included.
+        """
+        with self._post_lock:
+            return self._dropped_count + self._post_dropped
+
     # ///////////////////////////////////////////////////////////////
     # PUBLIC METHODS
     # ///////////////////////////////////////////////////////////////
@@ -315,6 +633,9 @@ class NotificationBanner(QWidget):
     ) -> None:
         """Display a notification banner with the given message and level.
 
+        The notification replaces the current one immediately, bypassing
+        the queue. The slide-in animation only runs if the banner is hidden.
+
         Args:
             message: The text to display in the banner.
             level: The severity level (default: NotificationLevel.INFO).
@@ -322,18 +643,83 @@ class NotificationBanner(QWidget):
                 permanent banner that requires manual dismissal
                 (default: 3000).
         """
-        self._stop_timer()
-        self._duration = duration
+        self._display(message, level, duration, 1)
 
-        self._message_label.setText(message)
-        self._apply_level_style(level)
-        self._slide_in()
+    def enqueueNotification(
+        self,
+        message: str,
+        level: NotificationLevel = NotificationLevel.INFO,
+        duration: int = 3000,
+    ) -> None:
+        """Queue a notification for display.
 
-        if duration > 0:
-            self._dismiss_timer = QTimer(self)
-            self._dismiss_timer.setSingleShot(True)
-            self._dismiss_timer.timeout.connect(self._dismiss)
-            self._dismiss_timer.start(duration)
+        Duplicates of a pending or displayed notification are merged into
+        it and shown as a count badge. When the queue is full, the
+        lowest-priority, most recent entry is dropped.
+
+        Args:
+            message: The text to display in the banner.
+            level: The severity level (default: NotificationLevel.INFO).
+            duration: Display duration in milliseconds. Use 0 for a
+                permanent banner that requires manual dismissal
+                (default: 3000).
+        """
+        self._enqueue(message, level, duration, 1)
+
+    def postNotification(
+        self,
+        message: str,
+        level: NotificationLevel = NotificationLevel.INFO,
+        duration: int = 3000,
+    ) -> None:
+        """Queue a notification from any thread.
+
+        Posted notifications are merged under a lock and handed to the GUI
+        thread with a single queued wake-up until it has been consumed, so
+        posting at a high rate does not queue one event per call. When
+        max_queue_size distinct notifications are already waiting, the
+        lowest-priority, most recent one is dropped, as in
+        enqueueNotification().
+
+        Args:
+            message: The text to display in the banner.
+            level: The severity level (default: NotificationLevel.INFO).
+            duration: Display duration in milliseconds (default: 3000).
+        """
+        key = (level.value, message)
+        with self._post_lock:
+            entry = self._posted.get(key)
+            if entry is not None:
+                entry.count += 1
+                entry.duration = duration
+            else:
+                entry = _PendingNotification(
+                    message, level, duration, 1, next(self._seq)
+                )
+                if len(self._posted) >= self._max_queue_size:
+                    worst = max(self._posted.values())
+                    if entry < worst:
+                        del self._posted[(worst.level.value, worst.message)]
+                        self._post_dropped += worst.count
+                if len(self._posted) < self._max_queue_size:
+                    self._posted[key] = entry
+                else:
+                    self._post_dropped += 1
+            if self._post_scheduled:
+                return
+            self._post_scheduled = True
+        self._notificationsPosted.emit()
+
+    def clearQueue(self) -> None:
+        """Discard every pending notification.
+
+        The notification on screen is left untouched.
+        """
+        self._advance_timer.stop()
+        self._queue.clear()
+        self._pending.clear()
+        with self._post_lock:
+            self._posted.clear()
 
     # ///////////////////////////////////////////////////////////////
     # EVENT HANDLERS
@@ -23,17 +23,31 @@ from PySide6.QtCore import (
     Property,
     QEasingCurve,
     QPropertyAnimation,
-    QRect,
     QSize,
     Qt,
     Signal,
 )
-from PySide6.QtGui import QBrush, QColor, QMouseEvent, QPainter, QPaintEvent, QPen
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+)
 from PySide6.QtWidgets import QSizePolicy, QWidget
 
 # Local imports
 from ...types import WidgetParent
 
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_PIXMAP_CACHE_PREFIX: str = "ezqt_widgets.ToggleSwitch"
+
 # ///////////////////////////////////////////////////////////////
 # CLASSES
 # ///////////////////////////////////////////////////////////////
@@ -49,6 +63,7 @@ class ToggleSwitch(QWidget):
         - Click to toggle functionality
         - Property-based access to state
         - Signal emitted on state change
+        - Track and knob rasterized once and shared through QPixmapCache
 
     Args:
         parent: The parent widget (default: None).
@@ -271,30 +286,31 @@ class ToggleSwitch(QWidget):
         self._animation_obj.setEndValue(target_position)
         self._animation_obj.start()
 
-    # ///////////////////////////////////////////////////////////////
-    # EVENT HANDLERS
-    # ///////////////////////////////////////////////////////////////
+    def _track_pixmap(self, dpr: float) -> QPixmap:
+        """Return the cached track pixmap for the current state.
 
-    def mousePressEvent(self, event: QMouseEvent) -> None:
-        """Handle mouse press events.
+        The cache key covers size, colors, checked state and device pixel
+        ratio, so any property change naturally selects (or builds) a new
+        entry while identical switches share the same pixmap.
 
         Args:
-            event: The mouse event.
-        """
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.toggle()
-
-    def paintEvent(self, _event: QPaintEvent) -> None:
-        """Custom paint event to draw the toggle switch.
+            dpr: The device pixel ratio of the target surface.
 
-        Args:
-            _event: The paint event (unused but required by signature).
+        Returns:
+            The rendered track pixmap.
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw background
         bg_color = self._bg_color_on if self._checked else self._bg_color_off
+        key = (
+            f"{_PIXMAP_CACHE_PREFIX}.track:{self._width}x{self._height}@{dpr}:"
+            f"{bg_color.rgba()}:{self._border_color.rgba()}"
+        )
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = self._create_pixmap(self._width, self._height, dpr)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setPen(QPen(self._border_color, 1))
         painter.setBrush(QBrush(bg_color))
         painter.drawRoundedRect(
@@ -305,19 +321,86 @@ class ToggleSwitch(QWidget):
             self._height // 2,
             self._height // 2,
         )
+        painter.end()
 
-        # Draw circle
-        circle_x = self._circle_position
-        circle_y = (self._height - self._circle_radius * 2) // 2
-        circle_rect = QRect(
-            circle_x, circle_y, self._circle_radius * 2, self._circle_radius * 2
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _knob_pixmap(self, dpr: float) -> QPixmap:
+        """Return the cached knob pixmap.
+
+        Args:
+            dpr: The device pixel ratio of the target surface.
+
+        Returns:
+            The rendered knob pixmap.
+        """
+        diameter = self._circle_radius * 2
+        key = (
+            f"{_PIXMAP_CACHE_PREFIX}.knob:{diameter}@{dpr}:{self._circle_color.rgba()}"
         )
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
 
+        pixmap = self._create_pixmap(diameter, diameter, dpr)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(QBrush(self._circle_color))
-        painter.drawEllipse(
-            circle_x, circle_y, circle_rect.width(), circle_rect.height()
-        )
+        painter.drawEllipse(0, 0, diameter, diameter)
+        painter.end()
+
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    @staticmethod
+    def _create_pixmap(width: int, height: int, dpr: float) -> QPixmap:
+        """Create a transparent pixmap sized for the given device pixel ratio.
+
+        Args:
+            width: Logical width in pixels.
+            height: Logical height in pixels.
+            dpr: The device pixel ratio.
+
+        Returns:
+            A transparent pixmap with its device pixel ratio set.
+        """
+        pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+
+    # ///////////////////////////////////////////////////////////////
+    # EVENT HANDLERS
+    # ///////////////////////////////////////////////////////////////
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """Handle mouse press events.
+
+        Args:
+            event: The mouse event.
+        """
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.toggle()
+
+    def paintEvent(self, _event: QPaintEvent) -> None:
+        """Custom paint event to draw the toggle switch.
+
+        The track and knob are composited from cached pixmaps so that
+        animation frames only blit two images instead of re-rasterizing
+        antialiased shapes.
+
+        Args:
+            _event: The paint event (unused but required by signature).
+        """
+        dpr = self.devicePixelRatioF()
+        circle_y = (self._height - self._circle_radius * 2) // 2
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._track_pixmap(dpr))
+        painter.drawPixmap(self._circle_position, circle_y, self._knob_pixmap(dpr))
+        painter.end()
 
     # ///////////////////////////////////////////////////////////////
     # OVERRIDE METHODS
@@ -7,7 +7,8 @@
 Shared constants package.
 
 Exports all shared widget constants (animation durations, icon sizes,
-and SVG icon bytes) for use across all widget modules.
+and SVG icon bytes), the cache and prebuilt bundle of rasterized
+built-in icons, and CSS color parsing for use across all widget modules.
 """
 
 from __future__ import annotations
@@ -15,31 +16,85 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
+# Standard library imports
+from typing import TYPE_CHECKING
+
 # Local imports
-from ._defaults import (
-    ANIMATION_DURATION_FAST,
-    ANIMATION_DURATION_NORMAL,
-    ANIMATION_DURATION_SLOW,
-    ICON_SIZE_LARGE,
-    ICON_SIZE_NORMAL,
-    ICON_SIZE_SMALL,
-    ICON_SIZE_XLARGE,
-    SVG_CALENDAR,
-    SVG_CHECK,
-    SVG_CHEVRON_DOWN,
-    SVG_CHEVRON_RIGHT,
-    SVG_CLOSE,
-    SVG_CROSS,
-    SVG_ERROR,
-    SVG_EYE_CLOSED,
-    SVG_EYE_OPEN,
-    SVG_FOLDER,
-    SVG_INFO,
-    SVG_SEARCH,
-    SVG_SPINNER,
-    SVG_SUCCESS,
-    SVG_WARNING,
-)
+from ..._lazy import attach
+
+# Type-checking-only imports (names are loaded lazily at runtime)
+if TYPE_CHECKING:
+    from ._colors import parse_css_color
+    from ._defaults import (
+        ANIMATION_DURATION_FAST,
+        ANIMATION_DURATION_NORMAL,
+        ANIMATION_DURATION_SLOW,
+        ICON_SIZE_LARGE,
+        ICON_SIZE_NORMAL,
+        ICON_SIZE_SMALL,
+        ICON_SIZE_XLARGE,
+        SVG_CALENDAR,
+        SVG_CHECK,
+        SVG_CHEVRON_DOWN,
+        SVG_CHEVRON_RIGHT,
+        SVG_CLOSE,
+        SVG_CROSS,
+        SVG_ERROR,
+        SVG_EYE_CLOSED,
+        SVG_EYE_OPEN,
+        SVG_FOLDER,
+        SVG_INFO,
+        SVG_SEARCH,
+        SVG_SPINNER,
+        SVG_SUCCESS,
+        SVG_WARNING,
+    )
+    from ._icons import (
+        build_icon_bundle,
+        builtin_icon_names,
+        clear_icon_cache,
+        get_builtin_icon,
+        get_builtin_pixmap,
+        load_icon_bundle,
+    )
+
+# ///////////////////////////////////////////////////////////////
+# LAZY EXPORTS
+# ///////////////////////////////////////////////////////////////
+
+_EXPORTS: dict[str, str] = {
+    "ANIMATION_DURATION_FAST": "._defaults",
+    "ANIMATION_DURATION_NORMAL": "._defaults",
+    "ANIMATION_DURATION_SLOW": "._defaults",
+    "ICON_SIZE_LARGE": "._defaults",
+    "ICON_SIZE_NORMAL": "._defaults",
+    "ICON_SIZE_SMALL": "._defaults",
+    "ICON_SIZE_XLARGE": "._defaults",
+    "SVG_CALENDAR": "._defaults",
+    "SVG_CHECK": "._defaults",
+    "SVG_CHEVRON_DOWN": "._defaults",
+    "SVG_CHEVRON_RIGHT": "._defaults",
+    "SVG_CLOSE": "._defaults",
+    "SVG_CROSS": "._defaults",
+    "SVG_ERROR": "._defaults",
+    "SVG_EYE_CLOSED": "._defaults",
+    "SVG_EYE_OPEN": "._defaults",
+    "SVG_FOLDER": "._defaults",
+    "SVG_INFO": "._defaults",
+    "SVG_SEARCH": "._defaults",
+    "SVG_SPINNER": "._defaults",
+    "SVG_SUCCESS": "._defaults",
+    "SVG_WARNING": "._defaults",
+    "build_icon_bundle": "._icons",
+    "builtin_icon_names": "._icons",
+    "clear_icon_cache": "._icons",
+    "get_builtin_icon": "._icons",
+    "get_builtin_pixmap": "._icons",
+    "load_icon_bundle": "._icons",
+    "parse_css_color": "._colors",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
@@ -68,4 +123,11 @@ __all__ = [
     "SVG_SPINNER",
     "SVG_SUCCESS",
     "SVG_WARNING",
+    "build_icon_bundle",
+    "builtin_icon_names",
+    "clear_icon_cache",
+    "get_builtin_icon",
+    "get_builtin_pixmap",
+    "load_icon_bundle",
+    "parse_css_color",
 ]
@@ -0,0 +1,64 @@
+# ///////////////////////////////////////////////////////////////
+# COLORS - Shared CSS Color Parsing
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Shared CSS color parsing module.
+
+Converts the color strings accepted by the painted widgets (rgb(), rgba(),
+hex and named colors) to QColor.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import re
+
+# Third-party imports
+from PySide6.QtGui import QColor
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def parse_css_color(color_str: QColor | str) -> QColor:
+    """Parse CSS color strings to QColor.
+
+    Supports rgb, rgba, hex, and named colors.
+
+    Args:
+        color_str: CSS color string or QColor object.
+
+    Returns:
+        QColor object.
+    """
+    if isinstance(color_str, QColor):
+        return color_str
+
+    color_str = str(color_str).strip()
+
+    rgb_match = re.match(r"rgb\((\d+),\s*(\d+),\s*(\d+)\)", color_str)
+    if rgb_match:
+        r, g, b = map(int, rgb_match.groups())
+        return QColor(r, g, b)
+
+    rgba_match = re.match(r"rgba\((\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\)", color_str)
+    if rgba_match:
+        r_str, g_str, b_str, a_str = rgba_match.groups()
+        r, g, b = int(r_str), int(g_str), int(b_str)
+        a = float(a_str) * 255
+        return QColor(r, g, b, int(a))
+
+    return QColor(color_str)
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["parse_css_color"]
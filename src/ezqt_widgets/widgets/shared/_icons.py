@@ -0,0 +1,565 @@
+# ///////////////////////////////////////////////////////////////
+# ICONS - Shared Built-in Icon Cache
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Shared built-in icon cache module.
+
+Rasterizes the built-in ``SVG_*`` icons on first use and keeps the result
+for the lifetime of the process, keyed by (name, size, color, device pixel
+ratio). Widgets that display the same built-in icon share one pixmap
+instead of parsing and rendering the SVG once per instance.
+
+Rasters can also be prebuilt into an icon bundle, a memory-mapped file of
+raw premultiplied ARGB32 images (see build_icon_bundle() and the
+``ezqt-widgets icons build`` command), stored by default in the user
+cache directory. When a bundle is present, cached
+icons are copied from it instead of being rendered, and QtSvg is not
+imported at all; missing entries and stale bundles fall back to SVG
+rendering.
+
+Pixmaps must only be created on the GUI thread, so the cache is meant to
+be used from the GUI thread only.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+# Third-party imports
+from PySide6.QtCore import QByteArray, QSize, Qt
+from PySide6.QtGui import QColor, QIcon, QImage, QPainter, QPixmap
+
+# Local imports
+from ._defaults import (
+    ICON_SIZE_NORMAL,
+    SVG_CALENDAR,
+    SVG_CHECK,
+    SVG_CHEVRON_DOWN,
+    SVG_CHEVRON_RIGHT,
+    SVG_CLOSE,
+    SVG_CROSS,
+    SVG_ERROR,
+    SVG_EYE_CLOSED,
+    SVG_EYE_OPEN,
+    SVG_FOLDER,
+    SVG_INFO,
+    SVG_SEARCH,
+    SVG_SPINNER,
+    SVG_SUCCESS,
+    SVG_WARNING,
+)
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_BUILTIN_SVGS: dict[str, bytes] = {
+    "CALENDAR": SVG_CALENDAR,
+    "CHECK": SVG_CHECK,
+    "CHEVRON_DOWN": SVG_CHEVRON_DOWN,
+    "CHEVRON_RIGHT": SVG_CHEVRON_RIGHT,
+    "CLOSE": SVG_CLOSE,
+    "CROSS": SVG_CROSS,
+    "ERROR": SVG_ERROR,
+    "EYE_CLOSED": SVG_EYE_CLOSED,
+    "EYE_OPEN": SVG_EYE_OPEN,
+    "FOLDER": SVG_FOLDER,
+    "INFO": SVG_INFO,
+    "SEARCH": SVG_SEARCH,
+    "SPINNER": SVG_SPINNER,
+    "SUCCESS": SVG_SUCCESS,
+    "WARNING": SVG_WARNING,
+}
+
+# (name, width, height, ARGB color or None, device pixel ratio) -> pixmap
+_IconKey = tuple[str, int, int, str | None, float]
+_PIXMAP_CACHE: dict[_IconKey, QPixmap] = {}
+
+# Icon bundle file layout: magic, little-endian header length, JSON header,
+# then raw premultiplied ARGB32 pixels at 16-byte aligned offsets.
+_BUNDLE_MAGIC: bytes = b"EZQTICO1"
+_BUNDLE_HEADER = struct.Struct("<8sI")
+_BUNDLE_ALIGN: int = 16
+_BUNDLE_FILE_NAME: str = "icons.bin"
+
+DEFAULT_BUNDLE_SIZES: tuple[int, ...] = (16, 20, 24)
+DEFAULT_BUNDLE_DPRS: tuple[float, ...] = (1.0, 2.0)
+DEFAULT_BUNDLE_COLORS: tuple[str | None, ...] = (None, "white")
+
+# Bundle state: loaded lazily on the first cache miss
+_bundle: _IconBundle | None = None
+_bundle_loaded: bool = False
+
+# ///////////////////////////////////////////////////////////////
+# CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class _IconBundle:
+    """Read-only view of a prebuilt icon bundle file.
+
+    Args:
+        path: The bundle file.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a bundle built from the current
+            built-in SVGs, or an entry does not fit in the file (for
+            example a truncated download).
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map the bundle file and validate its header and entries.
+
+        Args:
+            path: The bundle file.
+        """
+        with path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, header_size = _BUNDLE_HEADER.unpack_from(self._map, 0)
+            if magic != _BUNDLE_MAGIC:
+                raise ValueError(f"Not an icon bundle: {path}")
+            start = _BUNDLE_HEADER.size
+            header = json.loads(self._map[start : start + header_size])
+            if header.get("svg_digest") != _svg_digest():
+                raise ValueError(f"Icon bundle is out of date: {path}")
+            self._entries: dict[str, list[int]] = header["entries"]
+            data_start = start + header_size
+            for key, entry in self._entries.items():
+                if not _valid_entry(entry, data_start, len(self._map)):
+                    raise ValueError(f"Invalid icon bundle entry {key!r}: {path}")
+        except (KeyError, TypeError, struct.error, json.JSONDecodeError) as e:
+            self._map.close()
+            raise ValueError(f"Invalid icon bundle: {path}") from e
+        except ValueError:
+            self._map.close()
+            raise
+
+    def __len__(self) -> int:
+        """Return the number of bundled images.
+
+        Returns:
+            The number of entries in the bundle.
+        """
+        return len(self._entries)
+
+    def image(self, key: _IconKey) -> QImage | None:
+        """Return a copy of the bundled image for a cache key.
+
+        Args:
+            key: The icon cache key.
+
+        Returns:
+            The image, or None if the bundle has no entry for the key.
+        """
+        entry = self._entries.get(_bundle_key(key))
+        if entry is None:
+            return None
+        offset, width, height = entry
+        stride = width * 4
+        data = memoryview(self._map)[offset : offset + stride * height]
+        try:
+            return QImage(
+                data, width, height, stride, QImage.Format.Format_ARGB32_Premultiplied
+            ).copy()
+        finally:
+            data.release()
+
+    def close(self) -> None:
+        """Unmap the bundle file."""
+        self._map.close()
+
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize a built-in icon name.
+
+    Args:
+        name: The icon name, with or without the ``SVG_`` prefix, in any
+            case (``"calendar"``, ``"SVG_CALENDAR"``).
+
+    Returns:
+        The upper-case name without prefix.
+
+    Raises:
+        KeyError: If the name is not a built-in icon.
+    """
+    key = name.upper().removeprefix("SVG_")
+    if key not in _BUILTIN_SVGS:
+        raise KeyError(f"Unknown built-in icon: {name}")
+    return key
+
+
+def _default_bundle_path() -> Path:
+    """Return the default icon bundle location in the user cache directory.
+
+    The bundle is never stored inside the installed package, which may be
+    read-only or shared between users.
+
+    Returns:
+        ``ezqt_widgets/icons.bin`` under ``%LOCALAPPDATA%`` on Windows,
+        ``~/Library/Caches`` on macOS and ``$XDG_CACHE_HOME`` (default
+        ``~/.cache``) elsewhere.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData/Local")
+    elif sys.platform == "darwin":
+        base = str(Path.home() / "Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "ezqt_widgets" / _BUNDLE_FILE_NAME
+
+
+def _svg_digest() -> str:
+    """Return a digest of the built-in SVG sources.
+
+    Returns:
+        A hex digest identifying the built-in icon set.
+    """
+    digest = hashlib.sha256()
+    for name in sorted(_BUILTIN_SVGS):
+        digest.update(name.encode())
+        digest.update(_BUILTIN_SVGS[name])
+    return digest.hexdigest()
+
+
+def _valid_entry(entry: list[int], data_start: int, size: int) -> bool:
+    """Check that a bundle entry describes an image inside the file.
+
+    Args:
+        entry: The ``[offset, width, height]`` entry from the bundle header.
+        data_start: The first byte after the bundle header.
+        size: The bundle file size.
+
+    Returns:
+        True if the entry has positive dimensions and aligned pixel data
+        that lies entirely within the file.
+    """
+    if (
+        not isinstance(entry, list)
+        or len(entry) != 3
+        or not all(type(value) is int for value in entry)
+    ):
+        return False
+    offset, width, height = entry
+    return (
+        width > 0
+        and height > 0
+        and offset >= data_start
+        and offset % _BUNDLE_ALIGN == 0
+        and offset + width * 4 * height <= size
+    )
+
+
+def _bundle_key(key: _IconKey) -> str:
+    """Return the bundle index key for a cache key.
+
+    Args:
+        key: The icon cache key.
+
+    Returns:
+        A string of the form ``NAME:WxH:COLOR@DPR``.
+    """
+    name, width, height, color, dpr = key
+    return f"{name}:{width}x{height}:{color or '-'}@{dpr:g}"
+
+
+def _make_key(
+    name: str, size: QSize | int, color: QColor | str | None, dpr: float
+) -> tuple[_IconKey, QSize, QColor | None]:
+    """Normalize icon request arguments into a cache key.
+
+    Args:
+        name: The icon name.
+        size: The logical size, or a side length for square icons.
+        color: Optional icon color.
+        dpr: The device pixel ratio.
+
+    Returns:
+        The cache key, the logical size and the parsed color.
+
+    Raises:
+        KeyError: If the name is not a built-in icon.
+        ValueError: If the color is invalid.
+    """
+    key_name = _normalize_name(name)
+    qsize = QSize(size, size) if isinstance(size, int) else QSize(size)
+
+    qcolor: QColor | None = None
+    color_key: str | None = None
+    if color is not None:
+        qcolor = QColor(color)
+        if not qcolor.isValid():
+            raise ValueError(f"Invalid icon color: {color}")
+        color_key = qcolor.name(QColor.NameFormat.HexArgb)
+
+    ratio = float(dpr) if dpr > 0 else 1.0
+    return (key_name, qsize.width(), qsize.height(), color_key, ratio), qsize, qcolor
+
+
+def _render(svg: bytes, size: QSize, color: QColor | None, dpr: float) -> QImage:
+    """Rasterize SVG bytes to an image.
+
+    Args:
+        svg: The SVG document.
+        size: The logical image size.
+        color: Optional color filling every opaque pixel.
+        dpr: The device pixel ratio to render for.
+
+    Returns:
+        The rendered premultiplied ARGB32 image, in device pixels.
+
+    Raises:
+        ValueError: If the SVG cannot be parsed.
+    """
+    # QtSvg is only needed when an icon is missing from the bundle
+    from PySide6.QtSvg import QSvgRenderer
+
+    renderer = QSvgRenderer(QByteArray(svg))
+    if not renderer.isValid():
+        raise ValueError("Built-in SVG icon could not be rendered.")
+
+    image = QImage(
+        max(1, round(size.width() * dpr)),
+        max(1, round(size.height() * dpr)),
+        QImage.Format.Format_ARGB32_Premultiplied,
+    )
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    renderer.render(painter)
+    if color is not None:
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(image.rect(), color)
+    painter.end()
+    return image
+
+
+def _get_bundle() -> _IconBundle | None:
+    """Return the icon bundle, loading the default one on first use.
+
+    Returns:
+        The loaded bundle, or None if there is no usable bundle.
+    """
+    if not _bundle_loaded:
+        load_icon_bundle()
+    return _bundle
+
+
+def builtin_icon_names() -> list[str]:
+    """Return the names of the built-in icons.
+
+    Returns:
+        Sorted upper-case icon names, without the ``SVG_`` prefix.
+    """
+    return sorted(_BUILTIN_SVGS)
+
+
+def get_builtin_pixmap(
+    name: str,
+    size: QSize | int = ICON_SIZE_NORMAL,
+    color: QColor | str | None = None,
+    dpr: float = 1.0,
+) -> QPixmap:
+    """Return a cached raster of a built-in icon.
+
+    The icon is loaded from the icon bundle, or rendered from its SVG, on
+    the first request for a given (name, size, color, dpr) key; later
+    requests return the same implicitly shared pixmap.
+
+    Args:
+        name: The icon name, e.g. ``"calendar"`` or ``"SVG_CALENDAR"``.
+        size: The logical size, or a side length for square icons
+            (default: ICON_SIZE_NORMAL).
+        color: Optional color replacing the icon color; None keeps the
+            SVG colors (default: None).
+        dpr: The device pixel ratio to render for (default: 1.0).
+
+    Returns:
+        The rendered pixmap.
+
+    Raises:
+        KeyError: If the name is not a built-in icon.
+        ValueError: If the color is invalid or the SVG cannot be rendered.
+    """
+    key, qsize, qcolor = _make_key(name, size, color, dpr)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        bundle = _get_bundle()
+        image = bundle.image(key) if bundle is not None else None
+        if image is None:
+            image = _render(_BUILTIN_SVGS[key[0]], qsize, qcolor, key[4])
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(key[4])
+        _PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+
+def get_builtin_icon(
+    name: str,
+    size: QSize | int = ICON_SIZE_NORMAL,
+    color: QColor | str | None = None,
+    dpr: float = 1.0,
+) -> QIcon:
+    """Return a QIcon built from a cached built-in icon raster.
+
+    Args:
+        name: The icon name, e.g. ``"calendar"`` or ``"SVG_CALENDAR"``.
+        size: The logical size, or a side length for square icons
+            (default: ICON_SIZE_NORMAL).
+        color: Optional color replacing the icon color (default: None).
+        dpr: The device pixel ratio to render for (default: 1.0).
+
+    Returns:
+        A QIcon sharing the cached pixmap.
+
+    Raises:
+        KeyError: If the name is not a built-in icon.
+        ValueError: If the color is invalid or the SVG cannot be rendered.
+    """
+    return QIcon(get_builtin_pixmap(name, size, color, dpr))
+
+
+def clear_icon_cache() -> None:
+    """Drop every cached built-in icon raster."""
+    _PIXMAP_CACHE.clear()
+
+
+def build_icon_bundle(
+    path: str | Path | None = None,
+    sizes: Iterable[int] = DEFAULT_BUNDLE_SIZES,
+    dprs: Iterable[float] = DEFAULT_BUNDLE_DPRS,
+    colors: Iterable[str | None] = DEFAULT_BUNDLE_COLORS,
+) -> Path:
+    """Pre-rasterize every built-in icon into an icon bundle file.
+
+    Every built-in icon is rendered for each combination of size, device
+    pixel ratio and color. No QApplication is required.
+
+    Args:
+        path: The output file (default: ``ezqt_widgets/icons.bin`` in the
+            user cache directory, where the library looks for it).
+        sizes: Square icon sizes in logical pixels
+            (default: DEFAULT_BUNDLE_SIZES).
+        dprs: Device pixel ratios (default: DEFAULT_BUNDLE_DPRS).
+        colors: Icon colors; None keeps the SVG colors
+            (default: DEFAULT_BUNDLE_COLORS).
+
+    Returns:
+        The path of the written bundle.
+
+    Raises:
+        ValueError: If a color is invalid or an SVG cannot be rendered.
+        OSError: If the file cannot be written.
+    """
+    target = Path(path) if path is not None else _default_bundle_path()
+    sizes = list(dict.fromkeys(int(size) for size in sizes))
+    dprs = list(dict.fromkeys(float(dpr) for dpr in dprs))
+    colors = list(dict.fromkeys(colors))
+
+    images: list[tuple[str, QImage]] = []
+    for name in sorted(_BUILTIN_SVGS):
+        for size in sizes:
+            for dpr in dprs:
+                for color in colors:
+                    key, qsize, qcolor = _make_key(name, size, color, dpr)
+                    image = _render(_BUILTIN_SVGS[name], qsize, qcolor, key[4])
+                    images.append((_bundle_key(key), image))
+
+    def align(value: int) -> int:
+        return -(-value // _BUNDLE_ALIGN) * _BUNDLE_ALIGN
+
+    # Offsets depend on the header size, which depends on the offsets:
+    # reserve room for the longest offsets first, then pad the header
+    entries: dict[str, list[int]] = {}
+    header_room = 0
+    while True:
+        offset = align(_BUNDLE_HEADER.size + header_room)
+        for bundle_key, image in images:
+            entries[bundle_key] = [offset, image.width(), image.height()]
+            offset = align(offset + image.width() * image.height() * 4)
+        header = json.dumps(
+            {"svg_digest": _svg_digest(), "entries": entries},
+            separators=(",", ":"),
+        ).encode()
+        if len(header) <= header_room:
+            break
+        header_room = len(header)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("wb") as file:
+        file.write(_BUNDLE_HEADER.pack(_BUNDLE_MAGIC, len(header)))
+        file.write(header)
+        for bundle_key, image in images:
+            file.seek(entries[bundle_key][0])
+            row_bytes = image.width() * 4
+            bits = image.constBits()
+            for row in range(image.height()):
+                start = row * image.bytesPerLine()
+                file.write(bytes(bits[start : start + row_bytes]))
+    return target
+
+
+def load_icon_bundle(path: str | Path | None = None) -> bool:
+    """Load an icon bundle, replacing the current one.
+
+    The default bundle is loaded automatically on the first cache miss, so
+    this only needs to be called for a bundle stored elsewhere. The raster
+    cache is cleared so later requests use the new bundle.
+
+    Args:
+        path: The bundle file (default: ``ezqt_widgets/icons.bin`` in the
+            user cache directory).
+
+    Returns:
+        True if a bundle was loaded, False if the file is missing, invalid
+        or built from different SVG sources (SVG rendering is used then).
+    """
+    global _bundle, _bundle_loaded
+
+    if _bundle is not None:
+        _bundle.close()
+    _bundle = None
+    _bundle_loaded = True
+    _PIXMAP_CACHE.clear()
+
+    target = Path(path) if path is not None else _default_bundle_path()
+    try:
+        _bundle = _IconBundle(target)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "DEFAULT_BUNDLE_COLORS",
+    "DEFAULT_BUNDLE_DPRS",
+    "DEFAULT_BUNDLE_SIZES",
+    "build_icon_bundle",
+    "builtin_icon_names",
+    "clear_icon_cache",
+    "get_builtin_icon",
+    "get_builtin_pixmap",
+    "load_icon_bundle",
+]
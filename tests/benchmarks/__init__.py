@@ -0,0 +1,14 @@
+# ///////////////////////////////////////////////////////////////
+# BENCHMARKS - Benchmark Tests Module
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Benchmark tests for ezqt_widgets.
+
+This module contains throughput benchmarks for performance-sensitive
+widget code paths. They run headless and are marked ``benchmark`` and
+``slow`` so they can be deselected with ``-m "not slow"``.
+"""
+
+from __future__ import annotations
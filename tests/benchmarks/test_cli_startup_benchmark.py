@@ -0,0 +1,91 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_CLI_STARTUP_BENCHMARK - CLI Startup Time Benchmarks
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Benchmarks for the CLI startup time.
+
+Runs ``ezqt-widgets --help`` and ``ezqt-widgets version`` in fresh
+interpreters and checks their wall time, minus the bare interpreter
+startup, against a budget, so an eager import of a command, of rich or of
+Qt on these paths is caught.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+import ezqt_widgets
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Budget over the bare interpreter startup; importing rich and every
+# command eagerly takes well over this on a typical machine
+_STARTUP_BUDGET_MS: float = 120.0
+_RUNS: int = 5
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _wall_time_ms(*args: str) -> float:
+    """Measure the wall time of a fresh interpreter run.
+
+    Args:
+        *args: The interpreter arguments.
+
+    Returns:
+        The best wall time over several runs, in milliseconds.
+    """
+    src_dir = Path(ezqt_widgets.__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+
+    timings: list[float] = []
+    for _ in range(_RUNS):
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603
+            [sys.executable, *args],
+            capture_output=True,
+            env=env,
+            check=True,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestCliStartupBenchmark:
+    """Startup time budget for the fast CLI paths."""
+
+    @pytest.mark.parametrize("command", ["--help", "version"])
+    def test_should_start_within_budget(self, command: str, record_property) -> None:
+        """Check the startup overhead of a CLI invocation."""
+        baseline_ms = _wall_time_ms("-c", "pass")
+        elapsed_ms = _wall_time_ms("-m", "ezqt_widgets.cli.main", command)
+        overhead_ms = elapsed_ms - baseline_ms
+        record_property(f"cli_{command.strip('-')}_ms", round(elapsed_ms, 1))
+        record_property(f"cli_{command.strip('-')}_overhead_ms", round(overhead_ms, 1))
+
+        assert overhead_ms < _STARTUP_BUDGET_MS
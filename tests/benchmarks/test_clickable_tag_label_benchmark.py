@@ -0,0 +1,123 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_CLICKABLE_TAG_LABEL_BENCHMARK - ClickableTagLabel Benchmarks
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Benchmarks for ClickableTagLabel state toggles.
+
+Measures bulk toggle throughput ("select all" over many tags) and compares
+it with the former per-toggle stylesheet approach.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import time
+
+# Third-party imports
+import pytest
+from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget
+
+# Local imports
+from ezqt_widgets.widgets.label.clickable_tag_label import ClickableTagLabel
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_TAG_COUNT: int = 500
+_ROUNDS: int = 4
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _build_tags(app: QApplication) -> tuple[QWidget, list[ClickableTagLabel]]:
+    """Build a visible host holding many tags.
+
+    Args:
+        app: The Qt application used to flush pending events.
+
+    Returns:
+        The host widget and its tags.
+    """
+    host = QWidget()
+    layout = QVBoxLayout(host)
+    tags = [ClickableTagLabel(name=f"tag-{i}") for i in range(_TAG_COUNT)]
+    for tag in tags:
+        layout.addWidget(tag)
+    host.show()
+    app.processEvents()
+    return host, tags
+
+
+def _bulk_toggles_per_second(tags: list[ClickableTagLabel], app: QApplication) -> float:
+    """Toggle every tag several times and return the achieved rate.
+
+    Args:
+        tags: The tags to toggle.
+        app: The Qt application used to flush pending paints.
+
+    Returns:
+        Tag toggles per second.
+    """
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        for tag in tags:
+            tag.enabled = not tag.enabled
+        app.processEvents()
+    return _ROUNDS * len(tags) / (time.perf_counter() - start)
+
+
+def _stylesheet_toggles_per_second(
+    tags: list[ClickableTagLabel], app: QApplication
+) -> float:
+    """Replay the former per-toggle stylesheet path on the same tags.
+
+    Args:
+        tags: The tags to restyle.
+        app: The Qt application used to flush pending paints.
+
+    Returns:
+        Tag toggles per second.
+    """
+    start = time.perf_counter()
+    for round_index in range(_ROUNDS):
+        color = "#0078d4" if round_index % 2 == 0 else "rgb(86, 86, 86)"
+        for tag in tags:
+            tag._label.setStyleSheet(
+                f"color: {color}; background-color: transparent; border: none;"
+            )
+            tag.refreshStyle()
+            tag.adjustSize()
+        app.processEvents()
+    return _ROUNDS * len(tags) / (time.perf_counter() - start)
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestClickableTagLabelBenchmark:
+    """Bulk toggle benchmarks for ClickableTagLabel."""
+
+    def test_should_outperform_stylesheet_toggles_when_toggling_in_bulk(
+        self, qt_widget_cleanup, record_property
+    ) -> None:
+        """Compare property-based toggles with per-toggle stylesheets."""
+        _host, tags = _build_tags(qt_widget_cleanup)
+
+        property_rate = _bulk_toggles_per_second(tags, qt_widget_cleanup)
+        stylesheet_rate = _stylesheet_toggles_per_second(tags, qt_widget_cleanup)
+        record_property("property_toggles_per_second", round(property_rate))
+        record_property("stylesheet_toggles_per_second", round(stylesheet_rate))
+
+        assert property_rate > stylesheet_rate
@@ -0,0 +1,89 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_IMPORT_BENCHMARK - Package Import Time Benchmarks
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Benchmarks for the package import time.
+
+Runs ``python -X importtime`` in fresh interpreters and checks the
+cumulative import time of ``ezqt_widgets`` against a budget, so an eager
+import of Qt or of every widget module is caught.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+import ezqt_widgets
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+# Budget for "import ezqt_widgets"; importing PySide6.QtWidgets alone
+# takes well over this on a typical machine
+_IMPORT_BUDGET_MS: float = 100.0
+_RUNS: int = 3
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _import_time_ms(module: str) -> float:
+    """Measure the cumulative import time of a module.
+
+    Args:
+        module: The module to import in a fresh interpreter.
+
+    Returns:
+        The best cumulative import time over several runs, in milliseconds.
+    """
+    src_dir = Path(ezqt_widgets.__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+    pattern = re.compile(rf"\|\s*(\d+)\s*\|\s*{re.escape(module)}$", re.MULTILINE)
+
+    timings: list[float] = []
+    for _ in range(_RUNS):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        match = pattern.search(result.stderr)
+        assert match is not None, result.stderr[-500:]
+        timings.append(int(match.group(1)) / 1000)
+    return min(timings)
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestImportBenchmark:
+    """Import time budget for the package."""
+
+    def test_should_import_package_within_budget(self, record_property) -> None:
+        """Check the cumulative import time of ezqt_widgets."""
+        elapsed_ms = _import_time_ms("ezqt_widgets")
+        record_property("import_ezqt_widgets_ms", round(elapsed_ms, 1))
+
+        assert elapsed_ms < _IMPORT_BUDGET_MS
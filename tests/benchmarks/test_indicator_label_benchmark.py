@@ -0,0 +1,121 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_INDICATOR_LABEL_BENCHMARK - IndicatorLabel Benchmarks
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Benchmarks for IndicatorLabel status changes.
+
+Measures status changes per second, including the repaint they trigger,
+and compares them with the former per-update stylesheet approach.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import time
+
+# Third-party imports
+import pytest
+from PySide6.QtWidgets import QApplication, QLabel
+
+# Local imports
+from ezqt_widgets.widgets.label.indicator_label import IndicatorLabel
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_ITERATIONS: int = 2000
+_STATUSES: tuple[str, ...] = ("online", "partial", "offline", "neutral")
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _changes_per_second(label: IndicatorLabel, app: QApplication) -> float:
+    """Cycle through statuses and return the achieved rate.
+
+    Args:
+        label: The indicator to drive.
+        app: The Qt application used to flush pending paints.
+
+    Returns:
+        Status changes per second.
+    """
+    start = time.perf_counter()
+    for i in range(_ITERATIONS):
+        label.setStatus(_STATUSES[i % len(_STATUSES)])
+        if i % 100 == 0:
+            app.processEvents()
+    app.processEvents()
+    return _ITERATIONS / (time.perf_counter() - start)
+
+
+def _stylesheet_changes_per_second(led: QLabel, app: QApplication) -> float:
+    """Replay the former per-update stylesheet path on a bare QLabel.
+
+    Args:
+        led: The label receiving a stylesheet per change.
+        app: The Qt application used to flush pending paints.
+
+    Returns:
+        Stylesheet updates per second.
+    """
+    colors = ("#4CAF50", "#FFC107", "#F44336", "#A0A0A0")
+    start = time.perf_counter()
+    for i in range(_ITERATIONS):
+        color = colors[i % len(colors)]
+        led.setStyleSheet(
+            f"background-color: {color}; border: 2px solid rgb(66, 66, 66);"
+            " border-radius: 6px; margin-top: 3px;"
+        )
+        if i % 100 == 0:
+            app.processEvents()
+    app.processEvents()
+    return _ITERATIONS / (time.perf_counter() - start)
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestIndicatorLabelBenchmark:
+    """Throughput benchmarks for IndicatorLabel."""
+
+    def test_should_sustain_high_status_change_rate(
+        self, qt_widget_cleanup, record_property
+    ) -> None:
+        """Benchmark status changes per second on a visible indicator."""
+        label = IndicatorLabel()
+        label.show()
+        qt_widget_cleanup.processEvents()
+
+        rate = _changes_per_second(label, qt_widget_cleanup)
+        record_property("status_changes_per_second", round(rate))
+
+        assert rate > 1000
+
+    def test_should_outperform_stylesheet_updates(
+        self, qt_widget_cleanup, record_property
+    ) -> None:
+        """Compare painted status changes with per-update stylesheets."""
+        label = IndicatorLabel()
+        label.show()
+        led = QLabel()
+        led.show()
+        qt_widget_cleanup.processEvents()
+
+        painted_rate = _changes_per_second(label, qt_widget_cleanup)
+        stylesheet_rate = _stylesheet_changes_per_second(led, qt_widget_cleanup)
+        record_property("painted_changes_per_second", round(painted_rate))
+        record_property("stylesheet_changes_per_second", round(stylesheet_rate))
+
+        assert painted_rate > stylesheet_rate
@@ -0,0 +1,122 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_TAG_CLOUD_BENCHMARK - TagCloud Benchmarks
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Benchmarks for TagCloud construction.
+
+Measures building and painting a large tag set and compares it with one
+ClickableTagLabel per tag.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import time
+
+# Third-party imports
+import pytest
+from PySide6.QtWidgets import QApplication
+
+# Local imports
+from ezqt_widgets.widgets.label.clickable_tag_label import ClickableTagLabel
+from ezqt_widgets.widgets.label.tag_cloud import TagCloud
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_TAG_COUNT: int = 3000
+_WIDTH: int = 600
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _build_cloud(names: list[str], app: QApplication) -> float:
+    """Build and show a TagCloud and return the elapsed time.
+
+    Args:
+        names: The tag names.
+        app: The Qt application used to flush pending paints.
+
+    Returns:
+        Elapsed seconds.
+    """
+    start = time.perf_counter()
+    cloud = TagCloud(tags=names)
+    cloud.resize(_WIDTH, 400)
+    cloud.show()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    cloud.close()
+    return elapsed
+
+
+def _build_labels(names: list[str], app: QApplication) -> float:
+    """Build one ClickableTagLabel per tag and return the elapsed time.
+
+    Args:
+        names: The tag names.
+        app: The Qt application used to flush pending events.
+
+    Returns:
+        Elapsed seconds.
+    """
+    start = time.perf_counter()
+    labels = [ClickableTagLabel(name=name) for name in names]
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    for label in labels:
+        label.deleteLater()
+    return elapsed
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestTagCloudBenchmark:
+    """Construction benchmarks for TagCloud."""
+
+    def test_should_build_large_cloud_faster_than_tag_labels(
+        self, qt_widget_cleanup, record_property
+    ) -> None:
+        """Compare a painted cloud with one widget per tag."""
+        names = [f"tag-{i}" for i in range(_TAG_COUNT)]
+
+        cloud_seconds = _build_cloud(names, qt_widget_cleanup)
+        labels_seconds = _build_labels(names, qt_widget_cleanup)
+        record_property("tag_cloud_build_ms", round(cloud_seconds * 1000, 1))
+        record_property("tag_labels_build_ms", round(labels_seconds * 1000, 1))
+
+        assert cloud_seconds < labels_seconds
+
+    def test_should_toggle_tags_quickly_when_cloud_is_large(
+        self, qt_widget_cleanup, record_property
+    ) -> None:
+        """Benchmark single tag toggles on a visible cloud."""
+        names = [f"tag-{i}" for i in range(_TAG_COUNT)]
+        cloud = TagCloud(tags=names)
+        cloud.resize(_WIDTH, 400)
+        cloud.show()
+        qt_widget_cleanup.processEvents()
+
+        start = time.perf_counter()
+        for i in range(1000):
+            cloud.setSelected(names[i % 50], i % 2 == 0)
+            if i % 100 == 0:
+                qt_widget_cleanup.processEvents()
+        qt_widget_cleanup.processEvents()
+        rate = 1000 / (time.perf_counter() - start)
+        record_property("tag_toggles_per_second", round(rate))
+
+        assert rate > 1000
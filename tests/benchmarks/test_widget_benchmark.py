@@ -0,0 +1,92 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_WIDGET_BENCHMARK - Widget Micro-Benchmark Suite
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Micro-benchmark suite covering every exported widget.
+
+Runs every scenario of ``ezqt_widgets.benchmark`` headless (construction,
+first paint, repaint, theme switch, memory per instance), saves the report
+as JSON and compares it with the stored baseline.
+
+The benchmarks run in a fresh interpreter, like the one that produced the
+baseline: coverage tracing and the Qt state left by other tests would
+otherwise skew the timings.
+
+Environment variables:
+    EZQT_BENCH_OUTPUT: Where to write the report (default: a temporary
+        directory). Point it at ``tests/benchmarks/baselines/widgets.json``
+        to refresh the baseline.
+    EZQT_BENCH_TOLERANCE: Allowed slowdown ratio against the baseline
+        (default: 3.0, loose enough for a different machine).
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+import ezqt_widgets
+from ezqt_widgets.benchmark import compare_reports, load_report
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_BASELINE_PATH: Path = Path(__file__).with_name("baselines") / "widgets.json"
+_DEFAULT_TOLERANCE: float = 3.0
+
+_RUN_BENCHMARKS: str = (
+    "import sys\n"
+    "from ezqt_widgets.benchmark import run_benchmarks, save_report\n"
+    "save_report(run_benchmarks(), sys.argv[1])\n"
+)
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestWidgetBenchmark:
+    """Benchmark suite for every exported widget."""
+
+    def test_should_not_regress_against_baseline(
+        self, tmp_path, record_property
+    ) -> None:
+        """Benchmark every widget and compare the report with the baseline."""
+        baseline = load_report(_BASELINE_PATH)
+        output = Path(os.environ.get("EZQT_BENCH_OUTPUT", tmp_path / "widgets.json"))
+        src_dir = Path(ezqt_widgets.__file__).resolve().parents[1]
+        env = {**os.environ, "PYTHONPATH": str(src_dir), "QT_QPA_PLATFORM": "offscreen"}
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", _RUN_BENCHMARKS, str(output)],
+            env=env,
+            check=True,
+        )
+
+        report = load_report(output)
+        record_property("widget_benchmark_report", str(output))
+        for name, metrics in report["widgets"].items():
+            record_property(f"{name}_construct_p50_us", metrics["construct"]["p50"])
+            record_property(f"{name}_first_paint_p50_us", metrics["first_paint"]["p50"])
+
+        tolerance = float(os.environ.get("EZQT_BENCH_TOLERANCE", _DEFAULT_TOLERANCE))
+        regressions = compare_reports(report, baseline, tolerance=tolerance)
+
+        assert not regressions, "\n".join(
+            f"{r.widget}.{r.metric}: {r.baseline:g} -> {r.current:g} (x{r.ratio:.2f})"
+            for r in regressions
+        )
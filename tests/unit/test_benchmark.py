@@ -0,0 +1,162 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_BENCHMARK - Widget Benchmark Package Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Tests for the widget benchmark package.
+
+This test file verifies scenario coverage, percentile summaries, report
+persistence and baseline comparison.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import inspect
+import json
+
+# Third-party imports
+import pytest
+from PySide6.QtWidgets import QWidget
+
+# Local imports
+import ezqt_widgets
+from ezqt_widgets.benchmark import (
+    SCENARIOS,
+    TIMING_METRICS,
+    benchmark_widget,
+    compare_reports,
+    load_report,
+    run_benchmarks,
+    save_report,
+    summarize,
+)
+
+pytestmark = pytest.mark.unit
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _report(p50: float, python_bytes: int) -> dict:
+    """Build a minimal one-widget report.
+
+    Args:
+        p50: The median of every timing metric.
+        python_bytes: The Python heap per instance.
+
+    Returns:
+        The report.
+    """
+    metrics: dict = {name: {"p50": p50} for name in TIMING_METRICS}
+    metrics["memory"] = {"python_bytes": python_bytes, "rss_bytes": None}
+    return {"schema": 1, "widgets": {"ToggleSwitch": metrics}}
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestBenchmarkScenarios:
+    """Tests for the benchmark scenarios and runner."""
+
+    def test_should_have_scenario_for_every_exported_widget(self) -> None:
+        """Test that every exported widget class is benchmarked."""
+        widgets = {
+            name
+            for name in ezqt_widgets.__all__
+            if inspect.isclass(obj := getattr(ezqt_widgets, name))
+            and issubclass(obj, QWidget)
+        }
+
+        assert widgets == set(SCENARIOS)
+
+    @pytest.mark.parametrize("name", sorted(SCENARIOS))
+    def test_should_build_widget_of_scenario_class(
+        self, qt_widget_cleanup, name: str
+    ) -> None:
+        """Test that each scenario builds an instance of its widget."""
+        widget = SCENARIOS[name]()
+
+        assert type(widget).__name__ == name
+        widget.window().deleteLater()
+
+    def test_should_measure_every_metric(self, qt_widget_cleanup) -> None:
+        """Test a small benchmark run on one widget."""
+        result = benchmark_widget(SCENARIOS["ToggleSwitch"], instances=3, repeats=4)
+
+        for name in TIMING_METRICS:
+            assert result[name]["n"] in (3, 4)
+            assert 0 <= result[name]["min"] <= result[name]["p50"]
+        assert result["memory"]["python_bytes"] >= 0
+
+    def test_should_build_report_for_selected_widgets(self, qt_widget_cleanup) -> None:
+        """Test the report layout of run_benchmarks()."""
+        report = run_benchmarks(["ToggleSwitch"], instances=2, repeats=2)
+
+        assert report["schema"] == 1
+        assert report["config"] == {"instances": 2, "repeats": 2}
+        assert list(report["widgets"]) == ["ToggleSwitch"]
+        assert report["environment"]["ezqt_widgets"] == ezqt_widgets.__version__
+
+    def test_should_reject_unknown_widget(self, qt_widget_cleanup) -> None:
+        """Test that unknown widget names are rejected."""
+        with pytest.raises(ValueError, match="Missing"):
+            run_benchmarks(["Missing"])
+
+
+class TestBenchmarkReports:
+    """Tests for percentile summaries and report comparison."""
+
+    def test_should_summarize_with_interpolated_percentiles(self) -> None:
+        """Test the percentile summary."""
+        summary = summarize([float(value) for value in range(1, 102)])
+
+        assert summary["p50"] == 51.0
+        assert summary["p90"] == 91.0
+        assert summary["p99"] == 100.0
+        assert (summary["min"], summary["max"], summary["n"]) == (1.0, 101.0, 101)
+
+    def test_should_raise_when_summarizing_no_samples(self) -> None:
+        """Test that an empty sample set is rejected."""
+        with pytest.raises(ValueError):
+            summarize([])
+
+    def test_should_round_trip_report_through_json(self, tmp_path) -> None:
+        """Test save_report() and load_report()."""
+        path = save_report(_report(100.0, 1000), tmp_path / "nested" / "bench.json")
+
+        assert load_report(path) == _report(100.0, 1000)
+
+    def test_should_reject_file_that_is_not_a_report(self, tmp_path) -> None:
+        """Test that load_report() checks the schema."""
+        path = tmp_path / "other.json"
+        path.write_text(json.dumps({"widgets": {}}))
+
+        with pytest.raises(ValueError, match="not a benchmark report"):
+            load_report(path)
+
+    def test_should_report_regressions_over_tolerance(self) -> None:
+        """Test that slower timings and larger memory are reported."""
+        regressions = compare_reports(
+            _report(400.0, 10000), _report(100.0, 1000), tolerance=1.5
+        )
+
+        assert [r.metric for r in regressions] == [
+            *TIMING_METRICS,
+            "memory.python_bytes",
+        ]
+        assert regressions[0].ratio == 4.0
+
+    def test_should_ignore_small_or_tolerated_changes(self) -> None:
+        """Test that noise below the thresholds is not reported."""
+        baseline = _report(100.0, 1000)
+
+        assert compare_reports(_report(140.0, 1400), baseline, tolerance=1.5) == []
+        assert compare_reports(_report(20.0, 1000), _report(5.0, 1000)) == []
@@ -0,0 +1,12 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_CLI - CLI Module Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the command-line interface.
+
+This module contains unit tests for the CLI entry point and commands.
+"""
+
+from __future__ import annotations
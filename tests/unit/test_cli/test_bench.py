@@ -0,0 +1,125 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_BENCH - CLI Bench Command Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Tests for the bench CLI command group.
+
+This test file verifies the benchmark table, the JSON report, baseline
+comparison and the cProfile dump.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import pstats
+
+# Third-party imports
+import pytest
+from click.testing import CliRunner
+
+# Local imports
+from ezqt_widgets.benchmark import SCENARIOS, TIMING_METRICS, load_report, save_report
+from ezqt_widgets.cli.main import cli
+
+pytestmark = [pytest.mark.unit, pytest.mark.cli]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_FAST: list[str] = ["-n", "2", "-r", "2"]
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _baseline(p50: float) -> dict:
+    """Build a ToggleSwitch baseline with the same median everywhere.
+
+    Args:
+        p50: The median of every timing metric.
+
+    Returns:
+        The baseline report.
+    """
+    metrics: dict = {name: {"p50": p50} for name in TIMING_METRICS}
+    metrics["memory"] = {"python_bytes": 10**9, "rss_bytes": None}
+    return {"schema": 1, "widgets": {"ToggleSwitch": metrics}}
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestBenchCommand:
+    """Tests for the bench command group."""
+
+    def test_should_list_benchmarked_widgets(self, qt_widget_cleanup) -> None:
+        """Test bench list."""
+        result = CliRunner().invoke(cli, ["bench", "list"])
+
+        assert result.exit_code == 0
+        assert result.output.split() == sorted(SCENARIOS)
+
+    def test_should_print_percentile_table_and_write_report(
+        self, qt_widget_cleanup, tmp_path
+    ) -> None:
+        """Test bench run with an output file."""
+        output = tmp_path / "report.json"
+        result = CliRunner().invoke(
+            cli, ["bench", "run", "ToggleSwitch", *_FAST, "-o", str(output)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "p99" in result.output
+        assert "first_paint" in result.output
+        assert list(load_report(output)["widgets"]) == ["ToggleSwitch"]
+
+    def test_should_pass_when_baseline_is_slower(
+        self, qt_widget_cleanup, tmp_path
+    ) -> None:
+        """Test --compare against a slower baseline."""
+        baseline = save_report(_baseline(10**9), tmp_path / "baseline.json")
+        result = CliRunner().invoke(
+            cli, ["bench", "run", "ToggleSwitch", *_FAST, "-c", str(baseline)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "No regression" in result.output
+
+    def test_should_exit_with_error_when_metrics_regress(
+        self, qt_widget_cleanup, tmp_path
+    ) -> None:
+        """Test --compare against a much faster baseline."""
+        baseline = save_report(_baseline(0.001), tmp_path / "baseline.json")
+        result = CliRunner().invoke(
+            cli, ["bench", "run", "ToggleSwitch", *_FAST, "-c", str(baseline)]
+        )
+
+        assert result.exit_code == 1
+        assert "regression(s)" in result.output
+
+    def test_should_dump_profile_stats(self, qt_widget_cleanup, tmp_path) -> None:
+        """Test --profile."""
+        profile = tmp_path / "bench.pstats"
+        result = CliRunner().invoke(
+            cli, ["bench", "run", "ToggleSwitch", *_FAST, "-p", str(profile)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "cumulative" in result.output
+        assert pstats.Stats(str(profile)).total_calls > 0
+
+    def test_should_report_unknown_widget(self, qt_widget_cleanup) -> None:
+        """Test that an unknown widget name is a CLI error."""
+        result = CliRunner().invoke(cli, ["bench", "run", "Missing"])
+
+        assert result.exit_code == 1
+        assert "No benchmark scenario for: Missing" in result.output
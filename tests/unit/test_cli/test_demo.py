@@ -0,0 +1,117 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_DEMO - CLI Demo Command Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Tests for the isolated mode of the demo CLI command group.
+
+This test file runs small stand-in examples in offscreen subprocesses and
+verifies the timings, failure reporting and CLI output.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from pathlib import Path
+
+# Third-party imports
+import pytest
+from click.testing import CliRunner
+
+# Local imports
+from ezqt_widgets.cli.commands._demo import ExampleRunner
+from ezqt_widgets.cli.main import cli
+
+pytestmark = [pytest.mark.unit, pytest.mark.cli, pytest.mark.slow]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_WINDOW_EXAMPLE: str = """
+import sys
+from PySide6.QtWidgets import QApplication, QLabel
+
+app = QApplication(sys.argv)
+label = QLabel("example")
+label.show()
+sys.exit(app.exec())
+"""
+
+_FAILING_EXAMPLE: str = """
+raise RuntimeError("broken example")
+"""
+
+# ///////////////////////////////////////////////////////////////
+# FIXTURES
+# ///////////////////////////////////////////////////////////////
+
+
+@pytest.fixture
+def examples_dir(tmp_path, monkeypatch) -> Path:
+    """Provide an examples directory with stand-in category examples."""
+    (tmp_path / "_button.py").write_text(_WINDOW_EXAMPLE)
+    (tmp_path / "_input.py").write_text(_WINDOW_EXAMPLE)
+    (tmp_path / "_label.py").write_text(_FAILING_EXAMPLE)
+    monkeypatch.setattr(ExampleRunner, "_find_examples_dir", lambda _self: tmp_path)
+    return tmp_path
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestIsolatedExamples:
+    """Tests for running examples in isolated processes."""
+
+    def test_should_report_startup_and_first_paint(self, examples_dir) -> None:
+        """Test the timings of examples that show a window."""
+        results = ExampleRunner().run_isolated(
+            ["button", "_input"], workers=2, quit_after=0.05
+        )
+
+        assert [result.name for result in results] == ["_button", "_input"]
+        for result in results:
+            assert result.error is None
+            assert result.exit_code == 0
+            assert 0 < result.startup_ms <= result.first_paint_ms
+            assert result.first_paint_ms <= result.duration_ms
+
+    def test_should_report_failing_example(self, examples_dir) -> None:
+        """Test that an exception in an example is reported."""
+        (result,) = ExampleRunner().run_isolated(["label"])
+
+        assert result.exit_code == 1
+        assert "RuntimeError: broken example" in result.error
+        assert result.first_paint_ms is None
+
+    def test_should_raise_when_example_is_missing(self, examples_dir) -> None:
+        """Test that unknown example names are rejected."""
+        with pytest.raises(FileNotFoundError, match="missing"):
+            ExampleRunner().run_isolated(["missing"])
+
+    def test_should_print_timings_from_cli(self, examples_dir) -> None:
+        """Test demo run --isolated with one category."""
+        result = CliRunner().invoke(
+            cli, ["demo", "run", "--buttons", "--isolated", "--quit-after", "0"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "_button" in result.output
+        assert "first paint" in result.output
+        assert "Successfully ran 1/1 examples" in result.output
+
+    def test_should_exit_with_error_when_an_example_fails(self, examples_dir) -> None:
+        """Test that a failing isolated example sets the exit code."""
+        result = CliRunner().invoke(
+            cli, ["demo", "run", "--buttons", "--labels", "--isolated", "-j", "2"]
+        )
+
+        assert result.exit_code == 1
+        assert "❌ _label" in result.output
+        assert "Successfully ran 1/2 examples" in result.output
@@ -0,0 +1,142 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_MAIN - CLI Entry Point Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Tests for the CLI entry point.
+
+This test file verifies the lazily loaded command group: the help lists
+every command without importing it, and commands are imported on dispatch.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Third-party imports
+import click
+import pytest
+from click.testing import CliRunner
+
+# Local imports
+import ezqt_widgets
+from ezqt_widgets.cli._lazy_group import LazyGroup
+from ezqt_widgets.cli.main import COMMANDS, cli
+
+pytestmark = [pytest.mark.unit, pytest.mark.cli]
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _run_cli_modules(*args: str) -> list[str]:
+    """Run the CLI in a fresh interpreter and list the loaded modules.
+
+    Args:
+        *args: The CLI arguments.
+
+    Returns:
+        The sorted ezqt_widgets, PySide6 and rich modules left loaded.
+    """
+    src_dir = Path(ezqt_widgets.__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+    code = (
+        "import sys\n"
+        "from ezqt_widgets.cli.main import cli\n"
+        f"try:\n    cli({list(args)!r})\n"
+        "except SystemExit:\n    pass\n"
+        "print('\\n'.join(sorted(m for m in sys.modules"
+        " if m.split('.')[0] in ('ezqt_widgets', 'PySide6', 'rich'))))\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return result.stdout.strip().splitlines()
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestLazyCommandGroup:
+    """Tests for the lazily loaded CLI command group."""
+
+    def test_should_list_every_registered_command_in_help(self) -> None:
+        """Test that --help lists every registered command."""
+        result = CliRunner().invoke(cli, ["--help"])
+
+        assert result.exit_code == 0
+        for name, (_path, short_help) in COMMANDS.items():
+            assert f"{name}  " in result.output
+            assert short_help in result.output
+
+    @pytest.mark.parametrize("name", sorted(COMMANDS))
+    def test_should_register_help_matching_the_command(self, name: str) -> None:
+        """Test that the registered help text is the command's own help."""
+        import_path, short_help = COMMANDS[name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+
+        assert isinstance(command, click.Command)
+        assert command.name == name
+        assert command.help == short_help
+
+    def test_should_import_command_only_when_dispatched(self) -> None:
+        """Test that commands are imported on dispatch, not for --help."""
+        help_modules = _run_cli_modules("--help")
+        version_modules = _run_cli_modules("version")
+
+        assert not any(m.startswith("ezqt_widgets.cli.commands.") for m in help_modules)
+        assert "ezqt_widgets.cli.commands._version" in version_modules
+        assert "ezqt_widgets.cli.commands._demo" not in version_modules
+        for modules in (help_modules, version_modules):
+            assert not any(m.startswith(("PySide6", "rich")) for m in modules)
+            assert not any(m.startswith("ezqt_widgets.widgets") for m in modules)
+
+    def test_should_report_unknown_command(self) -> None:
+        """Test that an unknown command is still a usage error."""
+        result = CliRunner().invoke(cli, ["missing"])
+
+        assert result.exit_code == 2
+        assert "No such command 'missing'" in result.output
+
+    def test_should_raise_type_error_when_target_is_not_a_command(self) -> None:
+        """Test that a registry entry must point to a click command."""
+        group = LazyGroup(lazy_commands={"bad": ("ezqt_widgets:__version__", "")})
+
+        with pytest.raises(TypeError, match="is not a click command"):
+            group.get_command(click.Context(group), "bad")
+
+
+class TestVersionCommand:
+    """Tests for the version command."""
+
+    def test_should_print_package_version(self) -> None:
+        """Test the plain version output."""
+        result = CliRunner().invoke(cli, ["version"])
+
+        assert result.exit_code == 0
+        assert result.output.strip() == f"EzQt Widgets v{ezqt_widgets.__version__}"
+
+    def test_should_print_full_version_panel(self) -> None:
+        """Test the --full version output."""
+        result = CliRunner().invoke(cli, ["version", "--full"])
+
+        assert result.exit_code == 0
+        assert "Version Information" in result.output
+        assert ezqt_widgets.__author__ in result.output
@@ -0,0 +1,98 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_SNAPSHOT - CLI Snapshot Command Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Tests for the snapshot CLI command.
+
+This test file verifies listing, rendering and error reporting.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Third-party imports
+import pytest
+from click.testing import CliRunner
+
+# Local imports
+from ezqt_widgets.cli.main import cli
+
+pytestmark = [pytest.mark.unit, pytest.mark.cli]
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_SPEC: str = """
+snapshots:
+  - widget: ToggleSwitch
+    matrix:
+      checked: [true, false]
+"""
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestSnapshotCommand:
+    """Tests for the snapshot command."""
+
+    def test_should_list_snapshot_names(self, tmp_path) -> None:
+        """Test snapshot --list."""
+        spec = tmp_path / "spec.yaml"
+        spec.write_text(_SPEC)
+
+        result = CliRunner().invoke(cli, ["snapshot", str(spec), "--list"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.split() == [
+            "ToggleSwitch-checked-on",
+            "ToggleSwitch-checked-off",
+        ]
+
+    def test_should_write_png_files(self, qt_widget_cleanup, tmp_path) -> None:
+        """Test rendering in-process."""
+        spec = tmp_path / "spec.yaml"
+        spec.write_text(_SPEC)
+        output = tmp_path / "out"
+
+        result = CliRunner().invoke(
+            cli, ["snapshot", str(spec), "-o", str(output), "-j", "1"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "2 snapshot(s) written" in result.output
+        assert sorted(path.name for path in output.iterdir()) == [
+            "ToggleSwitch-checked-off.png",
+            "ToggleSwitch-checked-on.png",
+        ]
+
+    def test_should_exit_with_error_when_snapshots_fail(
+        self, qt_widget_cleanup, tmp_path
+    ) -> None:
+        """Test that failed snapshots are listed and set the exit code."""
+        spec = tmp_path / "spec.yaml"
+        spec.write_text("snapshots:\n  - widget: NotificationBanner\n")
+
+        result = CliRunner().invoke(
+            cli, ["snapshot", str(spec), "-o", str(tmp_path), "-j", "1"]
+        )
+
+        assert result.exit_code == 1
+        assert "NotificationBanner: TypeError" in result.output
+        assert "1 snapshot(s) failed" in result.output
+
+    def test_should_report_invalid_spec(self, tmp_path) -> None:
+        """Test that an invalid spec is a CLI error."""
+        spec = tmp_path / "spec.yaml"
+        spec.write_text("snapshots:\n  - widget: Missing\n")
+
+        result = CliRunner().invoke(cli, ["snapshot", str(spec)])
+
+        assert result.exit_code == 1
+        assert "unknown widget 'Missing'" in result.output
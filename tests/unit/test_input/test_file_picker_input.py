@@ -16,17 +16,39 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
+import os
 import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
 
 # Third-party imports
 import pytest
-from PySide6.QtWidgets import QLineEdit, QToolButton
+from PySide6.QtWidgets import QApplication, QLineEdit, QToolButton
 
 # Local imports
-from ezqt_widgets.widgets.input.file_picker_input import FilePickerInput
+from ezqt_widgets.widgets.input.file_picker_input import (
+    FilePickerInput,
+    _PathWorker,
+)
 
 pytestmark = pytest.mark.unit
 
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _wait_until(
+    app: QApplication, condition: Callable[[], bool], timeout: float = 5.0
+) -> None:
+    """Process events until condition holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+    assert condition()
+
+
 # ///////////////////////////////////////////////////////////////
 # TEST CLASSES
 # ///////////////////////////////////////////////////////////////
@@ -204,3 +226,88 @@ class TestFilePickerInput:
 
         # Signal is connected — verify no exception during connection
         assert widget.fileSelected is not None
+
+
+class TestFilePickerInputValidation:
+    """Tests for background path validation and completion."""
+
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        """Create a small directory tree."""
+        (tmp_path / "alpha.txt").write_text("a")
+        (tmp_path / "albums").mkdir()
+        (tmp_path / "beta.txt").write_text("b")
+        (tmp_path / ".alias").write_text("hidden")
+        return tmp_path
+
+    def test_should_report_validity_when_path_is_typed(
+        self, qt_widget_cleanup, tree: Path
+    ) -> None:
+        """Test that validity follows the typed path and the mode."""
+        widget = FilePickerInput(validation_delay=0)
+        changes: list[bool] = []
+        widget.validityChanged.connect(changes.append)
+        assert widget.is_valid is False
+        assert widget.path_status == "empty"
+        assert widget.validation_delay == 0
+
+        widget.path = str(tree / "alpha.txt")
+        _wait_until(qt_widget_cleanup, lambda: changes == [True])
+        assert widget.path_status == "valid"
+
+        widget.mode = "directory"
+        _wait_until(qt_widget_cleanup, lambda: changes == [True, False])
+        assert widget.path_status == "not_a_directory"
+
+        widget.path = str(tree / "missing")
+        _wait_until(qt_widget_cleanup, lambda: widget.path_status == "missing")
+        assert changes == [True, False]
+
+    def test_should_check_only_last_text_when_typing_quickly(
+        self, qt_widget_cleanup, tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that keystrokes within the delay produce a single check."""
+        submitted: list[str] = []
+        original = _PathWorker.submit
+
+        def submit(worker: _PathWorker, request: int, text: str, mode: str) -> None:
+            submitted.append(text)
+            original(worker, request, text, mode)
+
+        monkeypatch.setattr(_PathWorker, "submit", submit)
+        widget = FilePickerInput(validation_delay=50)
+        target = str(tree / "beta.txt")
+        for end in range(len(target) - 5, len(target) + 1):
+            widget.path = target[:end]
+
+        _wait_until(qt_widget_cleanup, lambda: widget.is_valid)
+        assert submitted == [target]
+
+    def test_should_complete_entries_when_prefix_is_typed(self, tree: Path) -> None:
+        """Test prefix completion from the directory listing."""
+        worker = _PathWorker(lambda _result: None)
+        prefix = str(tree / "al")
+
+        assert worker.completions(prefix, "file") == [
+            str(tree / "albums") + os.sep,
+            str(tree / "alpha.txt"),
+        ]
+        assert worker.completions(prefix, "directory") == [
+            str(tree / "albums") + os.sep
+        ]
+        assert worker.completions(str(tree / ".al"), "file") == [str(tree / ".alias")]
+        assert worker.completions(str(tree / "zz"), "file") == []
+
+    def test_should_reuse_listing_until_directory_changes(self, tree: Path) -> None:
+        """Test the mtime-based invalidation of cached listings."""
+        worker = _PathWorker(lambda _result: None)
+
+        first = worker.listing(str(tree))
+        assert worker.listing(str(tree)) is first
+
+        (tree / "gamma.txt").write_text("g")
+        os.utime(tree, ns=(0, os.stat(tree).st_mtime_ns + 1_000_000))
+        second = worker.listing(str(tree))
+        assert second is not first
+        assert ("gamma.txt", False) in second
+        assert worker.listing(str(tree / "missing")) == []
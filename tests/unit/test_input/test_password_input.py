@@ -494,3 +494,33 @@ class TestPasswordInput:
         # Verify that strength is calculated
         password_widget.updateStrength(long_password)
         # Method should not raise an exception
+
+    def test_should_update_painted_bar_without_stylesheet_when_strength_changes(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that strength updates only change the painted bar value."""
+        password_widget = PasswordInput()
+        bar = password_widget._strength_bar
+
+        password_widget.updateStrength("StrongP@ss123!")
+        assert bar.value() == password_strength("StrongP@ss123!")
+
+        password_widget.updateStrength("")
+        assert bar.value() == 0
+        assert bar.styleSheet() == ""
+        assert bar.property("type") == "PasswordStrengthBar"
+
+    def test_should_paint_bucket_color_when_bar_is_grabbed(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that the filled part uses the precomputed strength color."""
+        password_widget = PasswordInput(strength_bar_height=4)
+        bar = password_widget._strength_bar
+        bar.resize(100, 4)
+
+        password_widget.updateStrength("abc")
+        score = bar.value()
+        image = bar.grab().toImage()
+
+        assert image.pixelColor(0, 2).name() == get_strength_color(score)
+        assert image.pixelColor(99, 2).name() == bar.trackColor.name()
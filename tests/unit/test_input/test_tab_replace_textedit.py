@@ -14,14 +14,38 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
+# Standard library imports
+import time
+from collections.abc import Callable
+from pathlib import Path
+
 # Third-party imports
 import pytest
+from PySide6.QtCore import QEvent, Qt
+from PySide6.QtGui import QKeyEvent
+from PySide6.QtWidgets import QApplication, QPlainTextEdit
 
 # Local imports
+from ezqt_widgets.widgets.input import tab_replace_textedit
 from ezqt_widgets.widgets.input.tab_replace_textedit import TabReplaceTextEdit
 
 pytestmark = pytest.mark.unit
 
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _wait_until(
+    app: QApplication, condition: Callable[[], bool], timeout: float = 5.0
+) -> None:
+    """Process events until condition holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+    assert condition()
+
+
 # ///////////////////////////////////////////////////////////////
 # TEST CLASSES
 # ///////////////////////////////////////////////////////////////
@@ -406,3 +430,332 @@ class TestTabReplaceTextEdit:
         text_edit.tab_replacement = "\n\t"
         sanitized = text_edit.sanitizeText(text)
         assert sanitized == "col1\n\tcol2\n\tcol3"
+
+
+class TestTabReplaceTextEditBackgroundPaste:
+    """Tests for background sanitization of large pastes."""
+
+    @pytest.fixture(autouse=True)
+    def _small_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Use tiny chunks and batches so short texts span several."""
+        monkeypatch.setattr(tab_replace_textedit, "_PASTE_CHUNK_SIZE", 7)
+        monkeypatch.setattr(tab_replace_textedit, "_PASTE_BATCH_SIZE", 5)
+
+    @pytest.mark.parametrize(
+        ("tab_replacement", "remove_empty_lines", "preserve_whitespace"),
+        [
+            ("\n", True, False),
+            (";", True, True),
+            ("", False, False),
+        ],
+    )
+    def test_should_match_sanitize_text_when_paste_is_chunked(
+        self,
+        qt_widget_cleanup,
+        tab_replacement: str,
+        remove_empty_lines: bool,
+        preserve_whitespace: bool,
+    ) -> None:
+        """Test that chunked sanitization gives the same text."""
+        text = "col1\tcol2\n\n   \nlong_line_over_a_chunk\tx\n\n" * 5
+        text_edit = TabReplaceTextEdit(
+            tab_replacement=tab_replacement,
+            remove_empty_lines=remove_empty_lines,
+            preserve_whitespace=preserve_whitespace,
+            async_paste_threshold=10,
+        )
+        progress: list[tuple[int, int]] = []
+        finished: list[bool] = []
+        text_edit.pasteProgress.connect(
+            lambda done, total: progress.append((done, total))
+        )
+        text_edit.pasteFinished.connect(finished.append)
+
+        text_edit.pasteSanitized(text)
+
+        assert text_edit.isPasting() is True
+        assert text_edit.isReadOnly() is True
+        _wait_until(qt_widget_cleanup, lambda: bool(finished))
+        assert finished == [True]
+        assert text_edit.toPlainText() == text_edit.sanitizeText(text)
+        assert len(progress) > 1
+        assert progress[-1] == (len(text), len(text))
+        assert text_edit.isPasting() is False
+        assert text_edit.isReadOnly() is False
+
+    def test_should_replace_selection_in_one_undo_step_when_paste_completes(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that a background paste replaces the selection atomically."""
+        text_edit = TabReplaceTextEdit(tab_replacement=";", async_paste_threshold=10)
+        text_edit.setPlainText("before SELECTED after")
+        cursor = text_edit.textCursor()
+        cursor.setPosition(7)
+        cursor.setPosition(15, cursor.MoveMode.KeepAnchor)
+        text_edit.setTextCursor(cursor)
+        finished: list[bool] = []
+        text_edit.pasteFinished.connect(finished.append)
+
+        text_edit.pasteSanitized("a\tb\nc\td\n" * 10)
+        _wait_until(qt_widget_cleanup, lambda: bool(finished))
+
+        pasted = "\n".join(["a;b", "c;d"] * 10)
+        assert text_edit.toPlainText() == f"before {pasted} after"
+        text_edit.undo()
+        assert text_edit.toPlainText() == "before SELECTED after"
+
+    def test_should_remove_inserted_text_when_paste_is_cancelled(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that Escape cancels a background paste and rolls it back."""
+        text_edit = TabReplaceTextEdit(async_paste_threshold=10)
+        text_edit.setPlainText("kept")
+        text_edit.moveCursor(text_edit.textCursor().MoveOperation.End)
+        progress: list[tuple[int, int]] = []
+        finished: list[bool] = []
+        text_edit.pasteProgress.connect(
+            lambda done, total: progress.append((done, total))
+        )
+        text_edit.pasteFinished.connect(finished.append)
+
+        text_edit.pasteSanitized("line\tvalue\n" * 10_000)
+        _wait_until(qt_widget_cleanup, lambda: bool(progress))
+        escape = QKeyEvent(
+            QEvent.Type.KeyPress, Qt.Key.Key_Escape, Qt.KeyboardModifier.NoModifier
+        )
+        text_edit.keyPressEvent(escape)
+
+        assert finished == [False]
+        assert text_edit.toPlainText() == "kept"
+        assert text_edit.isPasting() is False
+        assert text_edit.isReadOnly() is False
+
+    def test_should_paste_synchronously_when_text_is_below_threshold(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that short pastes and a zero threshold stay synchronous."""
+        text_edit = TabReplaceTextEdit(async_paste_threshold=100)
+        assert text_edit.async_paste_threshold == 100
+
+        text_edit.pasteSanitized("a\tb")
+        assert text_edit.isPasting() is False
+        assert text_edit.toPlainText() == "a\nb"
+
+        text_edit.clear()
+        text_edit.async_paste_threshold = 0
+        text_edit.pasteSanitized("c\t" * 100)
+        assert text_edit.isPasting() is False
+        assert text_edit.toPlainText() == "\n".join(["c"] * 100)
+
+
+class TestTabReplaceTextEditTabularPaste:
+    """Tests for the tabular paste mode."""
+
+    def test_should_emit_columns_and_insert_preview_when_table_is_pasted(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that a pasted TSV table is emitted as columns."""
+        text_edit = TabReplaceTextEdit(tab_replacement=" | ", tabular_paste=True)
+        tables: list[tuple[int, int, list[list[str]]]] = []
+        text_edit.tableParsed.connect(
+            lambda rows, cols, data: tables.append((rows, cols, data))
+        )
+
+        text_edit.pasteSanitized("a\tb\tc\n1\t2\t3\n\n4\t5\t6\n")
+
+        assert tables == [(3, 3, [["a", "1", "4"], ["b", "2", "5"], ["c", "3", "6"]])]
+        assert text_edit.toPlainText() == "a | b | c\n1 | 2 | 3\n4 | 5 | 6"
+
+    def test_should_show_only_first_rows_when_table_is_large(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that the editor only receives a preview of a large table."""
+        text_edit = TabReplaceTextEdit(tab_replacement=";", tabular_paste=True)
+        tables: list[tuple[int, int]] = []
+        text_edit.tableParsed.connect(
+            lambda rows, cols, _data: tables.append((rows, cols))
+        )
+
+        text_edit.pasteSanitized("x\ty\n" * 1000)
+
+        assert tables == [(1000, 2)]
+        lines = text_edit.toPlainText().split("\n")
+        assert lines[:-1] == ["x;y"] * 20
+        assert lines[-1] == "… 980 more rows (1000 x 2)"
+
+    def test_should_parse_quoted_and_ragged_csv_when_delimiter_is_set(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test CSV parsing with quoted cells and short rows."""
+        text_edit = TabReplaceTextEdit()
+        assert text_edit.tabular_paste is False
+        assert text_edit.table_delimiter is None
+
+        assert text_edit.parseTable('x,y\n"1,5",2\n3\n') == [
+            ["x", "1,5", "3"],
+            ["y", "2", ""],
+        ]
+        text_edit.table_delimiter = ";"
+        assert text_edit.parseTable("a;b\nc;d;e") == [
+            ["a", "c"],
+            ["b", "d"],
+            ["", "e"],
+        ]
+        text_edit.table_delimiter = "|"
+        assert text_edit.parseTable("a|b,c\nd|e,f") == [["a", "d"], ["b,c", "e,f"]]
+
+    def test_should_split_rows_on_newlines_only_when_parsing_table(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that form feeds and Unicode separators stay inside cells."""
+        text_edit = TabReplaceTextEdit(table_delimiter="\t")
+
+        assert text_edit.parseTable("a\tb\nc\td\x0ce\tf\n") == [
+            ["a", "c"],
+            ["b", "d\x0ce"],
+            ["", "f"],
+        ]
+        assert text_edit.parseTable("a\tb\r\nc\x85\td\u2028e\r\n") == [
+            ["a", "c\x85"],
+            ["b", "d\u2028e"],
+        ]
+
+    def test_should_paste_as_text_when_content_is_not_a_table(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that text without a delimiter is pasted normally."""
+        text_edit = TabReplaceTextEdit(tabular_paste=True)
+        tables: list[int] = []
+        text_edit.tableParsed.connect(lambda rows, _cols, _data: tables.append(rows))
+
+        text_edit.pasteSanitized("first line\n\nsecond line")
+        assert text_edit.toPlainText() == "first line\nsecond line"
+
+        # A delimiter needs two rows with the same number of cells
+        for text in ("Hello, world", "red, green\nblue, yellow, white"):
+            text_edit.clear()
+            text_edit.pasteSanitized(text)
+            assert text_edit.toPlainText() == text
+
+        assert tables == []
+        assert text_edit.parseTable("a;b\nc;d;e") == []
+
+
+class TestTabReplaceTextEditLargeDocument:
+    """Tests for the large-document mode and memory-mapped files."""
+
+    def test_should_apply_and_restore_settings_when_mode_is_toggled(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that the large-document mode sets and restores its settings."""
+        text_edit = TabReplaceTextEdit(large_document=True, max_block_count=100)
+
+        assert text_edit.large_document is True
+        assert text_edit.max_block_count == 100
+        assert text_edit.lineWrapMode() == QPlainTextEdit.LineWrapMode.NoWrap
+        assert text_edit.maximumBlockCount() == 100
+
+        text_edit.setPlainText("\n".join(str(i) for i in range(150)))
+        assert text_edit.blockCount() == 100
+
+        text_edit.large_document = False
+        assert text_edit.lineWrapMode() == QPlainTextEdit.LineWrapMode.WidgetWidth
+        assert text_edit.maximumBlockCount() == 0
+        assert text_edit.document().isUndoRedoEnabled() is True
+
+    def test_should_keep_large_pastes_out_of_undo_history_when_mode_is_enabled(
+        self, qt_widget_cleanup, monkeypatch
+    ) -> None:
+        """Test that only large pastes bypass the undo history."""
+        monkeypatch.setattr(tab_replace_textedit, "_UNDO_BYPASS_THRESHOLD", 3)
+        text_edit = TabReplaceTextEdit(large_document=True)
+
+        text_edit.pasteSanitized("x")
+        assert text_edit.document().isUndoAvailable() is True
+        text_edit.undo()
+        assert text_edit.toPlainText() == ""
+
+        text_edit.pasteSanitized("a\tb\tc")
+        assert text_edit.toPlainText() == "a\nb\nc"
+        assert text_edit.document().isUndoAvailable() is False
+
+        text_edit.insertPlainText("d")
+        text_edit.undo()
+        assert text_edit.toPlainText() == "a\nb\nc"
+
+    @pytest.mark.parametrize(
+        ("ending", "trailing"),
+        [("\n", True), ("\n", False), ("\r\n", True)],
+    )
+    def test_should_read_any_line_when_file_is_mapped(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        ending: str,
+        trailing: bool,
+    ) -> None:
+        """Test line counting and reads across index and chunk boundaries."""
+        monkeypatch.setattr(tab_replace_textedit, "_LINE_INDEX_STRIDE", 4)
+        monkeypatch.setattr(tab_replace_textedit, "_LINE_INDEX_CHUNK_SIZE", 16)
+        lines = [f"line {i}" + "x" * (i % 7) for i in range(50)]
+        path = tmp_path / "data.txt"
+        path.write_bytes((ending.join(lines) + (ending if trailing else "")).encode())
+
+        mapped = tab_replace_textedit._MappedLines(path)
+        try:
+            for _count in mapped.index():
+                pass
+            assert mapped.indexed is True
+            assert mapped.count == 50
+            for first in range(0, 50, 3):
+                assert mapped.read(first, 5) == lines[first : first + 5]
+            assert mapped.read(50, 5) == []
+        finally:
+            mapped.close()
+
+    def test_should_show_viewport_lines_when_file_is_loaded(
+        self, qt_widget_cleanup, wait_for_signal, tmp_path: Path
+    ) -> None:
+        """Test that a loaded file is shown one viewport at a time."""
+        path = tmp_path / "log.txt"
+        path.write_text("".join(f"entry {i}\n" for i in range(10_000)))
+        text_edit = TabReplaceTextEdit()
+        text_edit.resize(300, 200)
+        counts: list[int] = []
+        text_edit.fileLoaded.connect(counts.append)
+
+        text_edit.loadFile(path)
+        assert text_edit.toPlainText().startswith("entry 0\nentry 1\n")
+        assert wait_for_signal(text_edit.fileLoaded, timeout=5000)
+        assert counts == [10_000]
+        assert text_edit.isFileBacked() is True
+        assert text_edit.isReadOnly() is True
+        shown = text_edit.toPlainText().split("\n")
+        assert shown[0] == "entry 0"
+        assert len(shown) < 100
+
+        text_edit.scrollToLine(5000)
+        assert text_edit.toPlainText().split("\n")[0] == "entry 5000"
+        end = QKeyEvent(
+            QEvent.Type.KeyPress, Qt.Key.Key_End, Qt.KeyboardModifier.NoModifier
+        )
+        text_edit.keyPressEvent(end)
+        assert text_edit.toPlainText().split("\n")[-1] == "entry 9999"
+
+        text_edit.pasteSanitized("ignored")
+        assert "ignored" not in text_edit.toPlainText()
+
+        text_edit.closeFile()
+        assert text_edit.isFileBacked() is False
+        assert text_edit.isReadOnly() is False
+        assert text_edit.toPlainText() == ""
+
+    def test_should_raise_when_file_cannot_be_opened(
+        self, qt_widget_cleanup, tmp_path: Path
+    ) -> None:
+        """Test that loading a missing file raises OSError."""
+        text_edit = TabReplaceTextEdit()
+
+        with pytest.raises(OSError):
+            text_edit.loadFile(tmp_path / "missing.txt")
+        assert text_edit.isFileBacked() is False
@@ -0,0 +1,183 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_INSTRUMENTATION - Widget Instrumentation Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Tests for the opt-in widget instrumentation.
+
+This test file verifies per-class and per-instance recording, icon loading
+hooks, disabling, resetting and the periodic reporter.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Third-party imports
+import pytest
+
+# Local imports
+from ezqt_widgets import ThemeIcon, ToggleSwitch
+from ezqt_widgets.instrumentation import (
+    InstrumentationReporter,
+    disable_instrumentation,
+    enable_instrumentation,
+    instrumentation_snapshot,
+    is_instrumentation_enabled,
+    reset_instrumentation,
+)
+from ezqt_widgets.widgets.shared import _icons
+
+pytestmark = pytest.mark.unit
+
+# ///////////////////////////////////////////////////////////////
+# FIXTURES
+# ///////////////////////////////////////////////////////////////
+
+
+@pytest.fixture
+def instrumentation(qt_widget_cleanup):
+    """Enable instrumentation with no recorded data for one test."""
+    enable_instrumentation()
+    reset_instrumentation()
+    yield qt_widget_cleanup
+    disable_instrumentation()
+    reset_instrumentation()
+
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _paint_count(class_name: str = "ToggleSwitch") -> int:
+    """Return the recorded paintEvent calls of a class.
+
+    Args:
+        class_name: The widget class name.
+
+    Returns:
+        The call count.
+    """
+    methods = instrumentation_snapshot()["classes"].get(class_name, {})
+    return methods.get("paintEvent", {}).get("count", 0)
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestInstrumentation:
+    """Tests for recording and snapshots."""
+
+    def test_should_record_widget_methods_per_class(self, instrumentation) -> None:
+        """Test paintEvent and sizeHint statistics."""
+        widget = ToggleSwitch()
+        widget.grab()
+        widget.grab()
+        widget.sizeHint()
+
+        methods = instrumentation_snapshot()["classes"]["ToggleSwitch"]
+        paint = methods["paintEvent"]
+        assert paint["count"] == 2
+        assert 0 < paint["p50_ms"] <= paint["max_ms"] <= paint["total_ms"]
+        assert methods["sizeHint"]["count"] == 1
+
+    def test_should_record_widget_methods_per_instance(self, instrumentation) -> None:
+        """Test that each live widget gets its own entry."""
+        first = ToggleSwitch()
+        first.setObjectName("first")
+        second = ToggleSwitch()
+        first.grab()
+        second.grab()
+        second.grab()
+
+        entries = {
+            entry["id"]: entry for entry in instrumentation_snapshot()["instances"]
+        }
+        assert entries[f"{id(first):#x}"]["object_name"] == "first"
+        assert entries[f"{id(first):#x}"]["methods"]["paintEvent"]["count"] == 1
+        assert entries[f"{id(second):#x}"]["methods"]["paintEvent"]["count"] == 2
+
+    def test_should_record_subclass_once_under_its_own_name(
+        self, instrumentation
+    ) -> None:
+        """Test that an override calling super() is not counted twice."""
+
+        class CustomSwitch(ToggleSwitch):
+            def paintEvent(self, event) -> None:
+                super().paintEvent(event)
+
+        CustomSwitch().grab()
+
+        assert _paint_count("CustomSwitch") == 1
+        assert _paint_count("ToggleSwitch") == 0
+
+    def test_should_record_icon_loading(self, instrumentation) -> None:
+        """Test the icon loading hooks."""
+        ThemeIcon.from_source(_icons.get_builtin_icon("check"))
+
+        icons = instrumentation_snapshot()["icons"]
+        assert icons["ThemeIcon.from_source"]["count"] == 1
+        assert icons["shared._icons.get_builtin_icon"]["count"] == 1
+        assert icons["shared._icons.get_builtin_pixmap"]["count"] >= 1
+
+    def test_should_stop_recording_when_disabled(self, instrumentation) -> None:
+        """Test disable_instrumentation()."""
+        widget = ToggleSwitch()
+        widget.grab()
+        disable_instrumentation()
+        widget.grab()
+
+        assert not is_instrumentation_enabled()
+        assert _paint_count() == 1
+
+    def test_should_clear_data_when_reset(self, instrumentation) -> None:
+        """Test reset_instrumentation()."""
+        ToggleSwitch().grab()
+        reset_instrumentation()
+
+        snapshot = instrumentation_snapshot()
+        assert snapshot["classes"] == {}
+        assert snapshot["instances"] == []
+
+    def test_should_omit_instances_when_not_requested(self, instrumentation) -> None:
+        """Test the instances flag of instrumentation_snapshot()."""
+        ToggleSwitch().grab()
+
+        assert "instances" not in instrumentation_snapshot(instances=False)
+
+
+class TestInstrumentationReporter:
+    """Tests for the periodic reporter."""
+
+    def test_should_emit_snapshots_and_reset(
+        self, instrumentation, wait_for_signal
+    ) -> None:
+        """Test snapshotReady with reset enabled."""
+        reporter = InstrumentationReporter(interval=10, reset=True)
+        received: list[dict] = []
+        reporter.snapshotReady.connect(received.append)
+        ToggleSwitch().grab()
+
+        reporter.start()
+        assert wait_for_signal(reporter.snapshotReady)
+        reporter.stop()
+
+        assert received[0]["classes"]["ToggleSwitch"]["paintEvent"]["count"] == 1
+        assert _paint_count() == 0
+        assert not reporter.isActive()
+
+    def test_should_expose_interval_and_reset_properties(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test the reporter properties."""
+        reporter = InstrumentationReporter()
+        reporter.interval = 0
+        reporter.reset = True
+
+        assert reporter.interval == 1
+        assert reporter.reset is True
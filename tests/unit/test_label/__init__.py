@@ -7,7 +7,8 @@
 Unit tests for label widgets.
 
 This module contains unit tests for all label widgets including
-ClickableTagLabel, FramedLabel, HoverLabel, and IndicatorLabel.
+ClickableTagLabel, FramedLabel, HoverLabel, IndicatorGrid,
+IndicatorLabel, and TagCloud.
 """
 
 from __future__ import annotations
@@ -418,3 +418,36 @@ class TestClickableTagLabel:
         tag.min_height = -5
         assert tag.min_width == -10
         assert tag.min_height == -5
+
+    def test_should_keep_stylesheet_when_state_is_toggled(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that toggling switches a property instead of the stylesheet."""
+        tag = ClickableTagLabel(name="Python", status_color="#ff0000")
+        label = tag._label
+        stylesheet = label.styleSheet()
+
+        def text_color() -> str:
+            return label.palette().color(label.foregroundRole()).name()
+
+        assert text_color() == "#565656"
+
+        tag.enabled = True
+        assert label.styleSheet() == stylesheet
+        assert label.property("status") == "selected"
+        assert text_color() == "#ff0000"
+
+        tag.enabled = False
+        assert label.styleSheet() == stylesheet
+        assert text_color() == "#565656"
+
+    def test_should_apply_new_status_color_when_color_is_changed(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that status_color updates the selected color."""
+        tag = ClickableTagLabel(name="Python", enabled=True)
+        label = tag._label
+
+        tag.status_color = "#00ff00"
+
+        assert label.palette().color(label.foregroundRole()).name() == "#00ff00"
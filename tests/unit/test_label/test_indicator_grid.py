@@ -0,0 +1,253 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_INDICATOR_GRID - IndicatorGrid Widget Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for IndicatorGrid widget.
+
+Tests for the painted grid of status indicators.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Third-party imports
+import pytest
+from PySide6.QtCore import QPoint, QPointF, Qt
+from PySide6.QtGui import QImage, QMouseEvent, QPainter, QPaintEvent, QRegion
+
+# Local imports
+from ezqt_widgets.widgets.label import indicator_grid
+from ezqt_widgets.widgets.label.indicator_grid import IndicatorGrid
+
+pytestmark = pytest.mark.unit
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+class _CountingPainter(QPainter):
+    """Painter on a scratch image that records the painted cell positions."""
+
+    painted: list[tuple[object, object]] = []
+
+    def __init__(self, _device: object) -> None:
+        self._image = QImage(1, 1, QImage.Format.Format_ARGB32_Premultiplied)
+        super().__init__(self._image)
+
+    def drawPixmap(self, *args: object) -> None:
+        _CountingPainter.painted.append((args[0], args[1]))
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestIndicatorGrid:
+    """Tests for IndicatorGrid class."""
+
+    def test_should_fill_cells_with_initial_status_when_created(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test creation with default parameters."""
+        grid = IndicatorGrid(count=10)
+
+        assert grid.count == 10
+        assert grid.statuses() == ["neutral"] * 10
+        assert grid.property("type") == "IndicatorGrid"
+
+    def test_should_store_statuses_compactly_when_created(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that statuses are kept in a 2-byte array."""
+        grid = IndicatorGrid(count=5000)
+
+        assert grid._states.itemsize == 2
+        assert len(grid._states) == 5000
+
+    def test_should_raise_when_initial_status_is_unknown(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that the initial status is validated."""
+        with pytest.raises(ValueError, match="Unknown status"):
+            IndicatorGrid(count=3, initial_status="invalid_status")
+
+    def test_should_update_single_cell_when_set_status_is_called(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test setting the status of one cell."""
+        grid = IndicatorGrid(count=4)
+        received: list[list[int]] = []
+        grid.statusesChanged.connect(received.append)
+
+        grid.setStatus(2, "online")
+
+        assert grid.status(2) == "online"
+        assert grid.status(1) == "neutral"
+        assert received == [[2]]
+
+    def test_should_emit_once_with_changed_cells_when_bulk_update_is_applied(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test bulk updates with per-cell statuses."""
+        grid = IndicatorGrid(count=6)
+        received: list[list[int]] = []
+        grid.statusesChanged.connect(received.append)
+
+        grid.setStatuses([0, 1, 2], ["online", "neutral", "offline"])
+
+        assert grid.statuses()[:3] == ["online", "neutral", "offline"]
+        # Cell 1 was already neutral and is not reported
+        assert received == [[0, 2]]
+
+    def test_should_apply_single_status_to_all_ids_when_string_is_given(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test bulk updates with a single status key."""
+        grid = IndicatorGrid(count=10)
+
+        grid.setStatuses(range(0, 10, 2), "partial")
+
+        assert grid.statuses() == ["partial", "neutral"] * 5
+
+    def test_should_set_every_cell_when_set_all_statuses_is_called(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test setAllStatuses()."""
+        grid = IndicatorGrid(count=8)
+
+        grid.setAllStatuses("offline")
+
+        assert grid.statuses() == ["offline"] * 8
+
+    def test_should_leave_cells_unchanged_when_bulk_update_is_invalid(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that invalid bulk updates are rejected as a whole."""
+        grid = IndicatorGrid(count=3)
+
+        with pytest.raises(ValueError, match="Unknown status"):
+            grid.setStatuses([0, 1], ["online", "invalid_status"])
+        with pytest.raises(IndexError):
+            grid.setStatuses([0, 5], "online")
+        with pytest.raises(ValueError, match="Expected 2 statuses"):
+            grid.setStatuses([0, 1], ["online"])
+
+        assert grid.statuses() == ["neutral"] * 3
+
+    def test_should_resize_storage_when_count_is_changed(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test growing and shrinking the grid."""
+        grid = IndicatorGrid(count=2)
+        grid.setAllStatuses("online")
+
+        grid.count = 4
+        assert grid.statuses() == ["online", "online", "neutral", "neutral"]
+
+        grid.count = 1
+        assert grid.statuses() == ["online"]
+
+    def test_should_map_points_to_cells_when_hit_testing(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test indexAt() and cellRect() consistency."""
+        grid = IndicatorGrid(count=20, columns=5, cell_size=10, spacing=2)
+
+        for index in (0, 4, 5, 19):
+            rect = grid.cellRect(index)
+            assert grid.indexAt(rect.center()) == index
+
+        # Gaps and points past the last cell are not hits
+        assert grid.indexAt(QPoint(0, 0)) == -1
+        assert grid.indexAt(QPoint(13, 5)) == -1
+        assert grid.indexAt(QPoint(5, 500)) == -1
+
+    def test_should_build_tooltip_from_label_and_status_when_queried(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test per-cell tooltip text."""
+        grid = IndicatorGrid(count=3)
+        grid.setLabels(["db", "api"])
+        grid.setStatus(0, "online")
+
+        assert grid.toolTipAt(0) == "db: Online"
+        assert grid.toolTipAt(2) == "Waiting"
+        assert grid.label(2) == ""
+
+    def test_should_raise_when_tooltip_index_is_out_of_range(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that toolTipAt() rejects indices outside the grid."""
+        grid = IndicatorGrid(count=3)
+
+        with pytest.raises(IndexError):
+            grid.toolTipAt(3)
+        with pytest.raises(IndexError):
+            grid.toolTipAt(-1)
+
+    def test_should_emit_cell_clicked_when_cell_is_pressed(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test click hit-testing."""
+        grid = IndicatorGrid(count=10, columns=5)
+        clicked: list[int] = []
+        grid.cellClicked.connect(clicked.append)
+
+        center = QPointF(grid.cellRect(7).center())
+        event = QMouseEvent(
+            QMouseEvent.Type.MouseButtonPress,
+            center,
+            center,
+            Qt.MouseButton.LeftButton,
+            Qt.MouseButton.LeftButton,
+            Qt.KeyboardModifier.NoModifier,
+        )
+        grid.mousePressEvent(event)
+
+        assert clicked == [7]
+
+    def test_should_size_to_fixed_columns_when_columns_are_set(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test size hint with a fixed column count."""
+        grid = IndicatorGrid(count=10, columns=5, cell_size=10, spacing=2)
+
+        hint = grid.sizeHint()
+        assert hint.width() == 2 + 5 * 12
+        assert hint.height() == 2 + 2 * 12
+        assert not grid.hasHeightForWidth()
+
+    def test_should_paint_status_colors_when_grabbed(self, qt_widget_cleanup) -> None:
+        """Test that cells are painted with their status color."""
+        grid = IndicatorGrid(count=2, columns=2, cell_size=14)
+        grid.resize(grid.sizeHint())
+        grid.setStatus(1, "offline")
+
+        image = grid.grab().toImage()
+        center0 = grid.cellRect(0).center()
+        center1 = grid.cellRect(1).center()
+
+        assert image.pixelColor(center0).name() == "#a0a0a0"
+        assert image.pixelColor(center1).name() == "#f44336"
+
+    def test_should_paint_only_dirty_cells_when_updates_are_scattered(
+        self, qt_widget_cleanup, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that two far-apart dirty cells do not repaint the cells between."""
+        grid = IndicatorGrid(count=400, columns=20)
+        grid.resize(grid.sizeHint())
+        monkeypatch.setattr(indicator_grid, "QPainter", _CountingPainter)
+        monkeypatch.setattr(_CountingPainter, "painted", [])
+
+        region = QRegion(grid.cellRect(0)) + QRegion(grid.cellRect(399))
+        grid.paintEvent(QPaintEvent(region))
+
+        assert sorted(_CountingPainter.painted) == sorted(
+            (grid.cellRect(index).x(), grid.cellRect(index).y()) for index in (0, 399)
+        )
@@ -335,3 +335,102 @@ class TestIndicatorLabel:
         # Verify that the widget is functional
         label.status = "online"
         assert label.status == "online"
+
+    def test_should_paint_led_color_from_status_map_when_status_changes(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that the LED color follows the precomputed status style."""
+        custom_map = {
+            "ok": {"text": "OK", "state": "ok", "color": "#4CAF50"},
+            "ko": {"text": "KO", "state": "ko", "color": "rgb(244, 67, 54)"},
+        }
+        label = IndicatorLabel(status_map=custom_map, initial_status="ok")
+
+        assert label._led is not None
+        assert label._led.color.name() == "#4caf50"
+        assert label.property("state") == "ok"
+
+        label.status = "ko"
+        assert label._led.color.name() == "#f44336"
+        assert label.property("state") == "ko"
+        assert label._status_label is not None
+        assert label._status_label.text() == "KO"
+
+    def test_should_not_use_stylesheet_for_led_when_status_changes(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that status changes leave widget stylesheets untouched."""
+        label = IndicatorLabel()
+
+        label.status = "online"
+        label.status = "offline"
+
+        assert label._led is not None
+        assert label._led.styleSheet() == ""
+        assert label.styleSheet() == ""
+
+    def test_should_apply_latest_status_once_per_window_when_coalescing(
+        self, qt_widget_cleanup, wait_for_signal
+    ) -> None:
+        """Test that coalescing keeps the latest status within a window."""
+        label = IndicatorLabel(coalesce_interval=50)
+        received: list[str] = []
+        label.statusChanged.connect(received.append)
+
+        # First change is applied immediately, the rest are coalesced
+        label.setStatus("online")
+        label.setStatus("offline")
+        label.setStatus("partial")
+        assert label.status == "online"
+        assert received == ["online"]
+
+        assert wait_for_signal(label.statusChanged, timeout=500)
+        assert label.status == "partial"
+        assert received == ["online", "partial"]
+
+    def test_should_flush_pending_status_when_coalescing_is_disabled(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that disabling coalescing applies the pending status."""
+        label = IndicatorLabel(coalesce_interval=1000)
+        label.setStatus("online")
+        label.setStatus("offline")
+        assert label.status == "online"
+
+        label.coalesce_interval = 0
+        assert label.coalesce_interval == 0
+        assert label.status == "offline"
+
+    def test_should_apply_latest_posted_status_when_posted_from_thread(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test thread-safe postStatus() with a burst of samples."""
+        import threading
+
+        label = IndicatorLabel()
+        received: list[str] = []
+        label.statusChanged.connect(received.append)
+
+        statuses = ["online", "partial", "offline"]
+
+        def worker() -> None:
+            for i in range(1000):
+                label.postStatus(statuses[i % len(statuses)])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        qt_widget_cleanup.processEvents()
+
+        # 999 % 3 == 0 -> last posted status is "online"
+        assert label.status == "online"
+        assert len(received) < 1000
+
+    def test_should_raise_when_unknown_status_is_posted(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that postStatus() validates the status key."""
+        label = IndicatorLabel()
+
+        with pytest.raises(ValueError, match="Unknown status"):
+            label.postStatus("invalid_status")
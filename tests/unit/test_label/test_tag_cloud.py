@@ -0,0 +1,296 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_TAG_CLOUD - TagCloud Widget Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for TagCloud widget.
+
+Tests for the painted flow layout of toggleable tags.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Third-party imports
+import pytest
+from PySide6.QtCore import QPoint, QPointF, Qt
+from PySide6.QtGui import (
+    QImage,
+    QKeyEvent,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QRegion,
+    QStaticText,
+)
+
+# Local imports
+from ezqt_widgets.widgets.label import tag_cloud
+from ezqt_widgets.widgets.label.tag_cloud import TagCloud
+
+pytestmark = pytest.mark.unit
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _click(cloud: TagCloud, pos: QPoint) -> None:
+    """Send a left button press to the cloud.
+
+    Args:
+        cloud: The tag cloud.
+        pos: The press position in widget coordinates.
+    """
+    point = QPointF(pos)
+    event = QMouseEvent(
+        QMouseEvent.Type.MouseButtonPress,
+        point,
+        point,
+        Qt.MouseButton.LeftButton,
+        Qt.MouseButton.LeftButton,
+        Qt.KeyboardModifier.NoModifier,
+    )
+    cloud.mousePressEvent(event)
+
+
+def _press(cloud: TagCloud, key: Qt.Key) -> None:
+    """Send a key press to the cloud.
+
+    Args:
+        cloud: The tag cloud.
+        key: The pressed key.
+    """
+    cloud.keyPressEvent(
+        QKeyEvent(QKeyEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier)
+    )
+
+
+class _CountingPainter(QPainter):
+    """Painter on a scratch image that records the painted tag texts."""
+
+    painted: list[str] = []
+
+    def __init__(self, _device: object) -> None:
+        self._image = QImage(1, 1, QImage.Format.Format_ARGB32_Premultiplied)
+        super().__init__(self._image)
+
+    def drawStaticText(self, *args: object) -> None:
+        static_text = args[-1]
+        assert isinstance(static_text, QStaticText)
+        _CountingPainter.painted.append(static_text.text())
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestTagCloud:
+    """Tests for TagCloud class."""
+
+    def test_should_keep_unique_tags_in_order_when_created(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test creation with duplicate tag names."""
+        cloud = TagCloud(tags=["python", "qt", "python", "rust"])
+
+        assert cloud.tags() == ["python", "qt", "rust"]
+        assert cloud.selectedTags() == []
+        assert cloud.property("type") == "TagCloud"
+
+    def test_should_store_selection_in_bitset_when_created(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that the selection uses one bit per tag."""
+        cloud = TagCloud(tags=[f"tag-{i}" for i in range(3000)], selected=["tag-9"])
+
+        assert len(cloud._selected) == 375
+        assert cloud.selectedTags() == ["tag-9"]
+
+    def test_should_emit_state_changed_with_name_when_set_selected_is_called(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test single tag selection signals."""
+        cloud = TagCloud(tags=["a", "b", "c"])
+        states: list[tuple[str, bool]] = []
+        cloud.stateChanged.connect(lambda name, on: states.append((name, on)))
+
+        cloud.setSelected("b")
+        cloud.setSelected("b")
+        cloud.setSelected("b", False)
+
+        assert states == [("b", True), ("b", False)]
+        assert not cloud.isSelected("b")
+
+    def test_should_emit_selection_changed_once_when_bulk_selection_is_applied(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test bulk selection."""
+        cloud = TagCloud(tags=["a", "b", "c", "d"], selected=["a"])
+        batches: list[list[str]] = []
+        cloud.selectionChanged.connect(batches.append)
+
+        cloud.setSelectedTags(["b", "c"])
+
+        assert cloud.selectedTags() == ["b", "c"]
+        assert batches == [["a", "b", "c"]]
+
+        cloud.clearSelection()
+        assert cloud.selectedTags() == []
+
+    def test_should_raise_when_tag_is_unknown(self, qt_widget_cleanup) -> None:
+        """Test that unknown tag names are rejected."""
+        cloud = TagCloud(tags=["a"])
+
+        with pytest.raises(KeyError, match="Unknown tag"):
+            cloud.setSelected("z")
+        with pytest.raises(KeyError, match="Unknown tag"):
+            cloud.setSelectedTags(["a", "z"])
+        assert cloud.selectedTags() == []
+
+    def test_should_wrap_tags_to_width_when_laid_out(self, qt_widget_cleanup) -> None:
+        """Test the flow layout and height for width."""
+        cloud = TagCloud(tags=[f"tag-{i}" for i in range(40)])
+        cloud.resize(200, cloud.heightForWidth(200))
+
+        first = cloud.tagRect(0)
+        last = cloud.tagRect(39)
+        assert last.top() > first.top()
+        assert cloud.heightForWidth(200) > cloud.heightForWidth(2000)
+        for index in range(40):
+            assert cloud.tagRect(index).right() < 200
+
+    def test_should_flow_once_per_width_when_height_for_width_is_queried(
+        self, qt_widget_cleanup, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the layout of a queried width is computed once."""
+        cloud = TagCloud(tags=[f"tag-{i}" for i in range(40)])
+        widths: list[int] = []
+        flow = cloud._flow
+
+        def counting_flow(width: int):
+            widths.append(width)
+            return flow(width)
+
+        monkeypatch.setattr(cloud, "_flow", counting_flow)
+
+        height = cloud.heightForWidth(250)
+        assert cloud.heightForWidth(250) == height
+        cloud.resize(250, height)
+        cloud.tagRect(39)
+
+        assert widths == [250]
+
+    def test_should_map_points_to_tags_when_hit_testing(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test indexAt() and tagAt() consistency with tagRect()."""
+        cloud = TagCloud(tags=[f"tag-{i}" for i in range(30)])
+        cloud.resize(300, cloud.heightForWidth(300))
+
+        for index in (0, 5, 29):
+            center = cloud.tagRect(index).center()
+            assert cloud.indexAt(center) == index
+            assert cloud.tagAt(center) == f"tag-{index}"
+
+        assert cloud.indexAt(QPoint(0, 0)) == -1
+        assert cloud.tagAt(QPoint(5, 5000)) is None
+
+    def test_should_toggle_and_emit_signals_when_tag_is_clicked(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test mouse toggling."""
+        cloud = TagCloud(tags=["python", "qt"])
+        cloud.resize(400, cloud.heightForWidth(400))
+        clicked: list[str] = []
+        toggled: list[str] = []
+        states: list[tuple[str, bool]] = []
+        cloud.clicked.connect(clicked.append)
+        cloud.toggleKeyword.connect(toggled.append)
+        cloud.stateChanged.connect(lambda name, on: states.append((name, on)))
+
+        _click(cloud, cloud.tagRect(1).center())
+        _click(cloud, cloud.tagRect(1).center())
+
+        assert clicked == ["qt", "qt"]
+        assert toggled == ["qt", "qt"]
+        assert states == [("qt", True), ("qt", False)]
+
+    def test_should_toggle_current_tag_when_space_is_pressed(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test keyboard navigation and toggling."""
+        cloud = TagCloud(tags=["a", "b", "c"])
+
+        for key in (Qt.Key.Key_Right, Qt.Key.Key_Right, Qt.Key.Key_Space):
+            cloud.keyPressEvent(
+                QKeyEvent(QKeyEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier)
+            )
+
+        assert cloud.selectedTags() == ["b"]
+
+    def test_should_move_focus_between_rows_when_up_or_down_is_pressed(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that Up and Down move to the tag in the adjacent row."""
+        cloud = TagCloud(tags=[f"tag-{i:02}" for i in range(40)])
+        cloud.resize(200, cloud.heightForWidth(200))
+        per_row = next(
+            index
+            for index in range(40)
+            if cloud.tagRect(index).top() > cloud.tagRect(0).top()
+        )
+        assert per_row > 1
+
+        # The first key press focuses the first tag
+        for key in (Qt.Key.Key_Right, Qt.Key.Key_Right, Qt.Key.Key_Down):
+            _press(cloud, key)
+        _press(cloud, Qt.Key.Key_Space)
+        assert cloud.selectedTags() == [f"tag-{1 + per_row:02}"]
+
+        for key in (Qt.Key.Key_Up, Qt.Key.Key_Up, Qt.Key.Key_Space):
+            _press(cloud, key)
+        assert cloud.selectedTags() == ["tag-01", f"tag-{1 + per_row:02}"]
+
+    def test_should_clear_selection_when_tags_are_replaced(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test setTags()."""
+        cloud = TagCloud(tags=["a", "b"], selected=["a"])
+
+        cloud.setTags(["x", "y", "z"])
+
+        assert cloud.tags() == ["x", "y", "z"]
+        assert cloud.selectedTags() == []
+
+    def test_should_paint_selected_tags_with_status_color_when_grabbed(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that selected tags use the status color for their border."""
+        cloud = TagCloud(tags=["a", "b"], selected=["b"], status_color="#ff0000")
+        cloud.resize(400, cloud.heightForWidth(400))
+
+        image = cloud.grab().toImage()
+        rect = cloud.tagRect(1)
+        edge = QPoint(rect.center().x(), rect.top())
+
+        assert image.pixelColor(edge).red() > 200
+        assert image.pixelColor(edge).green() < 100
+
+    def test_should_paint_only_dirty_tags_when_updates_are_scattered(
+        self, qt_widget_cleanup, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that two far-apart dirty tags do not repaint the tags between."""
+        cloud = TagCloud(tags=[f"tag-{i}" for i in range(200)])
+        cloud.resize(300, cloud.heightForWidth(300))
+        monkeypatch.setattr(tag_cloud, "QPainter", _CountingPainter)
+        monkeypatch.setattr(_CountingPainter, "painted", [])
+
+        region = QRegion(cloud.tagRect(0)) + QRegion(cloud.tagRect(199))
+        cloud.paintEvent(QPaintEvent(region))
+
+        assert sorted(_CountingPainter.painted) == ["tag-0", "tag-199"]
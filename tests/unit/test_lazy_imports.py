@@ -0,0 +1,136 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_LAZY_IMPORTS - Lazy Package Exports Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Tests for the lazy package exports.
+
+This test file verifies that every public name is still importable from
+the package namespaces and that importing the package does not import Qt.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+import ezqt_widgets
+
+pytestmark = pytest.mark.unit
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_LAZY_PACKAGES: list[str] = [
+    "ezqt_widgets",
+    "ezqt_widgets.cli.commands",
+    "ezqt_widgets.utils",
+    "ezqt_widgets.widgets",
+    "ezqt_widgets.widgets.button",
+    "ezqt_widgets.widgets.input",
+    "ezqt_widgets.widgets.label",
+    "ezqt_widgets.widgets.misc",
+    "ezqt_widgets.widgets.shared",
+]
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _run_python(code: str) -> str:
+    """Run code in a fresh interpreter and return its stdout.
+
+    Args:
+        code: The Python source to run.
+
+    Returns:
+        The stripped standard output.
+    """
+    src_dir = Path(ezqt_widgets.__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestLazyExports:
+    """Tests for PEP 562 lazy exports."""
+
+    @pytest.mark.parametrize("package_name", _LAZY_PACKAGES)
+    def test_should_declare_every_lazy_export_in_all(self, package_name: str) -> None:
+        """Test that __all__ and the lazy export table agree."""
+        package = importlib.import_module(package_name)
+
+        public = {name for name in package.__all__ if not name.startswith("__")}
+        assert public == set(package._EXPORTS)
+
+    @pytest.mark.parametrize("package_name", _LAZY_PACKAGES)
+    def test_should_resolve_every_public_name_when_accessed(
+        self, package_name: str
+    ) -> None:
+        """Test that every exported name resolves and is listed by dir()."""
+        package = importlib.import_module(package_name)
+
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+            assert name in dir(package)
+
+    def test_should_return_same_objects_as_defining_modules(self) -> None:
+        """Test that lazy names are the objects of their defining modules."""
+        from ezqt_widgets.widgets.misc.toggle_switch import ToggleSwitch
+        from ezqt_widgets.widgets.shared._defaults import SVG_INFO
+
+        assert ezqt_widgets.ToggleSwitch is ToggleSwitch
+        assert ezqt_widgets.widgets.shared.SVG_INFO is SVG_INFO
+
+    def test_should_raise_attribute_error_when_name_is_unknown(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+            _ = ezqt_widgets.Missing
+
+    def test_should_not_import_qt_when_package_is_imported(self) -> None:
+        """Test that importing the package leaves PySide6 unloaded."""
+        output = _run_python(
+            "import sys, ezqt_widgets;"
+            "print(ezqt_widgets.__version__);"
+            "print(any(m.startswith('PySide6') for m in sys.modules))"
+        )
+
+        assert output.splitlines() == [ezqt_widgets.__version__, "False"]
+
+    def test_should_import_only_requested_widget_module_when_accessed(self) -> None:
+        """Test that accessing one widget does not import its siblings."""
+        output = _run_python(
+            "import sys, ezqt_widgets;"
+            "ezqt_widgets.ToggleSwitch;"
+            "print(sorted(m for m in sys.modules"
+            " if m.startswith('ezqt_widgets.widgets.')))"
+        )
+
+        assert output == (
+            "['ezqt_widgets.widgets.misc', 'ezqt_widgets.widgets.misc.toggle_switch']"
+        )
@@ -0,0 +1,176 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_ACCORDION - Accordion Widget Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for Accordion widget.
+
+Tests for the container of collapsible sections with a shared animation
+group.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Third-party imports
+import pytest
+from PySide6.QtWidgets import QApplication, QLabel, QScrollArea, QWidget
+
+# Local imports
+from ezqt_widgets.widgets.misc.accordion import Accordion
+from ezqt_widgets.widgets.misc.collapsible_section import CollapsibleSection
+
+pytestmark = pytest.mark.unit
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestAccordion:
+    """Tests for Accordion class."""
+
+    def test_should_have_default_properties_when_created(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test creation with default parameters."""
+        accordion = Accordion()
+
+        assert accordion.count == 0
+        assert accordion.exclusive is False
+        assert accordion.property("type") == "Accordion"
+
+    def test_should_add_sections_with_content_when_add_section_is_called(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test adding sections from titles, widgets and factories."""
+        accordion = Accordion()
+        content = QLabel("Static")
+
+        first = accordion.addSection("First", content)
+        second = accordion.addSection("Second", lambda: QLabel("Lazy"))
+        existing = CollapsibleSection(title="Existing", expanded=False)
+        third = accordion.insertSection(0, existing)
+
+        assert accordion.sections() == [existing, first, second]
+        assert third is existing
+        assert first.contentWidget() is content
+        assert second.contentWidget() is None
+        assert accordion.indexOf(second) == 2
+
+    def test_should_keep_one_section_open_when_exclusive(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test the exclusive expand policy."""
+        accordion = Accordion(exclusive=True)
+        for title in ("A", "B", "C"):
+            accordion.addSection(title, QLabel(title))
+
+        accordion.expandSection(0)
+        accordion.expandSection(2)
+
+        assert accordion.expandedSections() == [accordion.section(2)]
+
+    def test_should_allow_many_open_sections_when_not_exclusive(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test the multi-expand policy and switching to exclusive."""
+        accordion = Accordion()
+        for title in ("A", "B", "C"):
+            accordion.addSection(title, QLabel(title))
+
+        accordion.expandAll()
+        assert len(accordion.expandedSections()) == 3
+
+        accordion.exclusive = True
+        assert accordion.expandedSections() == [accordion.section(0)]
+
+        accordion.collapseAll()
+        assert accordion.expandedSections() == []
+
+    def test_should_emit_section_toggled_with_index_when_section_changes(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test sectionToggled ordering in exclusive mode."""
+        accordion = Accordion(exclusive=True)
+        for title in ("A", "B"):
+            accordion.addSection(title, QLabel(title))
+        received: list[tuple[int, bool]] = []
+        accordion.sectionToggled.connect(lambda i, e: received.append((i, e)))
+
+        accordion.expandSection(0)
+        accordion.expandSection(1)
+
+        assert received == [(0, True), (1, True), (0, False)]
+
+    def test_should_run_visible_animations_in_one_group_when_shown(
+        self, qt_widget_cleanup, wait_for_signal
+    ) -> None:
+        """Test that simultaneous animations share the accordion group."""
+        accordion = Accordion(exclusive=True)
+        for title in ("A", "B"):
+            accordion.addSection(title, QLabel(title))
+        accordion.resize(300, 400)
+        accordion.show()
+        QApplication.processEvents()
+
+        accordion.expandSection(0)
+        assert wait_for_signal(accordion._group.finished, timeout=1000)
+        accordion.expandSection(1)
+
+        assert accordion._group.animationCount() == 2
+        assert wait_for_signal(accordion._group.finished, timeout=1000)
+        assert accordion._group.animationCount() == 0
+        assert accordion.section(0)._content_area.maximumHeight() == 0
+        assert accordion.section(1)._content_area.maximumHeight() == 16777215
+
+    def test_should_skip_animation_when_section_is_scrolled_out_of_view(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that sections outside the viewport jump to their end state."""
+        accordion = Accordion()
+        for i in range(30):
+            accordion.addSection(f"Section {i}", QLabel(f"Content {i}"))
+        area = QScrollArea()
+        area.setWidgetResizable(True)
+        area.setWidget(accordion)
+        area.resize(300, 150)
+        area.show()
+        QApplication.processEvents()
+
+        accordion.expandSection(29)
+
+        assert accordion._group.animationCount() == 0
+        assert accordion.section(29)._content_area.maximumHeight() == 16777215
+
+    def test_should_detach_section_when_remove_section_is_called(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test removing a section by index."""
+        accordion = Accordion(exclusive=True)
+        accordion.addSection("A", QLabel("A"))
+        accordion.addSection("B", QLabel("B"))
+
+        removed = accordion.removeSection(0)
+
+        assert accordion.count == 1
+        assert removed._animation_driver is None
+        assert removed.parent() is None
+        # The removed section no longer takes part in the exclusive policy
+        removed.expand()
+        accordion.expandSection(0)
+        assert removed.is_expanded
+
+        with pytest.raises(ValueError, match="does not belong"):
+            accordion.removeSection(removed)
+
+    def test_should_not_raise_when_set_theme_is_called(self, qt_widget_cleanup) -> None:
+        """Test theme propagation."""
+        accordion = Accordion()
+        accordion.addSection("A", QWidget())
+
+        accordion.setTheme("light")
+        accordion.setTheme("dark")
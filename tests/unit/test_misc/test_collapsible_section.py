@@ -16,13 +16,47 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Third-party imports
 import pytest
-from PySide6.QtWidgets import QApplication, QLabel, QWidget
+from PySide6.QtCore import QEvent, QObject, QSize
+from PySide6.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
 
 # Local imports
 from ezqt_widgets.widgets.misc.collapsible_section import CollapsibleSection
 
 pytestmark = pytest.mark.unit
 
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+class _CountingContent(QWidget):
+    """Content widget counting size hint computations."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.size_hint_calls = 0
+        layout = QVBoxLayout(self)
+        for i in range(5):
+            layout.addWidget(QLabel(f"Row {i}"))
+
+    def sizeHint(self) -> QSize:
+        self.size_hint_calls += 1
+        return super().sizeHint()
+
+
+class _ResizeCounter(QObject):
+    """Event filter counting resize events of the watched widget."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.resizes = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Resize:
+            self.resizes += 1
+        return super().eventFilter(watched, event)
+
+
 # ///////////////////////////////////////////////////////////////
 # TEST CLASSES
 # ///////////////////////////////////////////////////////////////
@@ -215,3 +249,245 @@ class TestCollapsibleSection:
 
         section.toggle()  # collapse
         assert not section.is_expanded
+
+    def test_should_build_content_on_first_expand_when_factory_is_set(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that a content factory is deferred until the first expand."""
+        section = CollapsibleSection(expanded=False)
+        calls: list[int] = []
+
+        def factory() -> QWidget:
+            calls.append(1)
+            return QLabel("Lazy content")
+
+        section.setContentFactory(factory)
+        assert calls == []
+        assert section.contentWidget() is None
+
+        section.expand()
+        section.collapse()
+        section.expand()
+
+        assert calls == [1]
+        assert isinstance(section.contentWidget(), QLabel)
+
+    def test_should_build_immediately_when_factory_is_set_on_expanded_section(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that an expanded section builds its content right away."""
+        section = CollapsibleSection(expanded=True)
+        created: list[QWidget] = []
+        section.contentCreated.connect(created.append)
+
+        section.setContentFactory(lambda: QLabel("Now"))
+
+        assert len(created) == 1
+        assert section.contentWidget() is created[0]
+
+    def test_should_build_in_slices_when_factory_is_a_generator(
+        self, qt_widget_cleanup, wait_for_signal
+    ) -> None:
+        """Test incremental building from a generator factory."""
+        section = CollapsibleSection(expanded=False)
+        steps: list[int] = []
+
+        def factory():
+            widget = QWidget()
+            for i in range(5):
+                steps.append(i)
+                yield
+            return widget
+
+        section.setContentFactory(factory)
+        section.expand()
+
+        # The build is driven by the event loop, not by expand() itself
+        assert section.contentWidget() is None
+        assert wait_for_signal(section.contentCreated, timeout=1000)
+        assert steps == [0, 1, 2, 3, 4]
+        assert section.contentWidget() is not None
+
+    def test_should_stop_build_when_generator_factory_raises(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that a failing generator factory aborts the build once."""
+        section = CollapsibleSection(expanded=False)
+        attempts: list[int] = []
+
+        def factory():
+            attempts.append(1)
+            yield
+            if len(attempts) == 1:
+                raise RuntimeError("build failed")
+            return QLabel("Built")
+
+        section.setContentFactory(factory)
+        section.expand()
+        assert section._build_timer.isActive()
+
+        with pytest.raises(RuntimeError, match="build failed"):
+            section._run_build_slice()
+
+        assert not section._build_timer.isActive()
+        assert section._build_steps is None
+        assert section.contentWidget() is None
+
+        # The next expand starts a fresh build
+        section.collapse()
+        section.expand()
+        section._run_build_slice()
+        assert attempts == [1, 1]
+        assert section.contentWidget() is not None
+
+    def test_should_release_factory_content_when_collapsed(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test releaseContent() and rebuilding on the next expand."""
+        section = CollapsibleSection(expanded=False)
+        calls: list[int] = []
+
+        def factory() -> QWidget:
+            calls.append(1)
+            return QLabel("Heavy form")
+
+        section.setContentFactory(factory)
+        section.expand()
+        assert section.releaseContent() is False  # Expanded: kept
+
+        section.collapse()
+        assert section.releaseContent() is True
+        assert section.contentWidget() is None
+
+        section.expand()
+        assert calls == [1, 1]
+
+    def test_should_release_content_after_collapse_animation_when_enabled(
+        self, qt_widget_cleanup, wait_for_signal
+    ) -> None:
+        """Test release_on_collapse."""
+        section = CollapsibleSection(expanded=False, release_on_collapse=True)
+        section.setContentFactory(lambda: QLabel("Heavy form"))
+        section.expand()
+        assert section._animation is not None
+        wait_for_signal(section._animation.finished, timeout=1000)
+
+        section.collapse()
+        assert wait_for_signal(section._animation.finished, timeout=1000)
+        QApplication.processEvents()
+
+        assert section.contentWidget() is None
+
+    def test_should_not_release_content_widget_set_directly(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that releaseContent() ignores content without a factory."""
+        section = CollapsibleSection(expanded=False)
+        section.setContentWidget(QLabel("Static"))
+
+        assert section.releaseContent() is False
+        assert section.contentWidget() is not None
+
+    def test_should_reuse_cached_content_height_when_toggled_repeatedly(
+        self, qt_widget_cleanup, wait_for_signal
+    ) -> None:
+        """Test that toggling does not recompute the content size hint."""
+        host = QWidget()
+        host_layout = QVBoxLayout(host)
+        section = CollapsibleSection(expanded=False)
+        content = _CountingContent()
+        section.setContentWidget(content)
+        host_layout.addWidget(section)
+        host_layout.addStretch()
+        host.resize(300, 400)
+        host.show()
+        QApplication.processEvents()
+        assert section._animation is not None
+
+        section.expand()
+        assert wait_for_signal(section._animation.finished, timeout=1000)
+        section.collapse()
+        assert wait_for_signal(section._animation.finished, timeout=1000)
+        content.size_hint_calls = 0
+
+        for _ in range(3):
+            section.expand()
+            assert wait_for_signal(section._animation.finished, timeout=1000)
+            section.collapse()
+            assert wait_for_signal(section._animation.finished, timeout=1000)
+
+        assert content.size_hint_calls == 0
+
+    def test_should_invalidate_cached_height_when_content_requests_layout(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that LayoutRequest events from the content drop the cache."""
+        section = CollapsibleSection(expanded=False)
+        content = _CountingContent()
+        section.setContentWidget(content)
+        section.show()
+        QApplication.processEvents()
+
+        first = section._get_content_height()
+        assert section._content_height is not None
+
+        layout = content.layout()
+        assert layout is not None
+        layout.addWidget(QLabel("Extra row"))
+        QApplication.processEvents()
+
+        assert section._content_height is None
+        assert section._get_content_height() > first
+
+    def test_should_animate_snapshot_without_resizing_content(
+        self, qt_widget_cleanup, wait_for_signal
+    ) -> None:
+        """Test that the content is covered by a snapshot while animating."""
+        section = CollapsibleSection(expanded=False)
+        content = _CountingContent()
+        section.setContentWidget(content)
+        section.resize(300, 400)
+        section.show()
+        QApplication.processEvents()
+        assert section._animation is not None
+
+        section.expand()
+        assert not section._snapshot.isHidden()
+        full_height = content.height()
+        assert full_height == section._get_content_height()
+
+        assert wait_for_signal(section._animation.finished, timeout=1000)
+        assert section._snapshot.isHidden()
+        assert content.height() == full_height
+        assert section._content_area.maximumHeight() == 16777215
+
+    def test_should_resize_content_area_once_per_animation(
+        self, qt_widget_cleanup, wait_for_signal
+    ) -> None:
+        """Test that animation frames clip the area instead of resizing it."""
+        host = QWidget()
+        host_layout = QVBoxLayout(host)
+        section = CollapsibleSection(expanded=False)
+        section.setContentWidget(_CountingContent())
+        host_layout.addWidget(section)
+        host_layout.addStretch()
+        host.resize(300, 400)
+        host.show()
+        QApplication.processEvents()
+        assert section._animation is not None
+        counter = _ResizeCounter()
+        section._content_area.installEventFilter(counter)
+
+        section.expand()
+        assert wait_for_signal(section._animation.finished, timeout=1000)
+        QApplication.processEvents()
+        assert counter.resizes == 1
+        assert section._content_area.mask().isEmpty()
+
+        section.collapse()
+        QApplication.processEvents()
+        assert not section._content_area.mask().isEmpty()
+        assert wait_for_signal(section._animation.finished, timeout=1000)
+        QApplication.processEvents()
+        assert counter.resizes == 2
+        assert section._content_area.maximumHeight() == 0
@@ -14,9 +14,12 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
+# Standard library imports
+import threading
+
 # Third-party imports
 import pytest
-from PySide6.QtWidgets import QWidget
+from PySide6.QtWidgets import QApplication, QWidget
 
 # Local imports
 from ezqt_widgets.widgets.misc.notification_banner import (
@@ -237,3 +240,147 @@ class TestNotificationBanner:
             banner.showNotification("Default level test")
         except Exception as exc:
             pytest.fail(f"showNotification with default level raised: {exc}")
+
+
+class TestNotificationQueue:
+    """Tests for the NotificationBanner priority queue."""
+
+    def test_should_order_pending_notifications_by_level_when_enqueued(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that higher levels are displayed first."""
+        parent = QWidget()
+        parent.resize(400, 300)
+        banner = NotificationBanner(parent, min_display_interval=60_000)
+        banner.showNotification("current", NotificationLevel.INFO, duration=0)
+
+        banner.enqueueNotification("info", NotificationLevel.INFO)
+        banner.enqueueNotification("error", NotificationLevel.ERROR)
+        banner.enqueueNotification("warning", NotificationLevel.WARNING)
+
+        assert banner.pending_count == 3
+        assert banner._message_label.text() == "current"
+        assert [e.message for e in sorted(banner._queue)] == [
+            "error",
+            "warning",
+            "info",
+        ]
+
+        banner.min_display_interval = 0
+        banner._advance_queue()
+        assert banner._message_label.text() == "error"
+
+    def test_should_merge_duplicates_into_count_badge_when_enqueued(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test duplicate merging for displayed and pending messages."""
+        parent = QWidget()
+        parent.resize(400, 300)
+        banner = NotificationBanner(parent, min_display_interval=60_000)
+
+        for _ in range(42):
+            banner.enqueueNotification("disk full", NotificationLevel.ERROR)
+        for _ in range(5):
+            banner.enqueueNotification("slow query", NotificationLevel.ERROR)
+
+        assert banner._message_label.text() == "disk full"
+        assert banner._count_label.text() == "x42"
+        assert not banner._count_label.isHidden()
+        assert banner.pending_count == 1
+        assert banner._queue[0].count == 5
+
+    def test_should_keep_notification_for_min_interval_when_queue_grows(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that queued notifications do not replace each other early."""
+        parent = QWidget()
+        parent.resize(400, 300)
+        banner = NotificationBanner(parent, min_display_interval=60_000)
+
+        banner.enqueueNotification("first", NotificationLevel.WARNING)
+        banner.enqueueNotification("second", NotificationLevel.WARNING)
+        QApplication.processEvents()
+
+        assert banner._message_label.text() == "first"
+        assert banner.pending_count == 1
+        assert banner._advance_timer.isActive()
+
+    def test_should_wait_for_dismissal_when_pending_level_is_lower(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that lower levels never replace a higher level on screen."""
+        parent = QWidget()
+        parent.resize(400, 300)
+        banner = NotificationBanner(parent, min_display_interval=0)
+        banner.showNotification("outage", NotificationLevel.ERROR, duration=0)
+
+        banner.enqueueNotification("hint", NotificationLevel.INFO)
+        QApplication.processEvents()
+        assert banner._message_label.text() == "outage"
+
+        banner._finish_dismiss()
+        assert banner._message_label.text() == "hint"
+        assert banner.pending_count == 0
+
+    def test_should_drop_lowest_priority_when_queue_is_full(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test the queue bound."""
+        parent = QWidget()
+        banner = NotificationBanner(
+            parent, max_queue_size=2, min_display_interval=60_000
+        )
+        banner.showNotification("current", NotificationLevel.ERROR, duration=0)
+
+        banner.enqueueNotification("a", NotificationLevel.INFO)
+        banner.enqueueNotification("b", NotificationLevel.INFO)
+        banner.enqueueNotification("c", NotificationLevel.WARNING)
+        banner.enqueueNotification("d", NotificationLevel.INFO)
+
+        assert sorted(e.message for e in banner._queue) == ["a", "c"]
+        assert banner.dropped_count == 2
+
+    def test_should_coalesce_posts_from_worker_threads(self, qt_widget_cleanup) -> None:
+        """Test thread-safe posting with duplicate merging."""
+        parent = QWidget()
+        parent.resize(400, 300)
+        banner = NotificationBanner(parent, min_display_interval=60_000)
+
+        def worker() -> None:
+            for _ in range(500):
+                banner.postNotification("timeout", NotificationLevel.ERROR)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        QApplication.processEvents()
+
+        assert banner._message_label.text() == "timeout"
+        assert banner._current_count == 2000
+        assert banner._count_label.text() == "x2000"
+
+    def test_should_evict_lower_priority_post_when_post_batch_is_full(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that a posted ERROR outranks a full batch of INFO posts."""
+        parent = QWidget()
+        parent.resize(400, 300)
+        banner = NotificationBanner(
+            parent, max_queue_size=3, min_display_interval=60_000
+        )
+
+        def worker() -> None:
+            for i in range(3):
+                banner.postNotification(f"info {i}", NotificationLevel.INFO)
+            banner.postNotification("failure", NotificationLevel.ERROR)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        QApplication.processEvents()
+
+        assert banner._message_label.text() == "failure"
+        assert banner.dropped_count == 1
+        assert sorted(e.message for e in banner._queue) == ["info 0", "info 1"]
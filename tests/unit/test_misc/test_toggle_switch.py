@@ -158,3 +158,50 @@ class TestToggleSwitch:
 
         # State should have changed
         assert switch.checked != initial_state
+
+    def test_should_share_cached_pixmaps_when_switches_are_identical(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that identical switches reuse the same cached pixmaps."""
+        switch1 = ToggleSwitch(checked=True, animation=False)
+        switch2 = ToggleSwitch(checked=True, animation=False)
+
+        track1 = switch1._track_pixmap(1.0)
+        track2 = switch2._track_pixmap(1.0)
+        knob1 = switch1._knob_pixmap(1.0)
+        knob2 = switch2._knob_pixmap(1.0)
+
+        assert track1.cacheKey() == track2.cacheKey()
+        assert knob1.cacheKey() == knob2.cacheKey()
+
+    def test_should_use_new_pixmaps_when_properties_change(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that state, size and dpr changes select different pixmaps."""
+        switch = ToggleSwitch(checked=False, animation=False)
+        track_off = switch._track_pixmap(1.0)
+
+        switch.checked = True
+        track_on = switch._track_pixmap(1.0)
+        assert track_on.cacheKey() != track_off.cacheKey()
+
+        switch.width = 80
+        track_wide = switch._track_pixmap(1.0)
+        assert track_wide.width() == 80
+        assert track_wide.cacheKey() != track_on.cacheKey()
+
+        track_hidpi = switch._track_pixmap(2.0)
+        assert track_hidpi.width() == 160
+        assert track_hidpi.devicePixelRatio() == 2.0
+
+    def test_should_render_state_colors_when_grabbed(self, qt_widget_cleanup) -> None:
+        """Test that the composited track reflects the checked state."""
+        switch = ToggleSwitch(checked=False, animation=False)
+        image_off = switch.grab().toImage()
+
+        switch.checked = True
+        image_on = switch.grab().toImage()
+
+        # Sample the track between the knob and the border
+        x, y = switch.width // 2, switch.height // 2
+        assert image_off.pixelColor(x, y) != image_on.pixelColor(x, y)
@@ -0,0 +1,12 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_SHARED - Shared Module Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the shared widget module.
+
+This module contains unit tests for the built-in icon cache.
+"""
+
+from __future__ import annotations
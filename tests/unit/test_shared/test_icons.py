@@ -0,0 +1,198 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_ICONS - Built-in Icon Cache Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the built-in icon cache.
+
+Tests for the shared, lazily populated raster cache of the SVG_* icons.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Third-party imports
+import pytest
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QColor
+
+# Local imports
+from ezqt_widgets.widgets.shared import (
+    _icons,
+    build_icon_bundle,
+    builtin_icon_names,
+    clear_icon_cache,
+    get_builtin_icon,
+    get_builtin_pixmap,
+    load_icon_bundle,
+)
+
+pytestmark = pytest.mark.unit
+
+# ///////////////////////////////////////////////////////////////
+# FIXTURES
+# ///////////////////////////////////////////////////////////////
+
+
+@pytest.fixture
+def restore_icon_bundle():
+    """Reload the default icon bundle after the test."""
+    yield
+    load_icon_bundle()
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestBuiltinIconCache:
+    """Tests for the built-in icon cache."""
+
+    def test_should_list_every_builtin_svg_when_names_are_queried(self) -> None:
+        """Test that every SVG_* constant has a cache name."""
+        from ezqt_widgets.widgets import shared
+
+        expected = sorted(
+            name.removeprefix("SVG_")
+            for name in shared.__all__
+            if name.startswith("SVG_")
+        )
+        assert builtin_icon_names() == expected
+
+    def test_should_render_once_per_key_when_pixmap_is_requested_twice(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test that repeated requests share the cached pixmap."""
+        clear_icon_cache()
+
+        first = get_builtin_pixmap("calendar", 16)
+        second = get_builtin_pixmap("SVG_CALENDAR", QSize(16, 16))
+
+        assert first.cacheKey() == second.cacheKey()
+        assert len(_icons._PIXMAP_CACHE) == 1
+
+    def test_should_key_cache_by_size_color_and_dpr(self, qt_widget_cleanup) -> None:
+        """Test that each (size, color, dpr) combination is cached apart."""
+        clear_icon_cache()
+
+        get_builtin_pixmap("info", 16)
+        get_builtin_pixmap("info", 24)
+        get_builtin_pixmap("info", 16, "white")
+        hidpi = get_builtin_pixmap("info", 16, dpr=2.0)
+
+        assert len(_icons._PIXMAP_CACHE) == 4
+        assert hidpi.size() == QSize(32, 32)
+        assert hidpi.devicePixelRatio() == 2.0
+
+    def test_should_fill_opaque_pixels_with_color_when_color_is_given(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test icon recoloring."""
+        image = get_builtin_pixmap("check", 24, QColor("#ff0000")).toImage()
+
+        colors = {
+            image.pixelColor(x, y).name()
+            for x in range(image.width())
+            for y in range(image.height())
+            if image.pixelColor(x, y).alpha() > 0
+        }
+        assert colors == {"#ff0000"}
+
+    def test_should_raise_when_name_or_color_is_invalid(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test error handling."""
+        with pytest.raises(KeyError, match="Unknown built-in icon"):
+            get_builtin_pixmap("does_not_exist")
+        with pytest.raises(ValueError, match="Invalid icon color"):
+            get_builtin_pixmap("info", 16, "not-a-color")
+
+    def test_should_wrap_cached_pixmap_when_icon_is_requested(
+        self, qt_widget_cleanup
+    ) -> None:
+        """Test get_builtin_icon()."""
+        icon = get_builtin_icon("folder", 16)
+
+        assert not icon.isNull()
+        assert icon.availableSizes() == [QSize(16, 16)]
+
+
+class TestIconBundle:
+    """Tests for the prebuilt icon bundle."""
+
+    def test_should_match_svg_rendering_when_loaded_from_bundle(
+        self, qt_widget_cleanup, tmp_path, restore_icon_bundle
+    ) -> None:
+        """Test that bundled rasters are identical to rendered ones."""
+        path = build_icon_bundle(
+            tmp_path / "icons.bin", sizes=[16], dprs=[1.0, 2.0], colors=[None]
+        )
+
+        assert load_icon_bundle(path)
+        assert len(_icons._bundle) == len(builtin_icon_names()) * 2
+        bundled = get_builtin_pixmap("calendar", 16, dpr=2.0).toImage()
+
+        assert not load_icon_bundle(tmp_path / "missing.bin")
+        rendered = get_builtin_pixmap("calendar", 16, dpr=2.0).toImage()
+
+        assert bundled == rendered
+        assert bundled.size() == QSize(32, 32)
+
+    def test_should_fall_back_to_svg_when_entry_is_missing(
+        self, qt_widget_cleanup, tmp_path, restore_icon_bundle
+    ) -> None:
+        """Test rendering of keys that were not prebuilt."""
+        path = build_icon_bundle(
+            tmp_path / "icons.bin", sizes=[16], dprs=[1.0], colors=[None]
+        )
+        load_icon_bundle(path)
+
+        pixmap = get_builtin_pixmap("info", 24, "white")
+
+        assert pixmap.size() == QSize(24, 24)
+
+    def test_should_ignore_bundle_when_file_is_invalid_or_stale(
+        self, qt_widget_cleanup, tmp_path, restore_icon_bundle, monkeypatch
+    ) -> None:
+        """Test that unusable bundles are rejected."""
+        garbage = tmp_path / "garbage.bin"
+        garbage.write_bytes(b"not a bundle at all")
+        assert not load_icon_bundle(garbage)
+
+        path = build_icon_bundle(
+            tmp_path / "icons.bin", sizes=[16], dprs=[1.0], colors=[None]
+        )
+        monkeypatch.setitem(_icons._BUILTIN_SVGS, "CHECK", b"<svg/>")
+        assert not load_icon_bundle(path)
+
+    def test_should_use_user_cache_directory_when_no_path_is_given(
+        self, qt_widget_cleanup, tmp_path, restore_icon_bundle, monkeypatch
+    ) -> None:
+        """Test that the default bundle lives outside the package."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "local"))
+
+        path = build_icon_bundle(sizes=[16], dprs=[1.0], colors=[None])
+
+        assert path.is_relative_to(tmp_path)
+        assert path.parent.name == "ezqt_widgets"
+        assert load_icon_bundle()
+        assert _icons._bundle is not None
+
+    def test_should_reject_bundle_when_file_is_truncated(
+        self, qt_widget_cleanup, tmp_path, restore_icon_bundle
+    ) -> None:
+        """Test that entries pointing past the end of the file are rejected."""
+        path = build_icon_bundle(
+            tmp_path / "icons.bin", sizes=[16], dprs=[1.0], colors=[None]
+        )
+        data = path.read_bytes()
+        path.write_bytes(data[: len(data) - 1])
+
+        assert not load_icon_bundle(path)
+        assert _icons._bundle is None
@@ -0,0 +1,214 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_SNAPSHOT - Snapshot Rendering Package Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Tests for the headless snapshot rendering package.
+
+This test file verifies spec expansion and validation, in-process
+rendering, per-job error reporting and the process pool.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+
+# Third-party imports
+import pytest
+from PySide6.QtGui import QImage
+
+# Local imports
+from ezqt_widgets.snapshot import _renderer, expand_spec, load_spec, render_snapshots
+
+pytestmark = pytest.mark.unit
+
+# ///////////////////////////////////////////////////////////////
+# CONSTANTS
+# ///////////////////////////////////////////////////////////////
+
+_SPEC: str = """
+defaults:
+  themes: [dark, light]
+stylesheets:
+  dark: "QWidget { background-color: #2d2d2d; }"
+snapshots:
+  - widget: ToggleSwitch
+    name: toggle
+    matrix:
+      checked: [true, false]
+    size: [60, 30]
+  - widget: IconButton
+    args: {icon: {builtin: info}, text: Info}
+    themes: []
+    stylesheet: "QToolButton { color: red; }"
+"""
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _crashing_render_batch(jobs, output_dir):
+    """Kill the worker process on the job of width 50, render the others."""
+    if any(job.args.get("width") == 50 for job in jobs):
+        os._exit(1)
+    return _renderer._render_batch(jobs, output_dir)
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestSnapshotSpec:
+    """Tests for spec loading and expansion."""
+
+    def test_should_expand_matrix_and_themes(self, tmp_path) -> None:
+        """Test one job per matrix combination and theme."""
+        path = tmp_path / "spec.yaml"
+        path.write_text(_SPEC)
+
+        jobs = load_spec(path)
+
+        assert [job.name for job in jobs] == [
+            "toggle-checked-on-dark",
+            "toggle-checked-on-light",
+            "toggle-checked-off-dark",
+            "toggle-checked-off-light",
+            "IconButton",
+        ]
+        assert jobs[0].args == {"checked": True}
+        assert jobs[0].size == (60, 30)
+        assert jobs[0].stylesheet == "QWidget { background-color: #2d2d2d; }"
+        assert jobs[1].stylesheet == ""
+        assert jobs[4].theme is None
+        assert jobs[4].args["icon"] == {"builtin": "info"}
+
+    @pytest.mark.parametrize(
+        ("spec", "message"),
+        [
+            ({"snapshots": []}, "non-empty list"),
+            ({"snapshots": [{"widget": "Missing"}]}, "unknown widget"),
+            ({"snapshots": [{"widget": "ToggleSwitch", "color": 1}]}, "unknown key"),
+            ({"snapshots": [{"widget": "ToggleSwitch", "size": [0, 1]}]}, "size"),
+            (
+                {"snapshots": [{"widget": "ToggleSwitch"}, {"widget": "ToggleSwitch"}]},
+                "duplicate",
+            ),
+            (
+                {"snapshots": [{"widget": "ToggleSwitch", "matrix": {"checked": 1}}]},
+                "non-empty list",
+            ),
+        ],
+    )
+    def test_should_reject_invalid_spec(self, spec: dict, message: str) -> None:
+        """Test spec validation."""
+        with pytest.raises(ValueError, match=message):
+            expand_spec(spec)
+
+    def test_should_reject_invalid_yaml(self, tmp_path) -> None:
+        """Test that a YAML syntax error is a ValueError."""
+        path = tmp_path / "spec.yaml"
+        path.write_text("snapshots: [")
+
+        with pytest.raises(ValueError, match="not valid YAML"):
+            load_spec(path)
+
+
+class TestSnapshotRenderer:
+    """Tests for rendering snapshots to PNG."""
+
+    def test_should_render_png_files_in_process(
+        self, qt_widget_cleanup, tmp_path
+    ) -> None:
+        """Test in-process rendering with an explicit size."""
+        jobs = expand_spec(
+            {
+                "snapshots": [
+                    {"widget": "FramedLabel", "args": {"text": "A"}, "size": [60, 30]}
+                ]
+            }
+        )
+        seen: list[str] = []
+
+        results = render_snapshots(
+            jobs, tmp_path / "out", workers=1, progress=lambda r: seen.append(r.name)
+        )
+
+        assert results[0].error is None
+        assert results[0].path == tmp_path / "out" / "FramedLabel.png"
+        image = QImage(str(results[0].path))
+        assert (image.width(), image.height()) == (60, 30)
+        assert seen == ["FramedLabel"]
+
+    def test_should_report_failing_job_and_render_the_others(
+        self, qt_widget_cleanup, tmp_path
+    ) -> None:
+        """Test that a widget that cannot be built does not stop the batch."""
+        jobs = expand_spec(
+            {
+                "snapshots": [
+                    {"widget": "NotificationBanner"},
+                    {"widget": "IconButton", "args": {"icon": {"builtin": "check"}}},
+                ]
+            }
+        )
+
+        results = render_snapshots(jobs, tmp_path, workers=1)
+
+        assert results[0].path is None
+        assert results[0].error.startswith("TypeError")
+        assert results[1].error is None
+        assert results[1].path.is_file()
+
+    def test_should_reject_invalid_worker_count(self, tmp_path) -> None:
+        """Test the workers argument."""
+        with pytest.raises(ValueError):
+            render_snapshots([], tmp_path, workers=0)
+
+    @pytest.mark.slow
+    def test_should_render_in_process_pool(self, tmp_path) -> None:
+        """Test rendering over two worker processes, in job order."""
+        jobs = expand_spec(
+            {
+                "snapshots": [
+                    {
+                        "widget": "ToggleSwitch",
+                        "matrix": {"width": [40, 50, 60, 70]},
+                    }
+                ]
+            }
+        )
+
+        results = render_snapshots(jobs, tmp_path, workers=2, batch_size=1)
+
+        assert [result.name for result in results] == [job.name for job in jobs]
+        assert all(result.error is None for result in results)
+        assert QImage(str(results[3].path)).width() >= 70
+
+    @pytest.mark.slow
+    def test_should_report_jobs_of_dead_worker_and_render_the_others(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        """Test that a worker crash does not abort the whole render."""
+        jobs = expand_spec(
+            {
+                "snapshots": [
+                    {"widget": "ToggleSwitch", "matrix": {"width": [40, 50, 60]}}
+                ]
+            }
+        )
+        monkeypatch.setattr(_renderer, "_render_batch", _crashing_render_batch)
+
+        results = render_snapshots(jobs, tmp_path, workers=2, batch_size=1)
+
+        assert [result.name for result in results] == [job.name for job in jobs]
+        assert results[1].path is None
+        assert results[1].error.startswith("BrokenProcessPool")
+        assert results[0].error is None
+        assert results[2].error is None
@@ -0,0 +1,13 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_UTILS - Utilities Tests Module
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the utilities.
+
+This module contains unit tests for the utilities including
+EventLoopMonitor.
+"""
+
+from __future__ import annotations
@@ -0,0 +1,201 @@
+# ///////////////////////////////////////////////////////////////
+# TEST_EVENT_LOOP_MONITOR - Event Loop Monitor Tests
+# Project: ezqt_widgets
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the EventLoopMonitor utility.
+
+This test file verifies heartbeat lag measurement, stack sampling of
+blocking calls, attribution to library code and nested event loop
+detection.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Third-party imports
+import pytest
+import shiboken6
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication, QDialog
+
+# Local imports
+from ezqt_widgets import DateButton, ToggleSwitch
+from ezqt_widgets.utils import EventLoopMonitor, StallReport
+from ezqt_widgets.utils._network_utils import fetch_url_bytes
+
+pytestmark = [pytest.mark.unit, pytest.mark.usefixtures("qt_widget_cleanup")]
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """HTTP handler that answers after a delay."""
+
+    def do_GET(self) -> None:
+        time.sleep(0.3)
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"data")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _block() -> None:
+    """Block the GUI thread."""
+    time.sleep(0.2)
+
+
+def _wait(seconds: float) -> None:
+    """Process events for a while."""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        QApplication.processEvents()
+
+
+# ///////////////////////////////////////////////////////////////
+# FIXTURES
+# ///////////////////////////////////////////////////////////////
+
+
+@pytest.fixture
+def monitor():
+    """Provide a running monitor with a short heartbeat."""
+    monitor = EventLoopMonitor(interval=10, threshold=80)
+    monitor.start()
+    yield monitor
+    monitor.stop()
+
+
+@pytest.fixture
+def slow_server():
+    """Provide the URL of a local HTTP server that answers slowly."""
+    server = HTTPServer(("127.0.0.1", 0), _SlowHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestEventLoopMonitor:
+    """Tests for the EventLoopMonitor utility."""
+
+    def test_should_sample_stack_of_blocking_call(
+        self, monitor, wait_for_signal
+    ) -> None:
+        """Test a stall caused by a blocking slot."""
+        QTimer.singleShot(20, _block)
+
+        assert wait_for_signal(monitor.stallDetected, timeout=2000)
+        report = monitor.stalls()[0]
+        assert isinstance(report, StallReport)
+        assert report.kind == "blocked"
+        assert report.duration_ms >= 80
+        assert report.stack[0].function == "_block"
+        assert report.stack[0].line == "time.sleep(0.2)"
+        assert report.attribution == ()
+
+    def test_should_attribute_stall_to_library_method(
+        self, monitor, wait_for_signal
+    ) -> None:
+        """Test that library frames below a blocking slot are attributed."""
+        switch = ToggleSwitch(animation=False)
+        switch.toggled.connect(lambda _checked: _block())
+        QTimer.singleShot(20, switch.toggle)
+
+        assert wait_for_signal(monitor.stallDetected, timeout=2000)
+        functions = [frame.function for frame in monitor.stalls()[0].attribution]
+        assert functions[:2] == ["ToggleSwitch.checked", "ToggleSwitch.toggle"]
+        assert "ToggleSwitch.checked" in str(monitor.stalls()[0])
+
+    def test_should_report_nested_event_loop(
+        self, monitor, slow_server, wait_for_signal
+    ) -> None:
+        """Test a blocking fetch_url_bytes() call."""
+        QTimer.singleShot(20, lambda: fetch_url_bytes(slow_server, timeout_ms=2000))
+
+        assert wait_for_signal(monitor.stallDetected, timeout=2000)
+        report = monitor.stalls()[0]
+        assert report.kind == "nested_event_loop"
+        assert report.duration_ms >= 80
+        assert report.attribution[0].function == "fetch_url_bytes"
+        assert report.attribution[0].line == "loop.exec()"
+
+    def test_should_not_report_modal_dialog_as_nested_event_loop(self, monitor) -> None:
+        """Test that a modal dialog opened by a widget is not a stall."""
+        button = DateButton()
+
+        def accept_dialog() -> None:
+            dialog = QApplication.activeModalWidget()
+            assert isinstance(dialog, QDialog)
+            dialog.accept()
+
+        QTimer.singleShot(200, accept_dialog)
+        button.openCalendar()
+        _wait(0.05)
+
+        assert [r for r in monitor.stalls() if r.kind == "nested_event_loop"] == []
+
+    def test_should_measure_heartbeat_lag(self, monitor, wait_for_signal) -> None:
+        """Test lagMeasured and lagStats()."""
+        lags: list[float] = []
+        monitor.lagMeasured.connect(lags.append)
+
+        assert wait_for_signal(monitor.lagMeasured)
+        stats = monitor.lagStats()
+        assert stats["count"] >= 1
+        assert 0 <= stats["p50_ms"] <= stats["max_ms"]
+        assert all(lag >= 0 for lag in lags)
+
+    def test_should_stop_heartbeat_and_clear_history(self, monitor) -> None:
+        """Test stop() and clear()."""
+        monitor.stop()
+        monitor.clear()
+
+        assert not monitor.isActive()
+        assert monitor.stalls() == []
+        assert monitor.lagStats()["count"] == 0
+
+    def test_should_expose_interval_and_threshold_properties(self) -> None:
+        """Test the monitor properties."""
+        monitor = EventLoopMonitor()
+        monitor.interval = 0
+        monitor.threshold = 150
+
+        assert monitor.interval == 1
+        assert monitor.threshold == 150
+
+    def test_should_keep_watchdog_running_when_timer_is_deleted(self) -> None:
+        """Test that the watchdog never touches the Qt timer."""
+        monitor = EventLoopMonitor(interval=5)
+        monitor.start()
+        watchdog, stop_event = monitor._watchdog, monitor._stop_event
+        assert watchdog is not None
+        assert stop_event is not None
+
+        # Simulates application teardown deleting the C++ timer first
+        shiboken6.delete(monitor._timer)
+        time.sleep(0.05)
+
+        assert watchdog.is_alive()
+        stop_event.set()
+        watchdog.join()